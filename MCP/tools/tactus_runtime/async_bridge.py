@@ -0,0 +1,272 @@
+"""Long-lived event loop for running coroutines from synchronous Tactus handlers.
+
+The Tactus host modules are synchronous, but many of the services they call
+(``FeedbackService``, the rubric-memory providers, ``FastMCP.call_tool``) are
+coroutines. Running each one with ``asyncio.run`` creates a new loop and
+closes it again, so loop-bound clients, connection pools and caches are
+rebuilt on every tool call.
+
+``AsyncBridge`` keeps one loop running on a daemon thread per process and
+runs submitted coroutines there:
+
+* each coroutine runs in a copy of the caller's ``contextvars`` context, so
+  actor attribution and other context-local state carry over;
+* ``run(..., timeout=...)`` cancels the coroutine on the loop when the caller
+  gives up, and a coroutine cancelled on the loop raises ``CancelledError``
+  in the caller;
+* at most ``max_concurrency`` callers wait on the loop at once. Calls made
+  from inside a bridged coroutine (for example a sync tool handler run by
+  ``call_tool`` in a worker thread) do not take a slot, so nesting cannot
+  deadlock on the cap.
+
+Limits come from ``PLEXUS_MCP_ASYNC_BRIDGE_MAX_CONCURRENCY`` (default 32) and
+``PLEXUS_MCP_ASYNC_BRIDGE_TIMEOUT_SECONDS`` (default: no timeout).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import contextvars
+import logging
+import os
+import threading
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_CONCURRENCY_ENV_VAR = "PLEXUS_MCP_ASYNC_BRIDGE_MAX_CONCURRENCY"
+TIMEOUT_ENV_VAR = "PLEXUS_MCP_ASYNC_BRIDGE_TIMEOUT_SECONDS"
+DEFAULT_MAX_CONCURRENCY = 32
+
+_USE_DEFAULT_TIMEOUT: Any = object()
+
+_inside_bridge: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "plexus_mcp_inside_async_bridge", default=False
+)
+
+
+def max_concurrency_from_env(default: int = DEFAULT_MAX_CONCURRENCY) -> int:
+    value = os.getenv(MAX_CONCURRENCY_ENV_VAR, "").strip()
+    if not value:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning("Invalid %s=%r; using default %s", MAX_CONCURRENCY_ENV_VAR, value, default)
+        return default
+
+
+def timeout_from_env() -> Optional[float]:
+    value = os.getenv(TIMEOUT_ENV_VAR, "").strip()
+    if not value:
+        return None
+    try:
+        timeout = float(value)
+    except ValueError:
+        logger.warning("Invalid %s=%r; running without a timeout", TIMEOUT_ENV_VAR, value)
+        return None
+    return timeout if timeout > 0 else None
+
+
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
+
+
+def _run_on_private_loop(awaitable: Any) -> Any:
+    """Run ``awaitable`` on a throwaway loop in its own thread (the pre-bridge behaviour)."""
+    outcome: dict[str, Any] = {}
+    context = contextvars.copy_context()
+
+    def run_in_thread() -> None:
+        try:
+            outcome["value"] = context.run(asyncio.run, _await(awaitable))
+        except BaseException as exc:  # noqa: BLE001
+            outcome["error"] = exc
+
+    thread = threading.Thread(target=run_in_thread, daemon=True)
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("value")
+
+
+class AsyncBridge:
+    """Runs coroutines submitted from synchronous code on one background event loop."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        default_timeout: Optional[float] = None,
+        name: str = "plexus-mcp-async-bridge",
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.default_timeout = default_timeout
+        self.name = name
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.calls = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and not self._closed
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"{self.name} is closed")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run_loop() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                thread = threading.Thread(target=run_loop, name=self.name, daemon=True)
+                thread.start()
+                ready.wait()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def run(self, awaitable: Any, timeout: Any = _USE_DEFAULT_TIMEOUT) -> Any:
+        """
+        Run ``awaitable`` on the bridge loop and return its result.
+
+        Raises ``TimeoutError`` (after cancelling the coroutine) if it does
+        not finish within ``timeout`` seconds, including time spent waiting
+        for a concurrency slot.
+        """
+        if timeout is _USE_DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        if self.in_loop_thread():
+            # Blocking here would stall the loop the coroutine needs.
+            logger.debug("%s called from its own loop thread; using a private loop", self.name)
+            return _run_on_private_loop(awaitable)
+
+        loop = self._ensure_loop()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        nested = _inside_bridge.get()
+        if not nested and not self._slots.acquire(timeout=timeout):
+            _close_awaitable(awaitable)
+            raise TimeoutError(
+                f"Timed out after {timeout}s waiting for one of {self.max_concurrency} async bridge slots"
+            )
+        try:
+            context = contextvars.copy_context()
+            context.run(_inside_bridge.set, True)
+            result: concurrent.futures.Future = concurrent.futures.Future()
+            tasks: list[asyncio.Task] = []
+
+            def copy_outcome(task: asyncio.Task) -> None:
+                if task.cancelled():
+                    result.set_exception(asyncio.CancelledError())
+                elif task.exception() is not None:
+                    result.set_exception(task.exception())
+                else:
+                    result.set_result(task.result())
+
+            def start() -> None:
+                if not result.set_running_or_notify_cancel():
+                    _close_awaitable(awaitable)
+                    return
+                task = loop.create_task(_await(awaitable), context=context)
+                tasks.append(task)
+                task.add_done_callback(copy_outcome)
+
+            def cancel() -> None:
+                if tasks:
+                    tasks[0].cancel()
+                else:
+                    result.cancel()
+
+            self.calls += 1
+            loop.call_soon_threadsafe(start)
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                return result.result(remaining)
+            except concurrent.futures.TimeoutError:
+                loop.call_soon_threadsafe(cancel)
+                raise TimeoutError(f"Async call timed out after {timeout}s and was cancelled") from None
+            except BaseException:
+                # KeyboardInterrupt or similar in the caller: stop the work too.
+                if not result.done():
+                    loop.call_soon_threadsafe(cancel)
+                raise
+        finally:
+            if not nested:
+                self._slots.release()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Cancel outstanding coroutines and stop the loop."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+        if loop is None or thread is None:
+            return
+
+        async def shutdown() -> None:
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+
+        if thread.is_alive():
+            try:
+                asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Async bridge shutdown did not finish cleanly: %s", exc)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+        if not loop.is_running():
+            loop.close()
+
+
+def _close_awaitable(awaitable: Any) -> None:
+    """Close a coroutine that will never run, avoiding 'never awaited' warnings."""
+    close = getattr(awaitable, "close", None)
+    if asyncio.iscoroutine(awaitable) and callable(close):
+        close()
+
+
+_bridge: Optional[AsyncBridge] = None
+_bridge_pid: Optional[int] = None
+_bridge_lock = threading.Lock()
+
+
+def get_async_bridge() -> AsyncBridge:
+    """The process-wide bridge, created on first use (and again after a fork)."""
+    global _bridge, _bridge_pid
+    with _bridge_lock:
+        if _bridge is None or _bridge_pid != os.getpid() or _bridge._closed:
+            _bridge = AsyncBridge(
+                max_concurrency=max_concurrency_from_env(),
+                default_timeout=timeout_from_env(),
+            )
+            _bridge_pid = os.getpid()
+        return _bridge
+
+
+def run_coroutine_sync(awaitable: Any, timeout: Any = _USE_DEFAULT_TIMEOUT) -> Any:
+    """Run ``awaitable`` on the process-wide bridge loop from synchronous code."""
+    return get_async_bridge().run(awaitable, timeout=timeout)
+
+
+@atexit.register
+def _close_bridge_at_exit() -> None:
+    if _bridge is not None and _bridge_pid == os.getpid():
+        _bridge.close(timeout=2.0)
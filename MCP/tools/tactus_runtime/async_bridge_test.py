@@ -0,0 +1,131 @@
+"""Tests for the persistent async bridge used by sync Tactus handlers."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from .async_bridge import AsyncBridge, get_async_bridge, run_coroutine_sync
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def bridge():
+    bridge = AsyncBridge(max_concurrency=2)
+    yield bridge
+    bridge.close()
+
+
+def test_loop_and_loop_bound_resources_survive_across_calls(bridge):
+    cache: dict = {}
+
+    async def use_shared_lock():
+        if "lock" not in cache:
+            cache["lock"] = asyncio.Lock()
+        async with cache["lock"]:
+            return asyncio.get_running_loop()
+
+    first = bridge.run(use_shared_lock())
+    second = bridge.run(use_shared_lock())
+
+    assert first is second
+    assert first.is_running()
+    assert bridge.calls == 2
+
+
+def test_results_exceptions_and_caller_context_are_propagated(bridge):
+    request_id = contextvars.ContextVar("request_id", default=None)
+
+    async def read_context():
+        return request_id.get()
+
+    async def fail():
+        raise ValueError("boom")
+
+    request_id.set("req-1")
+    assert bridge.run(read_context()) == "req-1"
+    with pytest.raises(ValueError, match="boom"):
+        bridge.run(fail())
+
+
+def test_timeout_cancels_the_coroutine(bridge):
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        bridge.run(slow(), timeout=0.1)
+    assert cancelled.wait(5)
+
+
+def test_concurrency_cap_limits_waiting_callers():
+    bridge = AsyncBridge(max_concurrency=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    async def hold_slot():
+        started.set()
+        await asyncio.to_thread(release.wait, 5)
+        return "done"
+
+    results = []
+    holder = threading.Thread(target=lambda: results.append(bridge.run(hold_slot())))
+    holder.start()
+    try:
+        assert started.wait(5)
+        with pytest.raises(TimeoutError):
+            bridge.run(asyncio.sleep(0), timeout=0.1)
+    finally:
+        release.set()
+        holder.join(5)
+        bridge.close()
+    assert results == ["done"]
+
+
+def test_nested_calls_do_not_take_a_slot_or_deadlock():
+    bridge = AsyncBridge(max_concurrency=1)
+
+    async def inner():
+        return "inner"
+
+    def sync_handler():
+        return bridge.run(inner(), timeout=5)
+
+    async def outer():
+        # Like FastMCP running a sync tool handler in a worker thread.
+        return await asyncio.to_thread(sync_handler)
+
+    try:
+        assert bridge.run(outer(), timeout=5) == "inner"
+    finally:
+        bridge.close()
+
+
+def test_call_from_the_loop_thread_uses_a_private_loop(bridge):
+    async def value():
+        return 42
+
+    async def call_back_into_bridge():
+        # A sync callback invoked directly on the bridge loop thread.
+        return bridge.run(value())
+
+    assert bridge.run(call_back_into_bridge()) == 42
+
+
+def test_module_bridge_is_shared_and_configured_from_env(monkeypatch):
+    monkeypatch.setenv("PLEXUS_MCP_ASYNC_BRIDGE_MAX_CONCURRENCY", "not-a-number")
+
+    async def loop_id():
+        return id(asyncio.get_running_loop())
+
+    assert run_coroutine_sync(loop_id()) == run_coroutine_sync(loop_id())
+    assert get_async_bridge() is get_async_bridge()
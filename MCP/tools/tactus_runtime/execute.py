@@ -20,6 +20,7 @@ from typing import Annotated, Any, Callable, Optional
 from fastmcp import Context, FastMCP
 from pydantic import Field
 from plexus.runtime_budget import RuntimeBudgetSpec
+from .async_bridge import run_coroutine_sync
 from plexus.attribution.actor_context import (
     apply_actor_attribution,
     apply_actor_context_to_env,
@@ -4912,28 +4913,15 @@ def _response_envelope(
     }
 
 
-def _run_async_from_sync(awaitable: Any) -> Any:
-    """Run an async FastMCP call from synchronous Tactus host-module code."""
+def _run_async_from_sync(awaitable: Any, timeout: Optional[float] = None) -> Any:
+    """Run an async FastMCP call from synchronous Tactus host-module code.
 
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.run(awaitable)
-
-    outcome: dict[str, Any] = {}
-
-    def run_in_thread() -> None:
-        try:
-            outcome["value"] = asyncio.run(awaitable)
-        except Exception as exc:  # noqa: BLE001
-            outcome["error"] = exc
-
-    thread = threading.Thread(target=run_in_thread, daemon=True)
-    thread.start()
-    thread.join()
-    if "error" in outcome:
-        raise outcome["error"]
-    return outcome.get("value")
+    Coroutines run on the process-wide bridge loop, so loop-bound clients and
+    caches are reused across tool calls instead of being rebuilt each time.
+    """
+    if timeout is None:
+        return run_coroutine_sync(awaitable)
+    return run_coroutine_sync(awaitable, timeout=timeout)
 
 
 def _stream_event_payload(event: Any) -> dict[str, Any]:
@@ -43,6 +43,16 @@ from plexus.feedback_item_explanations import (
 )
 
 from plexus.scores.LangGraphScore import LangGraphScore
+from plexus.profiling import SpanRecorder, profiled, record, recording, span
+from plexus.llm_response_cache import LLMResponseCache, caching
+from plexus.evaluation_journal import EvaluationJournal
+from plexus.adaptive_concurrency import (
+    AdaptiveConcurrencyLimiter,
+    LimiterRegistry,
+    max_concurrency_from_env,
+    model_concurrency_key,
+    run_bounded,
+)
 import inspect
 from plexus.CustomLogging import logging, setup_logging, set_log_group
 
@@ -412,6 +422,100 @@ class Evaluation:
         self.metrics_tasks = {}
         self.should_stop = False
         self.completed_scores = set()
+        # Span recorder for hot-path profiling; only created when PLEXUS_PROFILE is set.
+        self.profiler = SpanRecorder.from_env(name="evaluation")
+        # Response cache for deterministic node LLM calls; only created when PLEXUS_LLM_CACHE is set.
+        self.llm_cache = LLMResponseCache.from_env()
+        # Adaptive per-model concurrency limits for scoring, shared across scores on the same model.
+        self.concurrency_limiters = LimiterRegistry(self._create_concurrency_limiter)
+        self._scoring_executor_loop = None
+        # Local journal of completed results, opened once the evaluation ID is known.
+        self.result_journal = None
+
+    def _create_concurrency_limiter(self, model_key: str) -> AdaptiveConcurrencyLimiter:
+        initial_limit = getattr(self, 'concurrency_limit', 20)
+        max_limit = max(initial_limit, max_concurrency_from_env())
+        for score_config in getattr(getattr(self, 'scorecard', None), 'scores', None) or []:
+            if isinstance(score_config, dict) and model_concurrency_key(score_config) == model_key:
+                # A score's max_concurrency is the provider quota for its model.
+                quota = score_config.get('max_concurrency')
+                if quota:
+                    max_limit = min(max_limit, int(quota))
+                    initial_limit = min(initial_limit, max_limit)
+        return AdaptiveConcurrencyLimiter(
+            initial_limit=initial_limit,
+            max_limit=max_limit,
+            name=model_key,
+        )
+
+    def _get_result_journal(self) -> Optional[EvaluationJournal]:
+        journal = getattr(self, 'result_journal', None)
+        if journal is None:
+            # Journaling is opt-in: only runs started with --journal or --resume write one.
+            if not (getattr(self, 'journal_results', False) or getattr(self, 'resume', False)):
+                return None
+            evaluation_id = getattr(self, 'experiment_id', None)
+            if not evaluation_id or getattr(self, 'dry_run', False):
+                return None
+            journal = self.result_journal = EvaluationJournal(evaluation_id)
+        return journal
+
+    def _close_result_journal(self, completed: bool = False):
+        journal = getattr(self, 'result_journal', None)
+        if journal is None:
+            return
+        try:
+            if completed:
+                # Nothing left to resume once the evaluation has finished.
+                journal.discard()
+                self.result_journal = None
+                return
+            journal.close()
+            if journal.written:
+                logging.info(f"Journaled {journal.written} result(s) to {journal.path}")
+        except Exception as e:
+            logging.warning(f"Could not close evaluation result journal: {e}")
+
+    def _concurrency_limiter_for_score(self, score_name: str) -> AdaptiveConcurrencyLimiter:
+        score_config = None
+        for config in getattr(getattr(self, 'scorecard', None), 'scores', None) or []:
+            if isinstance(config, dict) and config.get('name') == score_name:
+                score_config = config
+                break
+        if getattr(self, 'concurrency_limiters', None) is None:
+            self.concurrency_limiters = LimiterRegistry(self._create_concurrency_limiter)
+        return self.concurrency_limiters.get(model_concurrency_key(score_config))
+
+    def _report_llm_cache(self):
+        """Log hit/miss statistics for this run's LLM response cache."""
+        llm_cache = getattr(self, "llm_cache", None)
+        if llm_cache is None:
+            return None
+        try:
+            stats = llm_cache.stats()
+        except Exception as e:
+            logging.warning(f"Could not read LLM response cache statistics: {e}")
+            return None
+        logging.info(
+            f"LLM response cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate']:.1%} hit rate), {stats['entries']} entries, "
+            f"{stats['bytes']} bytes, {stats['evictions']} evictions"
+        )
+        return stats
+
+    def _export_profile(self):
+        """Write the span summary and Chrome trace for this run to the local profile directory."""
+        profiler = getattr(self, "profiler", None)
+        if profiler is None or not len(profiler):
+            return None
+        prefix = f"evaluation-{getattr(self, 'experiment_id', None) or getattr(self, 'evaluation_id', None) or 'local'}"
+        try:
+            paths = profiler.export(prefix=prefix)
+            logging.info(f"Wrote evaluation profile to {paths['summary']} and trace to {paths['trace']}")
+            return paths
+        except Exception as e:
+            logging.warning(f"Could not write evaluation profile: {e}")
+            return None
 
     @staticmethod
     def _format_alignment_metric_value(alignment_value: Optional[float]) -> float:
@@ -572,7 +676,8 @@ class Evaluation:
     async def run(self):
         """Now this is an async function that just runs _async_run directly"""
         try:
-            return await self._async_run()
+            with recording(getattr(self, "profiler", None)), caching(getattr(self, "llm_cache", None)):
+                return await self._async_run()
         finally:
             # Signal metrics tasks to stop gracefully
             self.should_stop = True
@@ -610,6 +715,11 @@ class Evaluation:
                 
                 logging.info("Metrics task cleanup completed")
 
+            self._export_profile()
+            self._report_llm_cache()
+            self._close_result_journal()
+
+    @profiled("dashboard.update_evaluation")
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10)
@@ -743,6 +853,7 @@ class Evaluation:
             # Don't re-raise — dashboard updates must not crash scoring
             return None
 
+    @profiled("evaluation.calculate_metrics")
     def calculate_metrics(self, results):
         if not results:
             self.logging.warning("No results to calculate metrics")
@@ -1561,90 +1672,113 @@ class Evaluation:
 
         # Increase the default thread pool so dashboard logging and item scoring
         # don't compete for the same 8 threads (Python default = min(32, cpu+4)).
-        import concurrent.futures as _cf
+        # Installed once per event loop rather than on every call.
         loop = asyncio.get_running_loop()
-        loop.set_default_executor(_cf.ThreadPoolExecutor(max_workers=40))
+        if getattr(self, '_scoring_executor_loop', None) is not loop:
+            import concurrent.futures as _cf
+            loop.set_default_executor(_cf.ThreadPoolExecutor(max_workers=40))
+            self._scoring_executor_loop = loop
 
-        # Create a semaphore to limit concurrency
-        # Default to 20 concurrent operations
-        concurrency_limit = getattr(self, 'concurrency_limit', 20)
-        semaphore = asyncio.Semaphore(concurrency_limit)
+        # Concurrency adapts to the latency and throttling observed for this score's model.
+        limiter = self._concurrency_limiter_for_score(score_name)
         
         # Use an atomic counter for tracking progress
         processed_counter = 0
         total_rows = len(selected_sample_rows)
+
+        # When resuming, items already in the result journal are restored instead of re-scored.
+        journal = self._get_result_journal()
+        journaled = {}
+        if journal is not None and getattr(self, 'resume', False):
+            journaled = journal.completed_results(score_name)
+        restored = []
+        if journaled and 'content_id' in selected_sample_rows.columns:
+            for content_id in selected_sample_rows['content_id']:
+                result = journaled.pop(str(content_id), None) if content_id is not None else None
+                if result is not None:
+                    restored.append(result)
+        if restored:
+            processed_counter = len(restored)
+            self.results_by_score[score_name].extend(restored)
+            self.processed_items_by_score[score_name] = processed_counter
+            self.processed_items = sum(self.processed_items_by_score.values())
+            if tracker:
+                tracker.update(current_items=self.processed_items)
+            logging.info(f"Resuming {score_name}: restored {len(restored)} of {total_rows} result(s) from {journal.path}")
+        restored_ids = {str(result.get('content_id')) for result in restored}
+
+        def rows_to_score():
+            for idx, (index, row) in enumerate(selected_sample_rows.iterrows()):
+                if restored_ids and str(row.get('content_id')) in restored_ids:
+                    continue
+                yield idx, (index, row)
         
         # Add counter for ScoreResult creation attempts
         self.scoreresult_creation_attempts = getattr(self, 'scoreresult_creation_attempts', 0)
         self.scoreresult_creation_successes = getattr(self, 'scoreresult_creation_successes', 0)
         self.scoreresult_creation_failures = getattr(self, 'scoreresult_creation_failures', 0)
         
-        async def process_text(row, idx):
-            async with semaphore:  # This ensures only N concurrent operations
-                try:
-                    result = await self.score_text(row, score_name)
-                    if result:
-                        # Use nonlocal to modify the counter from within the nested function
-                        nonlocal processed_counter
-                        processed_counter += 1
-                        
-                        # Store result in order received
-                        self.results_by_score[score_name].append(result)
-                        self.processed_items_by_score[score_name] = processed_counter
-                        self.processed_items = sum(self.processed_items_by_score.values())
-                        
-                        # Update tracker with actual count of processed items
-                        # Note: Don't put the count in the status message — the progress bar
-                        # already shows it, and the message text lags due to API throttling.
-                        if tracker:
-                            tracker.update(current_items=self.processed_items)
-                        
-                        # Start metrics task if needed
-                        is_final_result = processed_counter == total_rows
-                        await self.maybe_start_metrics_task(score_name, is_final_result)
-                        
-                        return result
-                except Exception as e:
-                    # Enhanced error logging with more context
-                    error_context = {
-                        'score_name': score_name,
-                        'text_index': idx,
-                        'content_id': row.get('content_id', 'unknown'),
-                        'text_preview': str(row.get('text', ''))[:100] + '...' if row.get('text') else 'No text',
-                        'error_type': type(e).__name__,
-                        'error_message': str(e),
-                        'traceback': traceback.format_exc()
-                    }
-                    logging.error(f"Error processing text at index {idx} for {score_name}: {e}")
-                    logging.error(f"Error context: {json.dumps(error_context, indent=2)}")
+        async def process_text(indexed_row):
+            idx, (_, row) = indexed_row
+            try:
+                result = await self.score_text(row, score_name)
+                if result:
+                    # Use nonlocal to modify the counter from within the nested function
+                    nonlocal processed_counter
+                    processed_counter += 1
+                    
+                    # Store result in order received
+                    self.results_by_score[score_name].append(result)
+                    if journal is not None:
+                        journal.append(score_name, result)
+                    self.processed_items_by_score[score_name] = processed_counter
+                    self.processed_items = sum(self.processed_items_by_score.values())
                     
-                    # For NoneType iteration errors, provide specific guidance
-                    if 'NoneType' in str(e) and 'iterable' in str(e):
-                        logging.error("DEBUGGING TIP: This error usually occurs when None is used with 'in' operator or iteration")
-                        logging.error("Check for None values in metadata, score parameters, or workflow state")
+                    # Update tracker with actual count of processed items
+                    # Note: Don't put the count in the status message — the progress bar
+                    # already shows it, and the message text lags due to API throttling.
+                    if tracker:
+                        tracker.update(current_items=self.processed_items)
                     
-                    raise
+                    # Start metrics task if needed
+                    is_final_result = processed_counter == total_rows
+                    await self.maybe_start_metrics_task(score_name, is_final_result)
+                    
+                    return result
+            except Exception as e:
+                # Enhanced error logging with more context
+                error_context = {
+                    'score_name': score_name,
+                    'text_index': idx,
+                    'content_id': row.get('content_id', 'unknown'),
+                    'text_preview': str(row.get('text', ''))[:100] + '...' if row.get('text') else 'No text',
+                    'error_type': type(e).__name__,
+                    'error_message': str(e),
+                    'traceback': traceback.format_exc()
+                }
+                logging.error(f"Error processing text at index {idx} for {score_name}: {e}")
+                logging.error(f"Error context: {json.dumps(error_context, indent=2)}")
+                
+                # For NoneType iteration errors, provide specific guidance
+                if 'NoneType' in str(e) and 'iterable' in str(e):
+                    logging.error("DEBUGGING TIP: This error usually occurs when None is used with 'in' operator or iteration")
+                    logging.error("Check for None values in metadata, score parameters, or workflow state")
+                
+                raise
 
-        # Create tasks for all rows but process them with controlled concurrency
-        tasks = [
-            asyncio.create_task(process_text(row, idx))
-            for idx, (_, row) in enumerate(selected_sample_rows.iterrows())
-        ]
-        
-        results = []
-        try:
-            for task in asyncio.as_completed(tasks):
-                result = await task
-                if result:
-                    results.append(result)
-        except Exception:
-            for pending_task in tasks:
-                if not pending_task.done():
-                    pending_task.cancel()
-            await asyncio.gather(*tasks, return_exceptions=True)
-            raise
+        # Tasks are created lazily, so at most `limiter.limit` rows are in flight or pending.
+        if restored and processed_counter == total_rows:
+            await self.maybe_start_metrics_task(score_name, is_final_result=True)
 
-        return results
+        results = restored + await run_bounded(
+            limiter,
+            rows_to_score(),
+            process_text,
+            on_wait=lambda waited: record("evaluation.queue_wait", waited, score=score_name),
+        )
+        logging.info(f"Scoring concurrency for {score_name} ({limiter.name}): {limiter.snapshot()}")
+
+        return [result for result in results if result]
 
     async def maybe_start_metrics_task(self, score_name: str, is_final_result: bool = False):
         """Start a metrics computation task if one isn't running, or if this is the final result"""
@@ -1858,6 +1992,15 @@ class Evaluation:
                         if not isinstance(metadata, dict):
                             metadata = {}
                         metadata["cost_details"] = cost_details
+                        profiler = getattr(self, "profiler", None)
+                        if profiler is not None and len(profiler):
+                            metadata["profile"] = profiler.summary()
+                        llm_cache = getattr(self, "llm_cache", None)
+                        if llm_cache is not None:
+                            metadata["llm_cache"] = llm_cache.stats()
+                        concurrency_limiters = getattr(self, "concurrency_limiters", None)
+                        if concurrency_limiters:
+                            metadata["concurrency"] = concurrency_limiters.snapshot()
                         existing_parameters["metadata"] = metadata
                         update_input["parameters"] = json.dumps(existing_parameters)
                         self.parameters = existing_parameters
@@ -2333,6 +2476,7 @@ Total cost:       ${expenses['total_cost']:.6f}
 
         return report
 
+    @profiled("evaluation.score_text")
     async def score_text(self, row, score_name: str = None):
         """Score text with retry logic for handling timeouts and request exceptions"""
         max_attempts = 5
@@ -2369,7 +2513,8 @@ Total cost:       ${expenses['total_cost']:.6f}
                 if item_id:
                     try:
                         from plexus.dashboard.api.models.item import Item
-                        item = await asyncio.to_thread(Item.get_by_id, item_id, item_client) if item_client else None
+                        with span("dashboard.fetch_item"):
+                            item = await asyncio.to_thread(Item.get_by_id, item_id, item_client) if item_client else None
                         if not item_client:
                             logging.warning(f"No dashboard client available to fetch Item {item_id}")
                         elif not item:
@@ -2675,6 +2820,7 @@ Total cost:       ${expenses['total_cost']:.6f}
                 delay = min(base_delay * (2 ** attempt), max_delay)
                 logging.info(f"Attempt {attempt + 1} failed for content_id {row.get('content_id')} with error: {e}. Retrying in {delay} seconds...")
                 await asyncio.sleep(delay)
+                record("evaluation.retry_backoff", delay, attempt=attempt + 1)
 
         # If loop completes without returning (e.g., all attempts failed but didn't hit max_attempts check correctly)
         logging.error(f"Scoring loop completed for content_id {row.get('content_id')} without returning a result or error after {max_attempts} attempts.")
@@ -2692,6 +2838,7 @@ Total cost:       ${expenses['total_cost']:.6f}
             'human_labels': {}
         }
 
+    @profiled("dashboard.create_score_result")
     async def _create_score_result(self, *, score_result, content_id, result, feedback_item_id=None):
         """Create a score result in the dashboard."""
         logging.info(f"DEBUG: _create_score_result called for content_id={content_id}")
@@ -4128,6 +4275,16 @@ class FeedbackEvaluation(Evaluation):
                 rubric_memory_state_from_item_context,
                 resolve_final_output_classes_from_yaml_text,
             )
+            from plexus.rca_pipeline import (
+                RcaAnalysisCache,
+                RcaTaskPool,
+                analyze_score_result_cached,
+                gather_with_progress,
+                prefetch_item_contexts,
+            )
+
+            rca_pool = RcaTaskPool()
+            rca_cache = RcaAnalysisCache()
 
             # Fetch score context once so item-level misclassification classification can be
             # included in pre-clustering text and reused for post-cluster synthesis.
@@ -4137,9 +4294,10 @@ class FeedbackEvaluation(Evaluation):
             class_resolution_source = ""
             scorecard_guidance_text = ""
             dashboard_client = getattr(self, "dashboard_client", None)
+            # Resolved once and reused to version the RCA analysis memo keys.
+            score_version_id_for_context = getattr(self, "score_version_id", None)
             if dashboard_client and getattr(self, 'score_id', None):
                 try:
-                    score_version_id_for_context = getattr(self, "score_version_id", None)
                     if not score_version_id_for_context:
                         _sq = """query($id: ID!) { getScore(id: $id) { championVersionId } }"""
                         _sr = dashboard_client.execute(_sq, {'id': self.score_id})
@@ -4210,62 +4368,16 @@ class FeedbackEvaluation(Evaluation):
             rca_item_failures = []
             item_context_cache = {}
             if dashboard_client:
-                from plexus.dashboard.api.models.item import Item as DashboardItem
-
                 all_item_ids = sorted({fi.itemId for fi in candidate_items if getattr(fi, "itemId", None)})
-
-                async def _fetch_item_context(item_id: str):
-                    try:
-                        item = await asyncio.to_thread(
-                            DashboardItem.get_by_id, item_id, dashboard_client
-                        )
-                        if not item:
-                            return item_id, {
-                                "primary_input": "",
-                                "metadata_snapshot": "",
-                                "primary_input_modality": "unknown",
-                                "primary_input_fetch_error": True,
-                            }
-                        raw_metadata = getattr(item, "metadata", None)
-                        metadata_snapshot = ""
-                        if raw_metadata:
-                            if isinstance(raw_metadata, str):
-                                metadata_snapshot = raw_metadata
-                            else:
-                                try:
-                                    metadata_snapshot = json.dumps(raw_metadata)
-                                except TypeError:
-                                    metadata_snapshot = str(raw_metadata)
-                        primary_input = item.text or ""
-                        if primary_input:
-                            primary_input_modality = "text"
-                        elif metadata_snapshot:
-                            primary_input_modality = "structured"
-                        else:
-                            primary_input_modality = "unknown"
-                        return item_id, {
-                            "primary_input": primary_input,
-                            "metadata_snapshot": metadata_snapshot,
-                            "primary_input_modality": primary_input_modality,
-                            "primary_input_fetch_error": False,
-                        }
-                    except Exception as exc:
-                        self.logger.debug("Item context fetch failed for %s: %s", item_id, exc)
-                        return item_id, {
-                            "primary_input": "",
-                            "metadata_snapshot": "",
-                            "primary_input_modality": "unknown",
-                            "primary_input_fetch_error": True,
-                        }
-
                 if all_item_ids:
                     _update_status(f"Hydrating item context for {len(all_item_ids)} candidate item(s)...")
-                    fetched_context = await asyncio.gather(*[_fetch_item_context(iid) for iid in all_item_ids])
-                    item_context_cache = {iid: payload for iid, payload in fetched_context}
+                    item_context_cache = await prefetch_item_contexts(all_item_ids, dashboard_client)
 
             # Process all candidate items in parallel — the per-item RCA work
-            # (2 Bedrock LLM calls each) is the main bottleneck when done sequentially.
-            rca_sem = asyncio.Semaphore(3)
+            # (2 LLM calls each) is the main bottleneck when done sequentially.
+            # LLM calls go through the shared pool, which bounds concurrency and
+            # backs off on rate limits.
+            rca_sem = asyncio.Semaphore(rca_pool.max_concurrency)
 
             async def _process_single_candidate(fi):
                 """Process one candidate item: build context, extract evidence, classify, explain."""
@@ -4397,7 +4509,7 @@ class FeedbackEvaluation(Evaluation):
                         item_id=fi.itemId or "",
                         score_id=getattr(self, "score_id", "") or "",
                         scorecard_id=getattr(self, "scorecard_id", "") or "",
-                        score_version_id=getattr(self, "score_version_id", "") or "",
+                        score_version_id=score_version_id_for_context or "",
                         predicted_value=metadata.get("initial_answer_value", "") or "",
                         correct_value=metadata.get("final_answer_value", "") or "",
                         score_explanation=metadata.get("score_explanation", "") or "",
@@ -4420,7 +4532,7 @@ class FeedbackEvaluation(Evaluation):
                     )
                     rca_failure = None
                     try:
-                        misclassification_evidence_flags = await asyncio.to_thread(
+                        misclassification_evidence_flags = await rca_pool.run(
                             extract_misclassification_evidence_flags,
                             item_context=misclassification_item_context,
                         )
@@ -4450,7 +4562,7 @@ class FeedbackEvaluation(Evaluation):
 
                     if rca_failure is None:
                         try:
-                            triage_explainer = await asyncio.to_thread(
+                            triage_explainer = await rca_pool.run(
                                 explain_misclassification_item_classification,
                                 item_context=misclassification_item_context,
                                 classification=misclassification_classification,
@@ -4594,19 +4706,14 @@ class FeedbackEvaluation(Evaluation):
 
                     return timestamped, canonical_row, item_failure_diagnostics
 
-            _rca_completed = [0]  # mutable counter for closure
-            _rca_total = len(candidate_items)
-
-            async def _process_candidate_with_progress(fi):
-                result = await _process_single_candidate(fi)
-                _rca_completed[0] += 1
-                _update_status(f"Classifying misclassified items ({_rca_completed[0]}/{_rca_total})...")
-                return result
-
-            _update_status(f"Classifying {_rca_total} misclassified items...")
-            rca_results = await asyncio.gather(*[
-                _process_candidate_with_progress(fi) for fi in candidate_items
-            ], return_exceptions=True)
+            _update_status(f"Classifying {len(candidate_items)} misclassified items...")
+            rca_results = await gather_with_progress(
+                [_process_single_candidate(fi) for fi in candidate_items],
+                on_progress=lambda done, total: _update_status(
+                    f"Classifying misclassified items ({done}/{total})..."
+                ),
+                return_exceptions=True,
+            )
             rca_errors = 0
             for result in rca_results:
                 if isinstance(result, Exception):
@@ -4686,29 +4793,6 @@ class FeedbackEvaluation(Evaluation):
             )
             _update_status(f"Analyzing {len(transcript_cache)} exemplar input artifact(s)...")
 
-            def _detailed_analysis(primary_input: str, predicted: str, correct: str,
-                                   explanation: str, topic_label: str,
-                                   score_guidelines: str = "", score_yaml_code: str = "") -> tuple:
-                """Run a two-turn Bedrock Haiku conversation per exemplar.
-
-                Delegates to plexus.rca_analysis.analyze_score_result() for DRY reuse
-                with the plexus_score_result_investigate MCP tool.
-
-                Returns (detailed_cause, suggested_fix):
-                  - detailed_cause: why the AI prediction was wrong (2-4 sentences)
-                  - suggested_fix: one concrete score code change to prevent this error
-                """
-                from plexus.rca_analysis import analyze_score_result
-                return analyze_score_result(
-                    primary_input=primary_input,
-                    predicted=predicted,
-                    correct=correct,
-                    explanation=explanation,
-                    topic_label=topic_label,
-                    score_guidelines=score_guidelines,
-                    score_yaml_code=score_yaml_code,
-                )
-
             _HAIKU_MODEL = CLAUDE_HAIKU_45_MODEL_ID
 
             def _bedrock_converse(system: str, messages: list, max_tokens: int = 1000) -> str:
@@ -4940,9 +5024,18 @@ class FeedbackEvaluation(Evaluation):
                         predicted = ex.metadata.get("initial_answer_value", "")
                         correct = ex.metadata.get("final_answer_value", "")
                         explanation = ex.metadata.get("score_explanation", "")
-                        detailed_cause, suggested_fix = await asyncio.to_thread(
-                            _detailed_analysis, transcript, predicted, correct,
-                            explanation, tr.label, score_guidelines, score_yaml_code
+                        detailed_cause, suggested_fix = await analyze_score_result_cached(
+                            rca_pool,
+                            rca_cache,
+                            item_id=item_id,
+                            score_version_id=score_version_id_for_context or "",
+                            primary_input=transcript,
+                            predicted=predicted,
+                            correct=correct,
+                            explanation=explanation,
+                            topic_label=tr.label,
+                            score_guidelines=score_guidelines,
+                            score_yaml_code=score_yaml_code,
                         )
 
                     if canonical_row:
@@ -5013,18 +5106,19 @@ class FeedbackEvaluation(Evaluation):
                     "score_fix_candidate_count": len(score_fix_exemplars),
                 }
 
-            _topics_completed = [0]
-
-            async def _process_topic_with_progress(topic_idx, tr):
-                result = await _process_topic(topic_idx, tr)
-                _topics_completed[0] += 1
-                _update_status(f"Analyzing topics ({_topics_completed[0]}/{num_topics})...")
-                return result
-
             _update_status(f"Analyzing {num_topics} topic(s)...")
-            topics = list(await asyncio.gather(
-                *[_process_topic_with_progress(i, tr) for i, tr in enumerate(result.topics)]
-            ))
+            topics = await gather_with_progress(
+                [_process_topic(i, tr) for i, tr in enumerate(result.topics)],
+                on_progress=lambda done, total: _update_status(
+                    f"Analyzing topics ({done}/{total})..."
+                ),
+            )
+            if rca_cache.hits:
+                self.logger.info(
+                    "RCA: reused %d cached exemplar analysis(es), ran %d",
+                    rca_cache.hits,
+                    rca_cache.misses,
+                )
 
             # Post-loop: generate distinct topic titles informed by the detailed explanations.
             # Must remain sequential to avoid duplicate titles (each call knows prior titles).
@@ -5104,7 +5198,6 @@ class FeedbackEvaluation(Evaluation):
         """Run RCA summarization for small incorrect sets (<5 items)."""
         from datetime import datetime, timezone as _tz
         from plexus.rca_analysis import (
-            analyze_score_result,
             build_misclassification_classification_contract,
             build_misclassification_analysis_summary,
             build_misclassification_item_context,
@@ -5116,6 +5209,12 @@ class FeedbackEvaluation(Evaluation):
             rubric_memory_state_from_item_context,
             resolve_final_output_classes_from_yaml_text,
         )
+        from plexus.rca_pipeline import (
+            RcaAnalysisCache,
+            RcaTaskPool,
+            analyze_score_result_cached,
+            prefetch_item_contexts,
+        )
 
         def _update_status(msg: str):
             self.logger.info(f"RCA: {msg}")
@@ -5143,9 +5242,10 @@ class FeedbackEvaluation(Evaluation):
             )
 
         dashboard_client = getattr(self, "dashboard_client", None)
+        # Resolved once and reused to version the RCA analysis memo keys.
+        score_version_id_for_context = getattr(self, "score_version_id", None)
         if dashboard_client and getattr(self, "score_id", None):
             try:
-                score_version_id_for_context = getattr(self, "score_version_id", None)
                 if not score_version_id_for_context:
                     _sq = """query($id: ID!) { getScore(id: $id) { championVersionId } }"""
                     _sr = dashboard_client.execute(_sq, {"id": self.score_id})
@@ -5231,64 +5331,19 @@ class FeedbackEvaluation(Evaluation):
 
         item_context_cache = {}
         if dashboard_client:
-            from plexus.dashboard.api.models.item import Item as DashboardItem
-
             item_ids = [ex.get("item_id") for ex in exemplars if ex.get("item_id")]
+            item_context_cache = await prefetch_item_contexts(item_ids, dashboard_client)
 
-            async def _fetch_item_context(item_id: str):
-                try:
-                    item = await asyncio.to_thread(
-                        DashboardItem.get_by_id, item_id, dashboard_client
-                    )
-                    if not item:
-                        return item_id, {
-                            "primary_input": "",
-                            "metadata_snapshot": "",
-                            "primary_input_modality": "unknown",
-                            "primary_input_fetch_error": True,
-                        }
-                    raw_metadata = getattr(item, "metadata", None)
-                    metadata_snapshot = ""
-                    if raw_metadata:
-                        if isinstance(raw_metadata, str):
-                            metadata_snapshot = raw_metadata
-                        else:
-                            try:
-                                metadata_snapshot = json.dumps(raw_metadata)
-                            except TypeError:
-                                metadata_snapshot = str(raw_metadata)
-                    primary_input = item.text or ""
-                    if primary_input:
-                        modality = "text"
-                    elif metadata_snapshot:
-                        modality = "structured"
-                    else:
-                        modality = "unknown"
-                    return item_id, {
-                        "primary_input": primary_input,
-                        "metadata_snapshot": metadata_snapshot,
-                        "primary_input_modality": modality,
-                        "primary_input_fetch_error": False,
-                    }
-                except Exception as exc:
-                    self.logger.debug("Item context fetch failed for %s: %s", item_id, exc)
-                    return item_id, {
-                        "primary_input": "",
-                        "metadata_snapshot": "",
-                        "primary_input_modality": "unknown",
-                        "primary_input_fetch_error": True,
-                    }
-
-            fetched = await asyncio.gather(*[_fetch_item_context(iid) for iid in item_ids])
-            item_context_cache = {iid: payload for iid, payload in fetched}
-
-        for ex in exemplars[:max_summarization_exemplars]:
+        async def _analyze_exemplar(ex):
             item_context_record = item_context_cache.get(ex.get("item_id"))
             primary_input = item_context_record.get("primary_input") if item_context_record else ""
             if not primary_input:
-                continue
-            detailed_cause, suggested_fix = await asyncio.to_thread(
-                analyze_score_result,
+                return
+            detailed_cause, suggested_fix = await analyze_score_result_cached(
+                rca_pool,
+                rca_cache,
+                item_id=ex.get("item_id") or "",
+                score_version_id=score_version_id_for_context or "",
                 primary_input=primary_input,
                 predicted=ex.get("initial_answer_value", ""),
                 correct=ex.get("final_answer_value", ""),
@@ -5301,6 +5356,12 @@ class FeedbackEvaluation(Evaluation):
                 ex["detailed_cause"] = detailed_cause
             if suggested_fix:
                 ex["suggested_fix"] = suggested_fix
+
+        rca_pool = RcaTaskPool()
+        rca_cache = RcaAnalysisCache()
+        await asyncio.gather(*[
+            _analyze_exemplar(ex) for ex in exemplars[:max_summarization_exemplars]
+        ])
         rca_item_failures = []
         for ex in exemplars:
             item_failure_diagnostics = []
@@ -5370,7 +5431,7 @@ class FeedbackEvaluation(Evaluation):
                 item_id=ex.get("item_id", ""),
                 score_id=getattr(self, "score_id", "") or "",
                 scorecard_id=getattr(self, "scorecard_id", "") or "",
-                score_version_id=getattr(self, "score_version_id", "") or "",
+                score_version_id=score_version_id_for_context or "",
                 predicted_value=ex.get("initial_answer_value", "") or "",
                 correct_value=ex.get("final_answer_value", "") or "",
                 score_explanation=ex.get("score_explanation", "") or "",
@@ -5634,7 +5695,7 @@ class FeedbackEvaluation(Evaluation):
         }
 
 class AccuracyEvaluation(Evaluation):
-    def __init__(self, *, override_folder: Optional[str] = None, labeled_samples: list = None, labeled_samples_filename: str = None, score_id: str = None, score_version_id: str = None, visualize: bool = False, task_id: str = None, evaluation_id: str = None, account_id: str = None, account_key: str = None, scorecard_id: str = None, skip_local_reports: bool = False, rca_pending: bool = False, **kwargs):
+    def __init__(self, *, override_folder: Optional[str] = None, labeled_samples: list = None, labeled_samples_filename: str = None, score_id: str = None, score_version_id: str = None, visualize: bool = False, task_id: str = None, evaluation_id: str = None, account_id: str = None, account_key: str = None, scorecard_id: str = None, skip_local_reports: bool = False, rca_pending: bool = False, resume: bool = False, journal_results: bool = False, **kwargs):
         # Store evaluation_id BEFORE calling super().__init__ so parent can use it
         self.evaluation_id = evaluation_id
         # Store scorecard_id before calling super().__init__
@@ -5665,6 +5726,8 @@ class AccuracyEvaluation(Evaluation):
         self.should_stop = False
         self.completed_scores = set()  # Track which scores have completed all their results
         self.rca_pending = rca_pending  # When True, suppress autonomous COMPLETED — outer code owns the final write
+        self.resume = resume  # Restore completed items from the local result journal instead of re-scoring them
+        self.journal_results = journal_results  # Journal completed results locally so an interrupted run can be resumed
         self.override_data = {}  # Initialize empty override data dictionary
         self.logger = logging.getLogger('plexus/evaluation')  # Add dedicated logger
         
@@ -5787,7 +5850,9 @@ class AccuracyEvaluation(Evaluation):
         # Scorecard and Score IDs are now set during initialization and should already be updated in the evaluation record
 
         try:
-            returned_metrics = await self._run_evaluation(tracker)
+            with recording(getattr(self, "profiler", None)), caching(getattr(self, "llm_cache", None)):
+                returned_metrics = await self._run_evaluation(tracker)
+            self._close_result_journal(completed=True)
             return returned_metrics
         except Exception as e:
             self.logging.error(f"Error during AccuracyEvaluation.run: {e}", exc_info=True)
@@ -5823,17 +5888,34 @@ class AccuracyEvaluation(Evaluation):
                         await asyncio.wait(pending, timeout=10.0)
                     except Exception:
                         pass
+            self._export_profile()
+            self._report_llm_cache()
+            self._close_result_journal()
 
     async def _run_evaluation(self, tracker):
         try:
             # Use labeled_samples that were provided during AccuracyEvaluation construction
             import pandas as pd
             df = None
+            sampling_method = self.sampling_method
 
             # Check if we have labeled_samples from the constructor
             if self.labeled_samples:
                 df = pd.DataFrame(self.labeled_samples)
                 self.logging.info(f"Using {len(df)} labeled samples provided to AccuracyEvaluation")
+            elif self.labeled_samples_filename and str(self.labeled_samples_filename).lower().endswith('.parquet'):
+                # Stream the file and materialize only the sampled rows
+                from plexus.data.StreamingParquetReader import StreamingParquetReader
+                reader = StreamingParquetReader(self.labeled_samples_filename)
+                sample_size = min(reader.num_rows, self.requested_sample_size)
+                if self.sampling_method == 'random':
+                    df = reader.sample_dataframe(sample_size, random_state=self.random_seed)
+                elif self.sampling_method == 'sequential':
+                    df = reader.head_dataframe(sample_size)
+                else:
+                    df = reader.read_dataframe()
+                self.logging.info(f"Loaded {len(df)} of {reader.num_rows} samples from file: {self.labeled_samples_filename}")
+                sampling_method = 'provided'  # already sampled while streaming
             elif self.labeled_samples_filename:
                 df = pd.read_csv(self.labeled_samples_filename)
                 self.logging.info(f"Loaded {len(df)} samples from file: {self.labeled_samples_filename}")
@@ -5880,16 +5962,18 @@ class AccuracyEvaluation(Evaluation):
             self.logging.info(f"Adjusted sample size from {self.requested_sample_size} to {self.number_of_texts_to_sample} based on available data")
 
             # Sample rows based on the sampling method
-            if self.sampling_method == 'random':
+            if sampling_method == 'random':
                 selected_sample_rows = df.sample(n=self.number_of_texts_to_sample, random_state=self.random_seed)
-            elif self.sampling_method == 'sequential':
+            elif sampling_method == 'sequential':
                 selected_sample_rows = df.head(self.number_of_texts_to_sample)
-            elif self.sampling_method == 'provided':
+            elif sampling_method == 'provided':
                 # Samples are already provided and pre-processed, use them as-is
                 selected_sample_rows = df
                 self.logging.info(f"Using {len(df)} provided samples without additional sampling")
             else:
                 selected_sample_rows = df
+            # Don't keep the unsampled rows (and their text) alive while scoring
+            del df
 
             # Update tracker for start of processing (stage already advanced by caller)
             if tracker:
@@ -21,6 +21,9 @@ except ImportError:
 
 from plexus.CustomLogging import logging
 from plexus.bedrock_models import CLAUDE_HAIKU_45_MODEL_ID
+from plexus.llm_response_cache import ACTIVE_RESPONSE_CACHE, is_deterministic
+from plexus.adaptive_concurrency import report_throttle
+from plexus.utils.rate_limits import is_rate_limit_error
 
 from langchain_community.chat_models import ChatVertexAI
 
@@ -48,6 +51,9 @@ class LangChainUser:
 
     MAX_RETRY_ATTEMPTS = 20
 
+    # Subclasses opt in to the per-run LLM response cache (see plexus.llm_response_cache).
+    RESPONSE_CACHE_ENABLED = False
+
     def _create_token_counter(self):
         """
         Create and return a token counter callback.
@@ -127,6 +133,10 @@ class LangChainUser:
                     )
                 except Exception:
                     pass
+                # The model's own retries absorb throttling errors, so report each
+                # throttled attempt to the evaluation's adaptive concurrency limiter.
+                if is_rate_limit_error(error):
+                    report_throttle()
 
             def on_chain_end(self, outputs, **kwargs):
                 logging.info(f"Chain ended. Cumulative token usage - Prompt: {self.prompt_tokens}, Completion: {self.completion_tokens}, Total: {self.total_tokens}, Cached: {self.cached_tokens}")
@@ -302,6 +312,12 @@ class LangChainUser:
             callbacks = [self.token_counter]
         else:
             raise ValueError(f"Unsupported model provider: {params.model_provider}")
+
+        # Deterministic calls can be served from the active response cache, if any.
+        if self.RESPONSE_CACHE_ENABLED and is_deterministic(
+            params.model_provider, params.model_name, params.temperature
+        ):
+            base_model.cache = ACTIVE_RESPONSE_CACHE
         
         # Configure retry logic
         model_with_retry = base_model.with_retry(
@@ -12,8 +12,14 @@ from ruamel.yaml import YAML
 from datetime import datetime
 
 from plexus.Registries import ScoreRegistry
+from plexus.profiling import profiled, span
 from plexus.Registries import scorecard_registry
 from plexus.scores.Score import Score
+from plexus.scores.core.PredictionBatcher import (
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_WAIT_SECONDS,
+    PredictionBatcher,
+)
 from plexus.plexus_logging.Cloudwatch import CloudWatchLogger
 from plexus.scores.LangGraphScore import BatchProcessingPause, LangGraphScore
 
@@ -92,6 +98,8 @@ class Scorecard:
         self.cost_components = []
         # Track how many texts have been processed by this scorecard instance
         self.number_of_texts_processed = 0
+        # Shared instances and micro-batchers for scores with a native predict_batch
+        self._prediction_batchers = {}
 
         self.cloudwatch_logger = CloudWatchLogger()
         # Optional preference to load only from local YAML files (no API)
@@ -421,6 +429,31 @@ class Scorecard:
                 yaml_file_path = os.path.join(directory_path, file_name)
                 cls.create_from_yaml(yaml_file_path)
 
+    def _get_prediction_batcher(self, score, score_class, score_configuration):
+        """
+        Return the shared score instance and micro-batcher for a score whose class
+        implements ``predict_batch``.
+
+        Local-model scores are loaded once per scorecard and concurrent predictions
+        for them are grouped into batches instead of running one inference call per
+        item. ``max_batch_size`` and ``max_batch_wait_seconds`` in the score
+        configuration tune the batcher.
+        """
+        batcher = self._prediction_batchers.get(score)
+        if batcher is None:
+            batcher = PredictionBatcher(
+                score_class(**score_configuration),
+                max_batch_size=score_configuration.get(
+                    "max_batch_size", DEFAULT_MAX_BATCH_SIZE
+                ),
+                max_wait_seconds=score_configuration.get(
+                    "max_batch_wait_seconds", DEFAULT_MAX_WAIT_SECONDS
+                ),
+            )
+            self._prediction_batchers[score] = batcher
+        return batcher
+
+    @profiled("scorecard.get_score_result")
     async def get_score_result(
         self, *, scorecard, score, text, metadata, modality, results, item=None
     ):
@@ -503,7 +536,19 @@ class Scorecard:
                 {"scorecard_name": scorecard, "score_name": score}
             )
 
-            score_instance = await score_class.create(**score_configuration)
+            prediction_batcher = None
+            with span("score.load", score=score):
+                if (
+                    isinstance(score_class, type)
+                    and issubclass(score_class, Score)
+                    and score_class.supports_batch_prediction()
+                ):
+                    prediction_batcher = self._get_prediction_batcher(
+                        score, score_class, score_configuration
+                    )
+                    score_instance = prediction_batcher.score
+                else:
+                    score_instance = await score_class.create(**score_configuration)
 
             if score_instance is None:
                 logging.error(
@@ -579,9 +624,10 @@ class Scorecard:
                         input_source = InputSourceFactory.create_input_source(
                             source_class, **source_options
                         )
-                        score_input = input_source.extract(
-                            item
-                        )  # May raise ValueError or other exceptions
+                        with span("input_source.extract", source=source_class):
+                            score_input = input_source.extract(
+                                item
+                            )  # May raise ValueError or other exceptions
                         text = score_input.text
                         if score_input.metadata:
                             metadata = {
@@ -623,14 +669,15 @@ class Scorecard:
                 if processors_config:
                     try:
                         original_text_preview = text[:100] if text else ""
-                        processed_input = Score.apply_processors(
-                            Score.Input(
-                                text=text,
-                                metadata=metadata or {},
-                                results=converted_results,
-                            ),
-                            processors_config,
-                        )
+                        with span("processors", score=score):
+                            processed_input = Score.apply_processors(
+                                Score.Input(
+                                    text=text,
+                                    metadata=metadata or {},
+                                    results=converted_results,
+                                ),
+                                processors_config,
+                            )
                         processed_text = processed_input.text
                         processed_text_preview = (
                             processed_text[:100] if processed_text else ""
@@ -665,12 +712,16 @@ class Scorecard:
                         )
 
                     # Let BatchProcessingPause propagate up
-                    score_result = await score_instance.predict(
-                        context=None,
-                        model_input=Score.Input(
-                            text=text, metadata=metadata, results=converted_results
-                        ),
+                    model_input = Score.Input(
+                        text=text, metadata=metadata, results=converted_results
                     )
+                    with span("score.predict", score=score):
+                        if prediction_batcher is not None:
+                            score_result = await prediction_batcher.predict(model_input)
+                        else:
+                            score_result = await score_instance.predict(
+                                context=None, model_input=model_input
+                            )
                 except TypeError as te:
                     if "NoneType" in str(te) and "iterable" in str(te):
                         error_msg = (
@@ -809,7 +860,8 @@ class Scorecard:
                 )
                 raise
             finally:
-                if hasattr(score_instance, "cleanup"):
+                # Batched score instances are shared across calls and stay loaded
+                if prediction_batcher is None and hasattr(score_instance, "cleanup"):
                     try:
                         await score_instance.cleanup()
                     except Exception as cleanup_error:
@@ -826,6 +878,7 @@ class Scorecard:
                 )
             ]
 
+    @profiled("scorecard.score_entire_text")
     async def score_entire_text(
         self,
         *,
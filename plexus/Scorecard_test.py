@@ -799,5 +799,52 @@ class TestScorecard:
         assert result[0].value == 'Pass'
         cleanup_mock.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_get_score_result_batches_scores_with_native_predict_batch(self):
+        """Scores implementing predict_batch share one instance and are scored in batches."""
+        import asyncio
+        from plexus.scores.Score import Score
+
+        class LocalModelScore(Score):
+            instances = 0
+
+            def __init__(self, **parameters):
+                super().__init__(**parameters)
+                LocalModelScore.instances += 1
+                self.batch_sizes = []
+
+            def predict(self, context, model_input):
+                return self.predict_batch(context, [model_input])[0]
+
+            def predict_batch(self, context, model_inputs):
+                self.batch_sizes.append(len(model_inputs))
+                return [
+                    Score.Result(parameters=self.parameters, value="Yes")
+                    for _ in model_inputs
+                ]
+
+        config = {'name': 'LocalScore', 'id': 1, 'max_batch_wait_seconds': 0.05}
+        self.scorecard.properties = {'name': 'TestScorecard', 'scores': [config]}
+        self.mock_registry.get_properties.side_effect = lambda score_name: dict(config)
+        self.mock_registry.get.side_effect = lambda score_name: LocalModelScore
+
+        results = await asyncio.gather(*(
+            Scorecard.get_score_result(
+                self.scorecard,
+                scorecard='TestScorecard',
+                score='LocalScore',
+                text=f'Sample text {i}',
+                metadata={},
+                modality='test',
+                results=[],
+            )
+            for i in range(3)
+        ))
+
+        assert [result[0].value for result in results] == ['Yes', 'Yes', 'Yes']
+        assert LocalModelScore.instances == 1
+        batcher = self.scorecard._prediction_batchers['LocalScore']
+        assert batcher.score.batch_sizes == [3]
+
 if __name__ == '__main__':
     pytest.main()
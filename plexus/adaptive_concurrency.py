@@ -0,0 +1,299 @@
+"""
+Adaptive concurrency control for evaluation scoring.
+
+A fixed concurrency limit either gets throttled by the provider or leaves most
+of its rate limit unused, depending on the model behind a score.
+``AdaptiveConcurrencyLimiter`` instead adjusts the limit while the evaluation
+runs (additive increase, multiplicative decrease):
+
+* each completed round of calls without congestion raises the limit by one;
+* a throttling error (HTTP 429, Bedrock ``ThrottlingException``) halves it;
+* when short-term latency rises well above the long-term average -- the usual
+  sign that requests are queueing or being retried by the client -- the limit
+  is reduced by ``latency_decrease_factor``.
+
+Limits never leave ``[min_limit, max_limit]``; ``max_limit`` is the per-model
+quota. Limiters are shared per model through ``LimiterRegistry`` so several
+scores on the same model draw from one budget.
+
+Scoring code retries throttled LLM calls itself, so a 429 rarely reaches the
+``slot()`` block. The LLM callbacks call ``report_throttle()`` for every
+throttled attempt instead; it reaches the limiter whose slot the call runs in.
+"""
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional
+
+from plexus.CustomLogging import logging
+from plexus.utils.rate_limits import is_rate_limit_error
+
+DEFAULT_INITIAL_CONCURRENCY = 20
+DEFAULT_MAX_CONCURRENCY = 64
+MAX_CONCURRENCY_ENV_VAR = "PLEXUS_EVALUATION_MAX_CONCURRENCY"
+
+_EXHAUSTED = object()
+
+
+class _Slot:
+    """One held slot: its limiter and how many throttles were reported inside it."""
+
+    __slots__ = ("limiter", "throttles")
+
+    def __init__(self, limiter: "AdaptiveConcurrencyLimiter"):
+        self.limiter = limiter
+        self.throttles = 0
+
+
+# The slot the current task (and the threads it hands work to) runs in.
+_current_slot: ContextVar[Optional[_Slot]] = ContextVar("plexus_concurrency_slot", default=None)
+
+
+def report_throttle() -> bool:
+    """
+    Record a throttled call on the limiter whose slot the caller runs in.
+
+    Returns False when the caller is not running inside a limiter slot.
+    """
+    slot = _current_slot.get()
+    if slot is None:
+        return False
+    slot.throttles += 1
+    slot.limiter.record_throttle()
+    return True
+
+
+def max_concurrency_from_env(default: int = DEFAULT_MAX_CONCURRENCY) -> int:
+    """Upper bound on per-model concurrency, from ``PLEXUS_EVALUATION_MAX_CONCURRENCY``."""
+    value = os.getenv(MAX_CONCURRENCY_ENV_VAR, "").strip()
+    if not value:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logging.warning(f"Invalid {MAX_CONCURRENCY_ENV_VAR}={value!r}; using default {default}")
+        return default
+
+
+def model_concurrency_key(score_config: Optional[Dict[str, Any]]) -> str:
+    """
+    Identify the model behind a score configuration, e.g. ``"ChatOpenAI:gpt-4o-mini"``.
+
+    Uses the score's own ``model_provider``/``model_name`` or, for LangGraph
+    scores, those of the first graph node that sets them.
+    """
+    if not isinstance(score_config, dict):
+        return "default"
+    candidates = [score_config] + [
+        node for node in (score_config.get("graph") or []) if isinstance(node, dict)
+    ]
+    for config in candidates:
+        provider = config.get("model_provider")
+        model_name = config.get("model_name")
+        if provider or model_name:
+            return f"{provider or 'default'}:{model_name or 'default'}"
+    return "default"
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limit driven by observed latency and throttling errors."""
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_INITIAL_CONCURRENCY,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_MAX_CONCURRENCY,
+        backoff_factor: float = 0.5,
+        latency_decrease_factor: float = 0.9,
+        latency_tolerance: float = 1.5,
+        name: str = "default",
+    ):
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.backoff_factor = backoff_factor
+        self.latency_decrease_factor = latency_decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.in_flight = 0
+        self.completed = 0
+        self.throttled = 0
+        self.peak_limit = self.limit
+        self._short_latency: Optional[float] = None
+        self._long_latency: Optional[float] = None
+        # Completion count at the last decrease; at most one decrease per round of calls.
+        self._last_decrease_at = -self.limit
+        self._started_at = time.monotonic()
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop = None
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def _get_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        return self._condition
+
+    async def acquire(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight = max(0, self.in_flight - 1)
+            condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        """
+        Hold one concurrency slot; yields the seconds spent waiting for it.
+
+        Reports the call's latency, or a throttling error, when the block exits.
+        Throttles reported with ``report_throttle()`` inside the block count too.
+        """
+        requested = time.perf_counter()
+        await self.acquire()
+        started = time.perf_counter()
+        slot = _Slot(self)
+        token = _current_slot.set(slot)
+        try:
+            yield started - requested
+        except Exception as e:
+            # Don't count a throttle twice when it was already reported while retrying.
+            if is_rate_limit_error(e) and not slot.throttles:
+                self.record_throttle()
+            raise
+        else:
+            self.on_success(time.perf_counter() - started)
+        finally:
+            try:
+                _current_slot.reset(token)
+            except ValueError:
+                # Closed from another context (e.g. a cancelled task being collected).
+                pass
+            await self.release()
+
+    def _decrease(self, factor: float) -> None:
+        if self.completed - self._last_decrease_at < self.limit:
+            return
+        self._limit = max(float(self.min_limit), self._limit * factor)
+        self._last_decrease_at = self.completed
+
+    def on_success(self, latency_seconds: float) -> None:
+        self.completed += 1
+        if self._short_latency is None:
+            self._short_latency = self._long_latency = latency_seconds
+        else:
+            self._short_latency += 0.2 * (latency_seconds - self._short_latency)
+            self._long_latency += 0.02 * (latency_seconds - self._long_latency)
+
+        if self._short_latency > self._long_latency * self.latency_tolerance:
+            self._decrease(self.latency_decrease_factor)
+        elif self.in_flight >= self.limit:
+            # Only grow while the current limit is actually in use.
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+        self.peak_limit = max(self.peak_limit, self.limit)
+
+    def record_throttle(self) -> None:
+        """Count one throttled call and halve the limit (at most once per round)."""
+        self.throttled += 1
+        previous = self.limit
+        self._decrease(self.backoff_factor)
+        if self.limit < previous:
+            logging.info(
+                f"Concurrency for {self.name} reduced from {previous} to {self.limit} after throttling"
+            )
+
+    def throughput(self) -> float:
+        """Completed calls per second since the limiter was created."""
+        elapsed = time.monotonic() - self._started_at
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "peak_limit": self.peak_limit,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "throttled": self.throttled,
+            "throughput_per_second": round(self.throughput(), 3),
+            "latency_seconds": round(self._short_latency, 3) if self._short_latency is not None else None,
+        }
+
+
+class LimiterRegistry:
+    """One ``AdaptiveConcurrencyLimiter`` per model key."""
+
+    def __init__(self, factory: Callable[[str], AdaptiveConcurrencyLimiter]):
+        self._factory = factory
+        self._limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+
+    def get(self, key: str) -> AdaptiveConcurrencyLimiter:
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = self._limiters[key] = self._factory(key)
+        return limiter
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {key: limiter.snapshot() for key, limiter in self._limiters.items()}
+
+    def __len__(self) -> int:
+        return len(self._limiters)
+
+
+async def run_bounded(
+    limiter: AdaptiveConcurrencyLimiter,
+    items: Iterable[Any],
+    worker: Callable[[Any], Any],
+    on_wait: Optional[Callable[[float], None]] = None,
+) -> list:
+    """
+    Run ``worker(item)`` for each item, creating tasks lazily under ``limiter``.
+
+    At most ``limiter.limit`` tasks exist at a time. Results are returned in
+    completion order. The first exception cancels the remaining work and is
+    re-raised. ``on_wait`` receives how long each item waited for a slot.
+    """
+    pending: set = set()
+    results = []
+
+    async def _run(item):
+        async with limiter.slot() as waited:
+            if on_wait is not None:
+                on_wait(waited)
+            return await worker(item)
+
+    def _collect(done):
+        for task in done:
+            results.append(task.result())
+
+    try:
+        iterator = iter(items)
+        while True:
+            # Wait for a free slot before pulling the next item.
+            while pending and len(pending) >= limiter.limit:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                _collect(done)
+            item = next(iterator, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                break
+            pending.add(asyncio.create_task(_run(item)))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            _collect(done)
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        raise
+    return results
@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from plexus.adaptive_concurrency import (
+    AdaptiveConcurrencyLimiter,
+    LimiterRegistry,
+    model_concurrency_key,
+    run_bounded,
+)
+
+
+class RateLimitError(Exception):
+    pass
+
+
+def test_limit_grows_while_saturated_and_respects_max():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+    limiter.in_flight = limiter.limit
+
+    for _ in range(50):
+        limiter.in_flight = limiter.limit
+        limiter.on_success(1.0)
+
+    assert limiter.limit == 4
+    assert limiter.peak_limit == 4
+
+
+def test_limit_does_not_grow_when_underused():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=10)
+    for _ in range(20):
+        limiter.on_success(1.0)
+    assert limiter.limit == 4
+
+
+def test_throttling_halves_limit_once_per_round():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16, min_limit=2)
+
+    limiter.record_throttle()
+    limiter.record_throttle()
+    assert limiter.limit == 8
+    assert limiter.throttled == 2
+
+    for _ in range(8):
+        limiter.on_success(1.0)
+    limiter.record_throttle()
+    assert limiter.limit == 4
+
+
+def test_latency_spike_reduces_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+    for _ in range(20):
+        limiter.on_success(1.0)
+    for _ in range(5):
+        limiter.on_success(10.0)
+    assert limiter.limit < 10
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_creates_tasks_lazily_and_reports_metrics():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+    active = {"now": 0, "peak": 0}
+    consumed = []
+    waits = []
+
+    def items():
+        for i in range(10):
+            consumed.append(i)
+            yield i
+
+    async def worker(item):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        # The producer never runs more than one round ahead of completed work.
+        assert len(consumed) <= item + 3
+        await asyncio.sleep(0.001)
+        active["now"] -= 1
+        return item * 2
+
+    results = await run_bounded(limiter, items(), worker, on_wait=waits.append)
+
+    assert sorted(results) == [i * 2 for i in range(10)]
+    assert active["peak"] <= 3
+    assert len(waits) == 10
+    snapshot = limiter.snapshot()
+    assert snapshot["completed"] == 10
+    assert snapshot["in_flight"] == 0
+    assert snapshot["throughput_per_second"] > 0
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_cancels_remaining_work_on_error():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+    started = []
+
+    async def worker(item):
+        started.append(item)
+        if item == 1:
+            raise RateLimitError("429 Too Many Requests")
+        await asyncio.sleep(10)
+
+    with pytest.raises(RateLimitError):
+        await asyncio.wait_for(run_bounded(limiter, range(100), worker), timeout=5)
+
+    assert len(started) < 100
+    assert limiter.throttled == 1
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
+
+
+def test_model_concurrency_key_and_registry():
+    assert model_concurrency_key({"model_provider": "ChatOpenAI", "model_name": "gpt-4o-mini"}) == (
+        "ChatOpenAI:gpt-4o-mini"
+    )
+    assert model_concurrency_key({
+        "class": "LangGraphScore",
+        "graph": [{"name": "classifier", "model_provider": "BedrockChat", "model_name": "haiku"}],
+    }) == "BedrockChat:haiku"
+    assert model_concurrency_key({"class": "FastTextClassifier"}) == "default"
+    assert model_concurrency_key(None) == "default"
+
+    registry = LimiterRegistry(lambda key: AdaptiveConcurrencyLimiter(name=key))
+    assert registry.get("a") is registry.get("a")
+    assert registry.get("b") is not registry.get("a")
+    assert set(registry.snapshot()) == {"a", "b"}
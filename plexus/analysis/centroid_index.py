@@ -0,0 +1,170 @@
+"""
+Local nearest-centroid index for topic memory.
+
+Holds every cluster centroid as one L2-normalized float32 matrix so a batch of
+embeddings can be assigned to clusters with a single matrix multiply instead of
+one S3 Vectors query per embedding. S3 Vectors stays the system of record; the
+index is rebuilt from it (or reloaded from a memory-mapped cache file) keyed by
+cluster_version.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MATRIX_FILENAME = "centroids.npy"
+METADATA_FILENAME = "centroids.json"
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+class CentroidIndex:
+    """
+    In-process nearest-centroid index over topic memory clusters.
+
+    ``assign`` returns hits in the same shape as
+    ``TopicMemoryVectorStore.find_nearest_clusters`` (similarity = 1 - cosine distance).
+    """
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        clusters: List[Dict[str, Any]],
+        version: str = "",
+    ):
+        centroids = np.asanyarray(centroids, dtype=np.float32)
+        if centroids.ndim != 2 or len(centroids) != len(clusters):
+            raise ValueError("centroids must be a 2-D array with one row per cluster")
+        self.matrix = centroids
+        self.clusters = clusters
+        self.version = version
+
+    @classmethod
+    def from_clusters(
+        cls,
+        clusters: Iterable[Dict[str, Any]],
+        version: Optional[str] = None,
+    ) -> "CentroidIndex":
+        """Build an index from cluster records (as returned by get_all_clusters)."""
+        rows: List[List[float]] = []
+        entries: List[Dict[str, Any]] = []
+        dims = set()
+        for cluster in clusters:
+            embedding = cluster.get("centroid_embedding", cluster.get("embedding"))
+            if embedding is None:
+                continue
+            vector = np.asarray(embedding, dtype=np.float32).ravel()
+            dims.add(vector.shape[0])
+            rows.append(vector)
+            entries.append(
+                {
+                    "cluster_id": str(cluster.get("cluster_id", "")),
+                    "label": cluster.get("label", ""),
+                    "p95_distance": cluster.get("p95_distance", 0.0),
+                    "member_count": cluster.get("member_count", 0),
+                    "cluster_version": str(cluster.get("cluster_version", "") or ""),
+                }
+            )
+        if len(dims) > 1:
+            raise ValueError(f"cluster centroids have inconsistent dimensions: {sorted(dims)}")
+
+        if version is None:
+            version = ",".join(sorted({e["cluster_version"] for e in entries if e["cluster_version"]}))
+        matrix = _normalize_rows(np.vstack(rows)) if rows else np.zeros((0, 0), dtype=np.float32)
+        return cls(matrix, entries, version=version)
+
+    def __len__(self) -> int:
+        return len(self.clusters)
+
+    def assign(
+        self,
+        embeddings: np.ndarray,
+        k: int = 5,
+        threshold: Optional[float] = None,
+        batch_size: int = 4096,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Return the k nearest clusters for every embedding.
+
+        Args:
+            embeddings: (n, dim) array, or a single (dim,) vector.
+            k: Number of clusters to return per embedding.
+            threshold: Optional minimum similarity.
+            batch_size: Rows scored per matrix multiply, bounding memory use.
+
+        Returns:
+            One list of hits per embedding, ordered by descending similarity.
+        """
+        queries = np.asarray(embeddings, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[None, :]
+        if not len(self) or not len(queries) or k <= 0:
+            return [[] for _ in range(len(queries))]
+        if queries.shape[1] != self.matrix.shape[1]:
+            raise ValueError(
+                f"expected {self.matrix.shape[1]} dimensions, got {queries.shape[1]}"
+            )
+
+        k = min(k, len(self))
+        results: List[List[Dict[str, Any]]] = []
+        for start in range(0, len(queries), batch_size):
+            similarities = _normalize_rows(queries[start : start + batch_size]) @ self.matrix.T
+            np.clip(similarities, -1.0, 1.0, out=similarities)
+            if k < len(self):
+                top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+            else:
+                top = np.broadcast_to(np.arange(len(self)), (len(similarities), k))
+            top_scores = np.take_along_axis(similarities, top, axis=1)
+            ranking = np.argsort(-top_scores, axis=1, kind="stable")
+            top = np.take_along_axis(top, ranking, axis=1)
+            top_scores = np.take_along_axis(top_scores, ranking, axis=1)
+
+            for row_indices, row_scores in zip(top, top_scores):
+                hits = []
+                for cluster_index, similarity in zip(row_indices, row_scores):
+                    similarity = float(similarity)
+                    if threshold is not None and similarity < threshold:
+                        break
+                    cluster = self.clusters[cluster_index]
+                    hits.append(
+                        {
+                            "cluster_id": cluster["cluster_id"],
+                            "doc_id": f"cluster:{cluster['cluster_id']}",
+                            "similarity_score": similarity,
+                            "distance": 1.0 - similarity,
+                        }
+                    )
+                results.append(hits)
+        return results
+
+    def save(self, directory: str) -> None:
+        """Persist the matrix (.npy, memory-mappable) and cluster metadata beside it."""
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, MATRIX_FILENAME), self.matrix)
+        with open(os.path.join(directory, METADATA_FILENAME), "w") as f:
+            json.dump({"version": self.version, "clusters": self.clusters}, f)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> Optional["CentroidIndex"]:
+        """Load a saved index, memory-mapping the matrix. Returns None if absent or unreadable."""
+        matrix_path = os.path.join(directory, MATRIX_FILENAME)
+        metadata_path = os.path.join(directory, METADATA_FILENAME)
+        if not (os.path.exists(matrix_path) and os.path.exists(metadata_path)):
+            return None
+        try:
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+            matrix = np.load(matrix_path, mmap_mode="r" if mmap else None)
+            return cls(matrix, metadata.get("clusters", []), version=metadata.get("version", ""))
+        except Exception as e:
+            logger.warning("Could not load centroid index from %s: %s", directory, e)
+            return None
@@ -0,0 +1,63 @@
+"""Tests for the local nearest-centroid index."""
+
+import numpy as np
+import pytest
+
+from plexus.analysis.centroid_index import CentroidIndex
+
+
+def _clusters(centroids, version="v1"):
+    return [
+        {"cluster_id": i, "centroid_embedding": c, "label": f"Topic {i}", "cluster_version": version}
+        for i, c in enumerate(centroids)
+    ]
+
+
+def test_assign_matches_brute_force_cosine():
+    rng = np.random.default_rng(0)
+    centroids = rng.normal(size=(40, 16)).astype(np.float32)
+    queries = rng.normal(size=(300, 16)).astype(np.float32)
+    index = CentroidIndex.from_clusters(_clusters(centroids))
+
+    hits = index.assign(queries, k=3, batch_size=64)
+
+    normalized = centroids / np.linalg.norm(centroids, axis=1, keepdims=True)
+    expected = (queries / np.linalg.norm(queries, axis=1, keepdims=True)) @ normalized.T
+    assert len(hits) == len(queries)
+    for row, query_hits in zip(expected, hits):
+        assert [h["cluster_id"] for h in query_hits] == [str(i) for i in np.argsort(-row)[:3]]
+        assert query_hits[0]["similarity_score"] == pytest.approx(row.max(), abs=1e-5)
+        assert query_hits[0]["distance"] == pytest.approx(1.0 - row.max(), abs=1e-5)
+        assert query_hits[0]["doc_id"] == f"cluster:{query_hits[0]['cluster_id']}"
+
+
+def test_assign_applies_threshold_and_caps_k():
+    index = CentroidIndex.from_clusters(_clusters([[1.0, 0.0], [0.0, 1.0]]))
+
+    hits = index.assign(np.array([1.0, 0.1]), k=10, threshold=0.5)
+
+    assert len(hits) == 1
+    assert [h["cluster_id"] for h in hits[0]] == ["0"]
+
+
+def test_assign_on_empty_index():
+    index = CentroidIndex.from_clusters([])
+    assert index.assign(np.ones((2, 4)), k=3) == [[], []]
+
+
+def test_save_and_load_memory_mapped(tmp_path):
+    centroids = np.eye(3, dtype=np.float32)
+    index = CentroidIndex.from_clusters(_clusters(centroids, version="20260101-000000"))
+    index.save(str(tmp_path))
+
+    loaded = CentroidIndex.load(str(tmp_path))
+
+    assert isinstance(loaded.matrix, np.memmap)
+    assert loaded.version == "20260101-000000"
+    assert loaded.assign(np.array([0.0, 0.0, 2.0]), k=1)[0][0]["cluster_id"] == "2"
+    assert CentroidIndex.load(str(tmp_path / "missing")) is None
+
+
+def test_inconsistent_dimensions_rejected():
+    with pytest.raises(ValueError):
+        CentroidIndex.from_clusters(_clusters([[1.0, 0.0], [1.0, 0.0, 0.0]]))
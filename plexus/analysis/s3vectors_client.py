@@ -11,6 +11,8 @@ from typing import Any, Dict, Iterable, List, Optional
 import boto3
 import numpy as np
 
+from plexus.analysis.centroid_index import CentroidIndex
+
 logger = logging.getLogger(__name__)
 
 EMBEDDING_DIM = 384
@@ -276,44 +278,76 @@ class TopicMemoryVectorStore:
             self._client.put_vectors(**self._vector_ref(index_name=index_name), vectors=batch)
 
     def get_all_clusters(self) -> List[Dict[str, Any]]:
-        """Retrieve all cluster vectors from the index."""
+        """Retrieve all cluster vectors from the index.
+
+        Lists keys only, then fetches data and metadata for ``cluster:`` keys,
+        so item vectors are never downloaded.
+        """
+        cluster_keys = [
+            key for key in self._list_all_keys() if key.startswith("cluster:")
+        ]
         results: List[Dict[str, Any]] = []
-        next_token = None
+        for key, vector in self._get_vectors_by_keys(cluster_keys).items():
+            metadata = dict(vector.get("metadata", {}) or {})
+            if metadata.get("record_type") != "cluster":
+                continue
 
-        while True:
-            params = {
-                **self._vector_ref(),
-                "maxResults": MAX_BATCH_SIZE,
-                "returnData": True,
-                "returnMetadata": True,
-            }
-            if next_token:
-                params["nextToken"] = next_token
+            cluster_id = metadata.get("cluster_id", "")
+            results.append(
+                {
+                    "cluster_id": int(cluster_id)
+                    if str(cluster_id).lstrip("-").isdigit()
+                    else cluster_id,
+                    "centroid_embedding": vector.get("data", {}).get("float32"),
+                    "p95_distance": metadata.get("p95_distance", 0.0),
+                    "label": metadata.get("label", ""),
+                    "member_count": metadata.get("member_count", 0),
+                    "cluster_version": metadata.get("cluster_version", ""),
+                }
+            )
 
-            resp = self._client.list_vectors(**params)
-            for vector in resp.get("vectors", []):
-                metadata = dict(vector.get("metadata", {}) or {})
-                if metadata.get("record_type") != "cluster":
-                    continue
+        return results
 
-                cluster_id = metadata.get("cluster_id", "")
-                results.append(
-                    {
-                        "cluster_id": int(cluster_id)
-                        if str(cluster_id).lstrip("-").isdigit()
-                        else cluster_id,
-                        "centroid_embedding": vector.get("data", {}).get("float32"),
-                        "p95_distance": metadata.get("p95_distance", 0.0),
-                        "label": metadata.get("label", ""),
-                        "member_count": metadata.get("member_count", 0),
-                    }
-                )
+    def load_centroid_index(
+        self,
+        cache_dir: Optional[str] = None,
+        cluster_version: Optional[str] = None,
+    ) -> CentroidIndex:
+        """
+        Return a local nearest-centroid index for the clusters in this store.
 
-            next_token = resp.get("nextToken")
-            if not next_token:
-                break
+        When ``cache_dir`` holds an index saved for ``cluster_version`` it is
+        memory-mapped without touching S3 Vectors; otherwise clusters are
+        fetched and, if ``cache_dir`` is set, the cache is refreshed.
+        """
+        if cache_dir and cluster_version:
+            cached = CentroidIndex.load(cache_dir)
+            if cached is not None and cached.version == cluster_version:
+                return cached
 
-        return results
+        index = CentroidIndex.from_clusters(self.get_all_clusters(), version=cluster_version)
+        if cache_dir:
+            try:
+                index.save(cache_dir)
+            except OSError as e:
+                logger.warning("Could not cache centroid index in %s: %s", cache_dir, e)
+        return index
+
+    def assign_to_clusters(
+        self,
+        embeddings: np.ndarray,
+        k: int = 5,
+        threshold: Optional[float] = None,
+        index: Optional[CentroidIndex] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Batched equivalent of ``find_nearest_clusters`` for many embeddings.
+
+        Uses ``index`` (or a freshly loaded centroid index) instead of one
+        ``query_vectors`` call per embedding.
+        """
+        index = index if index is not None else self.load_centroid_index()
+        return index.assign(embeddings, k=k, threshold=threshold)
 
     def find_nearest_clusters(
         self,
@@ -369,3 +403,97 @@ class TopicMemoryVectorStore:
             reverse=True,
         )
         return results
+
+
+class InMemoryS3VectorsClient:
+    """
+    In-process stand-in for the boto3 ``s3vectors`` client.
+
+    Implements the subset of operations TopicMemoryVectorStore uses, with
+    cosine distance for queries, so topic memory can run without AWS.
+    """
+
+    def __init__(self):
+        self._vectors: Dict[str, Dict[str, Any]] = {}
+
+    def get_index(self, **_ref: Any) -> Dict[str, Any]:
+        return {"index": {"indexName": _ref.get("indexName", "in-memory")}}
+
+    def put_vectors(self, vectors: List[Dict[str, Any]], **_ref: Any) -> Dict[str, Any]:
+        for vector in vectors:
+            self._vectors[vector["key"]] = {
+                "key": vector["key"],
+                "data": {"float32": _to_float_list(vector["data"]["float32"])},
+                "metadata": dict(vector.get("metadata", {}) or {}),
+            }
+        return {}
+
+    def delete_vectors(self, keys: List[str], **_ref: Any) -> Dict[str, Any]:
+        for key in keys:
+            self._vectors.pop(key, None)
+        return {}
+
+    def _render(self, vector: Dict[str, Any], return_data: bool, return_metadata: bool) -> Dict[str, Any]:
+        rendered: Dict[str, Any] = {"key": vector["key"]}
+        if return_data:
+            rendered["data"] = {"float32": list(vector["data"]["float32"])}
+        if return_metadata:
+            rendered["metadata"] = dict(vector["metadata"])
+        return rendered
+
+    def list_vectors(
+        self,
+        maxResults: int = MAX_BATCH_SIZE,
+        nextToken: Optional[str] = None,
+        returnData: bool = False,
+        returnMetadata: bool = False,
+        **_ref: Any,
+    ) -> Dict[str, Any]:
+        keys = sorted(self._vectors)
+        start = int(nextToken or 0)
+        page = keys[start : start + maxResults]
+        response: Dict[str, Any] = {
+            "vectors": [self._render(self._vectors[key], returnData, returnMetadata) for key in page]
+        }
+        if start + maxResults < len(keys):
+            response["nextToken"] = str(start + maxResults)
+        return response
+
+    def get_vectors(
+        self,
+        keys: List[str],
+        returnData: bool = False,
+        returnMetadata: bool = False,
+        **_ref: Any,
+    ) -> Dict[str, Any]:
+        return {
+            "vectors": [
+                self._render(self._vectors[key], returnData, returnMetadata)
+                for key in keys
+                if key in self._vectors
+            ]
+        }
+
+    def query_vectors(
+        self,
+        queryVector: Dict[str, Any],
+        topK: int,
+        returnMetadata: bool = False,
+        returnDistance: bool = False,
+        **_ref: Any,
+    ) -> Dict[str, Any]:
+        if not self._vectors:
+            return {"vectors": []}
+        keys = list(self._vectors)
+        matrix = np.asarray([self._vectors[key]["data"]["float32"] for key in keys], dtype=np.float32)
+        query = np.asarray(queryVector["float32"], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+        norms[norms == 0] = 1.0
+        distances = 1.0 - np.clip((matrix @ query) / norms, -1.0, 1.0)
+        hits = []
+        for i in np.argsort(distances, kind="stable")[:topK]:
+            hit = self._render(self._vectors[keys[i]], False, returnMetadata)
+            if returnDistance:
+                hit["distance"] = float(distances[i])
+            hits.append(hit)
+        return {"vectors": hits}
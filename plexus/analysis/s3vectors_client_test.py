@@ -3,6 +3,7 @@
 from unittest.mock import MagicMock
 
 import numpy as np
+import pytest
 
 from plexus.analysis.s3vectors_client import EMBEDDING_DIM, TopicMemoryVectorStore
 
@@ -167,3 +168,58 @@ def test_find_nearest_clusters_orders_by_similarity_and_applies_similarity_thres
     assert results[0]["similarity_score"] > results[1]["similarity_score"]
     assert results[0]["similarity_score"] == 0.9
     assert results[1]["similarity_score"] == 0.7
+
+
+def _in_memory_store():
+    from plexus.analysis.s3vectors_client import InMemoryS3VectorsClient
+
+    return TopicMemoryVectorStore(
+        bucket_name="plexus-vectors-development",
+        index_name="topic-memory-idx-development",
+        region="us-west-2",
+        client=InMemoryS3VectorsClient(),
+    )
+
+
+def test_get_all_clusters_only_fetches_cluster_vectors():
+    store = _in_memory_store()
+    rng = np.random.default_rng(1)
+    store.build_index([
+        {"doc_id": f"d{i}", "embedding": rng.normal(size=EMBEDDING_DIM), "metadata": {}}
+        for i in range(3)
+    ])
+    store.persist_clusters([
+        {"cluster_id": 4, "embedding": rng.normal(size=EMBEDDING_DIM), "label": "Billing", "cluster_version": "v2"},
+    ])
+    store._client.get_vectors = MagicMock(wraps=store._client.get_vectors)
+
+    clusters = store.get_all_clusters()
+
+    assert [c["cluster_id"] for c in clusters] == [4]
+    assert clusters[0]["label"] == "Billing"
+    assert clusters[0]["cluster_version"] == "v2"
+    assert store._client.get_vectors.call_args.kwargs["keys"] == ["cluster:4"]
+
+
+def test_assign_to_clusters_matches_per_embedding_queries(tmp_path):
+    store = _in_memory_store()
+    rng = np.random.default_rng(2)
+    store.persist_clusters([
+        {"cluster_id": i, "embedding": rng.normal(size=EMBEDDING_DIM), "cluster_version": "v1"}
+        for i in range(12)
+    ])
+    embeddings = rng.normal(size=(25, EMBEDDING_DIM)).astype(np.float32)
+
+    index = store.load_centroid_index(cache_dir=str(tmp_path), cluster_version="v1")
+    batched = store.assign_to_clusters(embeddings, k=3, index=index)
+
+    for embedding, hits in zip(embeddings, batched):
+        expected = store.find_nearest_clusters(embedding, k=3)
+        assert [h["cluster_id"] for h in hits] == [h["cluster_id"] for h in expected]
+        for hit, exp in zip(hits, expected):
+            assert hit["similarity_score"] == pytest.approx(exp["similarity_score"], abs=1e-5)
+
+    # A cached index for the same version is reused without listing the store
+    store._client.list_vectors = MagicMock(side_effect=AssertionError("should use cache"))
+    cached = store.load_centroid_index(cache_dir=str(tmp_path), cluster_version="v1")
+    assert len(cached) == 12
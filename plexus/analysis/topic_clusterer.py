@@ -2,7 +2,7 @@
 TopicClusterer: clusters pre-computed embeddings via BERTopic (UMAP + HDBSCAN).
 
 Decouples embedding from clustering. Computes centroids, p95 boundaries,
-and LLM-generated labels. Used by VectorTopicMemory ReportBlock.
+exemplars, keywords and LLM-generated labels with vectorized post-processing. Used by VectorTopicMemory ReportBlock.
 """
 
 import logging
@@ -50,6 +50,8 @@ class TopicClusterer:
         self._documents: Optional[List[str]] = None
         self._cluster_version: Optional[str] = None
         self._topic_model = None
+        self._stats: Optional[Dict[str, Any]] = None
+        self._term_counts = None
 
     def cluster(
         self,
@@ -87,6 +89,8 @@ class TopicClusterer:
             self._embeddings = np.asarray(embeddings, dtype=np.float32)
             self._documents = documents
             self._topic_model = None
+            self._stats = None
+            self._term_counts = None
             self._cluster_version = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
             return self._topics, self._cluster_version
 
@@ -138,36 +142,91 @@ class TopicClusterer:
         self._embeddings = np.asarray(embeddings, dtype=np.float32)
         self._documents = documents
         self._topic_model = topic_model
+        self._stats = None
+        self._term_counts = None
         self._cluster_version = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
 
         return self._topics, self._cluster_version
 
+    def _cluster_stats(self) -> Optional[Dict[str, Any]]:
+        """Compute (and cache) per-cluster centroids and member distances.
+
+        Members are grouped into contiguous segments with one stable argsort of
+        the topic ids, embeddings are L2-normalized once, and each cluster's
+        member-to-centroid cosine distances come from a single matrix-vector
+        product over its segment. The cache is tied to the current topic and
+        embedding arrays, so re-clustering invalidates it.
+        """
+        if self._topics is None or self._embeddings is None:
+            return None
+        cached = self._stats
+        if (
+            cached is not None
+            and cached["topics"] is self._topics
+            and cached["embeddings"] is self._embeddings
+        ):
+            return cached
+
+        topics = np.asarray(self._topics)
+        embeddings = self._embeddings
+        order = np.flatnonzero(topics != -1)
+        order = order[np.argsort(topics[order], kind="stable")]
+        topic_ids, starts, counts = np.unique(
+            topics[order], return_index=True, return_counts=True
+        )
+
+        segments: Dict[int, slice] = {}
+        centroids: Dict[int, np.ndarray] = {}
+        distances = np.ones(len(order), dtype=np.float32)
+        if len(order):
+            members = embeddings[order]
+            sums = np.add.reduceat(members, starts, axis=0, dtype=np.float64)
+            centroid_matrix = (sums / counts[:, None]).astype(np.float32)
+
+            member_norms = np.linalg.norm(members, axis=1)
+            nonzero = member_norms > 0
+            normalized = np.zeros_like(members)
+            normalized[nonzero] = members[nonzero] / member_norms[nonzero, None]
+
+            for tid, start, count, centroid in zip(topic_ids, starts, counts, centroid_matrix):
+                segment = slice(int(start), int(start + count))
+                segments[int(tid)] = segment
+                centroids[int(tid)] = centroid
+                centroid_norm = np.linalg.norm(centroid)
+                if centroid_norm == 0:
+                    continue  # distance stays 1.0, as in _cosine_distance
+                sims = normalized[segment] @ (centroid / centroid_norm)
+                distances[segment] = np.where(
+                    nonzero[segment], 1.0 - np.clip(sims, -1.0, 1.0), 1.0
+                )
+
+        self._stats = {
+            "topics": self._topics,
+            "embeddings": self._embeddings,
+            "order": order,
+            "segments": segments,
+            "centroids": centroids,
+            "distances": distances,
+        }
+        return self._stats
+
     def cluster_centroids(self) -> Dict[int, np.ndarray]:
         """Return centroid (mean of member embeddings) per non-outlier cluster."""
-        if self._topics is None or self._embeddings is None:
+        stats = self._cluster_stats()
+        if stats is None:
             return {}
-        centroids: Dict[int, np.ndarray] = {}
-        for tid in np.unique(self._topics):
-            if tid == -1:
-                continue
-            mask = self._topics == tid
-            members = self._embeddings[mask]
-            centroids[int(tid)] = np.mean(members, axis=0).astype(np.float32)
-        return centroids
+        return dict(stats["centroids"])
 
     def cluster_boundaries(self) -> Dict[int, float]:
         """Return p95 cosine distance from members to centroid per cluster."""
-        centroids = self.cluster_centroids()
-        if not centroids:
+        stats = self._cluster_stats()
+        if stats is None:
             return {}
-        boundaries: Dict[int, float] = {}
-        for tid, centroid in centroids.items():
-            mask = self._topics == tid
-            members = self._embeddings[mask]
-            distances = [_cosine_distance(m, centroid) for m in members]
-            p95 = float(np.percentile(distances, 95))
-            boundaries[tid] = p95
-        return boundaries
+        distances = stats["distances"]
+        return {
+            tid: float(np.percentile(distances[segment], 95))
+            for tid, segment in stats["segments"].items()
+        }
 
     def generate_labels(
         self,
@@ -196,47 +255,84 @@ class TopicClusterer:
         """
         if self._documents is None or self._embeddings is None:
             return []
-        mask = self._topics == topic_id
-        indices = np.where(mask)[0]
-        centroid = self.cluster_centroids().get(topic_id)
-        if centroid is None:
+        stats = self._cluster_stats()
+        segment = stats["segments"].get(topic_id) if stats else None
+        if segment is None or n <= 0:
             return []
-        distances = [
-            (_cosine_distance(self._embeddings[i], centroid), int(i)) for i in indices
-        ]
-        distances.sort(key=lambda x: x[0])
-        return [(idx, self._documents[idx]) for _, idx in distances[:n]]
+        indices = stats["order"][segment]
+        distances = stats["distances"][segment]
+        if n < len(indices):
+            # Select candidates in linear time; keep everything tied with the
+            # n-th distance so ties still resolve to the lowest original index.
+            kth = np.partition(distances, n - 1)[n - 1]
+            candidates = np.flatnonzero(distances <= kth)
+            indices = indices[candidates]
+            distances = distances[candidates]
+        ranked = np.lexsort((indices, distances))[:n]
+        return [(int(indices[i]), self._documents[int(indices[i])]) for i in ranked]
 
     def _get_representative_docs(self, topic_id: int, n: int = 5) -> List[str]:
         """Get representative documents for a cluster (closest to centroid)."""
         return [doc for _, doc in self.get_representative_exemplars(topic_id, n=n)]
 
-    def get_keywords(self, topic_id: int, n: int = 8) -> List[str]:
-        """Extract top keywords for a cluster via TF-IDF on cluster documents."""
-        if self._documents is None:
+    def _keyword_term_counts(self):
+        """Tokenize the whole corpus once into a sparse (documents x terms) count matrix."""
+        cached = self._term_counts
+        if cached is not None and cached[0] is self._documents:
+            return cached[1], cached[2]
+        from sklearn.feature_extraction.text import CountVectorizer
+
+        vectorizer = CountVectorizer(ngram_range=(1, 2), stop_words="english")
+        try:
+            counts = vectorizer.fit_transform(self._documents).tocsr()
+            feature_names = vectorizer.get_feature_names_out()
+        except ValueError:
+            # Empty vocabulary (e.g. only stop words) – no cluster has keywords.
+            counts, feature_names = None, None
+        self._term_counts = (self._documents, counts, feature_names)
+        return counts, feature_names
+
+    def get_keywords(
+        self, topic_id: int, n: int = 8, max_features: int = 500
+    ) -> List[str]:
+        """Extract top keywords for a cluster via TF-IDF on cluster documents.
+
+        Term counts come from one corpus-wide tokenization; each cluster then
+        slices its rows and applies the same top-``max_features`` pruning,
+        smoothed IDF and L2 row normalization a TfidfVectorizer fitted on the
+        cluster documents alone would use.
+        """
+        if self._documents is None or self._topics is None:
             return []
-        mask = self._topics == topic_id
-        indices = np.where(mask)[0]
+        indices = np.flatnonzero(np.asarray(self._topics) == topic_id)
         if len(indices) < 2:
             return []
-        docs = [self._documents[i] for i in indices]
         try:
-            from sklearn.feature_extraction.text import TfidfVectorizer
+            from sklearn.preprocessing import normalize
 
-            vectorizer = TfidfVectorizer(
-                max_features=500,
-                ngram_range=(1, 2),
-                stop_words="english",
-                min_df=1,
-            )
-            X = vectorizer.fit_transform(docs)
-            feature_names = vectorizer.get_feature_names_out()
-            scores = np.asarray(X.sum(axis=0)).flatten()
+            counts, feature_names = self._keyword_term_counts()
+            if counts is None:
+                return []
+            cluster_counts = counts[indices]
+            term_freqs = np.asarray(cluster_counts.sum(axis=0)).ravel()
+            present = np.flatnonzero(term_freqs)
+            if not len(present):
+                return []
+            if len(present) > max_features:
+                keep = (-term_freqs[present]).argsort()[:max_features]
+                present = present[np.sort(keep)]
+            cluster_counts = cluster_counts[:, present].tocsr()
+
+            doc_freqs = np.bincount(cluster_counts.indices, minlength=len(present))
+            idf = np.log((1 + len(indices)) / (1 + doc_freqs)) + 1.0
+            tfidf = normalize(cluster_counts.multiply(idf).tocsr(), norm="l2")
+            scores = np.asarray(tfidf.sum(axis=0)).flatten()
+            names = feature_names[present]
             top_indices = scores.argsort()[-n:][::-1]
             return [
-                feature_names[i]
+                names[i]
                 for i in top_indices
-                if scores[i] > 0 and feature_names[i]
+                if scores[i] > 0 and names[i]
             ]
         except Exception as e:
             logger.warning(f"Failed to extract keywords for topic {topic_id}: {e}")
@@ -247,10 +343,11 @@ class TopicClusterer:
         centroids = self.cluster_centroids()
         boundaries = self.cluster_boundaries()
         labels = self.generate_labels()
+        segments = self._stats["segments"] if self._stats else {}
         records: List[Dict[str, Any]] = []
         for tid in centroids:
-            mask = self._topics == tid
-            member_count = int(np.sum(mask))
+            segment = segments[tid]
+            member_count = segment.stop - segment.start
             label = labels.get(tid, f"Topic {tid}")
             p95 = boundaries.get(tid, 0.0)
             centroid_list = centroids[tid].tolist()
@@ -103,3 +103,81 @@ def test_get_cluster_records():
         assert "p95_distance" in r
         assert "label" in r
         assert "member_count" in r
+
+
+def _clusterer_with_assignments(embeddings, docs, topics):
+    clusterer = TopicClusterer()
+    clusterer._embeddings = np.asarray(embeddings, dtype=np.float32)
+    clusterer._documents = docs
+    clusterer._topics = np.asarray(topics)
+    return clusterer
+
+
+def test_vectorized_post_processing_matches_scalar_reference():
+    """Centroids, boundaries and exemplars match the per-member scalar computation."""
+    rng = np.random.default_rng(7)
+    n, dim = 400, 32
+    embeddings = rng.normal(size=(n, dim)).astype(np.float32)
+    embeddings[5] = 0.0  # zero vector -> distance 1.0
+    embeddings[11] = embeddings[10]  # exact tie between members
+    topics = rng.integers(-1, 6, size=n)
+    topics[10] = topics[11] = 2
+    docs = [f"doc {i}" for i in range(n)]
+    clusterer = _clusterer_with_assignments(embeddings, docs, topics)
+
+    centroids = clusterer.cluster_centroids()
+    boundaries = clusterer.cluster_boundaries()
+    assert sorted(centroids) == sorted(set(topics.tolist()) - {-1})
+    for tid, centroid in centroids.items():
+        members = clusterer._embeddings[topics == tid]
+        np.testing.assert_allclose(centroid, members.mean(axis=0), atol=1e-5)
+        distances = [_cosine_distance(m, centroid) for m in members]
+        assert boundaries[tid] == pytest.approx(np.percentile(distances, 95), abs=1e-5)
+
+        indices = np.where(topics == tid)[0]
+        expected = sorted(
+            ((_cosine_distance(clusterer._embeddings[i], centroid), int(i)) for i in indices),
+            key=lambda x: x[0],
+        )[:4]
+        exemplars = clusterer.get_representative_exemplars(tid, n=4)
+        assert [idx for idx, _ in exemplars] == [idx for _, idx in expected]
+        assert [doc for _, doc in exemplars] == [docs[idx] for _, idx in expected]
+
+
+def test_representative_exemplars_unknown_topic():
+    clusterer = _clusterer_with_assignments(np.eye(4), ["a", "b", "c", "d"], [0, 0, 1, -1])
+    assert clusterer.get_representative_exemplars(-1) == []
+    assert clusterer.get_representative_exemplars(9) == []
+    assert len(clusterer.get_representative_exemplars(0, n=10)) == 2
+
+
+def test_keywords_match_per_cluster_tfidf():
+    """Corpus-wide term counts give the same keywords as a TF-IDF fit per cluster."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    rng = np.random.default_rng(3)
+    vocabulary = [
+        "billing", "refund", "agent", "greeting", "transfer", "hold", "verify",
+        "address", "payment", "escalation", "policy", "disclosure", "consent",
+    ]
+    docs = [" ".join(rng.choice(vocabulary, size=12)) for _ in range(120)]
+    docs[0] = "the and of"  # stop words only
+    topics = rng.integers(-1, 4, size=len(docs))
+    clusterer = _clusterer_with_assignments(np.ones((len(docs), 3)), docs, topics)
+
+    for tid in range(4):
+        cluster_docs = [docs[i] for i in np.where(topics == tid)[0]]
+        vectorizer = TfidfVectorizer(
+            max_features=20, ngram_range=(1, 2), stop_words="english", min_df=1
+        )
+        X = vectorizer.fit_transform(cluster_docs)
+        names = vectorizer.get_feature_names_out()
+        scores = np.asarray(X.sum(axis=0)).flatten()
+        expected = [names[i] for i in scores.argsort()[-8:][::-1] if scores[i] > 0]
+
+        assert clusterer.get_keywords(tid, n=8, max_features=20) == expected
+
+
+def test_keywords_for_stop_word_only_corpus():
+    clusterer = _clusterer_with_assignments(np.ones((3, 2)), ["the", "and of", "a"], [0, 0, 0])
+    assert clusterer.get_keywords(0) == []
@@ -18,7 +18,9 @@ import asyncio
 from openai import OpenAI
 import aiohttp
 import requests
+import time
 import traceback
+from contextlib import contextmanager
 
 from plexus.CustomLogging import logging
 from plexus.Registries import scorecard_registry
@@ -31,6 +33,12 @@ from plexus.cli.shared import select_sample_data_driven, select_sample_csv
 # Maximum number of requests per batch
 MAX_BATCH_SIZE = 1000
 
+# Concurrent scoring and result-writing workers used by `plexus batch complete`
+COMPLETION_CONCURRENCY_ENV_VAR = 'PLEXUS_BATCH_COMPLETION_CONCURRENCY'
+WRITE_CONCURRENCY_ENV_VAR = 'PLEXUS_BATCH_WRITE_CONCURRENCY'
+DEFAULT_COMPLETION_CONCURRENCY = 8
+DEFAULT_WRITE_CONCURRENCY = 8
+
 # Add this constant near the top with other constants
 STATUS_MAPPING = {
     'validating': 'PROCESSING',
@@ -152,6 +160,274 @@ async def get_scoring_jobs_for_batch(
     logging.info(f"Found {len(scoring_jobs)} scoring jobs for batch {batch_job_id}")
     return scoring_jobs
 
+def _concurrency_from_env(env_var: str, default: int) -> int:
+    value = os.getenv(env_var, "").strip()
+    if not value:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logging.warning(f"Invalid {env_var}={value!r}; using default {default}")
+        return default
+
+class BatchSampleIndex:
+    """
+    Sample text by content ID for one (scorecard, score), loaded once.
+
+    Scores that read ``labeled-samples.csv`` are indexed up front; data-driven
+    scores, and IDs missing from the CSV, fall back to ``select_sample``.
+    """
+
+    def __init__(self, scorecard_class, score_name):
+        self.scorecard_class = scorecard_class
+        self.score_name = score_name
+        self._texts: Optional[Dict[str, str]] = None
+        score_configuration = next(
+            (score for score in scorecard_class.scores if score['name'] == score_name),
+            {}
+        )
+        if 'data' not in score_configuration:
+            scorecard_key = scorecard_class.properties.get('key')
+            csv_path = os.path.join('scorecards', scorecard_key, 'experiments', 'labeled-samples.csv')
+            if os.path.exists(csv_path):
+                df = pd.read_csv(csv_path, usecols=['id', 'text'])
+                self._texts = dict(zip(df['id'].astype(str), df['text']))
+                logging.info(f"Indexed {len(self._texts)} samples from {csv_path}")
+
+    def text_for(self, content_id) -> Optional[str]:
+        if self._texts is not None:
+            text = self._texts.get(str(content_id))
+            if text is not None:
+                return text
+        sample_row, _ = select_sample(self.scorecard_class, self.score_name, content_id, fresh=False)
+        if sample_row is None or sample_row.empty:
+            return None
+        return sample_row.iloc[0]['text']
+
+class BatchCompletionStats:
+    """Item counts, errors and busy time for each stage of batch completion."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, Dict[str, Any]] = {}
+
+    def add_stage(self, name: str, workers: int = 1) -> None:
+        self.stages[name] = {'items': 0, 'errors': 0, 'busy_seconds': 0.0, 'workers': workers}
+
+    @contextmanager
+    def timed(self, name: str):
+        stage = self.stages.setdefault(
+            name, {'items': 0, 'errors': 0, 'busy_seconds': 0.0, 'workers': 1}
+        )
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            stage['errors'] += 1
+            raise
+        else:
+            stage['items'] += 1
+        finally:
+            stage['busy_seconds'] += time.perf_counter() - start
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-stage totals. ``capacity_per_second`` is how many items the stage's
+        workers could handle per second if never starved; the stage with the
+        lowest capacity is the bottleneck.
+        """
+        summary = {}
+        for name, stage in self.stages.items():
+            handled = stage['items'] + stage['errors']
+            busy = stage['busy_seconds']
+            summary[name] = {
+                **stage,
+                'busy_seconds': round(busy, 3),
+                'capacity_per_second': round(stage['workers'] * handled / busy, 2) if busy > 0 else None,
+            }
+        return summary
+
+    def log(self, batch_job_id: str) -> None:
+        elapsed = time.perf_counter() - self.started
+        logging.info(f"Batch {batch_job_id} completion finished in {elapsed:.1f}s")
+        for name, stage in self.summary().items():
+            logging.info(
+                f"  {name}: {stage['items']} ok, {stage['errors']} errors, "
+                f"{stage['busy_seconds']}s busy across {stage['workers']} worker(s), "
+                f"capacity {stage['capacity_per_second']}/s"
+            )
+
+def _write_completion_result(client, job, scoring_job, content_id, result):
+    """Mark the scoring job COMPLETED and record the prediction."""
+    update_mutation = """
+    mutation UpdateScoringJob($input: UpdateScoringJobInput!) {
+        updateScoringJob(input: $input) {
+            id
+            status
+        }
+    }
+    """
+
+    update_input = {
+        'id': scoring_job['id'],
+        'status': 'COMPLETED',
+        'accountId': job['accountId'],
+        'scorecardId': job['scorecardId'],
+        'itemId': content_id
+    }
+
+    client.execute(update_mutation, {'input': update_input})
+    logging.debug(f"Updated scoring job {scoring_job['id']} status to COMPLETED")
+
+    # Create score result if we have a value
+    if isinstance(result, dict) and 'value' in result:
+        create_result_mutation = """
+        mutation CreateScoreResult($input: CreateScoreResultInput!) {
+            createScoreResult(input: $input) {
+                id
+                value
+            }
+        }
+        """
+
+        result_input = {
+            'accountId': job['accountId'],
+            'scorecardId': job['scorecardId'],
+            'itemId': content_id,
+            'scoringJobId': scoring_job['id'],
+            'value': result['value'],
+            'code': '200',
+            'type': 'prediction'  # Batch processing creates prediction results
+        }
+
+        client.execute(create_result_mutation, {'input': result_input})
+        logging.debug(f"Created score result for scoring job {scoring_job['id']}")
+
+async def complete_batch_results(
+    client: PlexusDashboardClient,
+    job: Dict[str, Any],
+    content: str,
+    scoring_jobs: List[Dict[str, Any]],
+    account_key: str,
+    scorecard_key: str,
+    score_name: str,
+    scorecard_class,
+    score_concurrency: Optional[int] = None,
+    write_concurrency: Optional[int] = None,
+) -> BatchCompletionStats:
+    """
+    Score every line of an OpenAI batch output file and write the results.
+
+    Runs as a pipeline: output lines are parsed in order and queued for
+    ``score_concurrency`` scoring workers, which share one score instance and
+    one sample index; finished predictions are queued for ``write_concurrency``
+    workers that post results to the API. Queues are bounded, so a slow stage
+    applies back-pressure instead of buffering the whole file.
+    """
+    if score_concurrency is None:
+        score_concurrency = _concurrency_from_env(COMPLETION_CONCURRENCY_ENV_VAR, DEFAULT_COMPLETION_CONCURRENCY)
+    if write_concurrency is None:
+        write_concurrency = _concurrency_from_env(WRITE_CONCURRENCY_ENV_VAR, DEFAULT_WRITE_CONCURRENCY)
+
+    stats = BatchCompletionStats()
+    stats.add_stage('parse')
+    stats.add_stage('sample', score_concurrency)
+    stats.add_stage('score', score_concurrency)
+    stats.add_stage('write', write_concurrency)
+
+    scoring_jobs_by_item = {str(sj['itemId']): sj for sj in scoring_jobs}
+    samples = BatchSampleIndex(scorecard_class, score_name)
+    score_queue: asyncio.Queue = asyncio.Queue(maxsize=score_concurrency * 2)
+    write_queue: asyncio.Queue = asyncio.Queue(maxsize=write_concurrency * 2)
+
+    async with Score.from_name(scorecard_key, score_name) as score:
+
+        async def parse_lines():
+            for line_number, line in enumerate(content.splitlines(), start=1):
+                if not line.strip():
+                    continue
+                try:
+                    with stats.timed('parse'):
+                        result = json.loads(line)
+                        content_id = result['custom_id']
+                        response_content = result['response']['body']['choices'][0]['message']['content']
+                except Exception as e:
+                    logging.error(f"Could not parse batch output line {line_number}: {str(e)}")
+                    continue
+                await score_queue.put((content_id, response_content))
+            for _ in range(score_concurrency):
+                await score_queue.put(None)
+
+        async def score_items():
+            while (item := await score_queue.get()) is not None:
+                content_id, response_content = item
+                logging.debug(f"Processing result for content_id {content_id}")
+                try:
+                    with stats.timed('sample'):
+                        # select_sample can load data-driven samples from disk or the API
+                        text = await asyncio.to_thread(samples.text_for, content_id)
+                    if text is None:
+                        logging.error(f"Could not find sample data for content_id {content_id}")
+                        continue
+
+                    # Create Score.Input with batch completion in metadata
+                    score_input = Score.Input(
+                        text=text,
+                        metadata={
+                            "content_id": str(content_id),
+                            "account_key": account_key,
+                            "scorecard_key": scorecard_key,
+                            "score_name": score_name,
+                            "batch": {
+                                "completion": response_content
+                            }
+                        }
+                    )
+                    config = {
+                        "configurable": {
+                            "thread_id": str(content_id)
+                        }
+                    }
+                    with stats.timed('score'):
+                        result = await score.predict(config, score_input)
+                    logging.debug(f"Prediction completed with result: {result}")
+                except Exception as e:
+                    logging.error(f"Error processing content_id {content_id}: {str(e)}")
+                    logging.error(f"Full traceback: {traceback.format_exc()}")
+                    continue
+                await write_queue.put((content_id, result))
+
+        async def write_results():
+            while (item := await write_queue.get()) is not None:
+                content_id, result = item
+                scoring_job = scoring_jobs_by_item.get(str(content_id))
+                if scoring_job is None:
+                    logging.warning(f"No scoring job found for content_id {content_id}")
+                    continue
+                try:
+                    with stats.timed('write'):
+                        await asyncio.to_thread(
+                            _write_completion_result, client, job, scoring_job, content_id, result
+                        )
+                except Exception as e:
+                    logging.error(f"Error writing result for content_id {content_id}: {str(e)}")
+                    logging.error(f"Full traceback: {traceback.format_exc()}")
+
+        producers = [asyncio.create_task(parse_lines())]
+        producers += [asyncio.create_task(score_items()) for _ in range(score_concurrency)]
+        writers = [asyncio.create_task(write_results()) for _ in range(write_concurrency)]
+        try:
+            await asyncio.gather(*producers)
+            for _ in writers:
+                await write_queue.put(None)
+            await asyncio.gather(*writers)
+        finally:
+            for task in producers + writers:
+                task.cancel()
+
+    stats.log(job['id'])
+    return stats
+
 @batch.command(help="Generate JSON-L files for batch processing.")
 @click.option(
     '--account-key', 
@@ -528,112 +804,16 @@ async def _complete_batches(account_key):
                 logging.error(f"Could not find scorecard class for key: {scorecard_key}")
                 continue
             
-            # Process each line of the output
-            for line in content.splitlines():
-                result = json.loads(line)
-                content_id = result['custom_id']
-                response_content = result['response']['body']['choices'][0]['message']['content']
-                logging.info(f"Processing result for content_id {content_id}")
-                
-                try:
-                    # Get sample data
-                    sample_row, used_content_id = select_sample(
-                        scorecard_class, 
-                        score_name,
-                        content_id,
-                        fresh=False
-                    )
-                    
-                    if sample_row is None or sample_row.empty:
-                        logging.error(f"Could not find sample data for content_id {content_id}")
-                        continue
-                    
-                    # Create metadata for Score.Input
-                    metadata = {
-                        "content_id": str(content_id),
-                        "account_key": account_key,
-                        "scorecard_key": scorecard_key,
-                        "score_name": score_name,
-                        "batch": {
-                            "completion": response_content
-                        }
-                    }
-                    logging.info(f"Created metadata for Score.Input: {metadata}")
-
-                    # Create Score.Input with batch completion in metadata
-                    score_input = Score.Input(
-                        text=sample_row.iloc[0]['text'],
-                        metadata=metadata
-                    )
-
-                    # Create config for the score
-                    config = {
-                        "configurable": {
-                            "thread_id": str(content_id)
-                        }
-                    }
-
-                    # Let the score class handle all LangGraph details
-                    async with Score.from_name(scorecard_key, score_name) as score:
-                        result = await score.predict(config, score_input)
-                        logging.info(f"Prediction completed with result: {result}")
-
-                    # Get scoring job for this content_id - moved outside the if result check
-                    scoring_job = next(
-                        (sj for sj in scoring_jobs if sj['itemId'] == content_id),
-                        None
-                    )
-                    
-                    if scoring_job:
-                        # Update scoring job status to COMPLETED
-                        update_mutation = """
-                        mutation UpdateScoringJob($input: UpdateScoringJobInput!) {
-                            updateScoringJob(input: $input) {
-                                id
-                                status
-                            }
-                        }
-                        """
-                        
-                        update_input = {
-                            'id': scoring_job['id'],
-                            'status': 'COMPLETED',
-                            'accountId': job['accountId'],
-                            'scorecardId': job['scorecardId'],
-                            'itemId': content_id
-                        }
-                        
-                        client.execute(update_mutation, {'input': update_input})
-                        logging.info(f"Updated scoring job {scoring_job['id']} status to COMPLETED")
-
-                        # Create score result if we have a value
-                        if isinstance(result, dict) and 'value' in result:
-                            create_result_mutation = """
-                            mutation CreateScoreResult($input: CreateScoreResultInput!) {
-                                createScoreResult(input: $input) {
-                                    id
-                                    value
-                                }
-                            }
-                            """
-                            
-                            result_input = {
-                                'accountId': job['accountId'],
-                                'scorecardId': job['scorecardId'],
-                                'itemId': content_id,
-                                'scoringJobId': scoring_job['id'],
-                                'value': result['value'],
-                                'code': '200',
-                                'type': 'prediction'  # Batch processing creates prediction results
-                            }
-                            
-                            client.execute(create_result_mutation, {'input': result_input})
-                            logging.info(f"Created score result for scoring job {scoring_job['id']}")
-
-                except Exception as e:
-                    logging.error(f"Error processing content_id {content_id}: {str(e)}")
-                    logging.error(f"Full traceback: {traceback.format_exc()}")
-                    continue
+            await complete_batch_results(
+                client,
+                job,
+                content,
+                scoring_jobs,
+                account_key=account_key,
+                scorecard_key=scorecard_key,
+                score_name=score_name,
+                scorecard_class=scorecard_class,
+            )
 
             # After processing all results, update batch job status to COMPLETED
             update_batch_mutation = """
@@ -2,9 +2,12 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock, AsyncMock, mock_open
 from click.testing import CliRunner
 import pandas as pd
+import asyncio
 import json
 import os
 import tempfile
+import threading
+import time
 
 from plexus.cli.batch.operations import (
     batch, generate, status, complete, mark_processed,
@@ -551,4 +554,120 @@ class TestIntegration:
         for msg in batch_request['body']['messages']:
             assert 'role' in msg
             assert 'content' in msg
-            assert msg['role'] in ['system', 'user', 'assistant']
\ No newline at end of file
+            assert msg['role'] in ['system', 'user', 'assistant']
+
+def _batch_output_line(content_id, completion="Yes"):
+    return json.dumps({
+        "custom_id": content_id,
+        "response": {"body": {"choices": [{"message": {"content": completion}}]}},
+    })
+
+
+class _RecordingScore:
+    """Async-context score that tracks how many predictions run at once."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.inputs = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def predict(self, config, score_input):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.inputs.append(score_input)
+        return {"value": score_input.metadata["batch"]["completion"]}
+
+
+class TestCompleteBatchResults:
+    """Test the pipelined completion of one batch output file"""
+
+    @pytest.fixture
+    def scorecard_dir(self, tmp_path, monkeypatch):
+        experiments = tmp_path / 'scorecards' / 'test-scorecard' / 'experiments'
+        experiments.mkdir(parents=True)
+        pd.DataFrame({
+            'id': [101, 102, 103],
+            'text': ['first text', 'second text', 'third text'],
+        }).to_csv(experiments / 'labeled-samples.csv', index=False)
+        monkeypatch.chdir(tmp_path)
+        scorecard_class = Mock()
+        scorecard_class.scores = [{'name': 'test-score'}]
+        scorecard_class.properties = {'key': 'test-scorecard'}
+        return scorecard_class
+
+    @pytest.mark.asyncio
+    async def test_scores_lines_once_and_writes_matching_jobs(self, scorecard_dir):
+        from plexus.cli.batch.operations import complete_batch_results
+
+        score = _RecordingScore()
+        client = Mock()
+        job = {'id': 'batch-1', 'accountId': 'acc-1', 'scorecardId': 'sc-1'}
+        content = "\n".join([
+            _batch_output_line('101', 'Yes'),
+            _batch_output_line('102', 'No'),
+            'not json',
+            _batch_output_line('103', 'Yes'),
+        ])
+        scoring_jobs = [
+            {'id': 'sj-1', 'itemId': '101'},
+            {'id': 'sj-2', 'itemId': '102'},
+        ]
+
+        with patch('plexus.cli.batch.operations.Score.from_name', return_value=score) as from_name, \
+             patch('plexus.cli.batch.operations.select_sample') as select:
+            stats = await complete_batch_results(
+                client, job, content, scoring_jobs,
+                account_key='acct', scorecard_key='test-scorecard', score_name='test-score',
+                scorecard_class=scorecard_dir, score_concurrency=3, write_concurrency=2,
+            )
+
+        from_name.assert_called_once_with('test-scorecard', 'test-score')
+        select.assert_not_called()
+        assert sorted(i.text for i in score.inputs) == ['first text', 'second text', 'third text']
+        assert score.max_in_flight > 1
+
+        written = [call.args[1]['input'] for call in client.execute.call_args_list]
+        results = {w['scoringJobId']: w['value'] for w in written if 'scoringJobId' in w}
+        assert results == {'sj-1': 'Yes', 'sj-2': 'No'}
+
+        summary = stats.summary()
+        assert summary['parse']['items'] == 3
+        assert summary['parse']['errors'] == 1
+        assert summary['score']['items'] == 3
+        assert summary['write']['items'] == 2
+        assert summary['score']['workers'] == 3
+
+    @pytest.mark.asyncio
+    async def test_data_driven_sample_lookups_run_off_the_event_loop(self, scorecard_dir):
+        from plexus.cli.batch.operations import complete_batch_results
+
+        scorecard_dir.scores = [{'name': 'test-score', 'data': {'class': 'FeedbackItems'}}]
+        loop_thread = threading.get_ident()
+        lookup_threads = []
+
+        def slow_select_sample(scorecard_class, score_name, content_id, fresh):
+            lookup_threads.append(threading.get_ident())
+            time.sleep(0.05)
+            return pd.DataFrame({'text': [f'text {content_id}']}), {}
+
+        score = _RecordingScore()
+        content = "\n".join(_batch_output_line(str(content_id)) for content_id in range(101, 105))
+
+        with patch('plexus.cli.batch.operations.Score.from_name', return_value=score), \
+             patch('plexus.cli.batch.operations.select_sample', side_effect=slow_select_sample):
+            await complete_batch_results(
+                Mock(), {'id': 'batch-1', 'accountId': 'acc-1', 'scorecardId': 'sc-1'}, content, [],
+                account_key='acct', scorecard_key='test-scorecard', score_name='test-score',
+                scorecard_class=scorecard_dir, score_concurrency=4, write_concurrency=1,
+            )
+
+        assert sorted(i.text for i in score.inputs) == ['text 101', 'text 102', 'text 103', 'text 104']
+        assert loop_thread not in lookup_threads
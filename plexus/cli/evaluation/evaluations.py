@@ -33,6 +33,8 @@ from plexus.runtime_budget import RuntimeBudgetLimitExceeded, RuntimeBudgetMeter
 from plexus.dashboard.api.client import PlexusDashboardClient
 from plexus.dashboard.api.models.account import Account
 from plexus.dashboard.api.models.evaluation import Evaluation as DashboardEvaluation
+from plexus.data.StreamingParquetReader import StreamingParquetReader
+from plexus.evaluation_journal import EvaluationJournal
 from plexus.dashboard.api.models.scorecard import Scorecard as DashboardScorecard
 from plexus.dashboard.api.models.score import Score as DashboardScore
 from plexus.dashboard.api.models.score_result import ScoreResult
@@ -45,6 +47,7 @@ import threading
 import socket
 import types  # Add this at the top with other imports
 import uuid
+import random
 import inspect
 import subprocess
 
@@ -921,12 +924,19 @@ def load_samples_from_cloud_dataset(dataset: dict, score_name: str, score_config
         logging.info(f"Downloading {file_type} file to: {temp_file_path}")
         s3_client.download_file(bucket_name, key, temp_file_path)
         
-        # Load the data file into a DataFrame
+        # Load the data file into a DataFrame. Parquet files are streamed by
+        # row group so only the sampled rows are materialized.
         logging.info(f"Loading {file_type} file into DataFrame")
         if file_type == 'parquet':
-            df = pd.read_parquet(temp_file_path)
+            reader = StreamingParquetReader(temp_file_path)
+            total_rows = reader.num_rows
+            if number_of_samples and number_of_samples < total_rows:
+                df = reader.sample_dataframe(number_of_samples, random_state=random_seed)
+            else:
+                df = reader.read_dataframe()
         elif file_type == 'csv':
             df = pd.read_csv(temp_file_path)
+            total_rows = len(df)
         else:
             raise ValueError(f"Unsupported file type: {file_type}")
         
@@ -945,7 +955,7 @@ def load_samples_from_cloud_dataset(dataset: dict, score_name: str, score_config
         raise ValueError(f"Failed to load {file_type} file: {str(e)}")
     
     # Essential dataset info
-    logging.info(f"Dataset loaded: {df.shape[0]} rows x {df.shape[1]} columns")
+    logging.info(f"Dataset loaded: {total_rows} rows x {df.shape[1]} columns")
     logging.info(f"Columns: {df.columns.tolist()}")
     
     # Show first 3 rows sample
@@ -973,9 +983,10 @@ def load_samples_from_cloud_dataset(dataset: dict, score_name: str, score_config
     logging.info(f"Loaded DataFrame with {len(df)} rows and columns: {df.columns.tolist()}")
     
     # Sample the dataframe if number_of_samples is specified
-    if number_of_samples and number_of_samples < len(df):
-        logging.info(f"Sampling {number_of_samples} records from {len(df)} total records")
-        df = df.sample(n=number_of_samples, random_state=random_seed)
+    if number_of_samples and number_of_samples < total_rows:
+        logging.info(f"Sampling {number_of_samples} records from {total_rows} total records")
+        if len(df) > number_of_samples:
+            df = df.sample(n=number_of_samples, random_state=random_seed)
         actual_sample_count = number_of_samples
         logging.info(f"Using random_seed: {random_seed if random_seed is not None else 'None (fully random)'}")
     else:
@@ -2088,6 +2099,8 @@ def _build_evaluation_task_metadata(
 @click.option('--notes', default=None, type=str, help='Freeform notes explaining why this evaluation is being run. Stored in evaluation parameters.')
 @click.option('--procedure-id', default=None, type=str, help='Procedure ID to associate with the evaluation task metadata.')
 @click.option('--emit-id-file', default=None, type=str, help='Write the evaluation ID to this file as soon as the record is created (used by programmatic dispatch).')
+@click.option('--journal', 'journal', is_flag=True, default=False, help='Journal completed results locally so an interrupted run can be continued with --resume. The journal is deleted when the evaluation completes.')
+@click.option('--resume', 'resume', default=None, type=str, help='Resume an interrupted evaluation by ID: the sample recorded in its local result journal is reused, items already journaled are not re-scored and the same evaluation record is updated.')
 @_enforce_child_budget_from_env("evaluation.accuracy")
 def accuracy(
     scorecard: str,
@@ -2119,6 +2132,8 @@ def accuracy(
     notes: Optional[str] = None,
     procedure_id: Optional[str] = None,
     emit_id_file: Optional[str] = None,
+    journal: bool = False,
+    resume: Optional[str] = None,
     ):
     """
     Evaluate the accuracy of the scorecard using the current configuration against labeled samples.
@@ -2270,6 +2285,8 @@ def accuracy(
                 cmd.append("--use-langsmith-trace")
             if random_seed is not None:
                 cmd.extend(["--random-seed", str(random_seed)])
+            if journal:
+                cmd.append("--journal")
             if content_ids_to_sample:
                 cmd.extend(["--content-ids-to-sample", content_ids_to_sample])
             if score:
@@ -2400,6 +2417,14 @@ def accuracy(
             if not account:
                 raise Exception(f"Could not find account with key: {account_key}")
             logging.info(f"Found account: {account.name} ({account.id})")
+
+            if resume:
+                # Reuse the interrupted evaluation's record and task instead of creating new ones
+                evaluation_record = DashboardEvaluation.get_by_id(resume, client=client)
+                if not evaluation_record:
+                    raise Exception(f"Could not find evaluation to resume: {resume}")
+                task_id = task_id or getattr(evaluation_record, 'taskId', None)
+                logging.info(f"Resuming evaluation {evaluation_record.id} (task {task_id or 'none'})")
             
             if task_id:
                 # Get existing task if task_id provided (Celery path)
@@ -2492,11 +2517,12 @@ def accuracy(
                         # Parse the score option to get target score identifiers
                         target_score_identifiers = [s.strip() for s in score.split(',')] if score else []
                         
-                        evaluation_record = DashboardEvaluation.create(
-                            client=client,
-                            **experiment_params
-                        )
-                        logging.info(f"Created initial Evaluation record with ID: {evaluation_record.id}")
+                        if evaluation_record is None:
+                            evaluation_record = DashboardEvaluation.create(
+                                client=client,
+                                **experiment_params
+                            )
+                            logging.info(f"Created initial Evaluation record with ID: {evaluation_record.id}")
                         if emit_id_file:
                             try:
                                 with open(emit_id_file, "w") as _f:
@@ -2565,12 +2591,13 @@ def accuracy(
                     experiment_params["scoreVersionId"] = resolved_version
 
                 try:
-                    logging.info("Creating initial Evaluation record for Celery path...")
-                    evaluation_record = DashboardEvaluation.create(
-                        client=client,
-                        **experiment_params
-                    )
-                    logging.info(f"Created initial Evaluation record with ID: {evaluation_record.id}")
+                    if evaluation_record is None:
+                        logging.info("Creating initial Evaluation record for Celery path...")
+                        evaluation_record = DashboardEvaluation.create(
+                            client=client,
+                            **experiment_params
+                        )
+                        logging.info(f"Created initial Evaluation record with ID: {evaluation_record.id}")
                 except Exception as e:
                     logging.error(f"Failed to create or update Evaluation record in Celery path: {str(e)}", exc_info=True)
                     raise
@@ -2849,6 +2876,19 @@ def accuracy(
                 scorecard_id_resolved = scorecard  # Fallback to initial identifier
                 logging.info(f"Using fallback: name='{scorecard_name_resolved}', key='{scorecard_key_resolved}', id='{scorecard_id_resolved}' (type: {type(scorecard_id_resolved)})")
             
+            # A journaled run records its sample so --resume scores the same rows.
+            result_journal = None
+            journaled_sample = None
+            if (journal or resume) and evaluation_record and not dry_run:
+                result_journal = EvaluationJournal(evaluation_record.id)
+                if resume:
+                    journaled_sample = result_journal.read_sample()
+                    if journaled_sample and journaled_sample.get('random_seed') is not None:
+                        random_seed = journaled_sample['random_seed']
+                        logging.info(f"Resuming with the journaled random seed {random_seed}")
+                elif random_seed is None:
+                    random_seed = random.randrange(2 ** 31)
+
             # Check if any cloud dataset options are provided
             data_set_id_for_eval = None
             use_cloud_dataset = any([data_source_name, data_source_key, data_source_id, dataset_id, use_score_associated_dataset])
@@ -2921,6 +2961,14 @@ def accuracy(
             
             logging.info(f"Retrieved {len(labeled_samples_data)} samples.")
 
+            if journaled_sample and journaled_sample.get('content_ids'):
+                labeled_samples_data = select_journaled_samples(labeled_samples_data, journaled_sample['content_ids'])
+            elif result_journal is not None and not resume:
+                result_journal.write_sample(
+                    random_seed,
+                    [sample.get('content_id') for sample in labeled_samples_data]
+                )
+
             if len(labeled_samples_data) == 0:
                 logging.warning("No feedback items found in the specified time window. Marking evaluation as NO_DATA.")
                 if evaluation_record:
@@ -3099,7 +3147,9 @@ def accuracy(
                 score_id=score_id_for_eval,
                 score_version_id=score_version_id_for_eval,
                 override_folder=f"./overrides/{scorecard_name_resolved}",
-                allow_no_labels=allow_no_labels
+                allow_no_labels=allow_no_labels,
+                resume=bool(resume),
+                journal_results=journal,
             )
             logging.info(f"AccuracyEvaluation instantiated for task {task_id} and evaluation {eval_id_for_eval}")
 
@@ -3593,6 +3643,20 @@ def get_data_driven_samples(
         logging.error("Returning empty list due to error")
         return []
 
+def select_journaled_samples(samples, content_ids):
+    """
+    Keep the samples whose content IDs were recorded in a resumed evaluation's
+    journal, in the journaled order.
+    """
+    by_content_id = {str(sample.get('content_id')): sample for sample in samples}
+    selected = [by_content_id[str(content_id)] for content_id in content_ids if str(content_id) in by_content_id]
+    if len(selected) < len(content_ids):
+        logging.warning(
+            f"{len(content_ids) - len(selected)} of {len(content_ids)} journaled samples are no longer "
+            f"in the data source; resuming with the remaining {len(selected)}"
+        )
+    return selected
+
 def get_csv_samples(csv_filename):
     if not os.path.exists(csv_filename):
         logging.error(f"labeled-samples.csv not found at {csv_filename}")
@@ -15,6 +15,7 @@ from plexus.cli.evaluation.evaluations import (
     build_dataset_materialization_failure_message,
     resolve_cloud_dataset_sample_limit,
     load_samples_from_cloud_dataset,
+    select_journaled_samples,
     get_latest_associated_dataset_for_score,
     list_associated_datasets_for_score,
     validate_dataset_materialization,
@@ -448,3 +449,11 @@ def test_fetch_accuracy_evaluation_summary_for_json_returns_empty_on_lookup_erro
         side_effect=RuntimeError("lookup failed"),
     ):
         assert _fetch_accuracy_evaluation_summary_for_json("eval-1") == {}
+
+
+def test_select_journaled_samples_keeps_journaled_order_and_drops_new_rows():
+    samples = [{"content_id": 3}, {"content_id": 1}, {"content_id": 9}]
+
+    selected = select_journaled_samples(samples, ["1", "3", "7"])
+
+    assert selected == [{"content_id": 1}, {"content_id": 3}]
@@ -6,7 +6,6 @@ that can be used by both CLI commands and MCP tools.
 
 import logging
 import asyncio
-import random
 from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
@@ -19,10 +18,59 @@ from plexus.analysis.metrics.metric import Metric
 logger = logging.getLogger(__name__)
 
 
+FEEDBACK_GSI_PAGE_SIZE = 100
+ITEM_CONTENT_BATCH_SIZE = 25
+
+# Feedback fields read from the editedAt GSI; item text and metadata are only
+# requested inline when every row in the window is returned.
+_GSI_FEEDBACK_FIELDS = [
+    'id', 'accountId', 'scorecardId', 'scoreId', 'itemId', 'cacheKey',
+    'initialAnswerValue', 'finalAnswerValue', 'initialCommentValue',
+    'finalCommentValue', 'editCommentValue', 'editedAt', 'editorName',
+    'isAgreement', 'isInvalid', 'createdAt', 'updatedAt'
+]
+_GSI_LEAN_ITEM_FIELDS = ['id', 'identifiers', 'externalId', 'description']
+_HAS_EDIT_COMMENT_FILTER = {"editCommentValue": {"gt": ""}}
+_EARLIEST_EDITED_AT = datetime.min.replace(tzinfo=timezone.utc)
+
+
 def _feedback_item_relationship_fields() -> Dict[str, List[str]]:
     return {"item": list(FeedbackItem.GRAPHQL_ITEM_FIELDS)}
 
 
+def _combine_filter_conditions(conditions: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if not conditions:
+        return None
+    if len(conditions) == 1:
+        return conditions[0]
+    return {"and": conditions}
+
+
+@dataclass
+class FeedbackQueryPass:
+    """One ordered scan of the editedAt GSI with a server-side filter."""
+    filter: Optional[Dict[str, Any]]
+    edit_comment: Optional[bool] = None  # True/False restricts the pass to rows with/without edit comments
+
+    def accepts(self, item: FeedbackItem) -> bool:
+        if self.edit_comment is None:
+            return True
+        return bool(item.editCommentValue) == self.edit_comment
+
+
+@dataclass
+class FeedbackQueryPlan:
+    """How ``FeedbackService.find_feedback_items`` reads feedback for one request."""
+    value_conditions: List[Dict[str, Any]]
+    passes: List[FeedbackQueryPass]
+    row_budget: Optional[int]  # offset + limit; None reads the whole window
+    inline_item_text: bool
+    lazy_item_text: bool
+
+    def budget_met(self, row_count: int) -> bool:
+        return self.row_budget is not None and row_count >= self.row_budget
+
+
 @dataclass
 class FeedbackItemSummary:
     """Token-efficient summary of a feedback item for alignment work."""
@@ -395,7 +443,8 @@ class FeedbackService:
             initial_value=None,
             final_value=None,
             limit=None,
-            prioritize_edit_comments=False  # Get all items for comprehensive analysis
+            prioritize_edit_comments=False,  # Get all items for comprehensive analysis
+            include_item_text=False  # The analysis only reads answer values
         )
         
         # Analyze the feedback items
@@ -452,53 +501,245 @@ class FeedbackService:
         return output_dict
     
     @staticmethod
-    def prioritize_feedback_with_edit_comments(
-        feedback_items: List[FeedbackItem], 
+    def plan_feedback_query(
+        initial_value: Optional[str] = None,
+        final_value: Optional[str] = None,
         limit: Optional[int] = None,
-        prioritize_edit_comments: bool = True
-    ) -> List[FeedbackItem]:
+        offset: Optional[int] = None,
+        prioritize_edit_comments: bool = True,
+        include_item_text: bool = True
+    ) -> FeedbackQueryPlan:
         """
-        Prioritize feedback items that have edit comments when applying a limit.
-        
+        Decide how to read the editedAt GSI for a feedback request.
+
+        Value filters are pushed into the GraphQL filter. When a limit is given the
+        scan stops once ``offset + limit`` matching rows are loaded, and with
+        ``prioritize_edit_comments`` rows with edit comments are read in a first pass
+        so the second pass only tops the page up. Item text is requested inline only
+        when the whole window is returned; otherwise it is fetched for the returned
+        rows after paging.
+
         Args:
-            feedback_items: List of FeedbackItem objects
-            limit: Maximum number of items to return (None for no limit)
-            prioritize_edit_comments: Whether to prioritize items with edit comments
-            
+            initial_value: Optional filter for initial answer value
+            final_value: Optional filter for final answer value
+            limit: Optional limit on number of items to return
+            offset: Optional offset for pagination (number of items to skip)
+            prioritize_edit_comments: Whether items with edit comments come first when limiting
+            include_item_text: Whether the returned items need their item text and metadata
+
         Returns:
-            List of prioritized and optionally limited feedback items
+            FeedbackQueryPlan describing the passes, row budget and text loading
         """
-        if not limit or len(feedback_items) <= limit:
-            return feedback_items
-        
-        if not prioritize_edit_comments:
-            # Just shuffle and return the limit
-            items_copy = feedback_items.copy()
-            random.shuffle(items_copy)
-            return items_copy[:limit]
-        
-        # Separate items with and without edit comments
-        items_with_comments = [item for item in feedback_items if item.editCommentValue]
-        items_without_comments = [item for item in feedback_items if not item.editCommentValue]
-        
-        # Shuffle both groups for randomness when applying limits
-        random.shuffle(items_with_comments)
-        random.shuffle(items_without_comments)
-        
-        # Prioritize items with edit comments
-        result = []
-        
-        # Add as many items with comments as possible
-        comments_to_add = min(len(items_with_comments), limit)
-        result.extend(items_with_comments[:comments_to_add])
-        
-        # Fill remaining slots with items without comments
-        remaining_slots = limit - len(result)
-        if remaining_slots > 0:
-            result.extend(items_without_comments[:remaining_slots])
-        
-        return result
-    
+        value_conditions = []
+        if initial_value:
+            value_conditions.append({"initialAnswerValue": {"eq": initial_value}})
+        if final_value:
+            value_conditions.append({"finalAnswerValue": {"eq": final_value}})
+
+        row_budget = (offset or 0) + limit if limit else None
+
+        if limit and prioritize_edit_comments:
+            passes = [
+                FeedbackQueryPass(_combine_filter_conditions(value_conditions + [_HAS_EDIT_COMMENT_FILTER]), True),
+                FeedbackQueryPass(
+                    _combine_filter_conditions(value_conditions + [{"not": _HAS_EDIT_COMMENT_FILTER}]), False
+                ),
+            ]
+        else:
+            passes = [FeedbackQueryPass(_combine_filter_conditions(value_conditions))]
+
+        return FeedbackQueryPlan(
+            value_conditions=value_conditions,
+            passes=passes,
+            row_budget=row_budget,
+            inline_item_text=include_item_text and row_budget is None,
+            lazy_item_text=include_item_text and row_budget is not None,
+        )
+
+    @staticmethod
+    def _matches_value_filters(
+        item: FeedbackItem,
+        initial_value: Optional[str],
+        final_value: Optional[str],
+        include_invalid: bool = False
+    ) -> bool:
+        if not include_invalid and getattr(item, "isInvalid", False):
+            return False
+        if initial_value and item.initialAnswerValue != initial_value:
+            return False
+        if final_value and item.finalAnswerValue != final_value:
+            return False
+        return True
+
+    @staticmethod
+    def _select_page(
+        feedback_items: List[FeedbackItem],
+        limit: Optional[int],
+        offset: Optional[int],
+        prioritize_edit_comments: bool
+    ) -> List[FeedbackItem]:
+        """
+        Apply edit-comment ordering, offset and limit to newest-first feedback items.
+
+        Items with edit comments keep their relative order and move ahead of the rest,
+        so consecutive offsets page through a stable ordering.
+        """
+        if limit and prioritize_edit_comments:
+            feedback_items = (
+                [item for item in feedback_items if item.editCommentValue]
+                + [item for item in feedback_items if not item.editCommentValue]
+            )
+        start = offset if offset and offset > 0 else 0
+        end = start + limit if limit else None
+        return feedback_items[start:end]
+
+    @staticmethod
+    async def _read_gsi_pages(
+        client,
+        plan: FeedbackQueryPlan,
+        account_id: str,
+        scorecard_id: str,
+        score_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        initial_value: Optional[str],
+        final_value: Optional[str],
+        include_invalid: bool = False
+    ) -> List[FeedbackItem]:
+        """Run the plan's passes against the GSI, stopping once the row budget is met."""
+        item_fields = FeedbackItem.GRAPHQL_ITEM_FIELDS if plan.inline_item_text else _GSI_LEAN_ITEM_FIELDS
+        query = f"""
+        query ListFeedbackItemsByGSI(
+            $accountId: String!,
+            $composite_sk_condition: ModelFeedbackItemByAccountScorecardScoreEditedAtCompositeKeyConditionInput,
+            $filter: ModelFeedbackItemFilterInput,
+            $limit: Int,
+            $nextToken: String,
+            $sortDirection: ModelSortDirection
+        ) {{
+            listFeedbackItemByAccountIdAndScorecardIdAndScoreIdAndEditedAt(
+                accountId: $accountId,
+                scorecardIdScoreIdEditedAt: $composite_sk_condition,
+                filter: $filter,
+                limit: $limit,
+                nextToken: $nextToken,
+                sortDirection: $sortDirection
+            ) {{
+                items {{
+                    {' '.join(_GSI_FEEDBACK_FIELDS)}
+                    item {{ {' '.join(item_fields)} }}
+                }}
+                nextToken
+            }}
+        }}
+        """
+
+        composite_sk_condition = {
+            "between": [
+                {"scorecardId": scorecard_id, "scoreId": score_id, "editedAt": start_date.isoformat()},
+                {"scorecardId": scorecard_id, "scoreId": score_id, "editedAt": end_date.isoformat()},
+            ]
+        }
+
+        collected: List[FeedbackItem] = []
+        seen_ids = set()
+        pages_read = 0
+
+        for query_pass in plan.passes:
+            if plan.budget_met(len(collected)):
+                break
+
+            variables = {
+                "accountId": account_id,
+                "composite_sk_condition": composite_sk_condition,
+                "limit": FEEDBACK_GSI_PAGE_SIZE,
+                "nextToken": None,
+                "sortDirection": "DESC",
+            }
+            if query_pass.filter is not None:
+                variables["filter"] = query_pass.filter
+
+            while True:
+                response = await asyncio.to_thread(client.execute, query, variables)
+                pages_read += 1
+
+                if not isinstance(response, dict):
+                    raise TypeError(f"Unexpected GSI response type: {type(response).__name__}")
+
+                if 'errors' in response:
+                    logger.error(f"GraphQL errors in GSI query: {response['errors']}")
+                    raise RuntimeError(
+                        "Failed to load feedback items with related item metadata "
+                        f"for scorecard {scorecard_id}, score {score_id}: "
+                        f"GSI query failed: {response['errors']}"
+                    )
+
+                result_data = response.get('listFeedbackItemByAccountIdAndScorecardIdAndScoreIdAndEditedAt', {})
+                for item_dict in result_data.get('items', []):
+                    feedback_item = FeedbackItem.from_dict(item_dict, client=client)
+                    if feedback_item.id in seen_ids:
+                        continue
+                    if not FeedbackService._matches_value_filters(
+                        feedback_item, initial_value, final_value, include_invalid
+                    ):
+                        continue
+                    if not query_pass.accepts(feedback_item):
+                        continue
+                    seen_ids.add(feedback_item.id)
+                    collected.append(feedback_item)
+
+                logger.debug(f"Fetched GSI page {pages_read} (total matching: {len(collected)})")
+
+                next_token = result_data.get('nextToken')
+                if not next_token or plan.budget_met(len(collected)):
+                    break
+                variables["nextToken"] = next_token
+
+        logger.info(f"Retrieved {len(collected)} feedback items from GSI in {pages_read} page(s)")
+        return collected
+
+    @staticmethod
+    async def _load_item_content(client, feedback_items: List[FeedbackItem]) -> None:
+        """Fetch item text and metadata for the given feedback items in batched requests."""
+        items_by_id: Dict[str, List[Any]] = {}
+        for feedback_item in feedback_items:
+            item = getattr(feedback_item, 'item', None)
+            if item is not None and getattr(item, 'id', None):
+                items_by_id.setdefault(item.id, []).append(item)
+        if not items_by_id:
+            return
+
+        item_ids = list(items_by_id)
+        batches = [
+            item_ids[start:start + ITEM_CONTENT_BATCH_SIZE]
+            for start in range(0, len(item_ids), ITEM_CONTENT_BATCH_SIZE)
+        ]
+
+        async def load_batch(batch: List[str]) -> Dict[str, Any]:
+            parameters = ", ".join(f"$id{index}: ID!" for index in range(len(batch)))
+            selections = " ".join(
+                f"item{index}: getItem(id: $id{index}) {{ id text metadata }}" for index in range(len(batch))
+            )
+            query = f"query GetFeedbackItemContent({parameters}) {{ {selections} }}"
+            variables = {f"id{index}": item_id for index, item_id in enumerate(batch)}
+            response = await asyncio.to_thread(client.execute, query, variables)
+            if isinstance(response, dict) and 'errors' in response:
+                raise RuntimeError(f"Failed to load item text for feedback items: {response['errors']}")
+            if not isinstance(response, dict):
+                raise TypeError(f"Unexpected item content response type: {type(response).__name__}")
+            return response
+
+        responses = await asyncio.gather(*(load_batch(batch) for batch in batches))
+        for response in responses:
+            for item_data in response.values():
+                if not isinstance(item_data, dict):
+                    continue
+                for item in items_by_id.get(item_data.get('id'), []):
+                    item.text = item_data.get('text')
+                    item.metadata = item_data.get('metadata')
+
+        logger.debug(f"Loaded item content for {len(item_ids)} items in {len(batches)} request(s)")
+
     @staticmethod
     async def find_feedback_items(
         client,
@@ -512,10 +753,16 @@ class FeedbackService:
         final_value: Optional[str] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        prioritize_edit_comments: bool = True
+        prioritize_edit_comments: bool = True,
+        include_item_text: bool = True,
+        include_invalid: bool = False
     ) -> List[FeedbackItem]:
         """
         Find feedback items using the efficient GSI approach.
+
+        Results are ordered newest first by editedAt; when limiting with
+        ``prioritize_edit_comments`` the items with edit comments come first.
+        See ``plan_feedback_query`` for how the GSI is read.
         
         Args:
             client: The GraphQL client instance
@@ -530,6 +777,8 @@ class FeedbackService:
             limit: Optional limit on number of items to return
             offset: Optional offset for pagination (number of items to skip)
             prioritize_edit_comments: Whether to prioritize items with edit comments when limiting
+            include_item_text: Whether to load item text and metadata for the returned items
+            include_invalid: Whether to keep invalidated items (for callers mirroring the table)
             
         Returns:
             List of FeedbackItem objects matching the criteria
@@ -553,7 +802,18 @@ class FeedbackService:
             else f"last {days} days" if days is not None else "all time"
         )
         logger.info(f"Finding feedback items for scorecard {scorecard_id}, score {score_id}, {days_str}")
-        
+
+        plan = FeedbackService.plan_feedback_query(
+            initial_value=initial_value,
+            final_value=final_value,
+            limit=limit,
+            offset=offset,
+            prioritize_edit_comments=prioritize_edit_comments,
+            include_item_text=include_item_text,
+        )
+        value_conditions = plan.value_conditions
+        ordered_by_gsi = False
+
         # When days is None, we can't use the GSI query (which requires editedAt in composite key)
         # so we go straight to the fallback query without date filtering
         if days is None and not (start_date and end_date):
@@ -562,7 +822,8 @@ class FeedbackService:
                 "and": [
                     {"accountId": {"eq": account_id}},
                     {"scorecardId": {"eq": scorecard_id}},
-                    {"scoreId": {"eq": score_id}}
+                    {"scoreId": {"eq": score_id}},
+                    *value_conditions,
                 ]
             }
             
@@ -576,129 +837,32 @@ class FeedbackService:
             
             logger.info(f"Retrieved {len(all_feedback_items)} feedback items from standard query (all time)")
         else:
-            # Use the GSI query with date filtering for better performance
+            # Calculate date range
+            if not (start_date and end_date):
+                start_date = datetime.now(timezone.utc) - timedelta(days=days)
+                # Add a small buffer to end_date to catch items created very recently
+                end_date = datetime.now(timezone.utc) + timedelta(minutes=5)
+
             try:
-                # Calculate date range
-                if not (start_date and end_date):
-                    start_date = datetime.now(timezone.utc) - timedelta(days=days)
-                    # Add a small buffer to end_date to catch items created very recently
-                    end_date = datetime.now(timezone.utc) + timedelta(minutes=5)
-                
                 # Use the GSI query for efficient retrieval (same as reporting system)
-                query = """
-                query ListFeedbackItemsByGSI(
-                    $accountId: String!,
-                    $composite_sk_condition: ModelFeedbackItemByAccountScorecardScoreEditedAtCompositeKeyConditionInput,
-                    $limit: Int,
-                    $nextToken: String,
-                    $sortDirection: ModelSortDirection
-                ) {
-                    listFeedbackItemByAccountIdAndScorecardIdAndScoreIdAndEditedAt(
-                        accountId: $accountId,
-                        scorecardIdScoreIdEditedAt: $composite_sk_condition,
-                        limit: $limit,
-                        nextToken: $nextToken,
-                        sortDirection: $sortDirection
-                    ) {
-                        items {
-                            id
-                            accountId
-                            scorecardId
-                            scoreId
-                            itemId
-                            cacheKey
-                            initialAnswerValue
-                            finalAnswerValue
-                            initialCommentValue
-                            finalCommentValue
-                            editCommentValue
-                            editedAt
-                            editorName
-                            isAgreement
-                            isInvalid
-                            createdAt
-                            updatedAt
-                            item {
-                                id
-                                identifiers
-                                externalId
-                                description
-                                text
-                                metadata
-                            }
-                        }
-                        nextToken
-                    }
-                }
-                """
-                
-                variables = {
-                    "accountId": account_id,
-                    "composite_sk_condition": {
-                        "between": [
-                            {
-                                "scorecardId": scorecard_id,
-                                "scoreId": score_id,
-                                "editedAt": start_date.isoformat()
-                            },
-                            {
-                                "scorecardId": scorecard_id,
-                                "scoreId": score_id,
-                                "editedAt": end_date.isoformat()
-                            }
-                        ]
-                    },
-                    "limit": 100,
-                    "nextToken": None,
-                    "sortDirection": "DESC"
-                }
-                
-                # Handle pagination to get all items
-                all_feedback_items = []
-                next_token = None
-                
-                while True:
-                    if next_token:
-                        variables["nextToken"] = next_token
-                    
-                    # Execute the query (async operation)
-                    response = await asyncio.to_thread(client.execute, query, variables)
-                    
-                    if not isinstance(response, dict):
-                        raise TypeError(f"Unexpected GSI response type: {type(response).__name__}")
-
-                    if 'errors' in response:
-                        logger.error(f"GraphQL errors in GSI query: {response['errors']}")
-                        raise RuntimeError(
-                            "Failed to load feedback items with related item metadata "
-                            f"for scorecard {scorecard_id}, score {score_id}: "
-                            f"GSI query failed: {response['errors']}"
-                        )
-                    
-                    result_data = response.get('listFeedbackItemByAccountIdAndScorecardIdAndScoreIdAndEditedAt', {})
-                    items_data = result_data.get('items', [])
-                    
-                    # Convert to FeedbackItem objects
-                    batch_items = [FeedbackItem.from_dict(item_dict, client=client) for item_dict in items_data]
-                    all_feedback_items.extend(batch_items)
-                    
-                    logger.debug(f"Fetched {len(batch_items)} items (total: {len(all_feedback_items)})")
-                    
-                    # Check for more pages
-                    next_token = result_data.get('nextToken')
-                    if not next_token:
-                        break
-                
-                logger.info(f"Retrieved {len(all_feedback_items)} feedback items from GSI")
-                
+                all_feedback_items = await FeedbackService._read_gsi_pages(
+                    client,
+                    plan,
+                    account_id=account_id,
+                    scorecard_id=scorecard_id,
+                    score_id=score_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                    initial_value=initial_value,
+                    final_value=final_value,
+                    include_invalid=include_invalid,
+                )
+                ordered_by_gsi = True
             except RuntimeError:
                 raise
             except Exception as e:
                 logger.warning("GSI query failed, falling back to standard query: %s", str(e))
 
-                if not (start_date and end_date):
-                    start_date = datetime.now(timezone.utc) - timedelta(days=days)
-                    end_date = datetime.now(timezone.utc) + timedelta(minutes=5)
                 filter_condition = {
                     "and": [
                         {"accountId": {"eq": account_id}},
@@ -706,6 +870,7 @@ class FeedbackService:
                         {"scoreId": {"eq": score_id}},
                         {"editedAt": {"ge": start_date.isoformat()}},
                         {"editedAt": {"le": end_date.isoformat()}},
+                        *value_conditions,
                     ]
                 }
 
@@ -719,41 +884,25 @@ class FeedbackService:
 
                 logger.info(f"Retrieved {len(all_feedback_items)} feedback items from fallback query")
         
-        # Always exclude invalidated feedback items for alignment workflows.
-        all_feedback_items = [item for item in all_feedback_items if not getattr(item, "isInvalid", False)]
-
-        # Apply value filters if specified
-        if initial_value or final_value:
-            filtered_items = []
-            for item in all_feedback_items:
-                matches = True
-                if initial_value and item.initialAnswerValue != initial_value:
-                    matches = False
-                if final_value and item.finalAnswerValue != final_value:
-                    matches = False
-                if matches:
-                    filtered_items.append(item)
-            all_feedback_items = filtered_items
-            logger.info(f"After value filtering: {len(all_feedback_items)} items")
-        
-        # Apply offset if specified
-        if offset and offset > 0:
-            if offset >= len(all_feedback_items):
-                logger.info(f"Offset {offset} >= total items {len(all_feedback_items)}, returning empty list")
-                return []
-            all_feedback_items = all_feedback_items[offset:]
-            logger.info(f"After applying offset {offset}: {len(all_feedback_items)} items remaining")
-        
-        # Apply prioritization and limit if specified
-        if limit:
-            all_feedback_items = FeedbackService.prioritize_feedback_with_edit_comments(
-                all_feedback_items, 
-                limit=limit, 
-                prioritize_edit_comments=prioritize_edit_comments
+        # Exclude invalidated feedback items for alignment workflows unless asked; value filters are
+        # re-checked here because the standard query's filter is advisory.
+        all_feedback_items = [
+            item for item in all_feedback_items
+            if FeedbackService._matches_value_filters(item, initial_value, final_value, include_invalid)
+        ]
+
+        if limit or (offset and offset > 0):
+            if not ordered_by_gsi:
+                # Standard queries come back unordered; the GSI already returns newest first.
+                all_feedback_items.sort(key=lambda item: item.editedAt or _EARLIEST_EDITED_AT, reverse=True)
+            all_feedback_items = FeedbackService._select_page(
+                all_feedback_items, limit, offset, prioritize_edit_comments
             )
-            logger.info(f"After prioritization and limit: {len(all_feedback_items)} items")
-        
-        # Items are already sorted by the GSI query in DESC order
+            logger.info(f"After offset {offset or 0} and limit {limit}: {len(all_feedback_items)} items")
+
+        if ordered_by_gsi and plan.lazy_item_text:
+            await FeedbackService._load_item_content(client, all_feedback_items)
+
         logger.info(f"Final result: {len(all_feedback_items)} feedback items")
         return all_feedback_items
     
@@ -91,3 +91,114 @@ async def test_find_feedback_items_gsi_excludes_invalid_items():
     )
 
     assert [item.id for item in results] == ["valid-1"]
+
+
+def _gsi_row(row_id, edited_at, edit_comment=None, final_value="Yes"):
+    return {
+        "id": row_id,
+        "accountId": "account-789",
+        "scorecardId": "scorecard-123",
+        "scoreId": "score-456",
+        "itemId": f"item-{row_id}",
+        "initialAnswerValue": "No",
+        "finalAnswerValue": final_value,
+        "editCommentValue": edit_comment,
+        "isInvalid": False,
+        "editedAt": edited_at,
+        "item": {"id": f"item-{row_id}", "externalId": f"ext-{row_id}", "identifiers": []},
+    }
+
+
+class _FakeFeedbackClient:
+    """Serves GSI pages per filter and item content, recording each request."""
+
+    def __init__(self, pages_by_pass):
+        self.pages_by_pass = pages_by_pass
+        self.gsi_calls = []
+        self.content_calls = []
+
+    def execute(self, query, variables):
+        if "GetFeedbackItemContent" in query:
+            self.content_calls.append(dict(variables))
+            return {
+                f"item{key[2:]}": {"id": item_id, "text": f"text for {item_id}", "metadata": "{}"}
+                for key, item_id in variables.items()
+            }
+        self.gsi_calls.append((query, dict(variables)))
+        pass_index = 1 if "not" in str(variables.get("filter")) else 0
+        pages = self.pages_by_pass[pass_index]
+        page_index = int(variables["nextToken"] or 0)
+        next_token = str(page_index + 1) if page_index + 1 < len(pages) else None
+        return {
+            "listFeedbackItemByAccountIdAndScorecardIdAndScoreIdAndEditedAt": {
+                "items": [dict(row) for row in pages[page_index]],
+                "nextToken": next_token,
+            }
+        }
+
+
+@pytest.mark.asyncio
+async def test_find_feedback_items_stops_paging_and_loads_text_for_returned_rows():
+    pages = [
+        [_gsi_row("a", "2026-04-22T03:00:00Z"), _gsi_row("b", "2026-04-22T02:00:00Z")],
+        [_gsi_row("c", "2026-04-22T01:00:00Z"), _gsi_row("d", "2026-04-22T00:00:00Z")],
+        [_gsi_row("e", "2026-04-21T00:00:00Z")],
+    ]
+    client = _FakeFeedbackClient([pages])
+
+    results = await FeedbackService.find_feedback_items(
+        client=client,
+        scorecard_id="scorecard-123",
+        score_id="score-456",
+        account_id="account-789",
+        days=90,
+        final_value="Yes",
+        limit=2,
+        offset=1,
+        prioritize_edit_comments=False,
+    )
+
+    assert [item.id for item in results] == ["b", "c"]
+    assert len(client.gsi_calls) == 2
+    query, variables = client.gsi_calls[0]
+    assert variables["filter"] == {"finalAnswerValue": {"eq": "Yes"}}
+    assert "text" not in query.split("item {")[1]
+    assert client.content_calls == [{"id0": "item-b", "id1": "item-c"}]
+    assert [item.item.text for item in results] == ["text for item-b", "text for item-c"]
+
+
+@pytest.mark.asyncio
+async def test_find_feedback_items_reads_edit_comments_before_topping_up():
+    commented = [[_gsi_row("commented", "2026-04-20T00:00:00Z", edit_comment="Fixed")]]
+    uncommented = [
+        [_gsi_row("newest", "2026-04-22T00:00:00Z"), _gsi_row("older", "2026-04-21T00:00:00Z")],
+        [_gsi_row("oldest", "2026-04-19T00:00:00Z")],
+    ]
+    client = _FakeFeedbackClient([commented, uncommented])
+
+    results = await FeedbackService.find_feedback_items(
+        client=client,
+        scorecard_id="scorecard-123",
+        score_id="score-456",
+        account_id="account-789",
+        days=30,
+        limit=2,
+        include_item_text=False,
+    )
+
+    assert [item.id for item in results] == ["commented", "newest"]
+    assert [variables["filter"] for _, variables in client.gsi_calls] == [
+        {"editCommentValue": {"gt": ""}},
+        {"not": {"editCommentValue": {"gt": ""}}},
+    ]
+    assert client.content_calls == []
+
+
+def test_plan_feedback_query_reads_whole_window_with_inline_text_without_limit():
+    plan = FeedbackService.plan_feedback_query(initial_value="No", final_value="Yes")
+
+    assert plan.row_budget is None
+    assert plan.inline_item_text and not plan.lazy_item_text
+    assert [query_pass.filter for query_pass in plan.passes] == [
+        {"and": [{"initialAnswerValue": {"eq": "No"}}, {"finalAnswerValue": {"eq": "Yes"}}]}
+    ]
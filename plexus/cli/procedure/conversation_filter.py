@@ -6,6 +6,9 @@ message content and token limits for optimal model context management.
 """
 
 import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from abc import ABC, abstractmethod
 
@@ -16,6 +19,101 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# OpenAI message formatting overhead (role, etc.) per message and per conversation.
+MESSAGE_TOKEN_OVERHEAD = 4
+CONVERSATION_TOKEN_OVERHEAD = 2
+
+
+@lru_cache(maxsize=None)
+def _encoding_for_model(model: str):
+    """Return the tiktoken encoding for ``model``, loaded once per process."""
+    if not tiktoken:
+        logger.warning("TikToken not available - token counting will be approximate")
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        logger.warning(f"Model '{model}' not recognized by tiktoken, using cl100k_base encoding")
+        return tiktoken.get_encoding("cl100k_base")
+
+
+class TokenLedger:
+    """
+    Memoized per-message token counts for one encoding.
+
+    Agent conversations are re-filtered before every model turn, so the same
+    messages are counted again and again. The ledger remembers each message's
+    count by identity (valid while its content object is unchanged) and by
+    content hash, so only new or edited messages are encoded. Counts include the
+    per-message formatting overhead, matching ``_count_message_tokens``.
+    """
+
+    def __init__(self, encoding, max_entries: int = 4096):
+        self.encoding = encoding
+        self.max_entries = max_entries
+        self._by_identity: "OrderedDict[int, tuple]" = OrderedDict()
+        self._by_content: "OrderedDict[tuple, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.encode_calls = 0
+
+    def _encode_count(self, content) -> int:
+        self.encode_calls += 1
+        try:
+            return len(self.encoding.encode(content)) + MESSAGE_TOKEN_OVERHEAD
+        except Exception as e:
+            logger.warning(f"Error counting tokens for message: {e}")
+            return len(content) // 4  # Rough approximation: 4 chars per token
+
+    def _remember(self, cache: OrderedDict, key, value) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > self.max_entries:
+            cache.popitem(last=False)
+
+    def count(self, message) -> int:
+        """Token count for a single message (0 for messages without content)."""
+        content = getattr(message, 'content', None)
+        if not content:
+            return 0
+        if not isinstance(content, str):
+            # Structured (multi-part) content is not hashable; count it directly.
+            return self._encode_count(content)
+
+        identity = id(message)
+        with self._lock:
+            cached = self._by_identity.get(identity)
+            if cached is not None and cached[0] is content:
+                self._by_identity.move_to_end(identity)
+                return cached[1]
+            # str caches its hash, so this key is cheap to recompute.
+            content_key = (len(content), hash(content))
+            tokens = self._by_content.get(content_key)
+            if tokens is not None:
+                self._by_content.move_to_end(content_key)
+        if tokens is None:
+            tokens = self._encode_count(content)
+        with self._lock:
+            self._remember(self._by_content, content_key, tokens)
+            self._remember(self._by_identity, identity, (content, tokens))
+        return tokens
+
+    def counts(self, messages: List) -> List[int]:
+        return [self.count(message) for message in messages]
+
+
+_ledgers: Dict[int, TokenLedger] = {}
+_ledgers_lock = threading.Lock()
+
+
+def get_token_ledger(encoding) -> TokenLedger:
+    """The ledger shared by every filter using ``encoding``."""
+    with _ledgers_lock:
+        ledger = _ledgers.get(id(encoding))
+        if ledger is None or ledger.encoding is not encoding:
+            ledger = TokenLedger(encoding)
+            _ledgers[id(encoding)] = ledger
+        return ledger
+
 
 class ConversationFilter(ABC):
     """Abstract base class for conversation filtering strategies."""
@@ -46,16 +144,15 @@ class ConversationFilterBase:
         self._setup_tokenizer()
     
     def _setup_tokenizer(self):
-        """Setup the tokenizer for the specified model."""
-        self.encoding = None
-        if tiktoken:
-            try:
-                self.encoding = tiktoken.encoding_for_model(self.model)
-            except KeyError:
-                logger.warning(f"Model '{self.model}' not recognized by tiktoken, using cl100k_base encoding")
-                self.encoding = tiktoken.get_encoding("cl100k_base")
-        else:
-            logger.warning("TikToken not available - token counting will be approximate")
+        """Setup the tokenizer for the specified model (shared across filter instances)."""
+        self.encoding = _encoding_for_model(self.model)
+    
+    @property
+    def token_ledger(self) -> Optional[TokenLedger]:
+        """Shared token-count ledger for this filter's encoding, if any."""
+        if not self.encoding:
+            return None
+        return get_token_ledger(self.encoding)
     
     def _count_message_tokens(self, message) -> int:
         """
@@ -69,14 +166,13 @@ class ConversationFilterBase:
         """
         if not self.encoding or not hasattr(message, 'content') or not message.content:
             return 0
-        
-        try:
-            content_tokens = len(self.encoding.encode(message.content))
-            # Add overhead tokens for message structure (role, etc.)
-            return content_tokens + 4  # OpenAI message formatting overhead
-        except Exception as e:
-            logger.warning(f"Error counting tokens for message: {e}")
-            return len(message.content) // 4  # Rough approximation: 4 chars per token
+        return self.token_ledger.count(message)
+    
+    def _message_token_counts(self, conversation_history: List) -> List[int]:
+        """Per-message token counts (all zero without an encoding)."""
+        if not self.encoding:
+            return [0] * len(conversation_history)
+        return self.token_ledger.counts(conversation_history)
     
     def _count_conversation_tokens(self, conversation_history: List) -> int:
         """
@@ -88,8 +184,7 @@ class ConversationFilterBase:
         Returns:
             Total token count
         """
-        total_tokens = sum(self._count_message_tokens(msg) for msg in conversation_history)
-        return total_tokens + 2  # Conversation overhead
+        return sum(self._message_token_counts(conversation_history)) + CONVERSATION_TOKEN_OVERHEAD
     
     def _get_message_type_name(self, message) -> str:
         """Get human-readable message type name."""
@@ -116,12 +211,13 @@ class ConversationFilterBase:
         logger.info(f"   Conversation: {len(conversation_history)} messages")
         
         # Count total tokens
-        total_tokens = self._count_conversation_tokens(conversation_history)
+        message_token_counts = self._message_token_counts(conversation_history)
+        total_tokens = sum(message_token_counts) + CONVERSATION_TOKEN_OVERHEAD
         
         # Per-message token breakdown
         message_breakdown = []
         for i, message in enumerate(conversation_history):
-            message_tokens = self._count_message_tokens(message)
+            message_tokens = message_token_counts[i]
             message_type = self._get_message_type_name(message)
             content_length = len(message.content) if hasattr(message, 'content') and message.content else 0
             
@@ -283,7 +379,10 @@ class TokenAwareConversationFilter(ConversationFilterBase, ConversationFilter):
         logger.info(f"   Original history: {len(conversation_history)} messages")
         
         # Phase 1: Analyze original conversation
-        original_tokens = self._count_conversation_tokens(conversation_history) if max_tokens else 0
+        message_token_counts = self._message_token_counts(conversation_history) if max_tokens else []
+        original_tokens = sum(message_token_counts) + CONVERSATION_TOKEN_OVERHEAD if max_tokens else 0
+        # Adjusted as messages are truncated, instead of recounting the filtered history.
+        filtered_tokens = original_tokens
         if max_tokens:
             logger.info(f"   📊 Original: {original_tokens} tokens, Limit: {max_tokens} tokens")
             if original_tokens > max_tokens:
@@ -296,19 +395,20 @@ class TokenAwareConversationFilter(ConversationFilterBase, ConversationFilter):
         for i, message in enumerate(conversation_history):
             if self._is_tool_result_message(message):
                 tool_result_indices.append(i)
+        tool_result_positions = {index: position for position, index in enumerate(tool_result_indices)}
         
         logger.info(f"   🔧 Found {len(tool_result_indices)} tool result messages at indices: {tool_result_indices}")
         
         # Phase 3: Apply filtering rules with per-message logging
         filtered_history = []
         for i, message in enumerate(conversation_history):
-            message_tokens = self._count_message_tokens(message) if max_tokens else 0
+            message_tokens = message_token_counts[i] if max_tokens else 0
             message_type = self._get_message_type_name(message)
             content_length = len(message.content) if hasattr(message, 'content') and message.content else 0
             
-            if i in tool_result_indices:
+            if i in tool_result_positions:
                 # This is a tool result message
-                tool_index = tool_result_indices.index(i)
+                tool_index = tool_result_positions[i]
                 # Keep most recent 2 tool results (or all if <= 2 total)
                 is_recent = tool_index >= max(0, len(tool_result_indices) - 2)
                 
@@ -329,6 +429,7 @@ class TokenAwareConversationFilter(ConversationFilterBase, ConversationFilter):
                         
                         filtered_history.append(truncated_message)
                         new_tokens = self._count_message_tokens(truncated_message) if max_tokens else 0
+                        filtered_tokens += new_tokens - message_tokens
                         token_info = f", {message_tokens}→{new_tokens} tokens" if max_tokens else ""
                         logger.info(f"   ✂️  Truncated older tool result #{tool_index + 1} ({content_length}→{len(truncated_content + truncation_notice)} chars{token_info})")
                     else:
@@ -343,7 +444,6 @@ class TokenAwareConversationFilter(ConversationFilterBase, ConversationFilter):
                 logger.info(f"   ➡️  Keeping {message_type} as-is ({content_length} chars{token_info})")
         
         # Phase 4: Final analysis
-        filtered_tokens = self._count_conversation_tokens(filtered_history) if max_tokens else 0
         logger.info(f"   Filtered history: {len(filtered_history)} messages")
         
         if max_tokens:
@@ -867,7 +967,9 @@ class SOPAgentConversationFilter(ConversationFilterBase, ConversationFilter):
             return []
         
         # Phase 1: Analyze original conversation
-        original_tokens = self._count_conversation_tokens(conversation_history) if max_tokens else 0
+        message_token_counts = self._message_token_counts(conversation_history) if max_tokens else []
+        original_tokens = sum(message_token_counts) + CONVERSATION_TOKEN_OVERHEAD if max_tokens else 0
+        filtered_tokens = CONVERSATION_TOKEN_OVERHEAD if max_tokens else 0
         if max_tokens:
             logger.info(f"   📊 Original: {original_tokens} tokens, Target: {max_tokens} tokens")
         
@@ -884,7 +986,8 @@ class SOPAgentConversationFilter(ConversationFilterBase, ConversationFilter):
             if is_recent:
                 # Keep recent messages in full
                 filtered_history.append(message)
-                message_tokens = self._count_message_tokens(message) if max_tokens else 0
+                message_tokens = message_token_counts[i] if max_tokens else 0
+                filtered_tokens += message_tokens
                 message_type = self._get_message_type_name(message)
                 content_length = len(message.content) if hasattr(message, 'content') and message.content else 0
                 token_info = f", {message_tokens} tokens" if max_tokens else ""
@@ -906,12 +1009,12 @@ class SOPAgentConversationFilter(ConversationFilterBase, ConversationFilter):
                 filtered_history.append(summary_message)
                 
                 summary_tokens = self._count_message_tokens(summary_message) if max_tokens else 0
-                original_tokens = self._count_message_tokens(message) if max_tokens else 0
-                token_info = f", {original_tokens}→{summary_tokens} tokens" if max_tokens else ""
+                filtered_tokens += summary_tokens
+                message_tokens = message_token_counts[i] if max_tokens else 0
+                token_info = f", {message_tokens}→{summary_tokens} tokens" if max_tokens else ""
                 logger.info(f"   ✂️  Summarized message [{i}] ({len(summary_content)} chars{token_info})")
         
         # Phase 4: Final analysis
-        filtered_tokens = self._count_conversation_tokens(filtered_history) if max_tokens else 0
         logger.info(f"   Filtered history: {len(filtered_history)} messages")
         
         if max_tokens:
@@ -13,7 +13,9 @@ from plexus.cli.procedure.conversation_filter import (
     ConversationFilterBase, 
     TokenAwareConversationFilter, 
     WorkerAgentConversationFilter,
-    ManagerAgentConversationFilter
+    ManagerAgentConversationFilter,
+    SOPAgentConversationFilter,
+    TokenLedger,
 )
 
 
@@ -948,4 +950,65 @@ class TestManagerAgentConversationFilter:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])
+
+
+class CountingEncoding:
+    """Whitespace tokenizer that records how often it encodes."""
+    
+    def __init__(self):
+        self.encoded = []
+    
+    def encode(self, text):
+        self.encoded.append(text)
+        return text.split()
+
+
+class TestTokenLedger:
+    """Token counts are memoized so repeated filtering only encodes new messages."""
+    
+    def test_given_repeated_counts_then_each_message_is_encoded_once(self):
+        encoding = CountingEncoding()
+        ledger = TokenLedger(encoding)
+        message = MockHumanMessage("one two three")
+        
+        assert ledger.count(message) == 3 + 4
+        assert ledger.count(message) == 3 + 4
+        assert len(encoding.encoded) == 1
+        
+        # Same content on a different message object reuses the content-hash entry.
+        assert ledger.count(MockHumanMessage("one two three")) == 7
+        assert len(encoding.encoded) == 1
+        
+        # Editing the content in place invalidates the identity entry.
+        message.content = "one two"
+        assert ledger.count(message) == 2 + 4
+        assert len(encoding.encoded) == 2
+    
+    def test_given_messages_then_counts_include_overhead_and_skip_empty_content(self):
+        ledger = TokenLedger(CountingEncoding())
+        messages = [MockHumanMessage("a b"), MockAIMessage(""), MockToolMessage("c")]
+        
+        assert ledger.counts(messages) == [6, 0, 5]
+    
+    def test_when_growing_conversation_is_refiltered_then_only_new_messages_are_encoded(self):
+        encoding = CountingEncoding()
+        with patch('plexus.cli.procedure.conversation_filter._encoding_for_model', return_value=encoding):
+            token_filter = TokenAwareConversationFilter()
+            sop_filter = SOPAgentConversationFilter()
+        
+        history = [MockSystemMessage("system prompt"), MockHumanMessage("please do the task")]
+        for turn in range(5):
+            history.append(MockAIMessage(f"thinking about step {turn}"))
+            history.append(MockToolMessage(f"result {turn} " + "x " * 300))
+            token_filter.filter_conversation(history, max_tokens=10000)
+        
+        original_messages = set(id(m.content) for m in history)
+        encoded_originals = [text for text in encoding.encoded if id(text) in original_messages]
+        assert len(encoded_originals) == len(history)
+        
+        # Filters using the same encoding share the ledger.
+        before = len(encoding.encoded)
+        assert sop_filter.token_ledger is token_filter.token_ledger
+        assert sop_filter._count_conversation_tokens(history) == token_filter._count_conversation_tokens(history)
+        assert len(encoding.encoded) == before
@@ -331,6 +331,17 @@ def _persist_inference_costs_to_state(storage: Any, procedure_id: str, cost_even
         logger.warning("Failed persisting inference costs to state: %s", exc)
 
 
+def _flush_procedure_storage(storage: Any, procedure_id: str) -> None:
+    """Persist state buffered by the storage adapter (best-effort)."""
+    flush = getattr(storage, "flush", None)
+    if not callable(flush):
+        return
+    try:
+        flush(procedure_id)
+    except Exception as exc:
+        logger.warning("Failed flushing procedure state for %s: %s", procedure_id, exc)
+
+
 def _normalize_tactus_result(result: Any) -> Dict[str, Any]:
     """Normalize runtime results so wrapped logical failures are surfaced as top-level failures."""
     if not isinstance(result, dict):
@@ -767,6 +778,7 @@ async def _execute_tactus(
     log_bridge: Optional[_PlexusTraceLogBridge] = None
     cw_logger = None
     _uninstall_cw_llm_patch = None
+    storage = None
 
     try:
         from tactus.core import TactusRuntime
@@ -1157,6 +1169,7 @@ async def _execute_tactus(
                     getattr(event, "total_cost", None) or getattr(event, "cost", None),
                 )
             _persist_inference_costs_to_state(storage, procedure_id, [event])
+            _flush_procedure_storage(storage, procedure_id)
 
         # Generate invocation_run_id here so it can be used for CloudWatch stream naming.
         invocation_run_id = str(uuid.uuid4())
@@ -1502,6 +1515,7 @@ async def _execute_tactus(
         if log_bridge:
             await log_bridge.flush()
             _persist_inference_costs_to_state(storage, procedure_id, log_bridge.cost_events)
+        _flush_procedure_storage(storage, procedure_id)
 
         execution_succeeded = bool(isinstance(result, dict) and result.get("success"))
 
@@ -1557,6 +1571,8 @@ async def _execute_tactus(
                 await log_bridge.close()
             except Exception as close_error:
                 logger.warning("Failed closing trace log bridge after cancellation: %s", close_error)
+        if storage is not None:
+            _flush_procedure_storage(storage, procedure_id)
         if _uninstall_cw_llm_patch is not None:
             _uninstall_cw_llm_patch()
         if cw_logger is not None:
@@ -1583,6 +1599,8 @@ async def _execute_tactus(
                 await log_bridge.close()
             except Exception as close_error:
                 logger.warning("Failed closing trace log bridge after error: %s", close_error)
+        if storage is not None:
+            _flush_procedure_storage(storage, procedure_id)
         if _uninstall_cw_llm_patch is not None:
             _uninstall_cw_llm_patch()
         if cw_logger is not None:
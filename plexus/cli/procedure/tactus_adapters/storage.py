@@ -4,8 +4,15 @@ Plexus Storage Adapter for Tactus.
 Implements the Tactus StorageBackend protocol using Plexus GraphQL API.
 The DynamoDB Procedure record is an index card: it holds S3 keys and replay_index.
 All procedure data (state, lua_state, checkpoints) lives in S3 attachments.
+
+The adapter is a write-back cache for its procedure: state changes are applied
+to the in-memory metadata and only persisted at explicit boundaries
+(``save_procedure_metadata`` at Tactus checkpoints, checkpoint changes, status
+updates and ``flush()``). A flush uploads only the attachments whose content
+changed since they were last loaded or stored.
 """
 
+import hashlib
 import logging
 import json
 import os
@@ -188,6 +195,16 @@ def _looks_like_optimizer_state(state: Any) -> bool:
     )
 
 
+def _payload_digest(payload_json: str) -> str:
+    return hashlib.sha256(payload_json.encode('utf-8')).hexdigest()
+
+
+def _checkpoint_name(entry: Any) -> Optional[str]:
+    if entry.type == 'checkpoint' and isinstance(entry.result, dict):
+        return entry.result.get('name')
+    return None
+
+
 class PlexusStorageAdapter:
     """
     Implements Tactus StorageBackend protocol using Plexus GraphQL.
@@ -208,6 +225,13 @@ class PlexusStorageAdapter:
         self.procedure_id = procedure_id
         self._is_builtin = is_builtin_procedure_id(procedure_id)
         self._metadata_cache: Optional[ProcedureMetadata] = None
+        # Unpersisted state changes in the cached metadata.
+        self._dirty = False
+        # Digest of each attachment as last loaded from or stored to S3.
+        self._stored_digests: Dict[str, str] = {}
+        self._stored_replay_index: Optional[int] = None
+        self._checkpoint_index: Dict[str, Any] = {}
+        self._checkpoint_index_key: Optional[tuple] = None
         logger.info(f"PlexusStorageAdapter initialized for procedure {procedure_id}")
 
     def _fetch_raw_procedure_metadata(self, procedure_id: str) -> Dict[str, Any]:
@@ -293,6 +317,8 @@ class PlexusStorageAdapter:
                     logger.warning("Procedure metadata was not valid JSON; defaulting to empty object")
                     raw_metadata = {}
 
+            stored_digests: Dict[str, str] = {}
+
             def _load_s3_field(raw_value: Any, field_name: str, default: Any) -> Any:
                 """Return field value, downloading from S3 if it's an offloaded pointer."""
                 if isinstance(raw_value, dict) and '_s3_key' in raw_value:
@@ -300,6 +326,8 @@ class PlexusStorageAdapter:
                         s3 = boto3.client('s3')
                         obj = s3.get_object(Bucket=_S3_BUCKET, Key=raw_value['_s3_key'])
                         loaded = json.loads(obj['Body'].read().decode('utf-8'))
+                        # Unchanged attachments are not uploaded again on the next flush.
+                        stored_digests[field_name] = _payload_digest(json.dumps(loaded))
                         logger.info("Loaded %s from S3: %s/%s", field_name, _S3_BUCKET, raw_value['_s3_key'])
                         return loaded
                     except (ClientError, json.JSONDecodeError) as s3_err:
@@ -338,6 +366,10 @@ class PlexusStorageAdapter:
                 waiting_on_message_id=procedure_data.get('waitingOnMessageId')
             )
 
+            if isinstance(raw_metadata.get('dashboard_state'), dict) and 'state' in stored_digests:
+                stored_digests['dashboard_state'] = stored_digests['state']
+            self._stored_digests = stored_digests
+            self._stored_replay_index = metadata.replay_index
             self._metadata_cache = metadata
             logger.debug(f"Loaded metadata for {procedure_id}: {len(execution_log)} checkpoints, {len(metadata.state)} state keys")
             return metadata
@@ -353,10 +385,29 @@ class PlexusStorageAdapter:
         """
         Save procedure metadata to Plexus via GraphQL.
 
+        Tactus calls this at checkpoint boundaries, so it also persists any
+        state changes buffered since the last save. Attachments whose content
+        has not changed are not uploaded again.
+
         Args:
             procedure_id: Procedure ID (for API compatibility)
             metadata: ProcedureMetadata to save
         """
+        self._metadata_cache = metadata
+        self._persist(metadata)
+
+    def flush(self, procedure_id: Optional[str] = None) -> bool:
+        """
+        Persist buffered state changes. Returns True if anything was written.
+
+        Call at the end of a run (and other points where the stored record
+        must be current); checkpoints and status updates flush on their own.
+        """
+        if not self._dirty or self._metadata_cache is None:
+            return False
+        return self._persist(self._metadata_cache)
+
+    def _persist(self, metadata: ProcedureMetadata) -> bool:
         # Convert execution_log to serializable format (store as checkpoints for backward compat)
         checkpoints_dict = {}
         for checkpoint in metadata.execution_log:
@@ -371,15 +422,24 @@ class PlexusStorageAdapter:
                     entry['run_id'] = checkpoint.run_id
                 checkpoints_dict[name] = entry
 
-        # Build metadata JSON. Preserve any unrelated top-level keys already on
-        # the Procedure record (for example runtime/last_failure telemetry).
-        metadata_json = self._fetch_raw_procedure_metadata(metadata.procedure_id)
-        metadata_json.update({
-            'checkpoints': checkpoints_dict,
-            'state': metadata.state,
-            'lua_state': metadata.lua_state,
-            'replay_index': metadata.replay_index
-        })
+        if self._is_builtin:
+            self._dirty = False
+            logger.debug("Saved in-memory metadata for built-in procedure %s", metadata.procedure_id)
+            return False
+
+        payloads = {
+            'state': json.dumps(metadata.state),
+            'lua_state': json.dumps(metadata.lua_state),
+            'checkpoints': json.dumps(checkpoints_dict),
+        }
+        changed = {
+            field for field, payload_json in payloads.items()
+            if self._stored_digests.get(field) != _payload_digest(payload_json)
+        }
+        if not changed and self._stored_replay_index == metadata.replay_index:
+            self._dirty = False
+            logger.debug("Metadata for %s unchanged since last save; nothing to write", metadata.procedure_id)
+            return False
 
         # Update via GraphQL mutation
         mutation = """
@@ -412,17 +472,17 @@ class PlexusStorageAdapter:
         """
 
         try:
-            if self._is_builtin:
-                self._metadata_cache = metadata
-                logger.debug("Saved in-memory metadata for built-in procedure %s", metadata.procedure_id)
-                return
+            # Build metadata JSON. Preserve any unrelated top-level keys already on
+            # the Procedure record (for example runtime/last_failure telemetry).
+            metadata_json = self._fetch_raw_procedure_metadata(metadata.procedure_id)
+            metadata_json.update({'replay_index': metadata.replay_index})
 
             # Procedure data lives in S3. DynamoDB holds only S3 pointers and replay_index.
             s3 = boto3.client('s3')
             pid = metadata.procedure_id
+            stored_digests = dict(self._stored_digests)
 
-            def _store_attachment(field_name: str, payload: Any, s3_path: str) -> None:
-                payload_json = json.dumps(payload)
+            def _store_attachment(field_name: str, payload_json: str, s3_path: str) -> None:
                 try:
                     s3.put_object(
                         Bucket=_S3_BUCKET,
@@ -430,6 +490,7 @@ class PlexusStorageAdapter:
                         Body=payload_json.encode('utf-8'),
                         ContentType='application/json',
                     )
+                    stored_digests[field_name] = _payload_digest(payload_json)
                     logger.debug(
                         "Stored %d bytes of %s to S3: %s/%s",
                         len(payload_json), field_name, _S3_BUCKET, s3_path,
@@ -438,28 +499,33 @@ class PlexusStorageAdapter:
                     logger.error("Failed to store %s to S3: %s", field_name, s3_err)
                     raise
 
-            _store_attachment('state', metadata.state, f"procedures/{pid}/state.json")
+            if 'state' in changed:
+                _store_attachment('state', payloads['state'], f"procedures/{pid}/state.json")
             metadata_json['state'] = {'_s3_key': f"procedures/{pid}/state.json"}
 
             # Write dashboard projection under reportblocks/ prefix — the
             # Cognito authenticated role has read access to reportblocks/*
             # but NOT procedures/* (IAM policy not deployed for that path).
-            dashboard_state = _build_dashboard_state(metadata.state or {})
-            _store_attachment(
-                'dashboard_state', dashboard_state,
-                f"reportblocks/procedures/{pid}/dashboard_state.json",
-            )
+            if 'state' in changed or stored_digests.get('dashboard_state') != stored_digests.get('state'):
+                dashboard_state = _build_dashboard_state(metadata.state or {})
+                _store_attachment(
+                    'dashboard_state', json.dumps(dashboard_state),
+                    f"reportblocks/procedures/{pid}/dashboard_state.json",
+                )
+                stored_digests['dashboard_state'] = stored_digests['state']
             metadata_json['dashboard_state'] = {
                 '_s3_key': f"reportblocks/procedures/{pid}/dashboard_state.json"
             }
 
-            _store_attachment('lua_state', metadata.lua_state, f"procedures/{pid}/lua_state.json")
+            if 'lua_state' in changed:
+                _store_attachment('lua_state', payloads['lua_state'], f"procedures/{pid}/lua_state.json")
             metadata_json['lua_state'] = {'_s3_key': f"procedures/{pid}/lua_state.json"}
 
-            _store_attachment('checkpoints', checkpoints_dict, f"procedures/{pid}/checkpoints.json")
+            if 'checkpoints' in changed:
+                _store_attachment('checkpoints', payloads['checkpoints'], f"procedures/{pid}/checkpoints.json")
             metadata_json['checkpoints'] = {'_s3_key': f"procedures/{pid}/checkpoints.json"}
 
-            if _looks_like_optimizer_state(metadata.state):
+            if 'state' in changed and _looks_like_optimizer_state(metadata.state):
                 try:
                     from plexus.cli.shared.optimizer_results import (
                         OPTIMIZER_ARTIFACTS_METADATA_KEY,
@@ -490,9 +556,11 @@ class PlexusStorageAdapter:
                 retry_policy=LONG_RUNNING_WRITE_RETRY_POLICY_NAME,
             )
 
-            # Update cache
-            self._metadata_cache = metadata
-            logger.debug(f"Saved metadata for {metadata.procedure_id}")
+            self._stored_digests = stored_digests
+            self._stored_replay_index = metadata.replay_index
+            self._dirty = False
+            logger.debug(f"Saved metadata for {metadata.procedure_id} ({', '.join(sorted(changed)) or 'replay_index'} changed)")
+            return True
 
         except Exception as e:
             logger.error(f"Error saving procedure metadata: {e}", exc_info=True)
@@ -542,6 +610,9 @@ class PlexusStorageAdapter:
         }
         """
 
+        # A status change is a persistence boundary: store buffered state first.
+        self.flush(procedure_id)
+
         try:
             if self._is_builtin:
                 if self._metadata_cache is None:
@@ -572,23 +643,30 @@ class PlexusStorageAdapter:
             logger.error(f"Error updating procedure status: {e}", exc_info=True)
             raise
 
+    def _checkpoints_by_name(self, metadata: ProcedureMetadata) -> Dict[str, Any]:
+        """Name -> first checkpoint entry, rebuilt only when the execution log changes."""
+        log = metadata.execution_log
+        key = (id(log), len(log), id(log[-1]) if log else None)
+        if key != self._checkpoint_index_key:
+            index: Dict[str, Any] = {}
+            for entry in log:
+                name = _checkpoint_name(entry)
+                if name is not None:
+                    index.setdefault(name, entry)
+            self._checkpoint_index = index
+            self._checkpoint_index_key = key
+        return self._checkpoint_index
+
     def checkpoint_exists(self, procedure_id: str, name: str) -> bool:
         """Check if checkpoint exists."""
         metadata = self.load_procedure_metadata(procedure_id)
-        for entry in metadata.execution_log:
-            if entry.type == 'checkpoint' and isinstance(entry.result, dict):
-                if entry.result.get('name') == name:
-                    return True
-        return False
+        return name in self._checkpoints_by_name(metadata)
 
     def checkpoint_get(self, procedure_id: str, name: str) -> Optional[Any]:
         """Get checkpoint value."""
         metadata = self.load_procedure_metadata(procedure_id)
-        for entry in metadata.execution_log:
-            if entry.type == 'checkpoint' and isinstance(entry.result, dict):
-                if entry.result.get('name') == name:
-                    return entry.result.get('data')
-        return None
+        entry = self._checkpoints_by_name(metadata).get(name)
+        return entry.result.get('data') if entry is not None else None
 
     def checkpoint_save(
         self,
@@ -619,15 +697,10 @@ class PlexusStorageAdapter:
         metadata = self.load_procedure_metadata(procedure_id)
 
         # Find the target checkpoint
-        target_time = None
-        for entry in metadata.execution_log:
-            if entry.type == 'checkpoint' and isinstance(entry.result, dict):
-                if entry.result.get('name') == name:
-                    target_time = entry.timestamp
-                    break
-
-        if target_time is None:
+        target = self._checkpoints_by_name(metadata).get(name)
+        if target is None:
             return
+        target_time = target.timestamp
 
         # Keep only checkpoints older than target
         metadata.execution_log = [
@@ -639,13 +712,15 @@ class PlexusStorageAdapter:
     def get_state(self, procedure_id: str) -> Dict[str, Any]:
         """Get mutable state dictionary."""
         metadata = self.load_procedure_metadata(procedure_id)
+        # Callers may mutate the returned dict in place.
+        self._dirty = True
         return metadata.state
 
     def set_state(self, procedure_id: str, state: Dict[str, Any]) -> None:
-        """Set mutable state dictionary."""
+        """Set mutable state dictionary (persisted at the next flush boundary)."""
         metadata = self.load_procedure_metadata(procedure_id)
         metadata.state = {k: _lua_to_serializable(v) for k, v in state.items()}
-        self.save_procedure_metadata(procedure_id, metadata)
+        self._dirty = True
 
     def state_get(self, procedure_id: str, key: str, default: Any = None) -> Any:
         """Get state value."""
@@ -653,20 +728,20 @@ class PlexusStorageAdapter:
         return metadata.state.get(key, default)
 
     def state_set(self, procedure_id: str, key: str, value: Any) -> None:
-        """Set state value."""
+        """Set state value (persisted at the next flush boundary)."""
         metadata = self.load_procedure_metadata(procedure_id)
         metadata.state[key] = _lua_to_serializable(value)
-        self.save_procedure_metadata(procedure_id, metadata)
+        self._dirty = True
 
     def state_delete(self, procedure_id: str, key: str) -> None:
-        """Delete state key."""
+        """Delete state key (persisted at the next flush boundary)."""
         metadata = self.load_procedure_metadata(procedure_id)
         if key in metadata.state:
             del metadata.state[key]
-            self.save_procedure_metadata(procedure_id, metadata)
+            self._dirty = True
 
     def state_clear(self, procedure_id: str) -> None:
-        """Clear all state."""
+        """Clear all state (persisted at the next flush boundary)."""
         metadata = self.load_procedure_metadata(procedure_id)
         metadata.state = {}
-        self.save_procedure_metadata(procedure_id, metadata)
+        self._dirty = True
@@ -107,3 +107,103 @@ def test_update_procedure_status_uses_long_running_write_policy():
     storage.update_procedure_status("proc-123", "RUNNING", waiting_on_message_id="msg-1")
 
     assert fake_client.retry_policies[-1] == LONG_RUNNING_WRITE_RETRY_POLICY_NAME
+
+
+def _count_mutations(fake_client):
+    return sum(1 for policy in fake_client.retry_policies if policy == LONG_RUNNING_WRITE_RETRY_POLICY_NAME)
+
+
+def test_state_changes_are_buffered_until_flush(monkeypatch):
+    fake_client = _FakeClient()
+    fake_s3 = _FakeS3Client()
+    monkeypatch.setattr("plexus.cli.procedure.tactus_adapters.storage.boto3.client", lambda _name: fake_s3)
+
+    storage = PlexusStorageAdapter(fake_client, "proc-123")
+    for i in range(50):
+        storage.state_set("proc-123", "counter", i)
+    storage.state_set("proc-123", "scratch", True)
+    storage.state_delete("proc-123", "scratch")
+
+    assert fake_s3.put_calls == 0
+    assert _count_mutations(fake_client) == 0
+    assert storage.state_get("proc-123", "counter") == 49
+
+    assert storage.flush("proc-123") is True
+    assert fake_s3.put_calls == 4
+    assert _count_mutations(fake_client) == 1
+    stored_state = next(
+        json.loads(obj["Body"]) for (_bucket, key), obj in fake_s3.objects.items()
+        if key == "procedures/proc-123/state.json"
+    )
+    assert stored_state == {"counter": 49}
+    assert fake_client.saved_metadata["custom"] == {"keep": True}
+
+    # Nothing changed since the last flush: no uploads and no mutation.
+    assert storage.flush("proc-123") is False
+    storage.state_set("proc-123", "counter", 49)
+    assert storage.flush("proc-123") is False
+    assert fake_s3.put_calls == 4
+    assert _count_mutations(fake_client) == 1
+
+
+def test_save_uploads_only_changed_attachments(monkeypatch):
+    fake_client = _FakeClient()
+    fake_s3 = _FakeS3Client()
+    monkeypatch.setattr("plexus.cli.procedure.tactus_adapters.storage.boto3.client", lambda _name: fake_s3)
+
+    storage = PlexusStorageAdapter(fake_client, "proc-123")
+    metadata = ProcedureMetadata(
+        procedure_id="proc-123",
+        execution_log=[],
+        replay_index=1,
+        state={"step": 1},
+        lua_state={"cursor": 1},
+        status="RUNNING",
+        waiting_on_message_id=None,
+    )
+    storage.save_procedure_metadata("proc-123", metadata)
+    assert fake_s3.put_calls == 4
+
+    metadata.lua_state = {"cursor": 2}
+    metadata.replay_index = 2
+    storage.save_procedure_metadata("proc-123", metadata)
+
+    assert fake_s3.put_calls == 5
+    assert _count_mutations(fake_client) == 2
+    # Pointers to the unchanged attachments are still written.
+    assert fake_client.saved_metadata["state"]["_s3_key"].endswith("/state.json")
+    assert fake_client.saved_metadata["dashboard_state"]["_s3_key"].endswith("/dashboard_state.json")
+    assert fake_client.saved_metadata["checkpoints"]["_s3_key"].endswith("/checkpoints.json")
+    assert fake_client.saved_metadata["replay_index"] == 2
+
+    # A replay_index-only change still updates the record without uploads.
+    metadata.replay_index = 3
+    storage.save_procedure_metadata("proc-123", metadata)
+    assert fake_s3.put_calls == 5
+    assert _count_mutations(fake_client) == 3
+
+
+def test_checkpoint_lookups_use_index_and_persist_buffered_state(monkeypatch):
+    fake_client = _FakeClient()
+    fake_s3 = _FakeS3Client()
+    monkeypatch.setattr("plexus.cli.procedure.tactus_adapters.storage.boto3.client", lambda _name: fake_s3)
+
+    storage = PlexusStorageAdapter(fake_client, "proc-123")
+    storage.state_set("proc-123", "phase", "baseline")
+    assert fake_s3.put_calls == 0
+
+    storage.checkpoint_save("proc-123", "first", {"value": 1})
+    assert fake_s3.put_calls == 4
+    assert storage.checkpoint_exists("proc-123", "first")
+    assert storage.checkpoint_get("proc-123", "first") == {"value": 1}
+    assert not storage.checkpoint_exists("proc-123", "missing")
+    assert storage.checkpoint_get("proc-123", "missing") is None
+
+    storage.checkpoint_save("proc-123", "second", {"value": 2})
+    # Only the checkpoints attachment changed.
+    assert fake_s3.put_calls == 5
+    assert storage.checkpoint_get("proc-123", "second") == {"value": 2}
+
+    storage.checkpoint_clear_all("proc-123")
+    assert not storage.checkpoint_exists("proc-123", "first")
+    assert storage.state_get("proc-123", "phase") == "baseline"
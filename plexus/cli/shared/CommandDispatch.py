@@ -26,6 +26,11 @@ from urllib.parse import quote
 import boto3
 import subprocess
 import socket
+import signal
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_for_futures
+from dataclasses import dataclass
 from plexus.config.loader import ConfigLoader
 from plexus.dashboard.api.models.account import Account
 
@@ -46,6 +51,11 @@ console = Console()
 DEFAULT_CELERY_QUEUE_NAME = "plexus-celery-development"
 VALID_DISPATCH_MODES = {"celery", "local"}
 DEFAULT_LOCAL_DISPATCH_TIMEOUT_SECONDS = 900
+LOCAL_DISPATCH_CONCURRENCY_ENV_VAR = "PLEXUS_LOCAL_DISPATCH_CONCURRENCY"
+LOCAL_OUTPUT_TAIL_CHARS = 200000
+LOCAL_TERMINATE_GRACE_SECONDS = 10
+# Fields a listed task needs before it can be claimed and run without a getTask round trip.
+DISPATCH_TASK_FIELDS = ("id", "accountId", "type", "status", "target", "command", "dispatchStatus", "metadata")
 PROCEDURE_WAITING_STATUSES = {"WAITING_FOR_HUMAN"}
 PROCEDURE_SUCCESS_STATUSES = {"COMPLETED", "COMPLETE"}
 PROCEDURE_FAILURE_STATUSES = {"FAILED", "ERROR"}
@@ -99,6 +109,28 @@ def _resolve_local_dispatch_timeout_seconds() -> int:
     return timeout
 
 
+def _resolve_local_dispatch_concurrency(explicit: Optional[int] = None) -> int:
+    """Number of local tasks run at once: explicit value, then env, then the CPU count."""
+    if explicit is not None:
+        if explicit <= 0:
+            raise click.ClickException("--local-concurrency must be greater than zero.")
+        return explicit
+    value = os.getenv(LOCAL_DISPATCH_CONCURRENCY_ENV_VAR, "").strip()
+    if not value:
+        return os.cpu_count() or 1
+    try:
+        concurrency = int(value)
+    except ValueError as e:
+        raise click.ClickException(
+            f"Invalid {LOCAL_DISPATCH_CONCURRENCY_ENV_VAR}='{value}'. Must be a positive integer."
+        ) from e
+    if concurrency <= 0:
+        raise click.ClickException(
+            f"Invalid {LOCAL_DISPATCH_CONCURRENCY_ENV_VAR}='{value}'. Must be greater than zero."
+        )
+    return concurrency
+
+
 def _build_local_run_args(task: Task) -> list[str]:
     """
     Build the local subprocess argv for a claimed task.
@@ -213,32 +245,72 @@ def _normalize_metadata(value: Optional[typing.Any]) -> dict:
     return {}
 
 
-def _claim_task_for_dispatch(task: Task, dispatcher_id: str, mode: str) -> bool:
+_CLAIM_TASK_MUTATION = """
+mutation ClaimTaskForDispatch($input: UpdateTaskInput!, $condition: ModelTaskConditionInput) {
+    updateTask(input: $input, condition: $condition) {
+        %s
+    }
+}
+""" % Task.fields()
+
+
+def _is_conditional_check_failure(error: Exception) -> bool:
+    message = str(error).lower()
+    return "conditional request failed" in message or "conditionalcheckfailed" in message
+
+
+def _task_from_listing(client: PlexusDashboardClient, task_data: dict) -> Task:
+    """Build a Task from a listing row, fetching it only if the row lacks dispatch fields."""
+    if all(field in task_data for field in DISPATCH_TASK_FIELDS):
+        return Task.from_dict(dict(task_data), client)
+    return Task.get_by_id(task_data["id"], client)
+
+
+def _claim_task_for_dispatch(task: Task, dispatcher_id: str, mode: str) -> Optional[Task]:
+    """
+    Move a PENDING task to DISPATCHING for this dispatcher.
+
+    The update is conditional on ``dispatchStatus`` still being PENDING, so
+    when several dispatchers see the same task only one claim succeeds.
+    Returns the claimed task as stored, or None if the task was no longer
+    pending.
+    """
     if task.dispatchStatus != "PENDING":
-        return False
+        return None
 
     metadata = _normalize_metadata(task.metadata)
     metadata["dispatch_mode"] = mode
     metadata["dispatch_claimed_at"] = datetime.datetime.now(timezone.utc).isoformat()
 
-    task.update(
-        accountId=task.accountId,
-        type=task.type,
-        status=task.status,
-        target=task.target,
-        command=task.command,
-        dispatchStatus="DISPATCHING",
-        workerNodeId=dispatcher_id,
-        errorMessage=None,
-        errorDetails=None,
-        stdout=None,
-        stderr=None,
-        startedAt=None,
-        completedAt=None,
-        metadata=json.dumps(metadata),
-        updatedAt=datetime.datetime.now(timezone.utc).isoformat(),
-    )
-    return True
+    variables = {
+        "input": {
+            "id": task.id,
+            "accountId": task.accountId,
+            "type": task.type,
+            "status": task.status,
+            "target": task.target,
+            "command": task.command,
+            "dispatchStatus": "DISPATCHING",
+            "workerNodeId": dispatcher_id,
+            "errorMessage": None,
+            "errorDetails": None,
+            "stdout": None,
+            "stderr": None,
+            "startedAt": None,
+            "completedAt": None,
+            "metadata": json.dumps(metadata),
+            "updatedAt": datetime.datetime.now(timezone.utc).isoformat(),
+        },
+        "condition": {"dispatchStatus": {"eq": "PENDING"}},
+    }
+    try:
+        result = task._client.execute(_CLAIM_TASK_MUTATION, variables)
+    except Exception as e:
+        if _is_conditional_check_failure(e):
+            logging.info(f"Skipping task {task.id}; dispatchStatus was claimed by another dispatcher")
+            return None
+        raise
+    return Task.from_dict(result["updateTask"], task._client)
 
 
 def _resolve_dispatcher_account_id(client: PlexusDashboardClient, identifier: Optional[str]) -> str:
@@ -329,6 +401,380 @@ def _map_procedure_status_to_task_status(procedure_status: Optional[str]) -> Opt
         return "FAILED"
     return None
 
+class _OutputTail:
+    """Keeps the last ``limit`` characters written to it."""
+
+    def __init__(self, limit: int = LOCAL_OUTPUT_TAIL_CHARS):
+        self.limit = limit
+        self._chunks: deque = deque()
+        self._length = 0
+
+    def append(self, text: str) -> None:
+        self._chunks.append(text)
+        self._length += len(text)
+        while self._chunks and self._length - len(self._chunks[0]) >= self.limit:
+            self._length -= len(self._chunks.popleft())
+
+    def getvalue(self) -> str:
+        return "".join(self._chunks)[-self.limit:]
+
+
+@dataclass
+class LocalCommandResult:
+    returncode: Optional[int]
+    stdout: str
+    stderr: str
+    timed_out: bool = False
+
+
+_echo_lock = threading.Lock()
+
+
+def _pump_output(stream, tail: _OutputTail, echo, prefix: str) -> None:
+    try:
+        for line in iter(stream.readline, ""):
+            tail.append(line)
+            with _echo_lock:
+                echo.write(f"{prefix}{line}")
+                echo.flush()
+    finally:
+        stream.close()
+
+
+# Child processes started by _run_local_command that have not exited yet. They run in
+# their own session, so the dispatcher has to forward Ctrl-C / SIGTERM to them itself.
+_local_processes: set = set()
+_local_processes_lock = threading.Lock()
+
+
+def _signal_process_tree(process: subprocess.Popen, sig: int) -> None:
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, sig)
+        elif sig == signal.SIGTERM:
+            process.terminate()
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        if process.poll() is None:
+            process.kill()
+
+
+def _kill_process_tree(process: subprocess.Popen) -> None:
+    _signal_process_tree(process, signal.SIGKILL if hasattr(signal, "SIGKILL") else signal.SIGTERM)
+
+
+def _terminate_local_processes(grace_seconds: float = LOCAL_TERMINATE_GRACE_SECONDS) -> int:
+    """
+    Send SIGTERM to every running child's process group, then SIGKILL whatever is
+    still alive after ``grace_seconds``. Returns the number of children signalled.
+    """
+    with _local_processes_lock:
+        processes = [process for process in _local_processes if process.poll() is None]
+    for process in processes:
+        _signal_process_tree(process, signal.SIGTERM)
+    deadline = time.monotonic() + grace_seconds
+    for process in processes:
+        try:
+            process.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            logging.warning(f"Local task process {process.pid} did not exit after SIGTERM; killing it")
+            _kill_process_tree(process)
+    return len(processes)
+
+
+def _run_local_command(
+    run_args: list[str],
+    env: dict,
+    timeout_seconds: int,
+    label: str,
+    tail_chars: int = LOCAL_OUTPUT_TAIL_CHARS,
+) -> LocalCommandResult:
+    """
+    Run a task's CLI command, echoing its output line by line with a ``[label]``
+    prefix while keeping only the last ``tail_chars`` of each stream.
+    """
+    stdout_tail = _OutputTail(tail_chars)
+    stderr_tail = _OutputTail(tail_chars)
+    process = subprocess.Popen(
+        run_args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        env=env,
+        start_new_session=hasattr(os, "killpg"),
+    )
+    with _local_processes_lock:
+        _local_processes.add(process)
+    readers = [
+        threading.Thread(
+            target=_pump_output, args=(process.stdout, stdout_tail, sys.stdout, f"[{label}] "), daemon=True
+        ),
+        threading.Thread(
+            target=_pump_output, args=(process.stderr, stderr_tail, sys.stderr, f"[{label}] "), daemon=True
+        ),
+    ]
+    for reader in readers:
+        reader.start()
+    timed_out = False
+    try:
+        process.wait(timeout=timeout_seconds)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        _kill_process_tree(process)
+        process.wait()
+    finally:
+        with _local_processes_lock:
+            _local_processes.discard(process)
+    for reader in readers:
+        reader.join(timeout=5)
+    return LocalCommandResult(
+        returncode=None if timed_out else process.returncode,
+        stdout=stdout_tail.getvalue(),
+        stderr=stderr_tail.getvalue(),
+        timed_out=timed_out,
+    )
+
+
+def _execute_local_task(
+    client: PlexusDashboardClient,
+    task: Task,
+    dispatcher_id: str,
+    local_timeout_seconds: int,
+) -> None:
+    """Run a claimed task as a local child process and record the outcome on the task."""
+    started_at = datetime.datetime.now(timezone.utc).isoformat()
+    run_args = _build_local_run_args(task)
+    metadata = _normalize_metadata(task.metadata)
+    metadata["dispatch_mode"] = "local"
+    metadata["local_command"] = " ".join(run_args)
+    metadata["local_timeout_seconds"] = local_timeout_seconds
+    metadata["phase"] = "execute_cli"
+    child_env = os.environ.copy()
+    # Let downstream CLI runners bind tracking updates to this claimed task.
+    child_env["PLEXUS_DISPATCH_TASK_ID"] = task.id
+
+    result = _run_local_command(run_args, child_env, local_timeout_seconds, label=task.id[:8])
+    completed_at = datetime.datetime.now(timezone.utc).isoformat()
+
+    if result.timed_out:
+        timeout_stderr = f"{result.stderr}\nTimed out after {local_timeout_seconds} seconds.".strip()
+        task.update(
+            accountId=task.accountId,
+            type=task.type,
+            status='FAILED',
+            target=task.target,
+            command=task.command,
+            dispatchStatus='DISPATCHED',
+            workerNodeId=dispatcher_id,
+            startedAt=started_at,
+            completedAt=completed_at,
+            errorMessage=f"Local dispatch timed out after {local_timeout_seconds}s",
+            errorDetails=json.dumps({
+                "phase": "local_execute_timeout",
+                "timeout_seconds": local_timeout_seconds,
+            }),
+            stdout=result.stdout or None,
+            stderr=timeout_stderr[-LOCAL_OUTPUT_TAIL_CHARS:] if timeout_stderr else None,
+            metadata=json.dumps(metadata),
+            updatedAt=completed_at,
+        )
+        logging.error(f"Locally executed task {task.id} timed out after {local_timeout_seconds}s")
+        return
+
+    if result.returncode == 0:
+        procedure_id = _extract_procedure_id_from_task(task, metadata)
+        procedure_status = _get_procedure_status_for_local_command(client, procedure_id)
+        mapped_task_status = _map_procedure_status_to_task_status(procedure_status) or "COMPLETED"
+        metadata["procedure_id"] = procedure_id
+        metadata["procedure_status_after_command"] = procedure_status
+        metadata["phase"] = "persist_results"
+
+        update_kwargs = {
+            "accountId": task.accountId,
+            "type": task.type,
+            "status": mapped_task_status,
+            "target": task.target,
+            "command": task.command,
+            "dispatchStatus": "DISPATCHED",
+            "workerNodeId": dispatcher_id,
+            "startedAt": started_at,
+            "stdout": result.stdout or None,
+            "stderr": result.stderr or None,
+            "metadata": json.dumps(metadata),
+            "updatedAt": completed_at,
+            "errorMessage": None,
+            "errorDetails": None,
+            "completedAt": None,
+        }
+        if mapped_task_status in {"COMPLETED", "FAILED"}:
+            update_kwargs["completedAt"] = completed_at
+        if mapped_task_status == "FAILED":
+            update_kwargs["errorMessage"] = (
+                f"Procedure status after local command is {procedure_status}"
+            )
+            update_kwargs["errorDetails"] = json.dumps(
+                {
+                    "phase": "persist_results",
+                    "procedure_status": procedure_status,
+                }
+            )
+
+        task.update(**update_kwargs)
+        logging.info(
+            "Locally executed task %s exited 0 and mapped to %s (procedure_status=%s)",
+            task.id,
+            mapped_task_status,
+            procedure_status,
+        )
+        return
+
+    metadata["phase"] = "persist_results"
+    task.update(
+        accountId=task.accountId,
+        type=task.type,
+        status='FAILED',
+        target=task.target,
+        command=task.command,
+        dispatchStatus='DISPATCHED',
+        workerNodeId=dispatcher_id,
+        startedAt=started_at,
+        completedAt=completed_at,
+        errorMessage=f"Local dispatch failed (exit {result.returncode})",
+        errorDetails=json.dumps({
+            "exit_code": result.returncode,
+            "phase": "execute_cli",
+        }),
+        stdout=result.stdout or None,
+        stderr=result.stderr or None,
+        metadata=json.dumps(metadata),
+        updatedAt=completed_at,
+    )
+    logging.error(f"Locally executed task {task.id} failed exit={result.returncode}")
+
+
+class LocalTaskPool:
+    """Runs claimed tasks in worker threads, each driving one child process, at most ``max_workers`` at once."""
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="plexus-local-dispatch")
+        self._running: set = set()
+        self._lock = threading.Lock()
+
+    @property
+    def free_slots(self) -> int:
+        with self._lock:
+            return self.max_workers - len(self._running)
+
+    @property
+    def running(self) -> int:
+        with self._lock:
+            return len(self._running)
+
+    def submit(self, fn, *args) -> Future:
+        with self._lock:
+            future = self._executor.submit(fn, *args)
+            self._running.add(future)
+        future.add_done_callback(self._finished)
+        return future
+
+    def _finished(self, future: Future) -> None:
+        with self._lock:
+            self._running.discard(future)
+
+    def wait(self) -> None:
+        with self._lock:
+            running = list(self._running)
+        wait_for_futures(running)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the pool. With ``wait=False`` (the dispatcher was interrupted), queued
+        tasks are cancelled and running child processes are terminated instead of
+        being waited on for up to their timeout.
+        """
+        if wait:
+            self._executor.shutdown(wait=True)
+            return
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        terminated = _terminate_local_processes()
+        if terminated:
+            logging.info(f"Terminated {terminated} running local task process(es)")
+
+
+def _run_local_task_safely(client, task: Task, dispatcher_id: str, local_timeout_seconds: int) -> None:
+    try:
+        _execute_local_task(client, task, dispatcher_id, local_timeout_seconds)
+    except Exception as e:
+        logging.error(f"Failed to run local task {task.id}: {e}", exc_info=True)
+
+
+def _run_dispatch_cycle(
+    client: PlexusDashboardClient,
+    account_id: str,
+    dispatcher_id: str,
+    mode: str,
+    limit: int,
+    local_pool: Optional[LocalTaskPool] = None,
+    local_timeout_seconds: int = DEFAULT_LOCAL_DISPATCH_TIMEOUT_SECONDS,
+) -> int:
+    """
+    Claim pending tasks and hand them off. Returns how many were dispatched.
+
+    In local mode only as many tasks are claimed as the pool has free slots,
+    so tasks this dispatcher cannot start yet stay PENDING for other
+    dispatchers.
+    """
+    if local_pool is not None and local_pool.free_slots <= 0:
+        return 0
+    pending = _list_pending_tasks_for_account(client, account_id, limit=limit)
+    if not pending:
+        logging.debug("No pending tasks found")
+        return 0
+
+    dispatched = 0
+    for task_data in pending:
+        task_id = task_data.get("id")
+        if not task_id:
+            continue
+        if local_pool is not None and local_pool.free_slots <= 0:
+            break
+        try:
+            task = _claim_task_for_dispatch(
+                _task_from_listing(client, task_data), dispatcher_id=dispatcher_id, mode=mode
+            )
+            if task is None:
+                continue
+
+            if local_pool is None:
+                celery_task = get_celery_app().send_task(
+                    'plexus.execute_command',
+                    args=[task.command],
+                    kwargs={'target': task.target or "default/command", 'task_id': task.id}
+                )
+                task.update(
+                    accountId=task.accountId,
+                    type=task.type,
+                    status=task.status,
+                    target=task.target,
+                    command=task.command,
+                    dispatchStatus="DISPATCHED",
+                    workerNodeId=dispatcher_id,
+                    updatedAt=datetime.datetime.now(timezone.utc).isoformat(),
+                )
+                logging.info(f"Dispatched task {task.id} to Celery task {celery_task.id}")
+            else:
+                local_pool.submit(_run_local_task_safely, client, task, dispatcher_id, local_timeout_seconds)
+                logging.info(f"Started local task {task.id} ({local_pool.running}/{local_pool.max_workers} running)")
+            dispatched += 1
+        except Exception as e:
+            logging.error(f"Failed to dispatch task {task_id}: {e}", exc_info=True)
+    return dispatched
+
+
 def create_celery_app() -> Celery:
     """Create a configured Celery application with AWS credentials."""
     mode = _resolve_dispatch_mode()
@@ -769,22 +1215,39 @@ def dispatch(
 @click.option('--interval', default=2.0, type=float, help='Polling interval seconds')
 @click.option('--limit', default=25, type=int, help='Max pending tasks to inspect each cycle')
 @click.option('--once', is_flag=True, help='Run a single poll cycle and exit')
+@click.option(
+    '--local-concurrency',
+    default=None,
+    type=int,
+    help=f'Max local tasks run at once (defaults to {LOCAL_DISPATCH_CONCURRENCY_ENV_VAR}, then the CPU count)',
+)
 @click.option('--loglevel', default='INFO', help='Logging level')
-def dispatcher(account: Optional[str], interval: float, limit: int, once: bool, loglevel: str) -> None:
+def dispatcher(
+    account: Optional[str],
+    interval: float,
+    limit: int,
+    once: bool,
+    local_concurrency: Optional[int],
+    loglevel: str,
+) -> None:
     """
     Poll AppSync for PENDING tasks and dispatch them using explicit dispatch mode.
 
     Modes:
     - celery: enqueue claimed tasks to Celery
-    - local: run claimed tasks in local CLI process
+    - local: run claimed tasks as concurrent local CLI processes
     """
     logging.getLogger().setLevel(loglevel)
     mode = _resolve_dispatch_mode()
     queue_name = _resolve_queue_name()
     local_timeout_seconds = _resolve_local_dispatch_timeout_seconds()
+    local_pool = None
+    if mode == "local":
+        local_pool = LocalTaskPool(_resolve_local_dispatch_concurrency(local_concurrency))
     logging.info(
         f"Starting task dispatcher daemon | mode={mode} | queue={queue_name} "
         f"| local_timeout_seconds={local_timeout_seconds}"
+        + (f" | local_concurrency={local_pool.max_workers}" if local_pool else "")
     )
 
     if mode == "celery":
@@ -800,179 +1263,45 @@ def dispatcher(account: Optional[str], interval: float, limit: int, once: bool,
     )
 
     def run_cycle() -> int:
-        pending = _list_pending_tasks_for_account(client, account_id, limit=limit)
-        if not pending:
-            logging.debug("No pending tasks found")
-            return 0
-
-        processed = 0
-        for task_data in pending:
-            task_id = task_data.get("id")
-            if not task_id:
-                continue
-            try:
-                task = Task.get_by_id(task_id, client)
-                claimed = _claim_task_for_dispatch(task, dispatcher_id=dispatcher_id, mode=mode)
-                if not claimed:
-                    continue
-
-                if mode == "celery":
-                    celery_task = get_celery_app().send_task(
-                        'plexus.execute_command',
-                        args=[task.command],
-                        kwargs={'target': task.target or "default/command", 'task_id': task.id}
-                    )
-                    task.update(
-                        accountId=task.accountId,
-                        type=task.type,
-                        status=task.status,
-                        target=task.target,
-                        command=task.command,
-                        dispatchStatus="DISPATCHED",
-                        workerNodeId=dispatcher_id,
-                        updatedAt=datetime.datetime.now(timezone.utc).isoformat(),
-                    )
-                    logging.info(f"Dispatched task {task.id} to Celery task {celery_task.id}")
-                else:
-                    started_at = datetime.datetime.now(timezone.utc).isoformat()
-                    run_args = _build_local_run_args(task)
-                    metadata = _normalize_metadata(task.metadata)
-                    metadata["dispatch_mode"] = "local"
-                    metadata["local_command"] = " ".join(run_args)
-                    metadata["local_timeout_seconds"] = local_timeout_seconds
-                    metadata["phase"] = "execute_cli"
-                    child_env = os.environ.copy()
-                    # Let downstream CLI runners bind tracking updates to this claimed task.
-                    child_env["PLEXUS_DISPATCH_TASK_ID"] = task.id
-                    try:
-                        result = subprocess.run(
-                            run_args,
-                            text=True,
-                            capture_output=True,
-                            check=False,
-                            timeout=local_timeout_seconds,
-                            env=child_env,
-                        )
-                    except subprocess.TimeoutExpired as timeout_exc:
-                        completed_at = datetime.datetime.now(timezone.utc).isoformat()
-
-                        timeout_stdout = timeout_exc.stdout or ""
-                        timeout_stderr = timeout_exc.stderr or ""
-                        timeout_stderr = (
-                            f"{timeout_stderr}\nTimed out after {local_timeout_seconds} seconds."
-                        ).strip()
-
-                        task.update(
-                            accountId=task.accountId,
-                            type=task.type,
-                            status='FAILED',
-                            target=task.target,
-                            command=task.command,
-                            dispatchStatus='DISPATCHED',
-                            workerNodeId=dispatcher_id,
-                            startedAt=started_at,
-                            completedAt=completed_at,
-                            errorMessage=f"Local dispatch timed out after {local_timeout_seconds}s",
-                            errorDetails=json.dumps({
-                                "phase": "local_execute_timeout",
-                                "timeout_seconds": local_timeout_seconds,
-                            }),
-                            stdout=timeout_stdout[-200000:] if timeout_stdout else None,
-                            stderr=timeout_stderr[-200000:] if timeout_stderr else None,
-                            metadata=json.dumps(metadata),
-                            updatedAt=completed_at,
-                        )
-                        logging.error(
-                            f"Locally executed task {task.id} timed out after {local_timeout_seconds}s"
-                        )
-                        processed += 1
-                        continue
-                    completed_at = datetime.datetime.now(timezone.utc).isoformat()
-
-                    if result.returncode == 0:
-                        procedure_id = _extract_procedure_id_from_task(task, metadata)
-                        procedure_status = _get_procedure_status_for_local_command(client, procedure_id)
-                        mapped_task_status = _map_procedure_status_to_task_status(procedure_status) or "COMPLETED"
-                        metadata["procedure_id"] = procedure_id
-                        metadata["procedure_status_after_command"] = procedure_status
-                        metadata["phase"] = "persist_results"
-
-                        update_kwargs = {
-                            "accountId": task.accountId,
-                            "type": task.type,
-                            "status": mapped_task_status,
-                            "target": task.target,
-                            "command": task.command,
-                            "dispatchStatus": "DISPATCHED",
-                            "workerNodeId": dispatcher_id,
-                            "startedAt": started_at,
-                            "stdout": result.stdout[-200000:] if result.stdout else None,
-                            "stderr": result.stderr[-200000:] if result.stderr else None,
-                            "metadata": json.dumps(metadata),
-                            "updatedAt": completed_at,
-                            "errorMessage": None,
-                            "errorDetails": None,
-                            "completedAt": None,
-                        }
-                        if mapped_task_status in {"COMPLETED", "FAILED"}:
-                            update_kwargs["completedAt"] = completed_at
-                        if mapped_task_status == "FAILED":
-                            update_kwargs["errorMessage"] = (
-                                f"Procedure status after local command is {procedure_status}"
-                            )
-                            update_kwargs["errorDetails"] = json.dumps(
-                                {
-                                    "phase": "persist_results",
-                                    "procedure_status": procedure_status,
-                                }
-                            )
-
-                        task.update(**update_kwargs)
-                        logging.info(
-                            "Locally executed task %s exited 0 and mapped to %s (procedure_status=%s)",
-                            task.id,
-                            mapped_task_status,
-                            procedure_status,
-                        )
-                    else:
-                        metadata["phase"] = "persist_results"
-                        task.update(
-                            accountId=task.accountId,
-                            type=task.type,
-                            status='FAILED',
-                            target=task.target,
-                            command=task.command,
-                            dispatchStatus='DISPATCHED',
-                            workerNodeId=dispatcher_id,
-                            startedAt=started_at,
-                            completedAt=completed_at,
-                            errorMessage=f"Local dispatch failed (exit {result.returncode})",
-                            errorDetails=json.dumps({
-                                "exit_code": result.returncode,
-                                "phase": "execute_cli",
-                            }),
-                            stdout=result.stdout[-200000:] if result.stdout else None,
-                            stderr=result.stderr[-200000:] if result.stderr else None,
-                            metadata=json.dumps(metadata),
-                            updatedAt=completed_at,
-                        )
-                        logging.error(f"Locally executed task {task.id} failed exit={result.returncode}")
-
-                processed += 1
-            except Exception as e:
-                logging.error(f"Failed to dispatch task {task_id}: {e}", exc_info=True)
-        return processed
+        return _run_dispatch_cycle(
+            client,
+            account_id,
+            dispatcher_id,
+            mode,
+            limit,
+            local_pool=local_pool,
+            local_timeout_seconds=local_timeout_seconds,
+        )
 
-    if once:
-        processed = run_cycle()
-        logging.info(f"Dispatcher run complete (once): processed={processed}")
-        return
+    # SIGTERM would otherwise end the dispatcher without running the cleanup below.
+    previous_sigterm_handler = None
+    if local_pool is not None and threading.current_thread() is threading.main_thread():
+        previous_sigterm_handler = signal.signal(signal.SIGTERM, _exit_on_sigterm)
 
-    while True:
-        processed = run_cycle()
-        if processed:
-            logging.info(f"Dispatcher cycle processed {processed} task(s)")
-        time.sleep(interval)
+    completed = False
+    try:
+        if once:
+            processed = run_cycle()
+            if local_pool is not None:
+                local_pool.wait()
+            completed = True
+            logging.info(f"Dispatcher run complete (once): processed={processed}")
+            return
+
+        while True:
+            processed = run_cycle()
+            if processed:
+                logging.info(f"Dispatcher cycle processed {processed} task(s)")
+            time.sleep(interval)
+    finally:
+        if local_pool is not None:
+            local_pool.shutdown(wait=completed)
+        if previous_sigterm_handler is not None:
+            signal.signal(signal.SIGTERM, previous_sigterm_handler)
+
+
+def _exit_on_sigterm(signum, _frame) -> None:
+    raise SystemExit(128 + signum)
 
 @command.command()
 @click.argument('task_id')
@@ -8,38 +8,12 @@ import os
 import json
 import logging
 
-from plexus.cli.task.tasks import tasks, task
-from plexus.cli.item.items import items, item
-from plexus.cli.score.scores import score, scores
-from plexus.cli.shared.CommandDispatch import command
-from plexus.cli.batch.operations import batch
-from plexus.cli.evaluation.evaluations import evaluate, evaluations
-from plexus.cli.prediction.predictions import predict
-from plexus.cli.analyze.analysis import analyze
-from plexus.cli.tuning.operations import tuning
-from plexus.cli.training.operations import train
-from plexus.cli.result.results import score_results, score_result, result, results
-from plexus.cli.report.reports import report
-from plexus.cli.data.operations import data
-from plexus.cli.dataset.datasets import dataset
-from plexus.cli.score_chat.chat import score_chat
-from plexus.cli.data_lake.operations import lake_group
-from plexus.cli.feedback.commands import feedback
-from plexus.cli.scorecard.scorecards import scorecards, scorecard
-from plexus.cli.record_count.counting import count
-from plexus.cli.metrics.commands import metrics_group
-from plexus.cli.procedure.procedures import procedure
-from plexus.cli.rubric_memory.commands import rubric_memory
-from plexus.cli.chat.chats import chat
-from plexus.cli.execute.execute import execute
-
-# Define OrderCommands class for command ordering
-class OrderCommands(click.Group):
-    def list_commands(self, ctx: click.Context) -> list[str]:
-        return list(self.commands)
+# Loads .env and configures logging before any command module is imported.
+import plexus.CustomLogging  # noqa: F401
+from plexus.cli.shared.lazy_group import LazyGroup
 
 # Create the main CLI group
-@click.group(cls=OrderCommands)
+@click.group(cls=LazyGroup)
 @click.option('--debug', is_flag=True, help="Enable debug logging.")
 def cli(debug):
     """
@@ -60,39 +34,45 @@ def cli(debug):
     
     root_logger.setLevel(log_level)
 
-# Register all commands
-cli.add_command(scores)
-cli.add_command(scores, name="score")
-cli.add_command(tasks)
-cli.add_command(task)
-cli.add_command(items)
-cli.add_command(item)
-cli.add_command(command)
-cli.add_command(batch)
-cli.add_command(evaluate)
-cli.add_command(predict)
-cli.add_command(analyze)
-cli.add_command(tuning)
-cli.add_command(train)
-cli.add_command(score_results)
-cli.add_command(score_result)
-cli.add_command(result)
-cli.add_command(results)
-cli.add_command(report)
-cli.add_command(data)
-cli.add_command(score_chat)
-cli.add_command(lake_group)
-cli.add_command(feedback)
-cli.add_command(scorecards)
-cli.add_command(scorecard)
-cli.add_command(evaluations)
-cli.add_command(count)
-cli.add_command(metrics_group)
-cli.add_command(dataset)
-cli.add_command(procedure)
-cli.add_command(rubric_memory)
-cli.add_command(chat)
-cli.add_command(execute)
+# Register all commands. Each module is imported only when its command runs,
+# so the short help shown by `plexus --help` is kept here.
+COMMANDS = [
+    ('scores', 'plexus.cli.score.scores:scores', 'Commands for managing scores.'),
+    ('score', 'plexus.cli.score.scores:scores', 'Commands for managing scores.'),
+    ('tasks', 'plexus.cli.task.tasks:tasks', 'Manage task records in the dashboard'),
+    ('task', 'plexus.cli.task.tasks:task', "Manage task records in the dashboard (alias for 'tasks')"),
+    ('items', 'plexus.cli.item.items:items', 'Manage item records in the dashboard'),
+    ('item', 'plexus.cli.item.items:item', "Manage item records in the dashboard (alias for 'items')"),
+    ('command', 'plexus.cli.shared.CommandDispatch:command', 'Commands for remote command dispatch and worker management.'),
+    ('batch', 'plexus.cli.batch.operations:batch', 'Commands for batch processing with OpenAI models.'),
+    ('evaluate', 'plexus.cli.evaluation.evaluations:evaluate', 'Evaluating current scorecard configurations against labeled samples.'),
+    ('predict', 'plexus.cli.prediction.predictions:predict', 'Predict a scorecard or specific score(s) within a scorecard.'),
+    ('analyze', 'plexus.cli.analyze.analysis:analyze', 'Analysis commands for evaluating scorecard configurations and feedback.'),
+    ('tuning', 'plexus.cli.tuning.operations:tuning', 'Commands for fine-tuning models.'),
+    ('train', 'plexus.cli.training.operations:train', 'Train and evaluate a scorecard or specific score within a scorecard.'),
+    ('score-results', 'plexus.cli.result.results:score_results', 'Manage score result records in the dashboard'),
+    ('score-result', 'plexus.cli.result.results:score_result', "Manage score result records in the dashboard (alias for 'score-results')"),
+    ('result', 'plexus.cli.result.results:result', "Manage score result records in the dashboard (alias for 'score-results')"),
+    ('results', 'plexus.cli.result.results:results', "Manage score result records in the dashboard (alias for 'score-results')"),
+    ('report', 'plexus.cli.report.reports:report', 'Commands for managing and running reports.'),
+    ('data', 'plexus.cli.data.operations:data', 'Profiling the data available for each score in the scorecard.'),
+    ('score-chat', 'plexus.cli.score_chat.chat:score_chat', 'Commands for working with the Plexus score chat feature.'),
+    ('lake', 'plexus.cli.data_lake.operations:lake_group', 'Sub-group for data lake operations.'),
+    ('feedback', 'plexus.cli.feedback.commands:feedback', 'Commands for managing feedback data.'),
+    ('scorecards', 'plexus.cli.scorecard.scorecards:scorecards', 'Commands for managing scorecards.'),
+    ('scorecard', 'plexus.cli.scorecard.scorecards:scorecard', "Manage individual scorecards (alias for 'scorecards')"),
+    ('evaluations', 'plexus.cli.evaluation.evaluations:evaluations', 'Manage evaluation records in the dashboard'),
+    ('count', 'plexus.cli.record_count.counting:count', 'Count items and score results with various time-based filters.'),
+    ('metrics', 'plexus.cli.metrics.commands:metrics_group', 'Metrics aggregation commands.'),
+    ('dataset', 'plexus.cli.dataset.datasets:dataset', 'Commands for managing datasets.'),
+    ('procedure', 'plexus.cli.procedure.procedures:procedure', 'Manage procedures for AI system optimization.'),
+    ('rubric-memory', 'plexus.cli.rubric_memory.commands:rubric_memory', 'Commands for syncing and preparing rubric memory.'),
+    ('chat', 'plexus.cli.chat.chats:chat', 'Inspect and send chat messages.'),
+    ('execute', 'plexus.cli.execute.execute:execute', 'Execute a Tactus snippet through the Plexus runtime.'),
+]
+
+for _name, _import_path, _short_help in COMMANDS:
+    cli.add_lazy_command(_name, _import_path, _short_help)
 
 def main():
     """
@@ -1,9 +1,7 @@
 import sys
 import shlex
-import io
 import asyncio
 import json
-from contextlib import redirect_stdout, redirect_stderr
 from celery import Task
 from plexus.CustomLogging import logging
 from .CommandProgress import CommandProgress, ProgressState
@@ -28,6 +26,7 @@ from .task_output_storage import (
     persist_task_output_artifact,
     resolve_task_output_attachment_bucket_name,
 )
+from .task_output_capture import StreamingOutputSink, capture_task_output
 
 # Load environment variables from .env file
 load_dotenv()
@@ -95,6 +94,8 @@ def register_tasks(app):
     )
     def execute_command(self: Task, command_string: str, target: str = "default/command", task_id: Optional[str] = None) -> dict:
         """Execute a Plexus command and return its result."""
+        stdout_capture = None
+        stderr_capture = None
         try:
             # IMMEDIATELY claim the task if we have a task_id
             if task_id:
@@ -211,12 +212,19 @@ def register_tasks(app):
             if task_id and '--task-id' not in args and _should_append_task_id_arg(args):
                 args.extend(['--task-id', task_id])
             
-            # Save the original argv
-            original_argv = sys.argv
-            
-            # Capture stdout and stderr
-            stdout_capture = io.StringIO()
-            stderr_capture = io.StringIO()
+            # Capture stdout and stderr for this task only. Output is spooled to
+            # disk and streamed to the task's attachments while the command runs.
+            output_bucket_name = resolve_task_output_attachment_bucket_name() if task_id else None
+            stdout_capture = StreamingOutputSink(
+                "stdout",
+                bucket_name=output_bucket_name,
+                key=f"tasks/{task_id}/stdout.txt" if task_id else None,
+            )
+            stderr_capture = StreamingOutputSink(
+                "stderr",
+                bucket_name=output_bucket_name,
+                key=f"tasks/{task_id}/stderr.txt" if task_id else None,
+            )
             
             def progress_callback(state: ProgressState):
                 """Update Celery task state with progress information."""
@@ -325,16 +333,13 @@ def register_tasks(app):
                 os.environ["PLEXUS_DISPATCH_TASK_ID"] = task_id
 
             try:
-                # Replace argv with our command
-                sys.argv = ['plexus'] + args
-                
                 # Import the main CLI function
                 from plexus.cli.shared.CommandLineInterface import cli
                 
                 # Execute the command with output capture
-                with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
+                with capture_task_output(stdout_capture, stderr_capture):
                     try:
-                        cli(standalone_mode=False)
+                        cli(args=args, prog_name='plexus', standalone_mode=False)
                         status = 'success'
                     except SystemExit as e:
                         status = 'success' if e.code == 0 else 'error'
@@ -447,19 +452,12 @@ def register_tasks(app):
                                     else:
                                         logging.warning(f"Expected output file does not exist: {file_path}")
                             
-                            # Upload stdout as separate file if we have content
-                            if stdout_content.strip():
-                                stdout_key = f"tasks/{task_id}/stdout.txt"
-                                if upload_file_to_s3(bucket_name, stdout_key, stdout_content, 'text/plain'):
-                                    attached_files.append(stdout_key)
-                                    logging.info(f"Uploaded stdout: {stdout_key}")
-                            
-                            # Upload stderr as separate file if we have content
-                            if stderr_content.strip():
-                                stderr_key = f"tasks/{task_id}/stderr.txt"
-                                if upload_file_to_s3(bucket_name, stderr_key, stderr_content, 'text/plain'):
-                                    attached_files.append(stderr_key)
-                                    logging.info(f"Uploaded stderr: {stderr_key}")
+                            # Finish streaming stdout and stderr if they have content
+                            for capture in (stdout_capture, stderr_capture):
+                                output_key = capture.finish()
+                                if output_key:
+                                    attached_files.append(output_key)
+                                    logging.info(f"Uploaded {capture.name}: {output_key}")
                         else:
                             if not bucket_name:
                                 logging.warning("Task attachments bucket could not be resolved, skipping file uploads")
@@ -589,20 +587,11 @@ task_info:
                         except Exception as e:
                             logging.error(f"Failed to generate error Universal Code: {e}")
                         
-                        # Upload error files
-                        bucket_name = resolve_task_output_attachment_bucket_name()
-                        if bucket_name and task_id:
-                            # Upload stdout as separate file if we have content
-                            if stdout_content.strip():
-                                stdout_key = f"tasks/{task_id}/stdout.txt"
-                                if upload_file_to_s3(bucket_name, stdout_key, stdout_content, 'text/plain'):
-                                    attached_files.append(stdout_key)
-                            
-                            # Upload stderr as separate file if we have content
-                            if stderr_content.strip():
-                                stderr_key = f"tasks/{task_id}/stderr.txt"
-                                if upload_file_to_s3(bucket_name, stderr_key, stderr_content, 'text/plain'):
-                                    attached_files.append(stderr_key)
+                        # Finish streaming stdout and stderr if they have content
+                        for capture in (stdout_capture, stderr_capture):
+                            output_key = capture.finish()
+                            if output_key:
+                                attached_files.append(output_key)
                         
                         # Store the command output and error info in the task before failing
                         try:
@@ -656,8 +645,10 @@ task_info:
                 
             finally:
                 _restore_env_value("PLEXUS_DISPATCH_TASK_ID", previous_dispatch_task_id)
-                # Restore the original argv
-                sys.argv = original_argv
+                # Finish both sinks on every path: this uploads output the branches
+                # above did not (a no-op for sinks already finished) and removes the spool
+                stdout_capture.finish()
+                stderr_capture.finish()
                 # Only clear callback if not already cleared due to failure
                 if status == 'success':
                     CommandProgress.set_update_callback(None)
@@ -675,8 +666,8 @@ task_info:
                 'command': command_string,
                 'target': target,
                 'error': str(e),
-                'stdout': stdout_capture.getvalue() if 'stdout_capture' in locals() else '',
-                'stderr': stderr_capture.getvalue() if 'stderr_capture' in locals() else '',
+                'stdout': stdout_capture.getvalue() if stdout_capture is not None else '',
+                'stderr': stderr_capture.getvalue() if stderr_capture is not None else '',
                 'started_at': datetime.now(timezone.utc).timestamp(),
                 'completed_at': datetime.now(timezone.utc).timestamp()
             }
@@ -684,8 +675,8 @@ task_info:
             # Update task status to failed if available
             if 'task' in locals() and task:
                 try:
-                    stdout_content = stdout_capture.getvalue() if 'stdout_capture' in locals() else ''
-                    stderr_content = stderr_capture.getvalue() if 'stderr_capture' in locals() else ''
+                    stdout_content = stdout_capture.getvalue() if stdout_capture is not None else ''
+                    stderr_content = stderr_capture.getvalue() if stderr_capture is not None else ''
                     
                     # Generate error Universal Code for exception
                     error_yaml = None
@@ -723,17 +714,12 @@ task_info:
                             if upload_file_to_s3(bucket_name, exception_key, exception_content, 'text/plain'):
                                 attached_files.append(exception_key)
                             
-                            # Upload stdout as separate file if we have content
-                            if stdout_content.strip():
-                                stdout_key = f"tasks/{task_id}/stdout.txt"
-                                if upload_file_to_s3(bucket_name, stdout_key, stdout_content, 'text/plain'):
-                                    attached_files.append(stdout_key)
-                            
-                            # Upload stderr as separate file if we have content
-                            if stderr_content.strip():
-                                stderr_key = f"tasks/{task_id}/stderr.txt"
-                                if upload_file_to_s3(bucket_name, stderr_key, stderr_content, 'text/plain'):
-                                    attached_files.append(stderr_key)
+                            # Finish streaming stdout and stderr if they have content
+                            if stdout_capture is not None:
+                                for capture in (stdout_capture, stderr_capture):
+                                    output_key = capture.finish()
+                                    if output_key:
+                                        attached_files.append(output_key)
                     
                     update_data = {
                         'status': 'FAILED',
@@ -6,6 +6,7 @@ import click
 from plexus.cli.shared.CommandDispatch import (
     _resolve_dispatch_mode,
     _resolve_local_dispatch_timeout_seconds,
+    _resolve_local_dispatch_concurrency,
     _resolve_queue_name,
     _normalize_metadata,
     _list_pending_tasks_for_account,
@@ -68,6 +69,21 @@ class TestCommandDispatchConfig(unittest.TestCase):
             with self.assertRaises(click.ClickException):
                 _resolve_local_dispatch_timeout_seconds()
 
+    def test_resolve_local_dispatch_concurrency(self):
+        with patch.dict("os.environ", {}, clear=True), patch("os.cpu_count", return_value=6):
+            self.assertEqual(_resolve_local_dispatch_concurrency(), 6)
+        with patch.dict("os.environ", {"PLEXUS_LOCAL_DISPATCH_CONCURRENCY": "3"}, clear=True):
+            self.assertEqual(_resolve_local_dispatch_concurrency(), 3)
+            self.assertEqual(_resolve_local_dispatch_concurrency(2), 2)
+
+    def test_resolve_local_dispatch_concurrency_invalid_raises(self):
+        for value in ("abc", "0"):
+            with patch.dict("os.environ", {"PLEXUS_LOCAL_DISPATCH_CONCURRENCY": value}, clear=True):
+                with self.assertRaises(click.ClickException):
+                    _resolve_local_dispatch_concurrency()
+        with self.assertRaises(click.ClickException):
+            _resolve_local_dispatch_concurrency(0)
+
     def test_list_pending_tasks_filters_and_orders_newest_first(self):
         class FakeClient:
             def execute(self, _query, _variables):
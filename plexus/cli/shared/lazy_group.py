@@ -0,0 +1,78 @@
+"""
+Click group that imports subcommands on first use.
+
+Most ``plexus`` command modules pull in heavy dependencies (LangGraph,
+litellm, pandas, ...) at import time. ``LazyGroup`` registers each subcommand
+by import path and short help text, so ``plexus --help`` and lightweight
+commands such as ``plexus task list`` only import the module they run:
+
+    cli.add_lazy_command("task", "plexus.cli.task.tasks:task", "Manage task records")
+"""
+
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+
+class LazyGroup(click.Group):
+    """``click.Group`` that lists commands in registration order and imports them lazily."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy_commands: Dict[str, Tuple[str, str]] = {}
+        self._order: List[str] = list(self.commands)
+
+    def add_command(self, cmd: click.Command, name: Optional[str] = None) -> None:
+        super().add_command(cmd, name)
+        name = name or cmd.name
+        if name not in self._order:
+            self._order.append(name)
+
+    def add_lazy_command(self, name: str, import_path: str, short_help: str = "") -> None:
+        """
+        Register ``name`` to be imported from ``import_path`` (``"module:attribute"``)
+        when it is first invoked. ``short_help`` is shown in ``--help`` without
+        importing the module.
+        """
+        self._lazy_commands[name] = (import_path, short_help)
+        if name not in self._order:
+            self._order.append(name)
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return list(self._order)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self.commands
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = self.commands.get(cmd_name)
+        if command is not None or cmd_name not in self._lazy_commands:
+            return command
+        import_path, _ = self._lazy_commands[cmd_name]
+        module_name, _, attribute = import_path.partition(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{import_path} is not a click command")
+        self.commands[cmd_name] = command
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Like ``click.Group.format_commands``, but without importing lazy commands."""
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            command = self.commands.get(name)
+            if command is not None:
+                if command.hidden:
+                    continue
+                rows.append((name, command.get_short_help_str(limit)))
+            elif name in self._lazy_commands:
+                placeholder = click.Command(name, short_help=self._lazy_commands[name][1])
+                rows.append((name, placeholder.get_short_help_str(limit)))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
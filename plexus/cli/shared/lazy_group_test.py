@@ -0,0 +1,75 @@
+import sys
+import types
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from plexus.cli.shared.lazy_group import LazyGroup
+
+
+@pytest.fixture
+def lazy_module(monkeypatch):
+    module = types.ModuleType("fake_lazy_commands")
+
+    @click.group()
+    def widgets():
+        """Manage widgets in the dashboard."""
+
+    @widgets.command()
+    def count():
+        click.echo("3 widgets")
+
+    module.widgets = widgets
+    module.not_a_command = object()
+    monkeypatch.delitem(sys.modules, "fake_lazy_commands", raising=False)
+    return module
+
+
+def make_cli():
+    @click.group(cls=LazyGroup)
+    def cli():
+        """Test CLI."""
+
+    @cli.command()
+    def version():
+        """Print the version."""
+        click.echo("1.0")
+
+    cli.add_lazy_command("widgets", "fake_lazy_commands:widgets", "Manage widgets in the dashboard.")
+    cli.add_lazy_command("broken", "fake_lazy_commands:not_a_command", "Broken.")
+    return cli
+
+
+def test_help_lists_commands_in_order_without_importing(lazy_module):
+    cli = make_cli()
+
+    result = CliRunner().invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    assert "fake_lazy_commands" not in sys.modules
+    lines = [line.split()[0] for line in result.output.split("Commands:")[1].strip().splitlines()]
+    assert lines == ["version", "widgets", "broken"]
+    assert "Manage widgets in the dashboard." in result.output
+    assert not cli.is_loaded("widgets")
+
+
+def test_invoking_a_command_imports_it_once(lazy_module, monkeypatch):
+    cli = make_cli()
+    monkeypatch.setitem(sys.modules, "fake_lazy_commands", lazy_module)
+
+    result = CliRunner().invoke(cli, ["widgets", "count"])
+
+    assert result.exit_code == 0
+    assert result.output == "3 widgets\n"
+    assert cli.is_loaded("widgets")
+    assert cli.get_command(None, "widgets") is lazy_module.widgets
+
+
+def test_rejects_attributes_that_are_not_commands(lazy_module, monkeypatch):
+    cli = make_cli()
+    monkeypatch.setitem(sys.modules, "fake_lazy_commands", lazy_module)
+
+    with pytest.raises(TypeError):
+        cli.get_command(None, "broken")
+    assert cli.get_command(None, "missing") is None
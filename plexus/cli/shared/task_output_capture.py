@@ -0,0 +1,353 @@
+"""
+Per-task, bounded-memory capture of command stdout and stderr.
+
+``execute_command`` used to redirect the whole process's output into
+``StringIO`` buffers and upload them when the command finished, so a chatty
+evaluation held all of its logs in worker memory. Here each stream is written
+to a ``StreamingOutputSink``:
+
+* text is spooled to a local file; whenever the spool reaches ``part_bytes``
+  it is rotated and uploaded in the background as the next part of an S3
+  multipart upload, so neither memory nor local disk grows with the output;
+* only the last ``tail_chars`` characters are kept in memory, for the task
+  record and error messages;
+* ``finish()`` uploads the remainder and returns the S3 key (small outputs are
+  sent with a single ``put_object``).
+
+``capture_task_output`` routes ``sys.stdout``/``sys.stderr`` through a
+ContextVar instead of swapping them process-wide, so commands running
+concurrently in one worker (threads or asyncio tasks started from the command)
+each write to their own sinks. Threads that do not inherit the context (a
+bare ``threading.Thread``, ``ThreadPoolExecutor`` and ``run_in_executor``
+workers) write to the sinks of the only active capture, or to the original
+streams while several commands capture at once.
+"""
+
+import io
+import os
+import sys
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional
+
+import boto3
+from botocore.exceptions import ClientError
+
+from plexus.CustomLogging import logging
+
+# S3 requires every multipart part except the last to be at least 5 MiB.
+DEFAULT_PART_BYTES = 8 * 1024 * 1024
+DEFAULT_TAIL_CHARS = 256 * 1024
+
+_stdout_sink: ContextVar[Optional["StreamingOutputSink"]] = ContextVar("plexus_task_stdout", default=None)
+_stderr_sink: ContextVar[Optional["StreamingOutputSink"]] = ContextVar("plexus_task_stderr", default=None)
+
+# Sinks of every capture in progress, per stream, for threads without a context.
+_active_sinks = {_stdout_sink: [], _stderr_sink: []}
+
+
+class StreamingOutputSink(io.TextIOBase):
+    """Text stream that spools to rotating local files and uploads them to S3 in parts."""
+
+    def __init__(
+        self,
+        name: str,
+        bucket_name: Optional[str] = None,
+        key: Optional[str] = None,
+        content_type: str = "text/plain",
+        part_bytes: int = DEFAULT_PART_BYTES,
+        tail_chars: int = DEFAULT_TAIL_CHARS,
+        spool_dir: Optional[str] = None,
+        s3_client: Any = None,
+    ):
+        super().__init__()
+        self.name = name
+        self.bucket_name = bucket_name
+        self.key = key
+        self.content_type = content_type
+        self.part_bytes = part_bytes
+        self.tail_chars = tail_chars
+        self.spool_dir = spool_dir
+        self.bytes_written = 0
+        self.uploaded_key: Optional[str] = None
+        self._s3_client = s3_client
+        self._lock = threading.Lock()
+        self._tail: List[str] = []
+        self._tail_length = 0
+        self._has_content = False
+        self._spool = None
+        self._spool_bytes = 0
+        self._upload_id: Optional[str] = None
+        self._parts: List[dict] = []
+        self._pending: Optional[Future] = None
+        self._upload_failed = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._finished = False
+
+    @property
+    def uploads_enabled(self) -> bool:
+        return bool(self.bucket_name and self.key)
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    def write(self, text: str) -> int:
+        if not isinstance(text, str):
+            # Like StringIO; click probes streams with write(b"") to detect binary ones.
+            raise TypeError(f"write() argument must be str, not {type(text).__name__}")
+        if not text:
+            return 0
+        data = text.encode("utf-8", errors="replace")
+        with self._lock:
+            if self._finished:
+                return len(text)
+            if not self._has_content and not text.isspace():
+                self._has_content = True
+            self._append_tail(text)
+            self.bytes_written += len(data)
+            if self._spool is None:
+                self._spool = tempfile.NamedTemporaryFile(
+                    mode="w+b", prefix=f"plexus-{self.name}-", suffix=".log",
+                    dir=self.spool_dir, delete=False,
+                )
+                self._spool_bytes = 0
+            self._spool.write(data)
+            self._spool_bytes += len(data)
+            if self.uploads_enabled and self._spool_bytes >= self.part_bytes:
+                self._rotate_spool()
+        return len(text)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._spool is not None:
+                self._spool.flush()
+
+    def _append_tail(self, text: str) -> None:
+        self._tail.append(text)
+        self._tail_length += len(text)
+        if self._tail_length > 2 * self.tail_chars:
+            joined = "".join(self._tail)[-self.tail_chars:]
+            self._tail = [joined]
+            self._tail_length = len(joined)
+
+    def getvalue(self) -> str:
+        """The captured text, or its last ``tail_chars`` characters if it is longer."""
+        with self._lock:
+            joined = "".join(self._tail)
+        return joined[-self.tail_chars:] if len(joined) > self.tail_chars else joined
+
+    @property
+    def truncated(self) -> bool:
+        return self.bytes_written > len(self.getvalue().encode("utf-8", errors="replace"))
+
+    def _client(self):
+        if self._s3_client is None:
+            self._s3_client = boto3.client("s3")
+        return self._s3_client
+
+    def _rotate_spool(self) -> None:
+        """Hand the full spool file to the uploader and start a new one (caller holds the lock)."""
+        spool = self._spool
+        self._spool = None
+        self._spool_bytes = 0
+        spool.flush()
+        if self._upload_failed:
+            self._discard(spool)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"plexus-{self.name}-upload")
+        # Keep at most one part in flight so local disk stays bounded.
+        if self._pending is not None:
+            self._pending.result()
+        self._pending = self._executor.submit(self._upload_part, spool)
+
+    def _upload_part(self, spool) -> None:
+        try:
+            if self._upload_failed:
+                return
+            client = self._client()
+            if self._upload_id is None:
+                response = client.create_multipart_upload(
+                    Bucket=self.bucket_name, Key=self.key, ContentType=self.content_type
+                )
+                self._upload_id = response["UploadId"]
+            part_number = len(self._parts) + 1
+            spool.seek(0)
+            response = client.upload_part(
+                Bucket=self.bucket_name, Key=self.key, UploadId=self._upload_id,
+                PartNumber=part_number, Body=spool,
+            )
+            self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        except Exception as e:
+            self._upload_failed = True
+            logging.error(f"Failed to upload {self.name} part to s3://{self.bucket_name}/{self.key}: {e}")
+        finally:
+            self._discard(spool)
+
+    @staticmethod
+    def _discard(spool) -> None:
+        try:
+            spool.close()
+        finally:
+            try:
+                os.unlink(spool.name)
+            except OSError:
+                pass
+
+    def finish(self) -> Optional[str]:
+        """
+        Upload whatever has not been uploaded yet and release local files.
+
+        Returns the S3 key when the output was uploaded, otherwise None (no
+        bucket configured, only whitespace was written, or the upload failed).
+        Safe to call more than once.
+        """
+        with self._lock:
+            if self._finished:
+                return self.uploaded_key
+            self._finished = True
+            spool = self._spool
+            self._spool = None
+            pending = self._pending
+        if pending is not None:
+            pending.result()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        try:
+            if not self.uploads_enabled or not self._has_content or self._upload_failed:
+                self._abort_multipart()
+                return None
+            if self._upload_id is None:
+                # Small output: one request, as before.
+                body = b""
+                if spool is not None:
+                    spool.flush()
+                    spool.seek(0)
+                    body = spool.read()
+                self._client().put_object(
+                    Bucket=self.bucket_name, Key=self.key, Body=body, ContentType=self.content_type
+                )
+            else:
+                if spool is not None:
+                    self._upload_part(spool)
+                    spool = None
+                if self._upload_failed:
+                    self._abort_multipart()
+                    return None
+                self._client().complete_multipart_upload(
+                    Bucket=self.bucket_name, Key=self.key, UploadId=self._upload_id,
+                    MultipartUpload={"Parts": self._parts},
+                )
+            self.uploaded_key = self.key
+            logging.info(f"Successfully uploaded file to s3://{self.bucket_name}/{self.key}")
+            return self.uploaded_key
+        except ClientError as e:
+            logging.error(f"Failed to upload file to S3: {e}")
+            self._abort_multipart()
+            return None
+        except Exception as e:
+            logging.error(f"Unexpected error uploading to S3: {e}")
+            self._abort_multipart()
+            return None
+        finally:
+            if spool is not None:
+                self._discard(spool)
+
+    def _abort_multipart(self) -> None:
+        if self._upload_id is None:
+            return
+        try:
+            self._client().abort_multipart_upload(
+                Bucket=self.bucket_name, Key=self.key, UploadId=self._upload_id
+            )
+        except Exception as e:
+            logging.warning(f"Could not abort multipart upload for s3://{self.bucket_name}/{self.key}: {e}")
+        self._upload_id = None
+
+    def close(self) -> None:
+        self.finish()
+        super().close()
+
+
+class _ContextStream(io.TextIOBase):
+    """Stands in for sys.stdout/sys.stderr and writes to the current task's sink."""
+
+    def __init__(self, sink_var: ContextVar, fallback):
+        super().__init__()
+        self._sink_var = sink_var
+        self.fallback = fallback
+
+    def _target(self):
+        sink = self._sink_var.get()
+        if sink is not None:
+            return sink
+        active = list(_active_sinks[self._sink_var])
+        return active[0] if len(active) == 1 else self.fallback
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return self._target().isatty()
+
+    def fileno(self) -> int:
+        return self._target().fileno()
+
+    @property
+    def encoding(self):
+        return getattr(self._target(), "encoding", "utf-8")
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+
+_install_lock = threading.Lock()
+_active_captures = 0
+
+
+@contextmanager
+def capture_task_output(
+    stdout_sink: StreamingOutputSink, stderr_sink: StreamingOutputSink
+) -> Iterator[None]:
+    """Send this context's stdout and stderr to the given sinks."""
+    global _active_captures
+    with _install_lock:
+        if not isinstance(sys.stdout, _ContextStream):
+            sys.stdout = _ContextStream(_stdout_sink, sys.stdout)
+        if not isinstance(sys.stderr, _ContextStream):
+            sys.stderr = _ContextStream(_stderr_sink, sys.stderr)
+        _active_captures += 1
+        _active_sinks[_stdout_sink].append(stdout_sink)
+        _active_sinks[_stderr_sink].append(stderr_sink)
+    stdout_token = _stdout_sink.set(stdout_sink)
+    stderr_token = _stderr_sink.set(stderr_sink)
+    try:
+        yield
+    finally:
+        _stdout_sink.reset(stdout_token)
+        _stderr_sink.reset(stderr_token)
+        with _install_lock:
+            _active_captures -= 1
+            _active_sinks[_stdout_sink].remove(stdout_sink)
+            _active_sinks[_stderr_sink].remove(stderr_sink)
+            if _active_captures == 0:
+                if isinstance(sys.stdout, _ContextStream):
+                    sys.stdout = sys.stdout.fallback
+                if isinstance(sys.stderr, _ContextStream):
+                    sys.stderr = sys.stderr.fallback
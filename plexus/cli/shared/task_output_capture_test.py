@@ -0,0 +1,196 @@
+import asyncio
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from plexus.cli.shared.task_output_capture import StreamingOutputSink, capture_task_output
+
+
+class FakeS3:
+    """Records put_object and multipart calls, assembling uploaded objects."""
+
+    def __init__(self, fail_parts=False):
+        self.objects = {}
+        self.parts = {}
+        self.calls = []
+        self.fail_parts = fail_parts
+
+    def put_object(self, Bucket, Key, Body, ContentType):
+        self.calls.append("put_object")
+        self.objects[Key] = Body
+
+    def create_multipart_upload(self, Bucket, Key, ContentType):
+        self.calls.append("create_multipart_upload")
+        self.parts[Key] = []
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        if self.fail_parts:
+            raise RuntimeError("network down")
+        self.calls.append(f"upload_part:{PartNumber}")
+        self.parts[Key].append(Body.read())
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.calls.append("complete_multipart_upload")
+        assert [p["PartNumber"] for p in MultipartUpload["Parts"]] == list(range(1, len(self.parts[Key]) + 1))
+        self.objects[Key] = b"".join(self.parts[Key])
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.calls.append("abort_multipart_upload")
+
+
+def spool_files(directory):
+    return [name for name in os.listdir(directory) if name.startswith("plexus-")]
+
+
+def test_small_output_is_uploaded_with_one_put(tmp_path):
+    s3 = FakeS3()
+    sink = StreamingOutputSink("stdout", "bucket", "tasks/t1/stdout.txt", spool_dir=str(tmp_path), s3_client=s3)
+
+    sink.write("hello\n")
+    sink.write("world\n")
+
+    assert sink.finish() == "tasks/t1/stdout.txt"
+    assert s3.calls == ["put_object"]
+    assert s3.objects["tasks/t1/stdout.txt"] == b"hello\nworld\n"
+    assert sink.getvalue() == "hello\nworld\n"
+    assert spool_files(tmp_path) == []
+    assert sink.finish() == "tasks/t1/stdout.txt"
+    assert s3.calls == ["put_object"]
+
+
+def test_large_output_streams_parts_while_writing(tmp_path):
+    s3 = FakeS3()
+    sink = StreamingOutputSink(
+        "stdout", "bucket", "tasks/t1/stdout.txt",
+        part_bytes=1000, tail_chars=200, spool_dir=str(tmp_path), s3_client=s3,
+    )
+    lines = [f"line {i:05d} " + "x" * 40 + "\n" for i in range(500)]
+
+    for line in lines:
+        sink.write(line)
+    sink.flush()
+    uploaded_before_finish = sum(call.startswith("upload_part") for call in s3.calls)
+
+    assert sink.finish() == "tasks/t1/stdout.txt"
+    assert uploaded_before_finish > 10
+    assert s3.objects["tasks/t1/stdout.txt"].decode() == "".join(lines)
+    assert s3.calls[-1] == "complete_multipart_upload"
+    assert sink.getvalue() == "".join(lines)[-200:]
+    assert sink.truncated
+    assert spool_files(tmp_path) == []
+
+
+def test_whitespace_or_missing_bucket_is_not_uploaded(tmp_path):
+    s3 = FakeS3()
+    blank = StreamingOutputSink("stderr", "bucket", "tasks/t1/stderr.txt", spool_dir=str(tmp_path), s3_client=s3)
+    blank.write("\n  \n")
+    local = StreamingOutputSink("stdout", spool_dir=str(tmp_path), part_bytes=10, s3_client=s3)
+    local.write("kept locally " * 10)
+
+    assert blank.finish() is None
+    assert local.finish() is None
+    assert s3.calls == []
+    assert local.getvalue() == "kept locally " * 10
+    assert spool_files(tmp_path) == []
+
+
+def test_failed_part_upload_aborts(tmp_path):
+    s3 = FakeS3(fail_parts=True)
+    sink = StreamingOutputSink(
+        "stdout", "bucket", "tasks/t1/stdout.txt", part_bytes=100, spool_dir=str(tmp_path), s3_client=s3,
+    )
+    for _ in range(20):
+        sink.write("y" * 50)
+
+    assert sink.finish() is None
+    assert "abort_multipart_upload" in s3.calls
+    assert "complete_multipart_upload" not in s3.calls
+    assert spool_files(tmp_path) == []
+
+
+def test_concurrent_captures_are_isolated(tmp_path):
+    original_stdout = sys.stdout
+    sinks = {}
+    barrier = threading.Barrier(2)
+
+    def run(name):
+        out = StreamingOutputSink(f"{name}-out", spool_dir=str(tmp_path))
+        err = StreamingOutputSink(f"{name}-err", spool_dir=str(tmp_path))
+        sinks[name] = (out, err)
+        with capture_task_output(out, err):
+            barrier.wait()
+            for i in range(50):
+                print(f"{name} {i}")
+            print(f"{name} failed", file=sys.stderr)
+            barrier.wait()
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for name, (out, err) in sinks.items():
+        assert out.getvalue() == "".join(f"{name} {i}\n" for i in range(50))
+        assert err.getvalue() == f"{name} failed\n"
+        out.finish()
+        err.finish()
+    assert sys.stdout is original_stdout
+
+
+def test_executor_threads_write_to_the_only_active_capture(tmp_path):
+    out = StreamingOutputSink("out", spool_dir=str(tmp_path))
+    err = StreamingOutputSink("err", spool_dir=str(tmp_path))
+
+    async def run_in_loop_executor():
+        await asyncio.get_running_loop().run_in_executor(None, print, "from run_in_executor")
+
+    with capture_task_output(out, err):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(print, "from pool").result()
+            executor.submit(print, "pool failed", file=sys.stderr).result()
+        asyncio.run(run_in_loop_executor())
+
+    assert out.getvalue() == "from pool\nfrom run_in_executor\n"
+    assert err.getvalue() == "pool failed\n"
+    out.finish()
+    err.finish()
+
+
+def test_context_free_threads_use_original_streams_while_captures_overlap(tmp_path, capsys):
+    first = StreamingOutputSink("first", spool_dir=str(tmp_path))
+    second = StreamingOutputSink("second", spool_dir=str(tmp_path))
+
+    with capture_task_output(first, first), capture_task_output(second, second):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(print, "unowned").result()
+
+    assert first.getvalue() == ""
+    assert second.getvalue() == ""
+    assert "unowned" in capsys.readouterr().out
+    first.finish()
+    second.finish()
+
+
+def test_execute_command_captures_cli_output(monkeypatch):
+    from plexus.cli.shared.CommandTasks import register_tasks
+
+    monkeypatch.delenv("PLEXUS_API_URL", raising=False)
+    monkeypatch.delenv("PLEXUS_API_KEY", raising=False)
+    app = Mock()
+    app.conf.task_target_matcher = None
+    app.task.return_value = lambda func: func
+    execute_command, _ = register_tasks(app)
+    original_argv = list(sys.argv)
+
+    result = execute_command(Mock(), "task --help")
+
+    assert result["status"] == "success"
+    assert "Usage: plexus task" in result["stdout"]
+    assert sys.argv == original_argv
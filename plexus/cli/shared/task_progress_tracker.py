@@ -10,6 +10,7 @@ from plexus.dashboard.api.client import (
     PlexusDashboardClient,
 )
 from plexus.dashboard.api.models.task import Task
+import re
 import threading
 import traceback
 
@@ -97,6 +98,249 @@ class Stage:
         self.processed_items = current_count
         logging.info(f"Updated stage {self.name} processed count to {current_count}")
 
+def _sanitize_graphql_name(name: str) -> str:
+    """Sanitize a string to be a valid GraphQL name (remove spaces, etc.)."""
+    sanitized = re.sub(r'\W+', '', name)
+    # Ensure it starts with a letter or underscore if it's not empty
+    if sanitized and not sanitized[0].isalpha() and sanitized[0] != '_':
+        sanitized = '_' + sanitized
+    return sanitized or 'sanitizedStageName' # Fallback if empty
+
+
+class StageProgressPublisher:
+    """Sends stage progress for one task, coalescing updates into one in-flight mutation.
+
+    The publisher keeps the API stage ids, their last known statuses and the
+    last config sent for each stage, so publishing does not need to list the
+    task's stages again and unchanged stages are left out of the mutation.
+
+    ``submit`` never waits on the API: it replaces any update that has not been
+    sent yet and, if no worker is running, starts one that sends the latest
+    update and exits once nothing is pending. ``flush`` waits until everything
+    submitted so far has been sent (sending it on the calling thread if no
+    worker picked it up), and is called before terminal task updates.
+    """
+
+    def __init__(self, api_task: Task, stage_ids: Optional[Dict[str, str]] = None):
+        self.api_task = api_task
+        self._stage_ids = stage_ids if stage_ids is not None else {}
+        self._api_stages: Dict[str, Dict[str, Any]] = {}
+        self._last_sent: Dict[str, Dict[str, Any]] = {}
+        self._last_estimated_completion: Optional[str] = None
+        self._condition = threading.Condition()
+        self._pending: Optional[tuple] = None
+        self._publishing = False
+        self._worker_active = False
+        self.mutations_sent = 0
+
+    def stage_status(self, name: str) -> Optional[str]:
+        """Last status known to be stored in the API for the stage, if any."""
+        with self._condition:
+            return self._api_stages.get(name, {}).get("status")
+
+    def submit(self, stage_configs: Dict[str, Dict], estimated_completion: Optional[str],
+               current_stage_name: Optional[str] = None) -> None:
+        """Queue an update, replacing any queued one, without waiting for the API."""
+        with self._condition:
+            self._pending = (stage_configs, estimated_completion, current_stage_name)
+            if self._worker_active:
+                return
+            self._worker_active = True
+        try:
+            threading.Thread(target=self._drain, daemon=True).start()
+        except Exception as e:
+            with self._condition:
+                self._worker_active = False
+            logging.error(f"Could not start progress publisher for task {self.api_task.id}: {e}")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all submitted updates have been sent. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._condition:
+                while self._publishing:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+                if self._pending is None:
+                    return True
+                payload = self._pending
+                self._pending = None
+                self._publishing = True
+            self._publish_and_release(payload)
+
+    def _drain(self) -> None:
+        while True:
+            with self._condition:
+                while self._publishing:
+                    self._condition.wait()
+                if self._pending is None:
+                    self._worker_active = False
+                    self._condition.notify_all()
+                    return
+                payload = self._pending
+                self._pending = None
+                self._publishing = True
+            self._publish_and_release(payload)
+
+    def _publish_and_release(self, payload: tuple) -> None:
+        try:
+            self.publish(*payload)
+        finally:
+            with self._condition:
+                self._publishing = False
+                self._condition.notify_all()
+
+    def record_stage(self, name: str, stage_id: str, task_id: Optional[str] = None,
+                     order: Optional[int] = None, status: Optional[str] = None) -> None:
+        """Remember a stage the caller has already read or created, so it is not listed again."""
+        with self._condition:
+            self._stage_ids[name] = stage_id
+            self._api_stages[name] = {
+                "id": stage_id,
+                "taskId": task_id or self.api_task.id,
+                "order": order,
+                "status": status,
+            }
+
+    def _resolve_stages(self, names) -> None:
+        """Fill in API stage details for ``names``, listing the task's stages only if one is unknown."""
+        for name in names:
+            if name not in self._api_stages and name in self._stage_ids:
+                self._api_stages[name] = {"id": self._stage_ids[name], "taskId": self.api_task.id}
+        if all(name in self._api_stages for name in names):
+            return
+        for stage in self.api_task.get_stages():
+            self._stage_ids[stage.name] = stage.id
+            self._api_stages[stage.name] = {
+                "id": stage.id,
+                "taskId": stage.taskId,
+                "order": stage.order,
+                "status": stage.status,
+            }
+
+    def publish(self, stage_configs: Dict[str, Dict], estimated_completion: Optional[str],
+                current_stage_name: Optional[str] = None) -> None:
+        """Send one BatchUpdateStages mutation with the stages that changed since the last one."""
+        try:
+            self._resolve_stages(stage_configs.keys())
+
+            stage_inputs = {}
+            for name, stage_config in stage_configs.items():
+                api_stage = self._api_stages.get(name)
+                if api_stage is None:
+                    # Only update existing stages, never create new ones
+                    continue
+                config = stage_config.copy()
+                # Add estimated completion time to current stage
+                if name == current_stage_name and estimated_completion:
+                    config['estimatedCompletionAt'] = estimated_completion
+                config['id'] = api_stage["id"]
+                config['taskId'] = api_stage.get("taskId") or self.api_task.id
+                if api_stage.get("order") is not None:
+                    config['order'] = api_stage["order"]
+                config['name'] = name
+                if 'status' not in config and api_stage.get("status"):
+                    config['status'] = api_stage["status"]
+                if self._last_sent.get(name) != config:
+                    stage_inputs[name] = config
+
+            if not stage_inputs and estimated_completion == self._last_estimated_completion:
+                logging.debug("Skipping task progress mutation - nothing changed since the last one")
+                return
+
+            # Construct a single batched mutation for all stage updates
+            mutation = """
+            mutation BatchUpdateStages(
+                $taskInput: UpdateTaskInput!
+            """
+            for name in stage_inputs:
+                mutation += f"""
+                    ${_sanitize_graphql_name(name)}Input: UpdateTaskStageInput!"""
+
+            mutation += """) {
+                # Update task estimated completion if provided
+                updateTask(input: $taskInput) {
+                    id
+                    accountId
+                    type
+                    status
+                    target
+                    command
+                    estimatedCompletionAt
+                    description
+                    dispatchStatus
+                    metadata
+                    createdAt
+                    startedAt
+                    completedAt
+                    errorMessage
+                    errorDetails
+                    currentStageId
+                }
+            """
+            for name in stage_inputs:
+                sanitized_name = _sanitize_graphql_name(name)
+                mutation += f"""
+                    update{sanitized_name}Stage: updateTaskStage(input: ${sanitized_name}Input) {{
+                        id
+                        taskId
+                        name
+                        order
+                        status
+                        statusMessage
+                        processedItems
+                        totalItems
+                        startedAt
+                        completedAt
+                        estimatedCompletionAt
+                    }}
+                    """
+            mutation += "}"
+
+            variables = {
+                "taskInput": {
+                    "id": self.api_task.id,
+                    "accountId": self.api_task.accountId,
+                    "type": self.api_task.type,
+                    "status": self.api_task.status,
+                    "target": self.api_task.target,
+                    "command": self.api_task.command,
+                    "estimatedCompletionAt": estimated_completion
+                }
+            }
+            for name, config in stage_inputs.items():
+                variables[f"{_sanitize_graphql_name(name)}Input"] = config
+
+            logging.debug(json.dumps({
+                "type": "batch_mutation",
+                "mutation": mutation,
+                "variables": variables
+            }, indent=2))
+
+            self.api_task._client.execute(
+                mutation,
+                variables,
+                retry_policy=LONG_RUNNING_WRITE_RETRY_POLICY_NAME,
+            )
+            self.mutations_sent += 1
+
+            with self._condition:
+                self._last_estimated_completion = estimated_completion
+                for name, config in stage_inputs.items():
+                    self._last_sent[name] = config
+                    if config.get('status'):
+                        self._api_stages[name]["status"] = config['status']
+
+        except Exception as e:
+            logging.error(json.dumps({
+                "type": "task_update_error",
+                "error": str(e),
+                "traceback": traceback.format_exc()
+            }))
+
+
 class TaskProgressTracker:
     """Tracks progress of a multi-stage task with optional API integration.
     
@@ -127,6 +371,8 @@ class TaskProgressTracker:
         # Update progress (only affects stages with total_items set)
         tracker.update(current_items=50)
     """
+    _progress_publisher: Optional[StageProgressPublisher] = None
+
     def __init__(
         self,
         stage_configs: Dict[str, StageConfig],
@@ -399,6 +645,8 @@ class TaskProgressTracker:
 
         # Update API task if we have one
         if self.api_task:
+            # Let queued progress land before the terminal state
+            self.flush()
             # First update all stages to completed state
             stages = self.api_task.get_stages()
             for stage in stages:
@@ -437,6 +685,8 @@ class TaskProgressTracker:
             # Update API task if we have one - do this synchronously for failures
             if self.api_task:
                 try:
+                    # Let queued progress land before the failure
+                    self.flush()
                     # First update the stage status synchronously
                     if self.current_stage:
                         stage_configs = {
@@ -491,6 +741,7 @@ class TaskProgressTracker:
             # Update the API task stage if we have one
             if self.api_task:
                 try:
+                    self.flush()
                     # Delegate to the API task's fail_current_stage method
                     self.api_task.fail_current_stage(
                         error_message=error_message,
@@ -583,9 +834,7 @@ class TaskProgressTracker:
                 return
 
             stage_configs = {}
-
-            # Get current API stages to check their status
-            api_stages = {s.name: s for s in self.api_task.get_stages()}
+            publisher = self._get_progress_publisher()
 
             for name, stage in self._stages.items():
                 # Never update a stage that's already failed
@@ -595,8 +844,9 @@ class TaskProgressTracker:
 
                 if not self.is_complete:
                     # Skip updating stages that are in terminal states in the API
-                    if name in api_stages and api_stages[name].status in ['FAILED', 'COMPLETED']:
-                        logging.debug(f"Skipping update for {api_stages[name].status} stage '{name}'")
+                    api_status = publisher.stage_status(name)
+                    if api_status in ['FAILED', 'COMPLETED']:
+                        logging.debug(f"Skipping update for {api_status} stage '{name}'")
                         continue
 
                 start_time = (
@@ -660,146 +910,38 @@ class TaskProgressTracker:
             # Update the last update time before starting the update
             self._last_api_update_time = current_time
 
-            # For critical updates, do the update synchronously to ensure it completes
-            if is_critical_update:
-                logging.info(json.dumps({
-                    "type": "sync_update",
-                    "message": "Performing critical update synchronously"
-                }))
-                self._async_update_api_task_progress(stage_configs, self.estimated_completion_time.isoformat() if self.estimated_completion_time else None)
-            else:
-                # Offload non-critical updates to a background thread
-                threading.Thread(target=self._async_update_api_task_progress, args=(stage_configs, self.estimated_completion_time.isoformat() if self.estimated_completion_time else None), daemon=True).start()
+            # Hand the update to the publisher; terminal states flush it before finishing the task
+            publisher.submit(
+                stage_configs,
+                self.estimated_completion_time.isoformat() if self.estimated_completion_time else None,
+                self._current_stage_name,
+            )
         finally:
             if self._api_update_lock.locked():
                 self._api_update_lock.release()
 
+    def _get_progress_publisher(self) -> StageProgressPublisher:
+        if self._progress_publisher is None:
+            self._progress_publisher = StageProgressPublisher(self.api_task, getattr(self, "_stage_ids", None))
+        return self._progress_publisher
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued progress updates have been sent to the API.
+
+        Called before the task is completed or failed so that a progress update
+        cannot land after the terminal one. Returns False if ``timeout`` expired.
+        """
+        if not self.api_task:
+            return True
+        return self._get_progress_publisher().flush(timeout)
+
     def _async_update_api_task_progress(self, stage_configs, estimated_completion):
         """Helper method to perform the API task progress update."""
-        try:
-            # Only update existing stages, never create new ones
-            stages = self.api_task.get_stages()
-
-            # Construct a single batched mutation for all stage updates
-            mutation = """
-            mutation BatchUpdateStages(
-                $taskInput: UpdateTaskInput!
-            """ 
-            
-            # Add variables for each stage
-            for stage in stages:
-                if stage.name in stage_configs:
-                    sanitized_name = self._sanitize_graphql_name(stage.name)
-                    mutation += f"""
-                    ${sanitized_name}Input: UpdateTaskStageInput!"""
-            
-            mutation += """) {
-                # Update task estimated completion if provided
-                updateTask(input: $taskInput) {
-                    id
-                    accountId
-                    type
-                    status
-                    target
-                    command
-                    estimatedCompletionAt
-                    description
-                    dispatchStatus
-                    metadata
-                    createdAt
-                    startedAt
-                    completedAt
-                    errorMessage
-                    errorDetails
-                    currentStageId
-                }
-            """
-            
-            # Add update operations for each stage
-            for stage in stages:
-                if stage.name in stage_configs:
-                    sanitized_name = self._sanitize_graphql_name(stage.name)
-                    mutation += f"""
-                    update{sanitized_name}Stage: updateTaskStage(input: ${sanitized_name}Input) {{
-                        id
-                        taskId
-                        name
-                        order
-                        status
-                        statusMessage
-                        processedItems
-                        totalItems
-                        startedAt
-                        completedAt
-                        estimatedCompletionAt
-                    }}
-                    """
-            
-            mutation += "}"
-            
-            # Construct variables for the mutation
-            variables = {
-                "taskInput": {
-                    "id": self.api_task.id,
-                    "accountId": self.api_task.accountId,
-                    "type": self.api_task.type,
-                    "status": self.api_task.status,
-                    "target": self.api_task.target,
-                    "command": self.api_task.command,
-                    "estimatedCompletionAt": estimated_completion
-                }
-            }
-            
-            # Add variables for each stage update
-            for stage in stages:
-                if stage.name in stage_configs:
-                    config = stage_configs[stage.name].copy()
-                    # Add estimated completion time to current stage
-                    if stage.name == self._current_stage_name and estimated_completion:
-                        config['estimatedCompletionAt'] = estimated_completion
-                    
-                    # Add required fields
-                    config['id'] = stage.id
-                    config['taskId'] = stage.taskId  # Ensure taskId is included
-                    config['order'] = stage.order    # Ensure order is included
-                    config['name'] = stage.name      # Ensure name is included
-                    if 'status' not in config:       # Ensure status is included
-                        config['status'] = stage.status
-                    
-                    sanitized_name = self._sanitize_graphql_name(stage.name)
-                    variables[f"{sanitized_name}Input"] = config
-            
-            # Log the mutation and variables
-            logging.debug(json.dumps({
-                "type": "batch_mutation",
-                "mutation": mutation,
-                "variables": variables
-            }, indent=2))
-            
-            # Execute the batched mutation
-            result = self.api_task._client.execute(
-                mutation,
-                variables,
-                retry_policy=LONG_RUNNING_WRITE_RETRY_POLICY_NAME,
-            )
-            
-        except Exception as e:
-            logging.error(json.dumps({
-                "type": "task_update_error",
-                "error": str(e),
-                "traceback": traceback.format_exc()
-            }))
+        self._get_progress_publisher().publish(stage_configs, estimated_completion, self._current_stage_name)
 
     def _sanitize_graphql_name(self, name: str) -> str:
         """Sanitize a string to be a valid GraphQL name (remove spaces, etc.)."""
-        # Basic sanitization: remove spaces and non-alphanumeric chars
-        # Consider a more robust regex if needed
-        import re
-        sanitized = re.sub(r'\W+', '', name)
-        # Ensure it starts with a letter or underscore if it's not empty
-        if sanitized and not sanitized[0].isalpha() and sanitized[0] != '_':
-            sanitized = '_' + sanitized
-        return sanitized or 'sanitizedStageName' # Fallback if empty
+        return _sanitize_graphql_name(name)
 
     def _generate_status_message(self) -> str:
         """Generate a status message based on current progress."""
@@ -939,12 +1081,15 @@ class TaskProgressTracker:
             logging.error(f"Failed to get existing stages for task {self.api_task.id}: {e}", exc_info=True)
             existing_api_stages = {}
 
+        publisher = self._get_progress_publisher()
+
         # Collect stages that need to be created
         stages_to_create = []
         
         for name, stage_config in self._stages.items():
             if name in existing_api_stages:
-                self._stage_ids[name] = existing_api_stages[name].id
+                existing = existing_api_stages[name]
+                publisher.record_stage(name, existing.id, existing.taskId, existing.order, existing.status)
                 logging.debug(f"Stage '{name}' already exists in API with ID: {self._stage_ids[name]}")
             else:
                 # Prepare stage configuration for batch creation
@@ -975,8 +1120,11 @@ class TaskProgressTracker:
                 # Map created stages to our internal stage IDs
                 # Handle case where created_stages returns a non-iterable (like Mock object)
                 if hasattr(created_stages, '__iter__') and not isinstance(created_stages, (str, bytes)):
+                    created_fields = {fields['name']: fields for fields in stages_to_create}
                     for stage in created_stages:
-                        self._stage_ids[stage.name] = stage.id
+                        fields = created_fields.get(stage.name, {})
+                        publisher.record_stage(stage.name, stage.id, order=fields.get('order'),
+                                               status=fields.get('status'))
                         logging.debug(f"Successfully created API stage '{stage.name}' with ID: {stage.id}")
                 else:
                     logging.warning(f"create_stages_batch returned non-iterable: {type(created_stages)}")
@@ -991,7 +1139,8 @@ class TaskProgressTracker:
                     try:
                         new_stage = self.api_task.create_stage(**stage_config)
                         if new_stage:
-                            self._stage_ids[stage_config['name']] = new_stage.id
+                            publisher.record_stage(stage_config['name'], new_stage.id,
+                                                   order=stage_config['order'], status=stage_config['status'])
                             logging.debug(f"Successfully created API stage '{stage_config['name']}' with ID: {new_stage.id}")
                         else:
                             logging.error(f"API call create_stage for '{stage_config['name']}' returned None.")
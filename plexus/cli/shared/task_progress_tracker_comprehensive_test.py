@@ -21,6 +21,7 @@ from plexus.cli.shared.task_progress_tracker import (
     TaskProgressTracker, 
     StageConfig, 
     Stage,
+    StageProgressPublisher,
     MIN_API_UPDATE_INTERVAL
 )
 from plexus.cli.shared.stage_configurations import (
@@ -1286,3 +1287,124 @@ def test_async_update_api_task_progress_uses_long_running_retry_policy():
     tracker._async_update_api_task_progress(stage_configs, "2026-04-23T13:00:00+00:00")
 
     assert client.execute.call_args.kwargs["retry_policy"] == LONG_RUNNING_WRITE_RETRY_POLICY_NAME
+
+
+def _publisher_task(stage_names=("Setup", "Processing")):
+    client = Mock()
+    api_task = Mock(spec=Task)
+    api_task.id = "task-1"
+    api_task.accountId = "acct-1"
+    api_task.type = "Evaluation"
+    api_task.status = "RUNNING"
+    api_task.target = "evaluation/accuracy"
+    api_task.command = "evaluate accuracy"
+    api_task._client = client
+    stages = []
+    for order, name in enumerate(stage_names, start=1):
+        stage = Mock()
+        stage.id = f"stage-{name}"
+        stage.taskId = "task-1"
+        stage.order = order
+        stage.name = name
+        stage.status = "RUNNING"
+        stages.append(stage)
+    api_task.get_stages.return_value = stages
+    return api_task, client
+
+
+def _processing_config(processed):
+    return {"Processing": {"status": "RUNNING", "totalItems": 100, "processedItems": processed}}
+
+
+def test_publisher_coalesces_updates_behind_one_in_flight_mutation():
+    api_task, client = _publisher_task()
+    first_sent = threading.Event()
+    release = threading.Event()
+    sent = []
+
+    def execute(_mutation, variables, retry_policy=None):
+        sent.append(variables["ProcessingInput"]["processedItems"])
+        first_sent.set()
+        release.wait(5)
+
+    client.execute.side_effect = execute
+    publisher = StageProgressPublisher(api_task)
+
+    publisher.submit(_processing_config(1), None, "Processing")
+    assert first_sent.wait(5)
+    for processed in range(2, 50):
+        publisher.submit(_processing_config(processed), None, "Processing")
+    release.set()
+
+    assert publisher.flush(timeout=5)
+    assert sent == [1, 49]
+    assert api_task.get_stages.call_count == 1
+
+
+def test_publisher_only_sends_changed_stages():
+    api_task, client = _publisher_task()
+    publisher = StageProgressPublisher(api_task, {"Setup": "stage-Setup", "Processing": "stage-Processing"})
+    configs = {"Setup": {"status": "COMPLETED"}, **_processing_config(10)}
+
+    publisher.publish(configs, None, "Processing")
+    publisher.publish(configs, None, "Processing")
+    publisher.publish({"Setup": {"status": "COMPLETED"}, **_processing_config(20)}, None, "Processing")
+
+    assert client.execute.call_count == 2
+    last_variables = client.execute.call_args.args[1]
+    assert "SetupInput" not in last_variables
+    assert last_variables["ProcessingInput"]["id"] == "stage-Processing"
+    assert publisher.stage_status("Setup") == "COMPLETED"
+    api_task.get_stages.assert_not_called()
+
+
+def test_tracker_flushes_progress_before_completing():
+    api_task, client = _publisher_task(("Processing",))
+    calls = []
+    client.execute.side_effect = lambda *args, **kwargs: calls.append("progress")
+    api_task.complete_processing.side_effect = lambda: calls.append("complete")
+
+    with patch("threading.Thread"):
+        # The background workers never run, so everything is sent by the flush.
+        tracker = TaskProgressTracker(
+            stage_configs={"Processing": StageConfig(order=1, total_items=100)},
+            task_object=api_task,
+            total_items=100,
+            prevent_new_task=True,
+        )
+        for processed in range(1, 100):
+            tracker._last_api_update_time = 0
+            tracker.update(current_items=processed)
+        tracker.complete()
+
+    assert calls == ["progress", "complete"]
+    assert api_task.get_stages.call_count == 2  # stage lookup once, then complete()
+
+
+def test_synced_stages_keep_terminal_api_statuses_from_being_overwritten():
+    api_task, client = _publisher_task()
+    setup, processing = api_task.get_stages.return_value
+    setup.status = "COMPLETED"
+
+    with patch("threading.Thread"):
+        tracker = TaskProgressTracker(
+            stage_configs={
+                "Setup": StageConfig(order=1),
+                "Processing": StageConfig(order=2, total_items=100),
+            },
+            task_object=api_task,
+            total_items=100,
+            prevent_new_task=True,
+        )
+        tracker._sync_api_stages()
+        publisher = tracker._get_progress_publisher()
+        assert publisher.stage_status("Setup") == "COMPLETED"
+
+        tracker._last_api_update_time = 0
+        tracker.update(current_items=10)
+        tracker.flush()
+
+    sent_variables = client.execute.call_args.args[1]
+    assert "SetupInput" not in sent_variables
+    assert sent_variables["ProcessingInput"]["order"] == 2
+    assert api_task.get_stages.call_count == 1
@@ -1,7 +1,23 @@
 import json
+import sys
+import threading
+import time
 from types import SimpleNamespace
+from unittest.mock import patch
 
-from plexus.cli.shared.CommandDispatch import _build_local_run_args, _list_pending_tasks_for_account
+import pytest
+
+from plexus.cli.shared.CommandDispatch import (
+    LocalTaskPool,
+    _build_local_run_args,
+    _claim_task_for_dispatch,
+    _local_processes,
+    _list_pending_tasks_for_account,
+    _run_dispatch_cycle,
+    _run_local_command,
+    _task_from_listing,
+)
+from plexus.dashboard.api.models.task import Task
 
 
 class _StubClient:
@@ -95,3 +111,153 @@ def test_build_local_run_args_uses_plexus_entrypoint_for_other_task_types():
     task = SimpleNamespace(type="Procedure", command="procedure run --id proc-1")
     run_args = _build_local_run_args(task)
     assert run_args == ["plexus", "procedure", "run", "--id", "proc-1"]
+
+
+def _listed_task(task_id, **overrides):
+    task = {
+        "id": task_id,
+        "accountId": "acct-1",
+        "type": "Procedure",
+        "status": "PENDING",
+        "target": "default/command",
+        "command": f"procedure run --id {task_id}",
+        "dispatchStatus": "PENDING",
+        "metadata": "{}",
+        "createdAt": "2026-03-30T10:00:00Z",
+    }
+    task.update(overrides)
+    return task
+
+
+class _ClaimClient:
+    """Applies updateTask mutations with DynamoDB-style conditional checks."""
+
+    def __init__(self, tasks):
+        self.tasks = {task["id"]: dict(task) for task in tasks}
+        self.mutations = []
+        self.lock = threading.Lock()
+
+    def execute(self, query, variables):
+        if "listTaskByAccountIdAndUpdatedAt" in query:
+            return {"listTaskByAccountIdAndUpdatedAt": {"items": [dict(t) for t in self.tasks.values()]}}
+        assert "updateTask" in query
+        with self.lock:
+            self.mutations.append(variables)
+            current = self.tasks[variables["input"]["id"]]
+            expected = variables["condition"]["dispatchStatus"]["eq"]
+            if current["dispatchStatus"] != expected:
+                raise Exception(
+                    "GraphQL query failed: The conditional request failed (ConditionalCheckFailedException)"
+                )
+            current.update(variables["input"])
+            return {"updateTask": dict(current)}
+
+
+def test_task_from_listing_skips_refetch_when_fields_present():
+    client = object()
+    with patch.object(Task, "get_by_id") as get_by_id:
+        task = _task_from_listing(client, _listed_task("t1"))
+    get_by_id.assert_not_called()
+    assert task.id == "t1"
+    assert task.command == "procedure run --id t1"
+
+    partial = {"id": "t2", "status": "PENDING", "dispatchStatus": "PENDING"}
+    with patch.object(Task, "get_by_id", return_value="fetched") as get_by_id:
+        assert _task_from_listing(client, partial) == "fetched"
+    get_by_id.assert_called_once_with("t2", client)
+
+
+def test_claim_is_conditional_and_only_one_dispatcher_wins():
+    client = _ClaimClient([_listed_task("t1")])
+    first = _task_from_listing(client, _listed_task("t1"))
+    second = _task_from_listing(client, _listed_task("t1"))
+
+    claimed = _claim_task_for_dispatch(first, dispatcher_id="host-a", mode="local")
+    lost = _claim_task_for_dispatch(second, dispatcher_id="host-b", mode="local")
+
+    assert claimed.dispatchStatus == "DISPATCHING"
+    assert claimed.workerNodeId == "host-a"
+    assert lost is None
+    assert client.mutations[0]["condition"] == {"dispatchStatus": {"eq": "PENDING"}}
+    assert json.loads(client.tasks["t1"]["metadata"])["dispatch_mode"] == "local"
+
+
+def test_claim_reraises_other_errors():
+    class FailingClient:
+        def execute(self, _query, _variables):
+            raise Exception("GraphQL query failed: Unauthorized")
+
+    task = _task_from_listing(FailingClient(), _listed_task("t1"))
+    with pytest.raises(Exception, match="Unauthorized"):
+        _claim_task_for_dispatch(task, dispatcher_id="host-a", mode="local")
+
+
+def test_run_local_command_streams_output_and_keeps_tail(capsys):
+    script = "import sys\nfor i in range(100): print(f'line {i}')\nprint('oops', file=sys.stderr)\nsys.exit(3)"
+
+    result = _run_local_command([sys.executable, "-c", script], env=None, timeout_seconds=30, label="t1", tail_chars=30)
+
+    assert result.returncode == 3
+    assert not result.timed_out
+    assert result.stdout == "".join(f"line {i}\n" for i in range(100))[-30:]
+    assert result.stderr == "oops\n"
+    captured = capsys.readouterr()
+    assert "[t1] line 0\n" in captured.out
+    assert "[t1] oops\n" in captured.err
+
+
+def test_run_local_command_kills_on_timeout():
+    script = "import time\nprint('started', flush=True)\ntime.sleep(60)"
+
+    result = _run_local_command([sys.executable, "-c", script], env=None, timeout_seconds=1, label="t1")
+
+    assert result.timed_out
+    assert result.returncode is None
+    assert result.stdout == "started\n"
+
+
+def test_interrupted_pool_shutdown_terminates_running_children():
+    script = "import time\nprint('started', flush=True)\ntime.sleep(60)"
+    pool = LocalTaskPool(max_workers=1)
+    future = pool.submit(_run_local_command, [sys.executable, "-c", script], None, 600, "t1")
+    queued = pool.submit(_run_local_command, [sys.executable, "-c", script], None, 600, "t2")
+    deadline = time.monotonic() + 10
+    while not _local_processes and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    started = time.monotonic()
+    pool.shutdown(wait=False)
+    result = future.result(timeout=30)
+
+    assert time.monotonic() - started < 30
+    assert not result.timed_out
+    assert result.returncode != 0
+    assert queued.cancelled()
+    assert not _local_processes
+
+
+def test_local_dispatch_cycle_claims_only_free_slots_and_runs_concurrently():
+    client = _ClaimClient([_listed_task(f"t{i}", createdAt=f"2026-03-30T10:00:0{i}Z") for i in range(3)])
+    pool = LocalTaskPool(max_workers=2)
+    both_running = threading.Barrier(2, timeout=10)
+    release = threading.Event()
+    ran = []
+
+    def fake_execute(_client, task, _dispatcher_id, _timeout):
+        ran.append(task.id)
+        both_running.wait()
+        release.wait(10)
+
+    try:
+        with patch("plexus.cli.shared.CommandDispatch._execute_local_task", side_effect=fake_execute):
+            assert _run_dispatch_cycle(client, "acct-1", "host-a", "local", 25, local_pool=pool) == 2
+            assert _run_dispatch_cycle(client, "acct-1", "host-a", "local", 25, local_pool=pool) == 0
+            release.set()
+            pool.wait()
+    finally:
+        release.set()
+        pool.shutdown()
+
+    assert sorted(ran) == ["t1", "t2"]
+    assert client.tasks["t0"]["dispatchStatus"] == "PENDING"
+    assert len(client.mutations) == 2
@@ -101,6 +101,25 @@ def extract_confidence_accuracy_pairs(evaluation_results: List[Dict[str, Any]])
     return confidence_scores, accuracy_labels
 
 
+_PROBABILITY_EPSILON = 1e-7
+TEMPERATURE_BOUNDS = (0.1, 10.0)
+
+
+def _confidence_logits(confidence_scores) -> np.ndarray:
+    """Logits of clipped confidence scores, as a float array."""
+    probabilities = np.clip(
+        np.asarray(confidence_scores, dtype=float), _PROBABILITY_EPSILON, 1 - _PROBABILITY_EPSILON
+    )
+    return np.log(probabilities / (1 - probabilities))
+
+
+def temperature_scale_array(confidence_scores, temperature: float) -> np.ndarray:
+    """Vectorized temperature scaling; returns an array of scaled confidences."""
+    if temperature <= 0:
+        raise ValueError("Temperature must be positive")
+    return 1 / (1 + np.exp(-_confidence_logits(confidence_scores) / temperature))
+
+
 def apply_temperature_scaling(confidence_scores: List[float], temperature: float) -> List[float]:
     """
     Apply temperature scaling to confidence scores.
@@ -118,37 +137,28 @@ def apply_temperature_scaling(confidence_scores: List[float], temperature: float
     Returns:
         List of temperature-scaled confidence scores
     """
-    if temperature <= 0:
-        raise ValueError("Temperature must be positive")
-
-    # Convert probabilities to logits (assuming binary classification)
-    # For a probability p, logit = log(p / (1-p))
-    # For temperature scaling: scaled_logit = logit / T
-    # Then: p_scaled = 1 / (1 + exp(-scaled_logit))
+    return temperature_scale_array(confidence_scores, temperature).tolist()
 
-    scaled_scores = []
-    for prob in confidence_scores:
-        # Clip probability to avoid log(0) or log(inf)
-        prob = max(1e-7, min(1 - 1e-7, prob))
-
-        # Convert to logit
-        logit = np.log(prob / (1 - prob))
-
-        # Apply temperature scaling
-        scaled_logit = logit / temperature
 
-        # Convert back to probability
-        scaled_prob = 1 / (1 + np.exp(-scaled_logit))
-        scaled_scores.append(scaled_prob)
+def temperature_log_loss(logits: np.ndarray, accuracies: np.ndarray, temperatures) -> np.ndarray:
+    """
+    Mean binary log-loss of temperature-scaled logits, for one or many temperatures.
 
-    return scaled_scores
+    Uses log(1 + e^z) - y*z, which is stable for large |z|.
+    """
+    temperatures = np.atleast_1d(np.asarray(temperatures, dtype=float))
+    scaled = logits[np.newaxis, :] / temperatures[:, np.newaxis]
+    return np.mean(np.logaddexp(0, scaled) - accuracies[np.newaxis, :] * scaled, axis=1)
 
 
 def find_optimal_temperature(confidence_scores: List[float],
                            accuracy_labels: List[int],
                            method: str = "minimize_scalar") -> float:
     """
-    Find optimal temperature parameter to minimize Expected Calibration Error (ECE).
+    Find the temperature that minimizes log-loss of the scaled confidences.
+
+    Log-loss is smooth in the temperature, so a bounded 1-D optimizer over
+    log(T) converges reliably (ECE is piecewise constant and is only reported).
 
     Args:
         confidence_scores: List of raw confidence scores (0.0 to 1.0)
@@ -162,48 +172,38 @@ def find_optimal_temperature(confidence_scores: List[float],
         logger.warning(f"Insufficient data for temperature optimization: {len(confidence_scores)} samples")
         return 1.0  # Default temperature (no scaling)
 
-    confidences = np.array(confidence_scores)
-    accuracies = np.array(accuracy_labels)
-
-    def objective(temperature):
-        """Objective function to minimize - returns ECE for given temperature"""
-        try:
-            temp_scaled_scores = apply_temperature_scaling(confidence_scores, temperature)
-            temp_scaled_array = np.array(temp_scaled_scores)
-            ece = expected_calibration_error(temp_scaled_array, accuracies, n_bins=10)
-            return ece
-        except Exception as e:
-            logger.warning(f"Error computing ECE for temperature {temperature}: {e}")
-            return float('inf')
-
     try:
-        if method == "grid_search":
-            # Grid search over temperature range
-            temperatures = np.logspace(-1, 1, 21)  # 0.1 to 10.0, 21 points
-            best_temp = 1.0
-            best_ece = float('inf')
-
-            for temp in temperatures:
-                ece = objective(temp)
-                if ece < best_ece:
-                    best_ece = ece
-                    best_temp = temp
-
-            logger.info(f"Grid search found optimal temperature: {best_temp:.4f} (ECE: {best_ece:.4f})")
-            return best_temp
+        logits = _confidence_logits(confidence_scores)
+        accuracies = np.asarray(accuracy_labels, dtype=float)
+        low, high = TEMPERATURE_BOUNDS
 
+        if method == "grid_search":
+            # Grid search over temperature range, all candidates in one pass
+            temperatures = np.logspace(np.log10(low), np.log10(high), 21)  # 0.1 to 10.0, 21 points
+            losses = temperature_log_loss(logits, accuracies, temperatures)
+            best_temp = float(temperatures[int(np.argmin(losses))])
+            best_loss = float(np.min(losses))
         else:  # minimize_scalar
-            # Use scipy's minimize_scalar for more precise optimization
-            result = minimize_scalar(objective, bounds=(0.1, 10.0), method='bounded')
-
-            if result.success:
-                optimal_temp = result.x
-                optimal_ece = result.fun
-                logger.info(f"Optimization found optimal temperature: {optimal_temp:.4f} (ECE: {optimal_ece:.4f})")
-                return optimal_temp
-            else:
+            result = minimize_scalar(
+                lambda log_temperature: float(
+                    temperature_log_loss(logits, accuracies, np.exp(log_temperature))[0]
+                ),
+                bounds=(np.log(low), np.log(high)),
+                method='bounded',
+            )
+            if not result.success:
                 logger.warning("Temperature optimization failed, using default temperature 1.0")
                 return 1.0
+            best_temp = float(np.exp(result.x))
+            best_loss = float(result.fun)
+
+        ece = expected_calibration_error(
+            temperature_scale_array(confidence_scores, best_temp), accuracies, n_bins=10
+        )
+        logger.info(
+            f"Optimal temperature ({method}): {best_temp:.4f} (log-loss: {best_loss:.4f}, ECE: {ece:.4f})"
+        )
+        return best_temp
 
     except Exception as e:
         logger.error(f"Error in temperature optimization: {e}")
@@ -314,11 +314,62 @@ def serialize_calibration_model(calibration_model: IsotonicRegression) -> Dict[s
         return {"error": f"Failed to serialize calibration model: {str(e)}"}
 
 
+class CompiledCalibration:
+    """
+    Calibration mapping compiled once from serialized data.
+
+    Holds the lookup table as NumPy arrays so a whole batch of confidences is
+    calibrated with one interpolation, and single values skip re-parsing the
+    serialized lists.
+    """
+
+    def __init__(self, raw_points, calibrated_points):
+        raw = np.asarray(raw_points, dtype=float)
+        calibrated = np.asarray(calibrated_points, dtype=float)
+        if raw.ndim != 1 or raw.shape != calibrated.shape or raw.size == 0:
+            raise ValueError("Calibration lookup table must be two non-empty lists of equal length")
+        if np.any(np.diff(raw) < 0):
+            order = np.argsort(raw, kind="stable")
+            raw, calibrated = raw[order], calibrated[order]
+        self.raw_points = raw
+        self.calibrated_points = calibrated
+
+    @classmethod
+    def from_serialized(cls, calibration_data: Dict[str, Any]) -> "CompiledCalibration":
+        return cls(calibration_data["raw_confidence"], calibration_data["calibrated_confidence"])
+
+    def apply(self, raw_confidences) -> np.ndarray:
+        """Calibrate an array of confidences in one vectorized operation."""
+        calibrated = np.interp(np.asarray(raw_confidences, dtype=float), self.raw_points, self.calibrated_points)
+        return np.clip(calibrated, 0.0, 1.0)
+
+    def calibrate(self, raw_confidence: float) -> float:
+        return max(0.0, min(1.0, float(np.interp(raw_confidence, self.raw_points, self.calibrated_points))))
+
+
+def compile_calibration(calibration_data: Optional[Dict[str, Any]]) -> Optional[CompiledCalibration]:
+    """
+    Compile serialized calibration data, or return None when there is nothing to apply.
+
+    Invalid data is logged and treated as "no calibration".
+    """
+    if not calibration_data or calibration_data.get("method") != "isotonic_regression":
+        return None
+    try:
+        return CompiledCalibration.from_serialized(calibration_data)
+    except Exception as e:
+        logger.warning(f"Error compiling calibration: {e}")
+        return None
+
+
 def apply_calibration_from_serialized(raw_confidence: float,
                                     calibration_data: Dict[str, Any]) -> float:
     """
     Apply calibration using serialized calibration data.
 
+    For repeated calls with the same data, compile it once with
+    ``compile_calibration`` and call ``calibrate``/``apply`` instead.
+
     Args:
         raw_confidence: Raw confidence score (0.0 to 1.0)
         calibration_data: Serialized calibration data
@@ -326,21 +377,12 @@ def apply_calibration_from_serialized(raw_confidence: float,
     Returns:
         Calibrated confidence score
     """
-    if not calibration_data or calibration_data.get("method") != "isotonic_regression":
+    calibration = compile_calibration(calibration_data)
+    if calibration is None:
         return raw_confidence
 
     try:
-        raw_points = np.array(calibration_data["raw_confidence"])
-        calibrated_points = np.array(calibration_data["calibrated_confidence"])
-
-        # Interpolate to find calibrated value
-        calibrated_confidence = np.interp(raw_confidence, raw_points, calibrated_points)
-
-        # Ensure bounds
-        calibrated_confidence = max(0.0, min(1.0, float(calibrated_confidence)))
-
-        return calibrated_confidence
-
+        return calibration.calibrate(raw_confidence)
     except Exception as e:
         logger.warning(f"Error applying calibration: {e}")
         return raw_confidence
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from plexus.confidence_calibration import (
+    CompiledCalibration,
+    apply_calibration_from_serialized,
+    apply_temperature_scaling,
+    compile_calibration,
+    find_optimal_temperature,
+    temperature_log_loss,
+)
+
+
+def _scalar_temperature_scaling(confidence_scores, temperature):
+    scaled = []
+    for prob in confidence_scores:
+        prob = max(1e-7, min(1 - 1e-7, prob))
+        logit = np.log(prob / (1 - prob))
+        scaled.append(1 / (1 + np.exp(-logit / temperature)))
+    return scaled
+
+
+def _synthetic_overconfident_scores(true_temperature: float, size: int = 4000, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    logits = rng.normal(0.0, 3.0, size)
+    raw = 1 / (1 + np.exp(-logits))
+    true_probabilities = 1 / (1 + np.exp(-logits / true_temperature))
+    labels = (rng.random(size) < true_probabilities).astype(int)
+    return raw.tolist(), labels.tolist()
+
+
+def test_temperature_scaling_matches_scalar_loop():
+    scores = [0.0, 1e-9, 0.2, 0.5, 0.73, 0.999, 1.0]
+
+    assert apply_temperature_scaling(scores, 2.5) == pytest.approx(_scalar_temperature_scaling(scores, 2.5))
+    with pytest.raises(ValueError):
+        apply_temperature_scaling(scores, 0)
+
+
+def test_log_loss_is_evaluated_for_many_temperatures_at_once():
+    logits = np.array([-2.0, 0.5, 3.0])
+    accuracies = np.array([0.0, 1.0, 1.0])
+
+    losses = temperature_log_loss(logits, accuracies, [0.5, 1.0, 2.0])
+
+    expected = []
+    for temperature in (0.5, 1.0, 2.0):
+        p = 1 / (1 + np.exp(-logits / temperature))
+        expected.append(-np.mean(accuracies * np.log(p) + (1 - accuracies) * np.log(1 - p)))
+    assert losses == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("method", ["minimize_scalar", "grid_search"])
+def test_optimal_temperature_recovers_overconfidence(method):
+    raw, labels = _synthetic_overconfident_scores(true_temperature=2.0)
+
+    temperature = find_optimal_temperature(raw, labels, method=method)
+
+    assert temperature == pytest.approx(2.0, rel=0.25)
+
+
+def test_optimal_temperature_defaults_with_too_few_samples():
+    assert find_optimal_temperature([0.9] * 5, [1] * 5) == 1.0
+
+
+def test_compiled_calibration_matches_single_value_path():
+    calibration_data = {
+        "method": "isotonic_regression",
+        "raw_confidence": np.linspace(0, 1, 101).tolist(),
+        "calibrated_confidence": np.clip(np.linspace(-0.1, 1.1, 101), 0, 1).tolist(),
+    }
+    values = np.random.default_rng(1).random(1000)
+
+    compiled = compile_calibration(calibration_data)
+    batch = compiled.apply(values)
+
+    assert batch.tolist() == pytest.approx(
+        [apply_calibration_from_serialized(value, calibration_data) for value in values]
+    )
+    assert compiled.calibrate(0.5) == pytest.approx(0.5)
+    assert batch.min() >= 0.0 and batch.max() <= 1.0
+
+
+def test_compile_calibration_handles_missing_and_invalid_data():
+    assert compile_calibration(None) is None
+    assert compile_calibration({"method": "platt"}) is None
+    invalid = {"method": "isotonic_regression", "raw_confidence": [0, 1], "calibrated_confidence": [0]}
+    assert compile_calibration(invalid) is None
+    assert apply_calibration_from_serialized(0.42, invalid) == 0.42
+
+    unsorted = CompiledCalibration([1.0, 0.0], [0.8, 0.2])
+    assert unsorted.calibrate(0.5) == pytest.approx(0.5)
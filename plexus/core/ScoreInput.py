@@ -5,7 +5,7 @@ This module contains only the Score.Input class without any heavyweight dependen
 allowing it to be imported without triggering psycopg or other complex imports.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Any
 
 
@@ -20,7 +20,22 @@ class ScoreInput(BaseModel):
         text: The content to classify. Can be a transcript, document, etc.
         metadata: Additional context like source, timestamps, or tracking IDs
         results: Optional list of previous classification results
+
+    Inputs are immutable. Constructing one validates its fields; processors on
+    the scoring path use ``derive()`` instead, which skips validation and shares
+    unchanged fields (including large metadata payloads) with the original.
     """
+    model_config = ConfigDict(frozen=True)
+
     text: str
     metadata: dict = {}
     results: Optional[List[Any]] = None
+
+    def derive(self, **changes: Any) -> "ScoreInput":
+        """
+        Return a new input with ``changes`` applied, without validation or copying.
+
+        Unchanged fields are shared with this input, so metadata must be replaced
+        (``metadata={**score_input.metadata, "key": value}``), never mutated.
+        """
+        return self.model_copy(update=changes)
@@ -9,7 +9,8 @@ It is designed to be shared by CLI commands, MCP tools, and ReportBlocks.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any, Callable, Dict, List, Optional, Tuple
@@ -17,6 +18,9 @@ import json
 import logging
 import time
 
+import numpy as np
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -100,6 +104,181 @@ class CostGroupTotals:
         }
 
 
+def _extract_model(cost: Dict[str, Any]) -> str:
+    models = cost.get("model") or sorted(
+        {
+            str(component.get("model"))
+            for component in cost.get("components") or []
+            if isinstance(component, dict) and component.get("model")
+        }
+    )
+    if isinstance(models, list):
+        return "+".join(models) if models else "unknown"
+    return str(models)
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+# Grouping keys supported by CostFrame.grouped_stats / ScoreResultCostAnalyzer.analyze
+GROUP_COLUMNS: Dict[str, List[str]] = {
+    "scorecard": ["scorecardId"],
+    "score": ["scoreId"],
+    "scorecard_score": ["scorecardId", "scoreId"],
+    "model": ["model"],
+    "day": ["day"],
+}
+
+_DECIMAL_COLUMNS = ("total_cost", "input_cost", "output_cost")
+_INT_COLUMNS = ("prompt_tokens", "completion_tokens", "cached_tokens", "llm_calls")
+
+
+class CostFrame:
+    """
+    Columnar view of cost-bearing ScoreResults.
+
+    Cost and token fields are flattened once into typed columns: float64 cost
+    values for distribution statistics, int64 token/call counts, and Decimal
+    object columns that keep billing totals exact. Grouped summaries are
+    computed with pandas group-bys in a single pass over the frame.
+    """
+
+    COLUMNS = (
+        "id", "scorecardId", "scoreId", "scoreName", "itemId", "model", "day", "updatedAt",
+        *[f"{c}_exact" for c in _DECIMAL_COLUMNS], *_DECIMAL_COLUMNS, *_INT_COLUMNS,
+    )
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+
+    @classmethod
+    def from_score_results(cls, results: List[Dict[str, Any]]) -> "CostFrame":
+        columns: Dict[str, List[Any]] = {name: [] for name in cls.COLUMNS}
+        for sr in results:
+            cost = _extract_cost(sr)
+            if not cost:
+                continue
+            timestamp = sr.get("updatedAt") or sr.get("createdAt")
+            columns["id"].append(sr.get("id"))
+            columns["scorecardId"].append(str(sr.get("scorecardId")))
+            columns["scoreId"].append(str(sr.get("scoreId")))
+            columns["scoreName"].append((sr.get("score") or {}).get("name"))
+            columns["itemId"].append(sr.get("itemId"))
+            columns["model"].append(_extract_model(cost))
+            columns["day"].append(str(timestamp)[:10] if timestamp else "unknown")
+            columns["updatedAt"].append(_parse_timestamp(timestamp))
+            for name in _DECIMAL_COLUMNS:
+                value = _parse_decimal(cost.get(name))
+                columns[f"{name}_exact"].append(value)
+                columns[name].append(float(value))
+            pt, ct, cct = _extract_tokens(cost)
+            columns["prompt_tokens"].append(pt)
+            columns["completion_tokens"].append(ct)
+            columns["cached_tokens"].append(cct)
+            columns["llm_calls"].append(int(cost.get("llm_calls", 0) or 0))
+
+        df = pd.DataFrame(columns)
+        for name in _DECIMAL_COLUMNS:
+            df[name] = df[name].astype(np.float64)
+        for name in _INT_COLUMNS:
+            df[name] = df[name].astype(np.int64)
+        df["updatedAt"] = pd.to_datetime(df["updatedAt"], utc=True)
+        return cls(df)
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def extend(self, other: "CostFrame", window_start: Optional[datetime] = None) -> "CostFrame":
+        """
+        Return a frame with ``other``'s rows appended (replacing rows with the
+        same id) and rows updated before ``window_start`` dropped.
+        """
+        df = pd.concat([self.df, other.df], ignore_index=True)
+        has_id = df["id"].notna()
+        df = df[~(has_id & df["id"].duplicated(keep="last"))]
+        if window_start is not None:
+            df = df[df["updatedAt"].isna() | (df["updatedAt"] >= pd.Timestamp(window_start))]
+        return CostFrame(df.reset_index(drop=True))
+
+    @staticmethod
+    def _exact_sum(values: pd.Series) -> Decimal:
+        return sum(values, start=Decimal("0"))
+
+    def totals(self, group_by: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Exact cost totals and token counts, overall or per group."""
+        aggregations = {
+            "count": ("total_cost", "size"),
+            **{name: (f"{name}_exact", self._exact_sum) for name in _DECIMAL_COLUMNS},
+            **{name: (name, "sum") for name in _INT_COLUMNS},
+        }
+        if not group_by:
+            df = self.df.assign(_all=0)
+            group_by = ["_all"]
+        else:
+            df = self.df
+        if df.empty:
+            return []
+        grouped = df.groupby(group_by, sort=False).agg(**aggregations).reset_index()
+        rows = []
+        for record in grouped.to_dict("records"):
+            record.pop("_all", None)
+            rows.append(record)
+        return rows
+
+    def grouped_stats(self, group_by: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Distribution statistics for total_cost and llm_calls, overall or per group.
+
+        Returns one row per group (first-appearance order) with count, exact
+        total cost and call totals plus float mean/std (population)/min/q1/
+        median/q3/max for both columns.
+        """
+        keys = GROUP_COLUMNS[group_by] if group_by else ["_all"]
+        df = self.df.assign(_all=0) if not group_by else self.df
+        if df.empty:
+            return []
+        grouped = df.groupby(keys, sort=False)
+        stats = grouped.agg(
+            count=("total_cost", "size"),
+            total_cost_exact=("total_cost_exact", self._exact_sum),
+            total_calls=("llm_calls", "sum"),
+            mean_cost=("total_cost", "mean"),
+            std_cost=("total_cost", lambda v: float(np.std(v.to_numpy()))),
+            min_cost=("total_cost", "min"),
+            max_cost=("total_cost", "max"),
+            mean_calls=("llm_calls", "mean"),
+            std_calls=("llm_calls", lambda v: float(np.std(v.to_numpy()))),
+            min_calls=("llm_calls", "min"),
+            max_calls=("llm_calls", "max"),
+        )
+        cost_quantiles = grouped["total_cost"].quantile([0.25, 0.5, 0.75]).unstack()
+        call_quantiles = grouped["llm_calls"].quantile([0.25, 0.5, 0.75]).unstack()
+        stats = stats.join(cost_quantiles.add_prefix("cost_q")).join(call_quantiles.add_prefix("calls_q"))
+        stats = stats.reset_index()
+        rows = []
+        for record in stats.to_dict("records"):
+            record.pop("_all", None)
+            rows.append(record)
+        return rows
+
+
+@dataclass
+class _CachedWindow:
+    results: List[Dict[str, Any]]
+    frame: CostFrame
+    start_time: datetime
+    end_time: datetime
+    client: Any = None
+    loaded_at: float = field(default_factory=time.time)
+
+
 class ScoreResultCostAnalyzer:
     """
     Loads ScoreResults for a time range and computes cost aggregates.
@@ -109,11 +288,15 @@ class ScoreResultCostAnalyzer:
       - optional scorecard_id
       - optional score_id
       - days (default 7)
+
+    Loaded windows are kept in a class-level LRU keyed by the query
+    parameters. A hit on a relative (hours/days) window without max_items
+    only fetches results updated since the cached window ended and drops
+    rows that fell out of the window.
     """
 
-    # Single-entry module-level cache
-    _LAST_CACHE_KEY: Optional[Tuple[Any, ...]] = None
-    _LAST_CACHE_RESULTS: Optional[List[Dict[str, Any]]] = None
+    _CACHE_MAX_WINDOWS = 8
+    _CACHE: "OrderedDict[Tuple[Any, ...], _CachedWindow]" = OrderedDict()
 
     def __init__(
         self,
@@ -140,11 +323,29 @@ class ScoreResultCostAnalyzer:
         self.score_id = score_id
         self._loaded: bool = False
         self._results: List[Dict[str, Any]] = []
+        self._frame: Optional[CostFrame] = None
 
     @classmethod
     def clear_cache(cls) -> None:
-        cls._LAST_CACHE_KEY = None
-        cls._LAST_CACHE_RESULTS = None
+        cls._CACHE.clear()
+
+    @classmethod
+    def _cache_get(cls, key: Tuple[Any, ...]) -> Optional[_CachedWindow]:
+        entry = cls._CACHE.get(key)
+        if entry is not None:
+            cls._CACHE.move_to_end(key)
+        return entry
+
+    @classmethod
+    def _cache_put(cls, key: Tuple[Any, ...], entry: _CachedWindow) -> None:
+        cls._CACHE[key] = entry
+        cls._CACHE.move_to_end(key)
+        while len(cls._CACHE) > cls._CACHE_MAX_WINDOWS:
+            cls._CACHE.popitem(last=False)
+
+    @property
+    def is_relative_window(self) -> bool:
+        return self.start_time is None and self.end_time is None
 
     @property
     def time_window(self) -> Tuple[datetime, datetime]:
@@ -174,8 +375,13 @@ class ScoreResultCostAnalyzer:
             start_time = end_time - timedelta(days=max(1, int(self.days)))
         return start_time, end_time
 
-    def _query_name_and_body(self) -> Tuple[str, str, Dict[str, Any]]:
-        start_time, end_time = self.time_window
+    def _query_name_and_body(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        if start_time is None or end_time is None:
+            start_time, end_time = self.time_window
         page_limit = 1000
         if self.max_items is not None:
             try:
@@ -259,7 +465,7 @@ class ScoreResultCostAnalyzer:
         return query_name, query, variables
 
     def load(self) -> None:
-        """Load ScoreResults into memory using GSI-backed pagination with single-entry cache."""
+        """Load ScoreResults into memory using GSI-backed pagination with an LRU window cache."""
         # Check cache first
         cache_key = (
             self.account_id,
@@ -271,22 +477,58 @@ class ScoreResultCostAnalyzer:
             self.end_time.isoformat() if self.end_time is not None else None,
             int(self.max_items) if self.max_items is not None else None,
         )
-        if (
-            ScoreResultCostAnalyzer._LAST_CACHE_KEY == cache_key
-            and ScoreResultCostAnalyzer._LAST_CACHE_RESULTS is not None
-        ):
-            self._results = list(ScoreResultCostAnalyzer._LAST_CACHE_RESULTS)
+        cached = ScoreResultCostAnalyzer._cache_get(cache_key)
+        # Windows are only reused for the API client that loaded them
+        if cached is not None and cached.client is self.client:
+            if self.is_relative_window and self.max_items is None:
+                cached = self._extend_cached_window(cache_key, cached)
+            self._results = list(cached.results)
+            self._frame = cached.frame
             self._loaded = True
             return
 
-        query_name, query, variables = self._query_name_and_body()
+        start_time, end_time = self.time_window
+        results = self._fetch(start_time, end_time)
+        frame = CostFrame.from_score_results(results)
+        self._results = results
+        self._frame = frame
+        self._loaded = True
+        ScoreResultCostAnalyzer._cache_put(
+            cache_key, _CachedWindow(list(results), frame, start_time, end_time, self.client)
+        )
+
+    def _extend_cached_window(self, cache_key: Tuple[Any, ...], cached: _CachedWindow) -> _CachedWindow:
+        """Fetch only results updated since the cached window ended and slide the window forward."""
+        start_time, end_time = self.time_window
+        if end_time <= cached.end_time:
+            return cached
+
+        fetched = self._fetch(cached.end_time, end_time)
+        by_id: Dict[Any, Dict[str, Any]] = {}
+        for sr in cached.results + fetched:
+            by_id[sr.get("id") if sr.get("id") is not None else id(sr)] = sr
+        results = [
+            sr
+            for sr in by_id.values()
+            if (_parse_timestamp(sr.get("updatedAt")) or end_time) >= start_time
+        ]
+        frame = cached.frame.extend(CostFrame.from_score_results(fetched), window_start=start_time)
+        extended = _CachedWindow(results, frame, start_time, end_time, self.client)
+        ScoreResultCostAnalyzer._cache_put(cache_key, extended)
+        logger.info(
+            f"[CostAnalysis] Extended cached window by {len(fetched)} results; kept={len(results)}"
+        )
+        return extended
+
+    def _fetch(self, start_time: datetime, end_time: datetime) -> List[Dict[str, Any]]:
+        """Page through the best GSI for the window, keeping cost-bearing results."""
+        query_name, query, variables = self._query_name_and_body(start_time, end_time)
         next_token: Optional[str] = None
         results: List[Dict[str, Any]] = []
         seen_tokens: set[str] = set()
         empty_pages = 0
         scanned_items = 0
 
-        start_time, end_time = self.time_window
         scope = f"account_id={self.account_id}"
         if self.scorecard_id:
             scope += f" scorecard_id={self.scorecard_id}"
@@ -394,11 +636,6 @@ class ScoreResultCostAnalyzer:
                         pass
                 break
 
-        self._results = results
-        self._loaded = True
-        # Update cache
-        ScoreResultCostAnalyzer._LAST_CACHE_KEY = cache_key
-        ScoreResultCostAnalyzer._LAST_CACHE_RESULTS = list(results)
         logger.info(
             f"[CostAnalysis] Loaded kept={len(results)} scanned={scanned_items} pages={page} ({query_name})"
         )
@@ -409,6 +646,7 @@ class ScoreResultCostAnalyzer:
                 )
             except Exception:
                 pass
+        return results
 
     @staticmethod
     def extract_cost(sr: Dict[str, Any]) -> Dict[str, Any]:
@@ -419,101 +657,62 @@ class ScoreResultCostAnalyzer:
             self.load()
         return self._results
 
-    def summarize(self) -> Dict[str, Any]:
+    @property
+    def frame(self) -> CostFrame:
+        """Columnar view of the loaded cost-bearing results."""
         if not self._loaded:
             self.load()
+        if self._frame is None:
+            self._frame = CostFrame.from_score_results(self._results)
+        return self._frame
 
-        groups: Dict[Tuple[str, str], CostGroupTotals] = {}
-        names: Dict[Tuple[str, str], str] = {}
-        totals = CostGroupTotals()
+    def summarize(self) -> Dict[str, Any]:
+        frame = self.frame
 
-        for sr in self._results:
-            cost = _extract_cost(sr)
-            if not cost:
-                continue
-            key = (str(sr.get("scorecardId")), str(sr.get("scoreId")))
-            if key not in groups:
-                groups[key] = CostGroupTotals()
-            groups[key].add(cost)
-            totals.add(cost)
-            # Capture score name when available
-            score_obj = sr.get("score") or {}
-            score_name = score_obj.get("name")
-            if score_name:
-                names[key] = score_name
-
-        group_list: List[Dict[str, Any]] = []
-        for (scorecard_id, score_id), agg in groups.items():
-            group_list.append(
-                {
-                    "scorecardId": scorecard_id,
-                    "scoreId": score_id,
-                    "scoreName": names.get((scorecard_id, score_id)),
-                    **agg.to_dict(),
-                }
-            )
+        def to_totals(row: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                "count": int(row["count"]),
+                "prompt_tokens": int(row["prompt_tokens"]),
+                "completion_tokens": int(row["completion_tokens"]),
+                "cached_tokens": int(row["cached_tokens"]),
+                "llm_calls": int(row["llm_calls"]),
+                "input_cost": str(row["input_cost"]),
+                "output_cost": str(row["output_cost"]),
+                "total_cost": str(row["total_cost"]),
+            }
+
+        overall = frame.totals()
+        totals = to_totals(overall[0]) if overall else CostGroupTotals().to_dict()
+
+        # Capture the last non-empty score name per group, as results are scanned in order
+        names = (
+            frame.df.dropna(subset=["scoreName"])
+            .groupby(["scorecardId", "scoreId"], sort=False)["scoreName"]
+            .last()
+            .to_dict()
+        ) if len(frame) else {}
+
+        group_list: List[Dict[str, Any]] = [
+            {
+                "scorecardId": row["scorecardId"],
+                "scoreId": row["scoreId"],
+                "scoreName": names.get((row["scorecardId"], row["scoreId"])),
+                **to_totals(row),
+            }
+            for row in frame.totals(group_by=GROUP_COLUMNS["scorecard_score"])
+        ]
 
         return {
             "accountId": self.account_id,
             "days": self.days,
             "hours": self.hours,
             "filters": {"scorecardId": self.scorecard_id, "scoreId": self.score_id},
-            "totals": totals.to_dict(),
+            "totals": totals,
             "groups": sorted(
                 group_list, key=lambda g: (g["scorecardId"], g["scoreId"])
             ),
         }
 
-    # ----------------------
-    # Statistical aggregation
-    # ----------------------
-    @staticmethod
-    def _median(values: List[Decimal]) -> Decimal:
-        if not values:
-            return Decimal("0")
-        n = len(values)
-        s = sorted(values)
-        mid = n // 2
-        if n % 2 == 1:
-            return s[mid]
-        return (s[mid - 1] + s[mid]) / Decimal("2")
-
-    @staticmethod
-    def _percentile(values: List[Decimal], p: float) -> Decimal:
-        if not values:
-            return Decimal("0")
-        s = sorted(values)
-        k = (len(s) - 1) * p
-        f = int(k)
-        c = f + 1
-        if c >= len(s):
-            return s[-1]
-        d0 = s[f] * Decimal(c - k)
-        d1 = s[c] * Decimal(k - f)
-        return d0 + d1
-
-    @staticmethod
-    def _stddev(values: List[Decimal]) -> Decimal:
-        if not values:
-            return Decimal("0")
-        n = len(values)
-        if n == 1:
-            return Decimal("0")
-        mean = sum(values, start=Decimal("0")) / Decimal(n)
-        var = sum((x - mean) * (x - mean) for x in values) / Decimal(
-            n
-        )  # population stddev
-        # Avoid negative variance from floating Decimal oddities
-        if var < 0:
-            var = Decimal("0")
-        # sqrt for Decimal: use exponent ** 0.5 via float fallback for stability on typical magnitudes
-        try:
-            return var.sqrt()  # Decimal sqrt available if context precision sufficient
-        except Exception:
-            import math
-
-            return _parse_decimal(math.sqrt(float(var)))
-
     def analyze(self, group_by: Optional[str] = None) -> Dict[str, Any]:
         """
         Compute headline and box-plot friendly metrics.
@@ -523,122 +722,75 @@ class ScoreResultCostAnalyzer:
           - "scorecard": per scorecardId
           - "score": per scoreId
           - "scorecard_score": (scorecardId, scoreId)
-        """
-        if not self._loaded:
-            self.load()
-
-        # Collect values
-        overall_values: List[Decimal] = []  # total_cost per result
-        overall_calls: List[Decimal] = []  # llm_calls per result
-        by_scorecard: Dict[str, List[Decimal]] = {}
-        by_score: Dict[str, List[Decimal]] = {}
-        by_pair: Dict[Tuple[str, str], List[Decimal]] = {}
-        by_scorecard_calls: Dict[str, List[Decimal]] = {}
-        by_score_calls: Dict[str, List[Decimal]] = {}
-        by_pair_calls: Dict[Tuple[str, str], List[Decimal]] = {}
-        score_name_index: Dict[str, str] = {}
+          - "model": per model (from cost.model or cost components)
+          - "day": per UTC day of updatedAt
 
-        for sr in self._results:
-            cost = _extract_cost(sr)
-            if not cost:
-                continue
-            total = _parse_decimal(cost.get("total_cost"))
-            calls = _parse_decimal(cost.get("llm_calls", 0))
-            overall_values.append(total)
-            overall_calls.append(calls)
-
-            sc_id = str(sr.get("scorecardId"))
-            s_id = str(sr.get("scoreId"))
-            # Record score name when available
-            try:
-                score_obj = sr.get("score") or {}
-                s_name = score_obj.get("name")
-                if s_id and s_name and s_id not in score_name_index:
-                    score_name_index[s_id] = s_name
-            except Exception:
-                pass
-            if group_by in ("scorecard", "scorecard_score"):
-                by_scorecard.setdefault(sc_id, []).append(total)
-                by_scorecard_calls.setdefault(sc_id, []).append(calls)
-            if group_by in ("score", "scorecard_score"):
-                by_score.setdefault(s_id, []).append(total)
-                by_score_calls.setdefault(s_id, []).append(calls)
-            if group_by == "scorecard_score":
-                by_pair.setdefault((sc_id, s_id), []).append(total)
-                by_pair_calls.setdefault((sc_id, s_id), []).append(calls)
-
-        def build_stats(values: List[Decimal]) -> Dict[str, Any]:
-            n = len(values)
-            total_cost = sum(values, start=Decimal("0"))
-            avg = (total_cost / Decimal(n)) if n else Decimal("0")
-            std = self._stddev(values)
-            med = self._median(values)
-            q1 = self._percentile(values, 0.25)
-            q3 = self._percentile(values, 0.75)
-            iqr = q3 - q1
-            vmin = min(values) if values else Decimal("0")
-            vmax = max(values) if values else Decimal("0")
+        Totals are exact decimal sums; distribution statistics (population
+        stddev, linear-interpolated quartiles) are computed on float64 columns.
+        """
+        frame = self.frame
+        if group_by is not None and group_by not in GROUP_COLUMNS:
+            # Report blocks pass group_by through from their configuration; an
+            # unknown value falls back to the overall summary without groups.
+            logger.warning(
+                f"Ignoring unsupported group_by '{group_by}'. Expected one of: {', '.join(GROUP_COLUMNS)}"
+            )
+            group_by = None
+
+        def number(value: Any) -> str:
+            return str(_parse_decimal(float(value)))
+
+        def build_stats(row: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            if row is None:
+                zero = str(Decimal("0"))
+                return {
+                    "count": 0,
+                    **{f"{k}_cost": zero for k in ("total", "average", "stddev", "median", "q1", "q3", "iqr", "min", "max")},
+                    **{f"{k}_calls": zero for k in ("total", "average", "stddev", "median", "q1", "q3", "iqr", "min", "max")},
+                }
+            count = int(row["count"])
+            total_cost = row["total_cost_exact"]
+            total_calls = Decimal(int(row["total_calls"]))
             return {
-                "count": n,
+                "count": count,
                 "total_cost": str(total_cost),
-                "average_cost": str(avg),
-                "stddev_cost": str(std),
-                "median_cost": str(med),
-                "q1_cost": str(q1),
-                "q3_cost": str(q3),
-                "iqr_cost": str(iqr),
-                "min_cost": str(vmin),
-                "max_cost": str(vmax),
+                "average_cost": str(total_cost / Decimal(count)),
+                "stddev_cost": number(row["std_cost"]),
+                "median_cost": number(row["cost_q0.5"]),
+                "q1_cost": number(row["cost_q0.25"]),
+                "q3_cost": number(row["cost_q0.75"]),
+                "iqr_cost": number(row["cost_q0.75"] - row["cost_q0.25"]),
+                "min_cost": number(row["min_cost"]),
+                "max_cost": number(row["max_cost"]),
+                "total_calls": str(total_calls),
+                "average_calls": str(total_calls / Decimal(count)),
+                "stddev_calls": number(row["std_calls"]),
+                "median_calls": number(row["calls_q0.5"]),
+                "q1_calls": number(row["calls_q0.25"]),
+                "q3_calls": number(row["calls_q0.75"]),
+                "iqr_calls": number(row["calls_q0.75"] - row["calls_q0.25"]),
+                "min_calls": str(int(row["min_calls"])),
+                "max_calls": str(int(row["max_calls"])),
             }
 
-        headline = build_stats(overall_values)
-
-        # Add calls distribution metrics with _calls suffix
-        def build_calls(values: List[Decimal]) -> Dict[str, Any]:
-            n = len(values)
-            total = sum(values, start=Decimal("0"))
-            avg = (total / Decimal(n)) if n else Decimal("0")
-            std = self._stddev(values)
-            med = self._median(values)
-            q1 = self._percentile(values, 0.25)
-            q3 = self._percentile(values, 0.75)
-            iqr = q3 - q1
-            vmin = min(values) if values else Decimal("0")
-            vmax = max(values) if values else Decimal("0")
-            return {
-                "total_calls": str(total),
-                "average_calls": str(avg),
-                "stddev_calls": str(std),
-                "median_calls": str(med),
-                "q1_calls": str(q1),
-                "q3_calls": str(q3),
-                "iqr_calls": str(iqr),
-                "min_calls": str(vmin),
-                "max_calls": str(vmax),
-            }
-
-        headline.update(build_calls(overall_calls))
+        overall = frame.grouped_stats()
+        headline = build_stats(overall[0] if overall else None)
 
         groups: List[Dict[str, Any]] = []
-        if group_by == "scorecard":
-            for sc_id, vals in by_scorecard.items():
-                entry = {"group": {"scorecardId": sc_id}}
-                entry.update(build_stats(vals))
-                entry.update(build_calls(by_scorecard_calls.get(sc_id, [])))
-                groups.append(entry)
-        elif group_by == "score":
-            for s_id, vals in by_score.items():
-                entry = {"group": {"scoreId": s_id}}
-                entry.update(build_stats(vals))
-                entry.update(build_calls(by_score_calls.get(s_id, [])))
-                groups.append(entry)
-        elif group_by == "scorecard_score":
-            for (sc_id, s_id), vals in by_pair.items():
-                entry = {"group": {"scorecardId": sc_id, "scoreId": s_id}}
-                entry.update(build_stats(vals))
-                entry.update(build_calls(by_pair_calls.get((sc_id, s_id), [])))
+        if group_by:
+            keys = GROUP_COLUMNS[group_by]
+            group_keys = {"scorecardId": "scorecardId", "scoreId": "scoreId", "model": "model", "day": "day"}
+            for row in frame.grouped_stats(group_by):
+                entry: Dict[str, Any] = {"group": {group_keys[k]: row[k] for k in keys}}
+                entry.update(build_stats(row))
                 groups.append(entry)
 
+        score_name_index: Dict[str, str] = {}
+        if len(frame):
+            named = frame.df.dropna(subset=["scoreName"])
+            named = named[named["scoreId"].astype(bool) & named["scoreName"].astype(bool)]
+            score_name_index = named.groupby("scoreId", sort=False)["scoreName"].first().to_dict()
+
         return {
             "accountId": self.account_id,
             "days": self.days,
@@ -172,3 +172,129 @@ def test_excludes_entries_without_cost_in_analyze():
     assert "s1" in by_score and "s2" in by_score
     assert by_score["s1"]["count"] == 1
     assert by_score["s2"]["count"] == 1
+
+
+def _cost_items(n, start=0, updated_at=None):
+    updated_at = updated_at or datetime.now(timezone.utc).isoformat()
+    items = []
+    for i in range(start, start + n):
+        items.append({
+            "id": f"r{i}", "accountId": "acct", "itemId": f"item{i % 7}",
+            "scorecardId": f"sc{i % 2}", "scoreId": f"s{i % 3}",
+            "score": {"id": f"s{i % 3}", "name": f"Score {i % 3}"},
+            "updatedAt": updated_at,
+            "cost": {
+                "total_cost": f"0.{i + 1:04d}", "input_cost": "0.0001", "output_cost": "0.0002",
+                "prompt_tokens": i, "completion_tokens": 1, "llm_calls": i % 4,
+                "components": [{"model": "gpt-4o-mini" if i % 2 else "claude-haiku"}],
+            },
+        })
+    return items
+
+
+def test_analyze_statistics_match_reference_computation():
+    import statistics
+    from decimal import Decimal
+    from plexus.costs.cost_analysis import ScoreResultCostAnalyzer
+
+    ScoreResultCostAnalyzer.clear_cache()
+    items = _cost_items(25)
+    top_key = "listScoreResultByAccountIdAndUpdatedAt"
+    client = FakeClient([make_page(top_key, items, next_token=None)])
+
+    analysis = ScoreResultCostAnalyzer(client=client, account_id="acct", days=0, hours=1).analyze(group_by="scorecard_score")
+
+    costs = [Decimal(sr["cost"]["total_cost"]) for sr in items]
+    head = analysis["headline"]
+    assert head["count"] == 25
+    assert head["total_cost"] == str(sum(costs))
+    assert Decimal(head["average_cost"]) == sum(costs) / 25
+    assert float(head["median_cost"]) == pytest.approx(float(statistics.median(costs)))
+    assert float(head["stddev_cost"]) == pytest.approx(float(statistics.pstdev(costs)))
+    q1, _, q3 = statistics.quantiles([float(c) for c in costs], n=4, method="inclusive")
+    assert float(head["q1_cost"]) == pytest.approx(q1)
+    assert float(head["q3_cost"]) == pytest.approx(q3)
+    assert head["min_cost"] == "0.0001" and head["max_cost"] == "0.0025"
+    assert head["total_calls"] == str(sum(i % 4 for i in range(25)))
+
+    # Groups keep first-appearance order and sum to the headline
+    assert [g["group"] for g in analysis["groups"]][:2] == [
+        {"scorecardId": "sc0", "scoreId": "s0"},
+        {"scorecardId": "sc1", "scoreId": "s1"},
+    ]
+    assert sum(Decimal(g["total_cost"]) for g in analysis["groups"]) == sum(costs)
+    assert analysis["scoreNameIndex"]["s2"] == "Score 2"
+
+
+def test_analyze_groups_by_model_and_day():
+    from plexus.costs.cost_analysis import ScoreResultCostAnalyzer
+
+    ScoreResultCostAnalyzer.clear_cache()
+    items = _cost_items(6, updated_at="2026-03-02T10:00:00+00:00")
+    top_key = "listScoreResultByAccountIdAndUpdatedAt"
+    client = FakeClient([make_page(top_key, items, next_token=None)])
+    analyzer = ScoreResultCostAnalyzer(client=client, account_id="acct", days=0, hours=1)
+
+    by_model = {g["group"]["model"]: g["count"] for g in analyzer.analyze(group_by="model")["groups"]}
+    assert by_model == {"claude-haiku": 3, "gpt-4o-mini": 3}
+    by_day = analyzer.analyze(group_by="day")["groups"]
+    assert [(g["group"]["day"], g["count"]) for g in by_day] == [("2026-03-02", 6)]
+
+    unknown = analyzer.analyze(group_by="unknown")
+    assert unknown["groups"] == []
+    assert unknown["headline"]["count"] == 6
+
+
+def test_cache_keeps_multiple_windows_and_evicts_least_recent():
+    from plexus.costs.cost_analysis import ScoreResultCostAnalyzer
+
+    ScoreResultCostAnalyzer.clear_cache()
+    top_key = "listScoreResultByAccountIdAndUpdatedAt"
+    client = FakeClient([make_page(top_key, [], next_token=None)])
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def analyzer(hours):
+        return ScoreResultCostAnalyzer(
+            client=client, account_id="acct", start_time=start, end_time=start + timedelta(hours=hours)
+        )
+
+    analyzer(1).summarize()
+    analyzer(2).summarize()
+    analyzer(1).summarize()  # still cached alongside the 2h window
+    assert client.calls == 2
+
+    for hours in range(3, 3 + ScoreResultCostAnalyzer._CACHE_MAX_WINDOWS):
+        analyzer(hours).summarize()
+    calls = client.calls
+    analyzer(2).summarize()  # least recently used window was evicted
+    assert client.calls == calls + 1
+
+
+def test_relative_window_cache_hit_only_fetches_new_results():
+    from plexus.costs.cost_analysis import ScoreResultCostAnalyzer
+
+    ScoreResultCostAnalyzer.clear_cache()
+    top_key = "listScoreResultByAccountIdAndUpdatedAt"
+
+    class WindowClient:
+        def __init__(self):
+            self.windows = []
+            self.items = _cost_items(3)
+
+        def execute(self, query, variables):
+            self.windows.append((variables["startTime"], variables["endTime"]))
+            return make_page(top_key, self.items)
+
+    client = WindowClient()
+    first = ScoreResultCostAnalyzer(client=client, account_id="acct", days=0, hours=1)
+    assert first.summarize()["totals"]["count"] == 3
+
+    client.items = _cost_items(2, start=2)  # r2 updated again, r3 is new
+    second = ScoreResultCostAnalyzer(client=client, account_id="acct", days=0, hours=1)
+    summary = second.summarize()
+
+    assert len(client.windows) == 2
+    # The second query starts where the cached window ended
+    assert client.windows[1][0] == client.windows[0][1]
+    assert summary["totals"]["count"] == 4
+    assert sorted(sr["id"] for sr in second.list_raw()) == ["r0", "r1", "r2", "r3"]
@@ -39,6 +39,7 @@ GSI Usage:
 """
 
 from typing import Optional, Dict, Any, List, TYPE_CHECKING
+import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from .base import BaseModel
@@ -298,32 +299,38 @@ class Identifier(BaseModel):
         if not values:
             return {}
             
-        # Create OR conditions for all values
-        value_conditions = [f'{{eq: "{value}"}}' for value in values]
+        # Create OR conditions for all values. Values are JSON-encoded so quotes
+        # and backslashes in identifier values cannot break the query string.
+        value_conditions = [f'{{eq: {json.dumps(str(value))}}}' for value in values]
         values_filter = f'{{or: [{", ".join(value_conditions)}]}}'
         
         query = f"""
-        query BatchFindIdentifiersByValues($accountId: String!) {{
+        query BatchFindIdentifiersByValues($accountId: String!, $nextToken: String) {{
             listIdentifiers(filter: {{
                 accountId: {{eq: $accountId}}
                 value: {values_filter}
-            }}) {{
+            }}, nextToken: $nextToken) {{
                 items {{
                     {cls.fields()}
                 }}
+                nextToken
             }}
         }}
         """
         
-        result = client.execute(query, {'accountId': account_id})
-        
-        items = result.get('listIdentifiers', {}).get('items', [])
-        
-        # Build result dictionary mapping value -> Identifier
+        # Build result dictionary mapping value -> Identifier. The filter is applied
+        # per page, so keep following nextToken until the scan is exhausted.
         result_dict = {}
-        for item_data in items:
-            identifier = cls.from_dict(item_data, client)
-            result_dict[identifier.value] = identifier
+        next_token = None
+        while True:
+            result = client.execute(query, {'accountId': account_id, 'nextToken': next_token})
+            page = result.get('listIdentifiers', {}) or {}
+            for item_data in page.get('items', []):
+                identifier = cls.from_dict(item_data, client)
+                result_dict[identifier.value] = identifier
+            next_token = page.get('nextToken')
+            if not next_token:
+                break
             
         return result_dict
 
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any, List, Tuple, Union
+from typing import Optional, Dict, Any, Iterable, List, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from .base import BaseModel
@@ -209,6 +209,58 @@ class Item(BaseModel):
             return cls.from_dict(item_data, client)
         return None
 
+    @classmethod
+    def batch_get_by_ids(
+        cls,
+        item_ids: Iterable[str],
+        client: '_BaseAPIClient',
+        chunk_size: int = 25,
+    ) -> Dict[str, Optional['Item']]:
+        """
+        Get many items by ID, `chunk_size` items per request.
+
+        Each request is one query with an aliased `getItem` field per ID. If a
+        chunk request fails, its IDs are fetched one at a time with `get_by_id`.
+
+        Args:
+            item_ids: IDs of the items to retrieve
+            client: The API client to use
+            chunk_size: Number of items per request
+
+        Returns:
+            Dict mapping every requested ID to its Item, or None if not found
+        """
+        item_ids = list(dict.fromkeys(item_id for item_id in item_ids if item_id))
+        chunk_size = max(1, chunk_size)
+        items: Dict[str, Optional['Item']] = {}
+
+        for start in range(0, len(item_ids), chunk_size):
+            chunk = item_ids[start:start + chunk_size]
+            variable_defs = ", ".join(f"$id{i}: ID!" for i in range(len(chunk)))
+            fields = "\n".join(
+                f"item{i}: getItem(id: $id{i}) {{ {cls.fields()} }}" for i in range(len(chunk))
+            )
+            query = f"""
+            query BatchGetItems({variable_defs}) {{
+                {fields}
+            }}
+            """
+            try:
+                result = client.execute(query, {f"id{i}": item_id for i, item_id in enumerate(chunk)})
+            except Exception as e:
+                logging.getLogger(__name__).warning(
+                    f"Batch item fetch failed for {len(chunk)} items, fetching individually: {e}"
+                )
+                for item_id in chunk:
+                    items[item_id] = cls.get_by_id(item_id, client)
+                continue
+
+            for i, item_id in enumerate(chunk):
+                item_data = (result or {}).get(f"item{i}")
+                items[item_id] = cls.from_dict(item_data, client) if item_data else None
+
+        return items
+
     @classmethod
     def create(cls, client: '_BaseAPIClient', evaluationId: str, text: Optional[str] = None,
                metadata: Optional[Dict] = None, createdByType: Optional[str] = None, deterministic_id: Optional[str] = None, **kwargs) -> 'Item':
@@ -658,6 +710,477 @@ class Item(BaseModel):
                 logger.exception(error_msg)
             return None, False, error_msg
     
+    @classmethod
+    def batch_upsert_by_identifiers(
+        cls,
+        client: '_BaseAPIClient',
+        account_id: str,
+        rows: Iterable[Dict[str, Any]],
+        evaluation_id: Optional[str] = None,
+        is_evaluation: bool = False,
+        chunk_size: int = 25,
+        lookup_chunk_size: int = 50,
+        max_workers: int = 4,
+        debug: bool = False
+    ) -> List[Tuple[Optional[str], bool, Optional[str]]]:
+        """
+        Upsert many Items at once using identifier-based lookup.
+
+        This is the bulk counterpart of `upsert_by_identifiers`. Instead of issuing
+        several GraphQL requests per row, it:
+
+        1. Resolves every identifier value with `Identifier.batch_find_by_values`,
+           `lookup_chunk_size` values per request.
+        2. Looks up rows that no identifier matched by externalId (aliased
+           `byAccountAndExternalId` queries), so legacy Items without Identifier
+           records are updated instead of duplicated.
+        3. Diffs the rows against the existing Items and Identifier records locally.
+        4. Sends the Item create/update mutations and the missing Identifier
+           creations as aliased multi-field mutations, `chunk_size` per request,
+           with at most `max_workers` requests in flight.
+
+        Only the aliases that fail (for example because a deterministic ID already
+        exists) fall back to `upsert_by_identifiers`, so the per-row semantics
+        match the single-row path. Existing Items whose identifiers are not all
+        recorded under the same name and value go through the single-row
+        `_find_missing_identifiers` / `_create_identifier_records` handling.
+
+        Args:
+            client: PlexusDashboardClient instance
+            account_id: The Plexus account ID
+            rows: Iterable of dicts with the keys `identifiers`, and optionally
+                `external_id`, `description`, `text`, `metadata` and `score_id`
+            evaluation_id: Optional evaluation ID applied to created Items
+            is_evaluation: Whether the created Items are evaluation items
+            chunk_size: Number of Item or Identifier mutations per request
+            lookup_chunk_size: Number of identifier values per lookup request
+            max_workers: Maximum number of concurrent GraphQL requests
+            debug: Enable debug logging
+
+        Returns:
+            List of (item_id, was_created, error_msg) tuples, one per input row,
+            in input order.
+
+        Example:
+            outcomes = Item.batch_upsert_by_identifiers(
+                client=client,
+                account_id='account-123',
+                rows=[
+                    {'identifiers': {'formId': '12345'}, 'external_id': 'form-12345', 'text': '...'},
+                    {'identifiers': {'formId': '12346'}, 'external_id': 'form-12346', 'text': '...'},
+                ]
+            )
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from .identifier import Identifier
+
+        logger = logging.getLogger(__name__)
+        rows = list(rows)
+        outcomes: List[Tuple[Optional[str], bool, Optional[str]]] = [(None, False, None)] * len(rows)
+
+        if not rows:
+            return outcomes
+        if not account_id:
+            return [(None, False, "Missing required account_id parameter")] * len(rows)
+
+        chunk_size = max(1, chunk_size)
+        lookup_chunk_size = max(1, lookup_chunk_size)
+
+        # Normalize identifier values once; empty values are ignored like the single-row path.
+        row_identifiers: List[Dict[str, str]] = []
+        for row in rows:
+            identifiers = row.get('identifiers') or {}
+            row_identifiers.append({
+                key: str(value).strip()
+                for key, value in identifiers.items()
+                if value is not None and str(value).strip()
+            } if isinstance(identifiers, dict) else {})
+
+        # Stage 1: resolve all identifier values in chunks.
+        unique_values = list(dict.fromkeys(
+            value for identifiers in row_identifiers for value in identifiers.values()
+        ))
+        value_chunks = [
+            unique_values[start:start + lookup_chunk_size]
+            for start in range(0, len(unique_values), lookup_chunk_size)
+        ]
+        found: Dict[str, 'Identifier'] = {}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for chunk_result in executor.map(
+                lambda chunk: Identifier.batch_find_by_values(chunk, account_id, client),
+                value_chunks
+            ):
+                found.update(chunk_result)
+        if debug:
+            logger.debug(f"[BATCH UPSERT] Resolved {len(found)} of {len(unique_values)} identifier values in {len(value_chunks)} requests")
+
+        def item_id_from_identifiers(identifiers: Dict[str, str]) -> Optional[str]:
+            for value in identifiers.values():
+                identifier = found.get(value)
+                if identifier and isinstance(identifier.itemId, str) and identifier.itemId.strip():
+                    return identifier.itemId
+            return None
+
+        # Stage 2: rows no identifier matched fall back to an externalId lookup, like the single-row path.
+        unmatched_external_ids = list(dict.fromkeys(
+            row.get('external_id')
+            for row, identifiers in zip(rows, row_identifiers)
+            if row.get('external_id') and not item_id_from_identifiers(identifiers)
+        ))
+        external_id_chunks = [
+            unmatched_external_ids[start:start + lookup_chunk_size]
+            for start in range(0, len(unmatched_external_ids), lookup_chunk_size)
+        ]
+        items_by_external_id: Dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for chunk_result in executor.map(
+                lambda chunk: cls._find_item_ids_by_external_ids(client, account_id, chunk, debug),
+                external_id_chunks
+            ):
+                items_by_external_id.update(chunk_result)
+        if debug and unmatched_external_ids:
+            logger.debug(f"[BATCH UPSERT] Matched {len(items_by_external_id)} of {len(unmatched_external_ids)} external IDs to existing Items")
+
+        # Stage 3: diff rows against existing Items and Identifiers locally.
+        now = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        item_operations = []  # (row_index, field, input_data, was_created)
+        pending_identifiers: Dict[int, Dict[str, str]] = {}
+        # Existing Items with identifiers not recorded under the same name and value; handled per row.
+        reconcile_identifiers: Dict[int, Dict[str, str]] = {}
+
+        for index, (row, identifiers) in enumerate(zip(rows, row_identifiers)):
+            external_id = row.get('external_id')
+            description = row.get('description')
+            text = row.get('text')
+            metadata = row.get('metadata')
+            score_id = row.get('score_id')
+
+            existing_item_id = item_id_from_identifiers(identifiers) or items_by_external_id.get(external_id)
+
+            if existing_item_id:
+                input_data = {'id': existing_item_id, 'updatedAt': now}
+                if description:
+                    input_data['description'] = description
+                if text:
+                    input_data['text'] = text
+                if metadata:
+                    input_data['metadata'] = json.dumps(metadata)
+                if external_id:
+                    input_data['externalId'] = external_id
+                item_operations.append((index, 'updateItem', input_data, False))
+
+                # Identifiers already recorded for this Item need nothing; any other
+                # (missing, renamed or changed value) gets the single-row conflict handling.
+                unmatched = any(
+                    not (found.get(value) and found[value].itemId == existing_item_id
+                         and found[value].name == cls._identifier_display_name(key))
+                    for key, value in identifiers.items()
+                )
+                if unmatched:
+                    reconcile_identifiers[index] = identifiers
+            else:
+                item_evaluation_id = evaluation_id or ('prediction-default' if not is_evaluation else None)
+                if not item_evaluation_id:
+                    outcomes[index] = (None, False, "evaluationId is required for evaluation items")
+                    continue
+                input_data = {
+                    'accountId': account_id,
+                    'isEvaluation': is_evaluation,
+                    'evaluationId': item_evaluation_id,
+                    'createdAt': now,
+                    'updatedAt': now,
+                    'createdByType': 'evaluation' if (is_evaluation or item_evaluation_id != 'prediction-default') else 'prediction',
+                }
+                if external_id:
+                    # Same deterministic ID as upsert_by_identifiers to prevent duplicates.
+                    input_data['id'] = f"{account_id}--{external_id}"
+                    input_data['externalId'] = external_id
+                if description:
+                    input_data['description'] = description
+                if text:
+                    input_data['text'] = text
+                if metadata:
+                    input_data['metadata'] = json.dumps(metadata)
+                if score_id:
+                    input_data['scoreId'] = score_id
+                item_operations.append((index, 'createItem', input_data, True))
+                pending_identifiers[index] = dict(identifiers)
+
+        # Stage 4: batched Item mutations with bounded concurrency.
+        def upsert_row(index):
+            row = rows[index]
+            return cls.upsert_by_identifiers(
+                client=client,
+                account_id=account_id,
+                identifiers=row.get('identifiers') or {},
+                external_id=row.get('external_id'),
+                description=row.get('description'),
+                text=row.get('text'),
+                metadata=row.get('metadata'),
+                evaluation_id=evaluation_id,
+                is_evaluation=is_evaluation,
+                score_id=row.get('score_id'),
+                debug=debug
+            )
+
+        def run_item_chunk(chunk):
+            try:
+                results, errors = cls._execute_aliased_mutations(
+                    client,
+                    [(field, 'CreateItemInput!' if field == 'createItem' else 'UpdateItemInput!', input_data)
+                     for _, field, input_data, _ in chunk],
+                    selection='id'
+                )
+            except Exception as e:
+                logger.warning(f"[BATCH UPSERT] Chunk of {len(chunk)} Item mutations failed, falling back to per-row upsert: {e}")
+                results, errors = [None] * len(chunk), {position: str(e) for position in range(len(chunk))}
+            if errors and len(errors) < len(chunk):
+                logger.warning(f"[BATCH UPSERT] {len(errors)} of {len(chunk)} Item mutations failed, retrying only those rows: {list(errors.values())[:3]}")
+
+            # Aliases that succeeded are final; only the failed ones are retried one row at a time.
+            outcomes_for_chunk = []
+            for position, ((index, _, _, was_created), result) in enumerate(zip(chunk, results)):
+                if position not in errors and result is not None:
+                    outcomes_for_chunk.append((index, (result['id'], was_created, None), True))
+                else:
+                    outcomes_for_chunk.append((index, upsert_row(index), False))
+            return outcomes_for_chunk
+
+        item_chunks = [
+            item_operations[start:start + chunk_size]
+            for start in range(0, len(item_operations), chunk_size)
+        ]
+        identifier_inputs = []
+        reconcile_rows = []
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for chunk_outcomes in executor.map(run_item_chunk, item_chunks):
+                for index, outcome, batched in chunk_outcomes:
+                    outcomes[index] = outcome
+                    item_id = outcome[0]
+                    # The per-row fallback already created its own Identifier records.
+                    if not batched or not item_id:
+                        continue
+                    if index in reconcile_identifiers:
+                        reconcile_rows.append((item_id, reconcile_identifiers[index]))
+                        continue
+                    for position, (key, value) in enumerate(pending_identifiers.get(index, {}).items(), start=1):
+                        identifier = found.get(value)
+                        if identifier and identifier.itemId and identifier.itemId != item_id:
+                            logger.warning(f"[BATCH UPSERT] Identifier {key}={value} belongs to a different Item {identifier.itemId}; skipping")
+                            continue
+                        identifier_inputs.append({
+                            'itemId': item_id,
+                            'name': cls._identifier_display_name(key),
+                            'value': value,
+                            'accountId': account_id,
+                            'createdAt': now,
+                            'updatedAt': now,
+                            'position': position,
+                        })
+
+        # Stage 5: identifiers of existing Items that differ from what is recorded, same as
+        # the update branch of `upsert_by_identifiers`.
+        def reconcile_row(entry):
+            item_id, identifiers = entry
+            try:
+                missing_identifiers = cls._find_missing_identifiers(client, account_id, item_id, identifiers, debug)
+                if missing_identifiers:
+                    cls._create_identifier_records(client, item_id, account_id, missing_identifiers, debug)
+            except Exception as e:
+                logger.error(f"[BATCH UPSERT] Failed to create missing identifier records for existing Item {item_id}: {e}")
+
+        # Stage 6: batched Identifier creation. Failures are logged but don't fail the row,
+        # matching `_create_identifier_records`.
+        def create_identifier(input_data):
+            try:
+                Identifier.create(
+                    client=client,
+                    itemId=input_data['itemId'],
+                    name=input_data['name'],
+                    value=input_data['value'],
+                    accountId=input_data['accountId'],
+                    position=input_data['position']
+                )
+            except Exception as create_error:
+                if debug:
+                    logger.debug(f"[BATCH UPSERT] Could not create identifier {input_data['name']}={input_data['value']}: {create_error}")
+
+        def run_identifier_chunk(chunk):
+            try:
+                _, errors = cls._execute_aliased_mutations(
+                    client,
+                    [('createIdentifier', 'CreateIdentifierInput!', input_data) for input_data in chunk],
+                    selection='itemId\nname'
+                )
+            except Exception as e:
+                logger.warning(f"[BATCH UPSERT] Chunk of {len(chunk)} Identifier creations failed, retrying individually: {e}")
+                errors = {position: str(e) for position in range(len(chunk))}
+            for position in sorted(errors):
+                create_identifier(chunk[position])
+
+        identifier_chunks = [
+            identifier_inputs[start:start + chunk_size]
+            for start in range(0, len(identifier_inputs), chunk_size)
+        ]
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            list(executor.map(reconcile_row, reconcile_rows))
+            list(executor.map(run_identifier_chunk, identifier_chunks))
+
+        if debug:
+            created = sum(1 for _, was_created, error in outcomes if was_created and not error)
+            failed = sum(1 for item_id, _, error in outcomes if error or not item_id)
+            logger.debug(
+                f"[BATCH UPSERT] {len(rows)} rows: {created} created, "
+                f"{len(rows) - created - failed} updated, {failed} failed"
+            )
+
+        return outcomes
+
+    @staticmethod
+    def _identifier_display_name(key: str) -> str:
+        """Convert an identifier key like `report_id` into its display name (`Report Id`)."""
+        return key.replace('_', ' ').replace('Id', ' ID').title().strip()
+
+    @staticmethod
+    def _execute_aliased_mutations(
+        client: '_BaseAPIClient',
+        operations: List[Tuple[str, str, Dict[str, Any]]],
+        selection: str = 'id'
+    ) -> Tuple[List[Optional[Dict[str, Any]]], Dict[int, str]]:
+        """
+        Execute several mutations in a single GraphQL request using field aliases.
+
+        GraphQL runs each aliased field independently, so one failing mutation does
+        not undo the others. When the response carries partial data, the failed
+        aliases are reported instead of failing the whole request.
+
+        Args:
+            client: API client
+            operations: List of (mutation field, input type, input data) tuples
+            selection: Fields to select from each mutation result
+
+        Returns:
+            Tuple of (results, errors): the mutation results in the same order as
+            `operations` (None where an alias failed) and a map of operation index
+            to error message for the failed aliases
+
+        Raises:
+            Exception: If the request failed without returning per-alias data
+        """
+        variable_definitions = []
+        fields = []
+        variables = {}
+        for index, (field, input_type, input_data) in enumerate(operations):
+            variable_definitions.append(f"$input{index}: {input_type}")
+            fields.append(f"op{index}: {field}(input: $input{index}) {{ {selection} }}")
+            variables[f"input{index}"] = input_data
+
+        mutation = "mutation BatchMutation(%s) {\n%s\n}" % (
+            ", ".join(variable_definitions),
+            "\n".join(fields)
+        )
+        try:
+            result = client.execute(mutation, variables)
+            errors: Dict[int, str] = {}
+        except Exception as e:
+            partial = Item._partial_aliased_result(e)
+            if partial is None:
+                raise
+            result, errors = partial
+
+        results = []
+        for index in range(len(operations)):
+            value = (result or {}).get(f"op{index}")
+            if value is None and index not in errors:
+                errors[index] = "mutation returned no result"
+            results.append(value)
+        return results, errors
+
+    @staticmethod
+    def _partial_aliased_result(error: Exception) -> Optional[Tuple[Dict[str, Any], Dict[int, str]]]:
+        """
+        Recover the partial `data` and per-alias errors from a failed aliased request.
+
+        The API client wraps gql's `TransportQueryError`, which keeps the response
+        `data` and `errors` (each error's `path` starts with the `opN` alias).
+        """
+        seen = set()
+        current = error
+        while current is not None and id(current) not in seen:
+            seen.add(id(current))
+            data = getattr(current, 'data', None)
+            if isinstance(data, dict):
+                errors: Dict[int, str] = {}
+                for graphql_error in getattr(current, 'errors', None) or []:
+                    if not isinstance(graphql_error, dict):
+                        continue
+                    path = graphql_error.get('path') or []
+                    alias = path[0] if path else None
+                    if isinstance(alias, str) and alias.startswith('op') and alias[2:].isdigit():
+                        errors[int(alias[2:])] = graphql_error.get('message', str(graphql_error))
+                return data, errors
+            current = current.__cause__ or current.__context__
+        return None
+
+    @classmethod
+    def _find_item_ids_by_external_ids(
+        cls,
+        client: '_BaseAPIClient',
+        account_id: str,
+        external_ids: List[str],
+        debug: bool = False
+    ) -> Dict[str, str]:
+        """
+        Map external IDs to existing Item IDs with one aliased `byAccountAndExternalId` query.
+
+        Falls back to `_lookup_item_by_external_id` per external ID if the batched
+        query fails.
+
+        Args:
+            client: API client
+            account_id: The account ID
+            external_ids: External IDs to look up
+            debug: Enable debug logging
+
+        Returns:
+            Dict mapping found external IDs to Item IDs
+        """
+        if not external_ids or not account_id:
+            return {}
+
+        variable_definitions = ["$accountId: String!"]
+        fields = []
+        variables: Dict[str, Any] = {'accountId': account_id}
+        for index, external_id in enumerate(external_ids):
+            variable_definitions.append(f"$externalId{index}: String!")
+            fields.append(
+                f"lookup{index}: listItemByAccountIdAndExternalId(accountId: $accountId, "
+                f"externalId: {{eq: $externalId{index}}}, limit: 1) {{ items {{ id externalId }} }}"
+            )
+            variables[f"externalId{index}"] = external_id
+        query = "query BatchFindItemsByExternalId(%s) {\n%s\n}" % (
+            ", ".join(variable_definitions),
+            "\n".join(fields)
+        )
+
+        found: Dict[str, str] = {}
+        try:
+            result = client.execute(query, variables)
+        except Exception as e:
+            logger = logging.getLogger(__name__)
+            logger.warning(f"[BATCH UPSERT] External ID lookup for {len(external_ids)} Items failed, looking up individually: {e}")
+            for external_id in external_ids:
+                existing_item = cls._lookup_item_by_external_id(client, account_id, external_id, debug)
+                if existing_item:
+                    found[external_id] = existing_item['id']
+            return found
+
+        for index, external_id in enumerate(external_ids):
+            items = ((result or {}).get(f"lookup{index}") or {}).get('items') or []
+            if items and items[0].get('id'):
+                found[external_id] = items[0]['id']
+        return found
+
     @classmethod
     def _lookup_item_by_identifiers(
         cls,
@@ -0,0 +1,254 @@
+"""
+Tests for Item.batch_upsert_by_identifiers.
+
+Validates that the bulk upsert path:
+1. Resolves identifiers through Identifier.batch_find_by_values in chunks
+2. Matches rows without identifier records to existing Items by externalId
+3. Creates new Items and updates existing Items with aliased batch mutations
+4. Only creates Identifier records that are missing locally
+5. Falls back to the single-row upsert only for the mutations that failed
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+from plexus.dashboard.api.models.item import Item
+from plexus.dashboard.api.models.identifier import Identifier
+
+
+def make_identifier(item_id, name, value):
+    now = datetime.now(timezone.utc)
+    return Identifier(
+        itemId=item_id,
+        name=name,
+        value=value,
+        accountId="account-1",
+        createdAt=now,
+        updatedAt=now,
+    )
+
+
+class PartialFailure(Exception):
+    """Mimics gql's TransportQueryError, which keeps the partial response."""
+
+    def __init__(self, data, errors):
+        super().__init__(str(errors))
+        self.data = data
+        self.errors = errors
+
+
+class FakeClient:
+    """Records executed mutations and echoes back IDs for aliased mutation fields."""
+
+    def __init__(self, items_by_external_id=None):
+        self.mutations = []
+        self.lookups = []
+        self.items_by_external_id = items_by_external_id or {}
+
+    def execute(self, query, variables=None):
+        if 'listItemByAccountIdAndExternalId' in query:
+            self.lookups.append((query, variables))
+            return {
+                name.replace('externalId', 'lookup'): {
+                    'items': [{'id': self.items_by_external_id[value], 'externalId': value}]
+                    if value in self.items_by_external_id else []
+                }
+                for name, value in variables.items() if name != 'accountId'
+            }
+        self.mutations.append((query, variables))
+        result = {}
+        for name, input_data in (variables or {}).items():
+            alias = name.replace('input', 'op')
+            result[alias] = {
+                'id': input_data.get('id', f"generated-{name}"),
+                'itemId': input_data.get('itemId'),
+                'name': input_data.get('name'),
+            }
+        return result
+
+
+class TestItemBatchUpsert:
+
+    def setup_method(self):
+        self.client = FakeClient()
+        self.account_id = "account-1"
+
+    def test_creates_and_updates_in_batches(self):
+        rows = [
+            {'identifiers': {'formId': '100'}, 'external_id': 'ext-100', 'text': 'existing'},
+            {'identifiers': {'formId': '200', 'reportId': '300'}, 'external_id': 'ext-200', 'text': 'new'},
+        ]
+        found = {'100': make_identifier('item-100', 'Form Id', '100')}
+
+        with patch.object(Identifier, 'batch_find_by_values', return_value=found) as mock_find:
+            outcomes = Item.batch_upsert_by_identifiers(
+                client=self.client,
+                account_id=self.account_id,
+                rows=rows,
+                chunk_size=10,
+                max_workers=1
+            )
+
+        mock_find.assert_called_once()
+        assert sorted(mock_find.call_args[0][0]) == ['100', '200', '300']
+
+        assert outcomes[0] == ('item-100', False, None)
+        assert outcomes[1] == ('account-1--ext-200', True, None)
+
+        # Only the row no identifier matched is looked up by externalId
+        assert len(self.client.lookups) == 1
+        assert self.client.lookups[0][1] == {'accountId': 'account-1', 'externalId0': 'ext-200'}
+
+        # One request for both Item mutations, one for the missing identifiers
+        assert len(self.client.mutations) == 2
+        item_query, item_variables = self.client.mutations[0]
+        assert 'updateItem' in item_query and 'createItem' in item_query
+        assert item_variables['input0']['id'] == 'item-100'
+        assert item_variables['input1']['id'] == 'account-1--ext-200'
+        assert item_variables['input1']['createdByType'] == 'prediction'
+
+        identifier_query, identifier_variables = self.client.mutations[1]
+        assert identifier_query.count('createIdentifier') == 2
+        created = {(v['name'], v['value']) for v in identifier_variables.values()}
+        assert created == {('Form Id', '200'), ('Report Id', '300')}
+
+    def test_lookup_values_are_chunked(self):
+        rows = [{'identifiers': {'formId': str(i)}, 'external_id': f'ext-{i}'} for i in range(5)]
+
+        with patch.object(Identifier, 'batch_find_by_values', return_value={}) as mock_find:
+            Item.batch_upsert_by_identifiers(
+                client=self.client,
+                account_id=self.account_id,
+                rows=rows,
+                lookup_chunk_size=2,
+                max_workers=1
+            )
+
+        assert mock_find.call_count == 3
+
+    def test_failed_chunk_falls_back_to_single_row_upsert(self):
+        client = Mock()
+        client.execute.side_effect = Exception("conditional request failed")
+        rows = [
+            {'identifiers': {'formId': '1'}, 'external_id': 'ext-1', 'metadata': {'a': 1}},
+            {'identifiers': {'formId': '2'}, 'external_id': 'ext-2'},
+        ]
+
+        with patch.object(Identifier, 'batch_find_by_values', return_value={}), \
+                patch.object(Item, '_find_item_ids_by_external_ids', return_value={}):
+            with patch.object(Item, 'upsert_by_identifiers', side_effect=[
+                ('item-1', False, None),
+                ('item-2', True, None),
+            ]) as mock_upsert:
+                outcomes = Item.batch_upsert_by_identifiers(
+                    client=client,
+                    account_id=self.account_id,
+                    rows=rows,
+                    max_workers=1
+                )
+
+        assert outcomes == [('item-1', False, None), ('item-2', True, None)]
+        assert mock_upsert.call_count == 2
+        assert mock_upsert.call_args_list[0][1]['metadata'] == {'a': 1}
+        # Only the failed Item mutation was attempted; fallback rows create their own identifiers
+        assert client.execute.call_count == 1
+
+    def test_partial_chunk_failure_retries_only_failed_aliases(self):
+        client = FakeClient()
+        echo = client.execute
+
+        def execute(query, variables=None):
+            if 'createItem' in query:
+                client.mutations.append((query, variables))
+                wrapped = PartialFailure(
+                    data={'op0': {'id': variables['input0']['id']}, 'op1': None},
+                    errors=[{'message': 'conditional request failed', 'path': ['op1']}],
+                )
+                raise Exception("GraphQL query failed") from wrapped
+            return echo(query, variables)
+
+        client.execute = execute
+        rows = [
+            {'identifiers': {'formId': '1'}, 'external_id': 'ext-1'},
+            {'identifiers': {'formId': '2'}, 'external_id': 'ext-2'},
+        ]
+
+        with patch.object(Identifier, 'batch_find_by_values', return_value={}):
+            with patch.object(Item, 'upsert_by_identifiers', return_value=('item-2', False, None)) as mock_upsert:
+                outcomes = Item.batch_upsert_by_identifiers(
+                    client=client,
+                    account_id=self.account_id,
+                    rows=rows,
+                    max_workers=1
+                )
+
+        assert outcomes == [('account-1--ext-1', True, None), ('item-2', False, None)]
+        mock_upsert.assert_called_once()
+        assert mock_upsert.call_args[1]['external_id'] == 'ext-2'
+        # The created row still gets its identifier through the batched path
+        identifier_query, identifier_variables = client.mutations[-1]
+        assert identifier_query.count('createIdentifier') == 1
+        assert identifier_variables['input0']['itemId'] == 'account-1--ext-1'
+
+    def test_legacy_item_is_matched_by_external_id(self):
+        client = FakeClient(items_by_external_id={'ext-7': 'legacy-item'})
+        rows = [{'identifiers': {'formId': '7'}, 'external_id': 'ext-7', 'text': 'updated'}]
+
+        with patch.object(Identifier, 'batch_find_by_values', return_value={}), \
+                patch.object(Item, '_find_missing_identifiers', return_value={'formId': '7'}) as mock_missing, \
+                patch.object(Item, '_create_identifier_records') as mock_create:
+            outcomes = Item.batch_upsert_by_identifiers(
+                client=client,
+                account_id=self.account_id,
+                rows=rows
+            )
+
+        assert outcomes == [('legacy-item', False, None)]
+        [(item_query, item_variables)] = client.mutations
+        assert 'updateItem' in item_query and 'createItem' not in item_query
+        assert item_variables['input0']['id'] == 'legacy-item'
+        # Identifiers of existing Items go through the single-row conflict handling
+        mock_missing.assert_called_once_with(client, self.account_id, 'legacy-item', {'formId': '7'}, False)
+        mock_create.assert_called_once_with(client, 'legacy-item', self.account_id, {'formId': '7'}, False)
+
+    def test_identifier_with_changed_value_uses_single_row_handling(self):
+        rows = [{'identifiers': {'formId': '100', 'reportId': '301'}, 'external_id': 'ext-100'}]
+        found = {'100': make_identifier('item-100', 'Form Id', '100')}
+
+        with patch.object(Identifier, 'batch_find_by_values', return_value=found), \
+                patch.object(Item, '_find_missing_identifiers', return_value={'reportId': '301'}) as mock_missing, \
+                patch.object(Item, '_create_identifier_records') as mock_create:
+            Item.batch_upsert_by_identifiers(
+                client=self.client,
+                account_id=self.account_id,
+                rows=rows
+            )
+
+        mock_missing.assert_called_once()
+        mock_create.assert_called_once_with(self.client, 'item-100', self.account_id, {'reportId': '301'}, False)
+        assert all('createIdentifier' not in query for query, _ in self.client.mutations)
+
+    def test_existing_identifiers_are_not_recreated(self):
+        rows = [{'identifiers': {'formId': '100'}, 'external_id': 'ext-100'}]
+        found = {'100': make_identifier('item-100', 'Form Id', '100')}
+
+        with patch.object(Identifier, 'batch_find_by_values', return_value=found):
+            outcomes = Item.batch_upsert_by_identifiers(
+                client=self.client,
+                account_id=self.account_id,
+                rows=rows
+            )
+
+        assert outcomes == [('item-100', False, None)]
+        assert len(self.client.mutations) == 1
+        assert 'createIdentifier' not in self.client.mutations[0][0]
+
+    def test_missing_account_id_reports_error_per_row(self):
+        outcomes = Item.batch_upsert_by_identifiers(
+            client=self.client,
+            account_id=None,
+            rows=[{'identifiers': {}}, {'identifiers': {}}]
+        )
+        assert outcomes == [(None, False, "Missing required account_id parameter")] * 2
+        assert self.client.mutations == []
+
@@ -1,3 +1,4 @@
+import json
 from abc import ABC, abstractmethod
 from pydantic import BaseModel, ValidationError, Field
 from plexus.CustomLogging import logging
@@ -81,59 +82,20 @@ class DataCache(ABC):
         """
         try:
             from plexus.dashboard.api.models.item import Item
-            
-            # Determine external ID
-            if not external_id:
-                if hasattr(item_data, 'id'):
-                    external_id = item_data.id
-                elif hasattr(item_data, 'externalId'):
-                    external_id = item_data.externalId
-                elif isinstance(item_data, dict):
-                    external_id = item_data.get('id') or item_data.get('externalId')
-            
-            # Determine description
-            description = None
-            if hasattr(item_data, 'description'):
-                description = item_data.description
-            elif isinstance(item_data, dict):
-                description = item_data.get('description')
-            
-            if not description and external_id:
-                description = f"Dataset Item - {external_id}"
-            
-            # Extract text and metadata from item_data if available
-            text = None
-            metadata = None
-            if hasattr(item_data, 'text'):
-                text = item_data.text
-            elif isinstance(item_data, dict):
-                text = item_data.get('text')
-                
-            if hasattr(item_data, 'metadata'):
-                metadata = item_data.metadata
-            elif isinstance(item_data, dict):
-                metadata = item_data.get('metadata')
-            
-            # If metadata is already a JSON string, convert it to dict for Item.upsert_by_identifiers
-            if isinstance(metadata, str):
-                try:
-                    import json
-                    metadata = json.loads(metadata)
-                except (json.JSONDecodeError, TypeError):
-                    # If it's not valid JSON, leave it as a string
-                    pass
-            
+
+            row = self._dataset_row_upsert_fields(item_data, identifiers_dict, external_id, score_id)
+
             # Upsert the Item with identifiers and score association
             return Item.upsert_by_identifiers(
                 client=dashboard_client,
                 account_id=account_id,
-                identifiers=identifiers_dict,
-                external_id=str(external_id) if external_id else None,
-                description=description,
-                text=text or "",
-                metadata=metadata,
+                identifiers=row['identifiers'],
+                external_id=row['external_id'],
+                description=row['description'],
+                text=row['text'],
+                metadata=row['metadata'],
                 is_evaluation=False,  # Dataset items are not evaluation items
-                score_id=score_id,  # Associate with score if provided
+                score_id=row['score_id'],  # Associate with score if provided
                 debug=True
             )
             
@@ -142,6 +104,120 @@ class DataCache(ABC):
             logging.error(error_msg)
             return None, False, error_msg
 
+    def upsert_items_for_dataset_rows(self, dashboard_client, account_id, rows, score_id=None, chunk_size=25, max_workers=4):
+        """
+        Bulk version of `upsert_item_for_dataset_row`.
+
+        Identifier lookups and Item/Identifier mutations are batched through
+        `Item.batch_upsert_by_identifiers` instead of issuing several GraphQL
+        requests per row.
+
+        Args:
+            dashboard_client: PlexusDashboardClient instance
+            account_id: The account ID
+            rows: pandas DataFrame or iterable of dicts. Each row holds the item
+                fields (id/externalId, description, text, metadata) plus an
+                `identifiers` dict of identifier key-value pairs.
+            score_id: Optional score ID to associate with every Item
+            chunk_size: Number of mutations sent per GraphQL request
+            max_workers: Maximum number of concurrent GraphQL requests
+
+        Returns:
+            List[Tuple[str, bool, str]]: (item_id, was_created, error_msg) per row, in input order
+        """
+        if hasattr(rows, 'to_dict'):
+            rows = rows.to_dict('records')
+        rows = list(rows)
+
+        try:
+            from plexus.dashboard.api.models.item import Item
+
+            prepared_rows = [
+                self._dataset_row_upsert_fields(
+                    row,
+                    row.get('identifiers') if isinstance(row, dict) else getattr(row, 'identifiers', None),
+                    score_id=score_id
+                )
+                for row in rows
+            ]
+            return Item.batch_upsert_by_identifiers(
+                client=dashboard_client,
+                account_id=account_id,
+                rows=prepared_rows,
+                is_evaluation=False,  # Dataset items are not evaluation items
+                chunk_size=chunk_size,
+                max_workers=max_workers
+            )
+
+        except Exception as e:
+            error_msg = f"Failed to upsert items: {str(e)}"
+            logging.error(error_msg)
+            return [(None, False, error_msg)] * len(rows)
+
+    @staticmethod
+    def _dataset_row_upsert_fields(item_data, identifiers_dict, external_id=None, score_id=None):
+        """
+        Extract the fields needed to upsert an Item from a dataset row.
+
+        Returns:
+            dict with identifiers, external_id, description, text, metadata and score_id
+        """
+        # Identifiers may arrive as a JSON string when rows come from a cached DataFrame
+        if isinstance(identifiers_dict, str):
+            try:
+                identifiers_dict = json.loads(identifiers_dict)
+            except (json.JSONDecodeError, TypeError):
+                identifiers_dict = {}
+
+        # Determine external ID
+        if not external_id:
+            if hasattr(item_data, 'id'):
+                external_id = item_data.id
+            elif hasattr(item_data, 'externalId'):
+                external_id = item_data.externalId
+            elif isinstance(item_data, dict):
+                external_id = item_data.get('id') or item_data.get('externalId')
+        
+        # Determine description
+        description = None
+        if hasattr(item_data, 'description'):
+            description = item_data.description
+        elif isinstance(item_data, dict):
+            description = item_data.get('description')
+        
+        if not description and external_id:
+            description = f"Dataset Item - {external_id}"
+        
+        # Extract text and metadata from item_data if available
+        text = None
+        metadata = None
+        if hasattr(item_data, 'text'):
+            text = item_data.text
+        elif isinstance(item_data, dict):
+            text = item_data.get('text')
+            
+        if hasattr(item_data, 'metadata'):
+            metadata = item_data.metadata
+        elif isinstance(item_data, dict):
+            metadata = item_data.get('metadata')
+        
+        # If metadata is already a JSON string, convert it to dict for Item.upsert_by_identifiers
+        if isinstance(metadata, str):
+            try:
+                metadata = json.loads(metadata)
+            except (json.JSONDecodeError, TypeError):
+                # If it's not valid JSON, leave it as a string
+                pass
+
+        return {
+            'identifiers': identifiers_dict,
+            'external_id': str(external_id) if external_id else None,
+            'description': description,
+            'text': text or "",
+            'metadata': metadata,
+            'score_id': score_id,
+        }
+
     @staticmethod
     def format_value_for_display(value, column_name=None):
         """
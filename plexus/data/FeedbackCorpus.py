@@ -0,0 +1,265 @@
+"""
+Local, incrementally synced feedback corpus for one scorecard score.
+
+The corpus keeps every feedback item seen for a (scorecard, score) pair in a
+Parquet file keyed by feedback item id, together with the ``editedAt``
+high-water mark and the earliest ``editedAt`` the corpus covers. A sync only
+reads the editedAt GSI for the range after the watermark (with a small overlap
+for late writes) and for any older range that a request reaches past the
+covered start, then merges the rows column-wise. Edits move a row's
+``editedAt`` forward, so the newer copy replaces the older one on merge.
+"""
+
+import os
+import json
+import logging
+from typing import Optional, List, Dict, Iterable, Tuple
+from datetime import datetime, timezone, timedelta
+
+import pandas as pd
+
+from plexus.cli.feedback.feedback_service import FeedbackService
+from plexus.dashboard.api.models.feedback_item import FeedbackItem
+
+logger = logging.getLogger(__name__)
+
+
+class FeedbackCorpus:
+    """Parquet-backed feedback items for one score, synced by ``editedAt`` watermark."""
+
+    # Rows written shortly before the previous sync can land with an editedAt just
+    # below the watermark, so each sync re-reads this much before it.
+    WATERMARK_OVERLAP = timedelta(minutes=5)
+
+    FEEDBACK_COLUMNS = [
+        'id', 'accountId', 'scorecardId', 'scoreId', 'itemId', 'cacheKey',
+        'initialAnswerValue', 'finalAnswerValue', 'initialCommentValue',
+        'finalCommentValue', 'editCommentValue', 'editorName', 'isAgreement',
+        'isInvalid', 'editedAt', 'createdAt', 'updatedAt'
+    ]
+    DATETIME_COLUMNS = ['editedAt', 'createdAt', 'updatedAt']
+    ITEM_FIELDS = ['id', 'identifiers', 'externalId', 'description', 'text', 'metadata']
+
+    def __init__(self, client, directory: str, account_id: str, scorecard_id: str, score_id: str):
+        self.client = client
+        self.directory = directory
+        self.account_id = account_id
+        self.scorecard_id = scorecard_id
+        self.score_id = score_id
+
+        base_name = f"feedback_corpus_{scorecard_id}_{score_id}"
+        self.data_path = os.path.join(directory, f"{base_name}.parquet")
+        self.state_path = os.path.join(directory, f"{base_name}.json")
+
+        self.covered_from: Optional[datetime] = None
+        self.watermark: Optional[datetime] = None
+        self._frame: Optional[pd.DataFrame] = None
+        self._load_state()
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """All corpus rows, newest edit first (loaded lazily from Parquet)."""
+        if self._frame is None:
+            if self.covered_from is not None and os.path.exists(self.data_path):
+                self._frame = pd.read_parquet(self.data_path)
+            else:
+                self._frame = self._empty_frame()
+        return self._frame
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def _load_state(self) -> None:
+        if not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path) as state_file:
+                state = json.load(state_file)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable feedback corpus state {self.state_path}: {e}")
+            return
+        if state.get('account_id') != self.account_id:
+            logger.warning(f"Feedback corpus {self.state_path} belongs to another account; rebuilding it")
+            return
+        self.covered_from = _parse_datetime(state.get('covered_from'))
+        self.watermark = _parse_datetime(state.get('watermark'))
+
+    def save(self) -> None:
+        """Write the rows and then the watermark state, each atomically."""
+        os.makedirs(self.directory, exist_ok=True)
+        data_tmp = f"{self.data_path}.tmp"
+        self.frame.to_parquet(data_tmp, index=False)
+        os.replace(data_tmp, self.data_path)
+
+        state = {
+            'account_id': self.account_id,
+            'scorecard_id': self.scorecard_id,
+            'score_id': self.score_id,
+            'covered_from': self.covered_from.isoformat() if self.covered_from else None,
+            'watermark': self.watermark.isoformat() if self.watermark else None,
+            'row_count': len(self.frame),
+        }
+        state_tmp = f"{self.state_path}.tmp"
+        with open(state_tmp, 'w') as state_file:
+            json.dump(state, state_file)
+        os.replace(state_tmp, self.state_path)
+
+    def plan_sync(self, start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+        """
+        editedAt ranges that must be read so the corpus covers ``[start, end]``
+        with every change up to ``end``.
+        """
+        start = _as_utc(start)
+        end = _as_utc(end)
+        if self.covered_from is None:
+            return [(start, end)]
+
+        ranges = []
+        if start < self.covered_from:
+            ranges.append((start, self.covered_from))
+        resume_from = max(self.watermark or self.covered_from, self.covered_from) - self.WATERMARK_OVERLAP
+        if end > resume_from:
+            ranges.append((resume_from, end))
+        return ranges
+
+    async def sync(self, start: datetime, end: Optional[datetime] = None) -> int:
+        """
+        Bring the corpus up to date for ``[start, end]`` and persist it.
+
+        Args:
+            start: Earliest editedAt the caller needs
+            end: Upper editedAt bound (defaults to now plus the late-write buffer)
+
+        Returns:
+            Number of rows read from the API
+        """
+        if end is None:
+            end = datetime.now(timezone.utc) + self.WATERMARK_OVERLAP
+        start = _as_utc(start)
+        end = _as_utc(end)
+
+        fetched = 0
+        for range_start, range_end in self.plan_sync(start, end):
+            feedback_items = await FeedbackService.find_feedback_items(
+                client=self.client,
+                scorecard_id=self.scorecard_id,
+                score_id=self.score_id,
+                account_id=self.account_id,
+                days=None,
+                start_date=range_start,
+                end_date=range_end,
+                prioritize_edit_comments=False,
+                include_invalid=True,
+            )
+            fetched += len(feedback_items)
+            self.merge(feedback_items)
+            logger.info(
+                f"Synced {len(feedback_items)} feedback items for {range_start.isoformat()} to "
+                f"{range_end.isoformat()} into the corpus ({len(self.frame)} rows)"
+            )
+
+        self.covered_from = min(start, self.covered_from) if self.covered_from else start
+        if self.watermark is None:
+            self.watermark = self.covered_from
+        self.save()
+        return fetched
+
+    def merge(self, feedback_items: Iterable[FeedbackItem]) -> int:
+        """Upsert feedback items by id and advance the watermark; returns the rows merged."""
+        incoming = self._to_frame(feedback_items)
+        if incoming.empty:
+            return 0
+
+        merged = pd.concat([self.frame, incoming], ignore_index=True) if len(self.frame) else incoming
+        merged = merged.drop_duplicates(subset='id', keep='last')
+        merged = merged.sort_values('editedAt', ascending=False, na_position='last', kind='stable')
+        self._frame = merged.reset_index(drop=True)
+
+        newest = incoming['editedAt'].max()
+        if pd.notna(newest):
+            newest = newest.to_pydatetime()
+            self.watermark = max(self.watermark, newest) if self.watermark else newest
+        return len(incoming)
+
+    def items(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        include_invalid: bool = False
+    ) -> List[FeedbackItem]:
+        """Feedback items edited in ``[start, end]``, newest first."""
+        frame = self.frame
+        mask = pd.Series(True, index=frame.index)
+        if start is not None:
+            mask &= frame['editedAt'] >= pd.Timestamp(_as_utc(start))
+        if end is not None:
+            mask &= frame['editedAt'] <= pd.Timestamp(_as_utc(end))
+        if not include_invalid:
+            mask &= frame['isInvalid'].ne(True)
+        return self._to_feedback_items(frame[mask])
+
+    def get(self, feedback_item_ids: Iterable[str]) -> Dict[str, FeedbackItem]:
+        """Feedback items by id, for the ids present in the corpus."""
+        frame = self.frame
+        selected = frame[frame['id'].isin(list(feedback_item_ids))]
+        return {feedback_item.id: feedback_item for feedback_item in self._to_feedback_items(selected)}
+
+    @classmethod
+    def _empty_frame(cls) -> pd.DataFrame:
+        frame = pd.DataFrame({column: pd.Series(dtype=object) for column in cls.FEEDBACK_COLUMNS + ['metadata', 'item']})
+        for column in cls.DATETIME_COLUMNS:
+            frame[column] = pd.Series(dtype='datetime64[ns, UTC]')
+        return frame
+
+    @classmethod
+    def _to_frame(cls, feedback_items: Iterable[FeedbackItem]) -> pd.DataFrame:
+        records = []
+        for feedback_item in feedback_items:
+            record = {column: getattr(feedback_item, column, None) for column in cls.FEEDBACK_COLUMNS}
+            metadata = getattr(feedback_item, 'metadata', None)
+            record['metadata'] = json.dumps(metadata) if metadata is not None else None
+            item = getattr(feedback_item, 'item', None)
+            record['item'] = (
+                json.dumps({field: getattr(item, field, None) for field in cls.ITEM_FIELDS}, default=str)
+                if item is not None else None
+            )
+            records.append(record)
+        if not records:
+            return cls._empty_frame()
+
+        frame = pd.DataFrame.from_records(records, columns=cls.FEEDBACK_COLUMNS + ['metadata', 'item'])
+        for column in cls.DATETIME_COLUMNS:
+            frame[column] = pd.to_datetime(frame[column], utc=True)
+        return frame
+
+    def _to_feedback_items(self, frame: pd.DataFrame) -> List[FeedbackItem]:
+        feedback_items = []
+        for record in frame.to_dict('records'):
+            data = {}
+            for column in self.FEEDBACK_COLUMNS:
+                value = record.get(column)
+                if pd.isna(value):
+                    value = None
+                elif column in self.DATETIME_COLUMNS:
+                    value = value.to_pydatetime()
+                data[column] = value
+            if record.get('metadata'):
+                data['metadata'] = record['metadata']
+            if record.get('item'):
+                data['item'] = json.loads(record['item'])
+            feedback_items.append(FeedbackItem.from_dict(data, client=self.client))
+        return feedback_items
+
+
+def _as_utc(value: datetime) -> datetime:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    return _as_utc(value)
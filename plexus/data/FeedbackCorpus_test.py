@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from plexus.dashboard.api.models.feedback_item import FeedbackItem
+from plexus.data.FeedbackCorpus import FeedbackCorpus
+
+NOW = datetime(2026, 5, 1, tzinfo=timezone.utc)
+
+
+def _feedback_item(feedback_id, edited_at, final_value="Yes", is_invalid=False, edit_comment=None):
+    return FeedbackItem.from_dict({
+        "id": feedback_id,
+        "accountId": "account-1",
+        "scorecardId": "scorecard-1",
+        "scoreId": "score-1",
+        "itemId": f"item-{feedback_id}",
+        "initialAnswerValue": "No",
+        "finalAnswerValue": final_value,
+        "editCommentValue": edit_comment,
+        "isInvalid": is_invalid,
+        "editedAt": edited_at.isoformat(),
+        "createdAt": edited_at.isoformat(),
+        "updatedAt": edited_at.isoformat(),
+        "item": {
+            "id": f"item-{feedback_id}",
+            "externalId": f"ext-{feedback_id}",
+            "identifiers": [{"name": "form", "value": "5001"}],
+            "text": f"transcript {feedback_id}",
+            "metadata": '{"source": "call"}',
+        },
+    })
+
+
+class _FakeFeedbackTable:
+    """Answers editedAt range reads the way the GSI would, recording each range."""
+
+    def __init__(self, rows):
+        self.rows = {row.id: row for row in rows}
+        self.ranges = []
+
+    async def find(self, **kwargs):
+        start, end = kwargs["start_date"], kwargs["end_date"]
+        self.ranges.append((start, end))
+        assert kwargs["include_invalid"] is True
+        return [row for row in self.rows.values() if start <= row.editedAt <= end]
+
+
+def _corpus(tmp_path):
+    return FeedbackCorpus(Mock(), str(tmp_path), "account-1", "scorecard-1", "score-1")
+
+
+def test_sync_reads_only_past_the_watermark_and_merges_edits(tmp_path):
+    table = _FakeFeedbackTable([
+        _feedback_item("a", NOW - timedelta(days=3)),
+        _feedback_item("b", NOW - timedelta(days=2)),
+    ])
+    window_start = NOW - timedelta(days=7)
+
+    with patch("plexus.data.FeedbackCorpus.FeedbackService.find_feedback_items", side_effect=table.find):
+        corpus = _corpus(tmp_path)
+        assert asyncio.run(corpus.sync(window_start, NOW)) == 2
+        assert corpus.watermark == NOW - timedelta(days=2)
+
+        # "a" is corrected and "b" invalidated: both move past the watermark.
+        table.rows["a"] = _feedback_item("a", NOW + timedelta(hours=1), final_value="No")
+        table.rows["b"] = _feedback_item("b", NOW + timedelta(hours=2), is_invalid=True)
+        table.rows["c"] = _feedback_item("c", NOW + timedelta(hours=3))
+
+        reopened = _corpus(tmp_path)
+        later = NOW + timedelta(days=1)
+        assert asyncio.run(reopened.sync(window_start, later)) == 3
+
+    assert table.ranges[1] == (NOW - timedelta(days=2) - FeedbackCorpus.WATERMARK_OVERLAP, later)
+    assert len(reopened) == 3
+    assert [item.id for item in reopened.items(window_start)] == ["c", "a"]
+    assert reopened.get(["a"])["a"].finalAnswerValue == "No"
+    assert [item.id for item in reopened.items(window_start, include_invalid=True)] == ["c", "b", "a"]
+
+
+def test_items_round_trip_feedback_and_item_fields(tmp_path):
+    original = _feedback_item("a", NOW - timedelta(days=1), edit_comment="Fixed")
+    corpus = _corpus(tmp_path)
+    corpus.merge([original])
+    corpus.covered_from = NOW - timedelta(days=7)
+    corpus.save()
+
+    [restored] = _corpus(tmp_path).items()
+
+    assert restored.editedAt == original.editedAt
+    assert restored.editCommentValue == "Fixed"
+    assert restored.isInvalid is False
+    assert restored.item.text == "transcript a"
+    assert restored.item.metadata == '{"source": "call"}'
+    assert restored.item.identifiers == [{"name": "form", "value": "5001"}]
+
+
+def test_plan_sync_extends_coverage_backwards_once(tmp_path):
+    corpus = _corpus(tmp_path)
+    assert corpus.plan_sync(NOW - timedelta(days=7), NOW) == [(NOW - timedelta(days=7), NOW)]
+
+    corpus.covered_from = NOW - timedelta(days=7)
+    corpus.watermark = NOW - timedelta(days=1)
+    resume_from = corpus.watermark - FeedbackCorpus.WATERMARK_OVERLAP
+
+    assert corpus.plan_sync(NOW - timedelta(days=30), NOW) == [
+        (NOW - timedelta(days=30), NOW - timedelta(days=7)),
+        (resume_from, NOW),
+    ]
+    assert corpus.plan_sync(NOW - timedelta(days=3), NOW) == [(resume_from, NOW)]
+
+
+def test_state_from_another_account_is_ignored(tmp_path):
+    corpus = _corpus(tmp_path)
+    corpus.merge([_feedback_item("a", NOW)])
+    corpus.covered_from = NOW - timedelta(days=1)
+    corpus.save()
+
+    other = FeedbackCorpus(Mock(), str(tmp_path), "account-2", "scorecard-1", "score-1")
+
+    assert other.covered_from is None
+    assert len(other) == 0
@@ -20,6 +20,7 @@ import pandas as pd
 from pydantic import Field, validator
 
 from plexus.data.DataCache import DataCache
+from plexus.data.FeedbackCorpus import FeedbackCorpus
 from plexus.cli.feedback.feedback_service import FeedbackService
 from plexus.cli.shared.identifier_resolution import resolve_scorecard_identifier, resolve_score_identifier
 from plexus.cli.shared.client_utils import create_client
@@ -64,6 +65,9 @@ class FeedbackItems(DataCache):
     LABEL_SOURCE_FINAL = "regular_final_feedback"
     LABEL_SOURCE_SCORE_RESULT_OR_IMPORTED = "score_result_or_imported"
     LABEL_SOURCE_UNRESOLVED = "unresolved"
+
+    # Lookback used for "all time" windows and backfill, so reads stay on the editedAt GSI.
+    ALL_TIME_LOOKBACK_DAYS = 3650
     
     class Parameters(DataCache.Parameters):
         """Parameters for FeedbackItems data cache."""
@@ -85,6 +89,7 @@ class FeedbackItems(DataCache):
         identifier_extractor: Optional[str] = Field(None, description="Optional client-specific identifier extractor class (e.g., 'CallCriteriaIdentifierExtractor')")
         column_mappings: Optional[Dict[str, str]] = Field(None, description="Optional mapping of original score names to new column names (e.g., {'Agent Misrepresentation': 'Agent Misrepresentation - With Confidence'})")
         item_config: Optional[Dict] = Field(None, description="Optional item configuration for running Item.to_score_input() pipeline (from 'item:' section of score YAML)")
+        feedback_corpus: bool = Field(False, description="Keep a local per-score feedback corpus synced by editedAt watermark and sample and backfill from it instead of refetching the window")
         cache_file: str = Field(default="feedback_items_cache.parquet", description="Cache file name")
         local_cache_directory: str = Field(default='./.plexus_training_data_cache/', description="Local cache directory")
         
@@ -137,6 +142,8 @@ class FeedbackItems(DataCache):
         self.normalized_initial_value = self._normalize_value(self.parameters.initial_value)
         self.normalized_final_value = self._normalize_value(self.parameters.final_value)
         
+        self._feedback_corpus: Optional[FeedbackCorpus] = None
+
         # Load identifier extractor if specified
         self.identifier_extractor = None
         if self.parameters.identifier_extractor:
@@ -156,7 +163,9 @@ class FeedbackItems(DataCache):
         This method:
         1. Loads the existing cached dataframe
         2. Extracts the feedback_item_ids from the cache
-        3. Fetches ONLY those specific feedback items from the API (with current values)
+        3. Fetches ONLY those specific feedback items from the API (with current values).
+           The local feedback corpus is not used here: it syncs by editedAt, and
+           invalidating an item does not move its editedAt.
         4. Updates the values in the cached dataframe
         5. Preserves all IDs and the exact same set of records
         
@@ -179,71 +188,44 @@ class FeedbackItems(DataCache):
             logger.error("Cannot perform reload: 'feedback_item_id' column not found in cached data")
             return existing_df
         
-        feedback_item_ids = existing_df['feedback_item_id'].tolist()
+        feedback_item_ids = existing_df['feedback_item_id'].dropna().unique().tolist()
         logger.info(f"Will fetch updates for {len(feedback_item_ids)} feedback items")
-        
+
         # Fetch only the specific feedback items by their IDs
         logger.info(f"Fetching current values for existing feedback items...")
-        try:
-            # Try to get the current event loop
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If we're in a running loop, create a task
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        lambda: asyncio.run(self._fetch_specific_feedback_items(feedback_item_ids))
-                    )
-                    feedback_items = future.result()
-            else:
-                # If no running loop, use asyncio.run
-                feedback_items = asyncio.run(self._fetch_specific_feedback_items(feedback_item_ids))
-        except RuntimeError:
-            # Fallback: create new event loop
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(new_loop)
-            try:
-                feedback_items = new_loop.run_until_complete(
-                    self._fetch_specific_feedback_items(feedback_item_ids)
-                )
-            finally:
-                new_loop.close()
-        
+        feedback_items = self._run_async(lambda: self._fetch_specific_feedback_items(feedback_item_ids))
+
         if not feedback_items:
             logger.warning("Could not fetch feedback items for reload, returning existing data")
             return existing_df
-        
+
         logger.info(f"Fetched {len(feedback_items)} feedback items for reload")
-        
+
         # Create a mapping of feedback_item_id to FeedbackItem for efficient lookup
         feedback_items_map = {item.id: item for item in feedback_items}
-        
-        # Update the dataframe with new values
-        updated_count = 0
-        for idx, row in existing_df.iterrows():
-            feedback_item_id = row['feedback_item_id']
-            
-            if feedback_item_id in feedback_items_map:
-                feedback_item = feedback_items_map[feedback_item_id]
-                
-                # Update the answer values and comments
-                existing_df.at[idx, score_name] = feedback_item.finalAnswerValue
-                
-                # Update the comment using the same logic as in _determine_score_comment
-                score_comment = self._determine_score_comment(feedback_item)
-                existing_df.at[idx, f"{score_name} comment"] = score_comment
-                
-                # Update edit comment
-                edit_comment = getattr(feedback_item, 'editCommentValue', None) or ""
-                existing_df.at[idx, f"{score_name} edit comment"] = edit_comment
-                
-                # Update metadata with latest values
-                metadata = self._create_metadata_structure(feedback_item)
-                existing_df.at[idx, 'metadata'] = metadata
-                
-                updated_count += 1
-            else:
-                logger.warning(f"Feedback item {feedback_item_id} not found in API response, keeping existing values")
+
+        # Build the refreshed values once per feedback item and patch them in column by column
+        updates = pd.DataFrame.from_records(
+            [
+                {
+                    'feedback_item_id': feedback_item_id,
+                    score_name: feedback_item.finalAnswerValue,
+                    f"{score_name} comment": self._determine_score_comment(feedback_item),
+                    f"{score_name} edit comment": getattr(feedback_item, 'editCommentValue', None) or "",
+                    'metadata': self._create_metadata_structure(feedback_item),
+                }
+                for feedback_item_id, feedback_item in feedback_items_map.items()
+            ]
+        ).set_index('feedback_item_id')
+
+        row_ids = existing_df['feedback_item_id']
+        matched = row_ids.isin(updates.index)
+        for column in updates.columns:
+            existing_df.loc[matched, column] = row_ids[matched].map(updates[column]).values
+        updated_count = int(matched.sum())
+
+        for feedback_item_id in row_ids[~matched]:
+            logger.warning(f"Feedback item {feedback_item_id} not found in API response, keeping existing values")
         
         logger.info(f"Updated {updated_count} out of {len(existing_df)} records")
         
@@ -252,6 +234,58 @@ class FeedbackItems(DataCache):
         
         return existing_df
     
+    def _run_async(self, coroutine_factory):
+        """Run a coroutine to completion from sync code, whether or not a loop is already running."""
+        try:
+            loop = asyncio.get_event_loop()
+            if loop.is_running():
+                import concurrent.futures
+                with concurrent.futures.ThreadPoolExecutor() as executor:
+                    return executor.submit(lambda: asyncio.run(coroutine_factory())).result()
+            return asyncio.run(coroutine_factory())
+        except RuntimeError:
+            new_loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(new_loop)
+            try:
+                return new_loop.run_until_complete(coroutine_factory())
+            finally:
+                new_loop.close()
+
+    def _feedback_window(self) -> Tuple[datetime, datetime]:
+        """The editedAt window requested by the parameters, as UTC datetimes."""
+        if self.parameters.feedback_start_at and self.parameters.feedback_end_at:
+            start, end = (
+                datetime.fromisoformat(value.replace("Z", "+00:00"))
+                for value in (self.parameters.feedback_start_at, self.parameters.feedback_end_at)
+            )
+            return (
+                start if start.tzinfo else start.replace(tzinfo=timezone.utc),
+                end if end.tzinfo else end.replace(tzinfo=timezone.utc),
+            )
+        days = self.parameters.days if self.parameters.days is not None else self.ALL_TIME_LOOKBACK_DAYS
+        now = datetime.now(timezone.utc)
+        # Small buffer on the upper bound catches items edited while the query runs
+        return now - timedelta(days=days), now + timedelta(minutes=5)
+
+    def _get_feedback_corpus(self, scorecard_id: str, score_id: str) -> FeedbackCorpus:
+        return FeedbackCorpus(
+            client=self.client,
+            directory=os.path.join(self.local_cache_directory, 'feedback_corpus'),
+            account_id=self.account_id,
+            scorecard_id=scorecard_id,
+            score_id=score_id,
+        )
+
+    def _load_feedback_items_from_corpus(self, scorecard_id: str, score_id: str) -> List[FeedbackItem]:
+        """Sync the local corpus for the requested window and return the window's items."""
+        corpus = self._get_feedback_corpus(scorecard_id, score_id)
+        start, end = self._feedback_window()
+        # Always sync up to now so rows re-edited out of a frozen window are not served stale
+        fetched = self._run_async(lambda: corpus.sync(start))
+        self._feedback_corpus = corpus
+        logger.info(f"Feedback corpus sync read {fetched} rows from the API ({len(corpus)} rows stored)")
+        return self._filter_items_by_values(corpus.items(start, end))
+
     def _normalize_value(self, value: Optional[str]) -> Optional[str]:
         """
         Normalize a value for case-insensitive comparison.
@@ -529,35 +563,13 @@ class FeedbackItems(DataCache):
         logger.info(f"Fetching fresh feedback data for {scorecard_name} / {score_name} ({days_str})")
         
         # Fetch feedback items
-        try:
-            # Try to get the current event loop
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If we're in a running loop, create a task
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        lambda: asyncio.run(self._fetch_feedback_items_for_scores(scorecard_id, [(score_id, score_name)]))
-                    )
-                    result = future.result()
-                    feedback_items = result.get(score_id, [])
-            else:
-                # If no running loop, use asyncio.run
-                result = asyncio.run(self._fetch_feedback_items_for_scores(
-                    scorecard_id, [(score_id, score_name)]
-                ))
-                feedback_items = result.get(score_id, [])
-        except RuntimeError:
-            # Fallback: create new event loop
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(new_loop)
-            try:
-                result = new_loop.run_until_complete(self._fetch_feedback_items_for_scores(
-                    scorecard_id, [(score_id, score_name)]
-                ))
-                feedback_items = result.get(score_id, [])
-            finally:
-                new_loop.close()
+        if self.parameters.feedback_corpus and not self.parameters.feedback_id:
+            feedback_items = self._load_feedback_items_from_corpus(scorecard_id, score_id)
+        else:
+            result = self._run_async(
+                lambda: self._fetch_feedback_items_for_scores(scorecard_id, [(score_id, score_name)])
+            )
+            feedback_items = result.get(score_id, [])
         
         if not feedback_items:
             logger.warning("No feedback items found")
@@ -857,34 +869,37 @@ class FeedbackItems(DataCache):
                 else:
                     logger.error(f"🔍 FEEDBACK SERVICE DEBUG: First item has no .item or .item is None")
             
-            # Apply case-insensitive filtering locally if needed
-            if self.parameters.initial_value or self.parameters.final_value:
-                filtered_items = []
-                for item in all_items:
-                    matches = True
-                    
-                    # Case-insensitive initial_value filtering
-                    if self.parameters.initial_value:
-                        item_initial = self._normalize_item_value(item.initialAnswerValue)
-                        if item_initial != self.normalized_initial_value:
-                            matches = False
-                    
-                    # Case-insensitive final_value filtering  
-                    if self.parameters.final_value:
-                        item_final = self._normalize_item_value(item.finalAnswerValue)
-                        if item_final != self.normalized_final_value:
-                            matches = False
-                    
-                    if matches:
-                        filtered_items.append(item)
-                
-                logger.info(f"After case-insensitive filtering: {len(filtered_items)} items (from {len(all_items)} total)")
-                feedback_by_score[score_id] = filtered_items
-            else:
-                feedback_by_score[score_id] = all_items
+            feedback_by_score[score_id] = self._filter_items_by_values(all_items)
         
         return feedback_by_score
 
+    def _filter_items_by_values(self, feedback_items: List[FeedbackItem]) -> List[FeedbackItem]:
+        """Apply the case-insensitive initial_value/final_value parameters."""
+        if not (self.parameters.initial_value or self.parameters.final_value):
+            return feedback_items
+
+        filtered_items = []
+        for item in feedback_items:
+            matches = True
+            
+            # Case-insensitive initial_value filtering
+            if self.parameters.initial_value:
+                item_initial = self._normalize_item_value(item.initialAnswerValue)
+                if item_initial != self.normalized_initial_value:
+                    matches = False
+            
+            # Case-insensitive final_value filtering  
+            if self.parameters.final_value:
+                item_final = self._normalize_item_value(item.finalAnswerValue)
+                if item_final != self.normalized_final_value:
+                    matches = False
+            
+            if matches:
+                filtered_items.append(item)
+        
+        logger.info(f"After case-insensitive filtering: {len(filtered_items)} items (from {len(feedback_items)} total)")
+        return filtered_items
+
     def _build_confusion_matrix(self, feedback_items: List[FeedbackItem]) -> Dict[Tuple[str, str], List[FeedbackItem]]:
         """
         Build confusion matrix by grouping items into cells based on (initial_value, final_value) pairs.
@@ -943,16 +958,28 @@ class FeedbackItems(DataCache):
             scorecard_id=scorecard_id,
             score_id=score_id,
             account_id=self.account_id,
-            days=3650,  # 10 years - effectively "all time" using the efficient GSI query
+            days=self.ALL_TIME_LOOKBACK_DAYS,  # effectively "all time" using the efficient GSI query
             initial_value=None,
             final_value=None,
             limit=None,
             prioritize_edit_comments=False
         )
 
+        return self._select_backfill_items(all_items, initial_value, final_value, before_date, limit, existing_ids)
+
+    def _select_backfill_items(
+        self,
+        candidates: List[FeedbackItem],
+        initial_value: str,
+        final_value: str,
+        before_date: datetime,
+        limit: int,
+        existing_ids: set
+    ) -> List[FeedbackItem]:
+        """Pick the newest candidates in a matrix cell edited before ``before_date``."""
         # Filter items manually
         backfill_items = []
-        for item in all_items:
+        for item in candidates:
             # Skip if already in existing dataset
             if item.id in existing_ids:
                 continue
@@ -1007,6 +1034,14 @@ class FeedbackItems(DataCache):
 
         logger.info(f"Backfilling matrix cells (current total: {len(existing_ids)} items)")
 
+        # With a local corpus, extend its coverage back once and pick every cell's backfill locally
+        corpus_candidates = None
+        if self._feedback_corpus is not None:
+            corpus = self._feedback_corpus
+            lookback_start = datetime.now(timezone.utc) - timedelta(days=self.ALL_TIME_LOOKBACK_DAYS)
+            self._run_async(lambda: corpus.sync(lookback_start))
+            corpus_candidates = corpus.items(lookback_start)
+
         # Check each cell and backfill if needed
         for cell_key, cell_items in matrix_cells.items():
             initial_value, final_value = cell_key
@@ -1027,39 +1062,17 @@ class FeedbackItems(DataCache):
                 oldest_date = datetime.now(timezone.utc)
 
             # Fetch backfill items
-            try:
-                # Try to get the current event loop
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # If we're in a running loop, create a task
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(
-                            lambda: asyncio.run(self._fetch_backfill_items_for_cell(
-                                scorecard_id, score_id, initial_value, final_value,
-                                oldest_date, needed, existing_ids
-                            ))
-                        )
-                        backfill_items = future.result()
-                else:
-                    # If no running loop, use asyncio.run
-                    backfill_items = asyncio.run(self._fetch_backfill_items_for_cell(
+            if corpus_candidates is not None:
+                backfill_items = self._select_backfill_items(
+                    corpus_candidates, initial_value, final_value, oldest_date, needed, existing_ids
+                )
+            else:
+                backfill_items = self._run_async(
+                    lambda: self._fetch_backfill_items_for_cell(
                         scorecard_id, score_id, initial_value, final_value,
                         oldest_date, needed, existing_ids
-                    ))
-            except RuntimeError:
-                # Fallback: create new event loop
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    backfill_items = new_loop.run_until_complete(
-                        self._fetch_backfill_items_for_cell(
-                            scorecard_id, score_id, initial_value, final_value,
-                            oldest_date, needed, existing_ids
-                        )
                     )
-                finally:
-                    new_loop.close()
+                )
 
             # Add backfill items to the cell
             if backfill_items:
@@ -1182,6 +1195,8 @@ class FeedbackItems(DataCache):
         # Create properly formatted dataset rows
         rows = []
         skipped_feedback_item_ids = []
+        # Items whose extracted identifiers need Identifier records; upserted in bulk below
+        pending_item_upserts = []
         
         for i, feedback_item in enumerate(feedback_items):
             # content_id: Use DynamoDB item ID
@@ -1243,7 +1258,7 @@ class FeedbackItems(DataCache):
             metadata = json.dumps(metadata_dict)
             
             # IDs: Create hash of identifiers from Item
-            ids_hash = self._create_ids_hash(feedback_item)
+            ids_hash = self._create_ids_hash(feedback_item, pending_item_upserts)
             
             # Score comment: Complex logic for determining the comment
             score_comment = self._determine_score_comment(feedback_item)
@@ -1277,6 +1292,8 @@ class FeedbackItems(DataCache):
             # Only debug first few items to avoid too much output
             # Processing feedback items for dataset creation
         
+        self._upsert_dataset_items(pending_item_upserts)
+
         # Create DataFrame with proper column structure even when empty
         if not rows:
             # Create empty DataFrame with expected columns (IDs first, then metadata, then text)
@@ -1446,7 +1463,74 @@ class FeedbackItems(DataCache):
                 logger.error(f"  metadata['{key}'] = {value} (type: {type(value)})")
             raise
     
-    def _create_ids_hash(self, feedback_item: FeedbackItem) -> str:
+    def _upsert_dataset_items(self, pending_item_upserts: List[Tuple[str, Any, Dict[str, str], str]]) -> None:
+        """
+        Upsert the Items collected while building the dataset, with their identifiers.
+        
+        All rows go through one bulk upsert per account on a single client; rows the
+        bulk upsert reports as failed are retried one at a time.
+        
+        Args:
+            pending_item_upserts: (account_id, item, identifiers_dict, external_id) tuples
+        """
+        if not pending_item_upserts:
+            return
+
+        try:
+            dashboard_client = create_client()
+            # Get the resolved score ID for associating Items with scores
+            _, _, score_id, _ = self._resolve_identifiers()
+        except Exception as e:
+            logger.warning(f"IDENTIFIERS_DEBUG: Could not prepare Item upserts: {e}")
+            return
+
+        rows_by_account: Dict[str, List[Tuple[Any, Dict[str, str], str]]] = {}
+        for account_id, item, identifiers_dict, external_id in pending_item_upserts:
+            rows_by_account.setdefault(account_id, []).append((item, identifiers_dict, external_id))
+
+        for account_id, account_rows in rows_by_account.items():
+            logger.info(f"IDENTIFIERS_DEBUG: Upserting {len(account_rows)} Items with identifiers in bulk")
+            results = self.upsert_items_for_dataset_rows(
+                dashboard_client=dashboard_client,
+                account_id=account_id,
+                rows=[
+                    {
+                        'externalId': external_id,
+                        'description': getattr(item, 'description', None),
+                        'text': getattr(item, 'text', None),
+                        'metadata': getattr(item, 'metadata', None),
+                        'identifiers': identifiers_dict,
+                    }
+                    for item, identifiers_dict, external_id in account_rows
+                ],
+                score_id=score_id  # Associate Items with the score being evaluated
+            )
+            failed_rows = [
+                row for row, (_, _, error_msg) in zip(account_rows, results) if error_msg
+            ]
+            if failed_rows:
+                logger.warning(
+                    f"IDENTIFIERS_DEBUG: Bulk upsert failed for {len(failed_rows)} Items; retrying them one at a time"
+                )
+            for item, identifiers_dict, external_id in failed_rows:
+                item_id, was_created, error_msg = self.upsert_item_for_dataset_row(
+                    dashboard_client=dashboard_client,
+                    account_id=account_id,
+                    item_data=item,
+                    identifiers_dict=identifiers_dict,
+                    external_id=external_id,
+                    score_id=score_id
+                )
+                if error_msg:
+                    logger.warning(f"IDENTIFIERS_DEBUG: Error upserting Item with identifiers: {error_msg}")
+                else:
+                    logger.info(f"IDENTIFIERS_DEBUG: Successfully upserted Item {item_id} (was_created: {was_created})")
+
+    def _create_ids_hash(
+        self,
+        feedback_item: FeedbackItem,
+        pending_item_upserts: Optional[List[Tuple[str, Any, Dict[str, str], str]]] = None
+    ) -> str:
         """
         Create IDs hash from Item identifiers, using identifier extractor if available.
         
@@ -1454,6 +1538,8 @@ class FeedbackItems(DataCache):
         
         Args:
             feedback_item: The feedback item with associated item data
+            pending_item_upserts: When given, Items that need Identifier records are
+                appended here for `_upsert_dataset_items` instead of upserted right away
             
         Returns:
             JSON string containing identifier hash
@@ -1481,7 +1567,11 @@ class FeedbackItems(DataCache):
                             identifiers_dict[name] = str(identifier['value'])
                     
                     # Upsert the Item with extracted identifiers to ensure it has proper Identifier records
-                    if identifiers_dict:
+                    if identifiers_dict and pending_item_upserts is not None:
+                        pending_item_upserts.append(
+                            (feedback_item.accountId, item, identifiers_dict, item.externalId or item.id)
+                        )
+                    elif identifiers_dict:
                         logger.info(f"IDENTIFIERS_DEBUG: Upserting Item {item.id} with identifiers: {identifiers_dict}")
                         try:
                             # Create a dashboard client for Item operations
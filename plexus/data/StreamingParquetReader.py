@@ -0,0 +1,105 @@
+"""
+Row-group streaming over Parquet datasets.
+
+Evaluations usually score a sample of a much larger dataset. Loading the whole
+file with ``pd.read_parquet`` keeps every transcript in memory only to throw
+most of them away. ``StreamingParquetReader`` reads the file in record batches,
+projecting only the requested columns, and keeps just the rows that are
+selected:
+
+    reader = StreamingParquetReader(path)
+    df = reader.sample_dataframe(1000, random_state=42)
+
+Random samples choose row positions the same way ``DataFrame.sample`` does
+(``RandomState(seed).choice(num_rows, n, replace=False)``), so a seeded sample
+picks the same rows, in the same order, as it did when the file was loaded in
+full.
+"""
+
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1024
+
+
+class StreamingParquetReader:
+    """Streams a Parquet file in record batches and samples rows in one pass."""
+
+    def __init__(
+        self,
+        path: str,
+        columns: Optional[Sequence[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self._file = pq.ParquetFile(path)
+        available = self._file.schema_arrow.names
+        if columns is not None:
+            missing = [column for column in columns if column not in available]
+            if missing:
+                logger.warning(f"Columns not found in {path}: {missing}")
+            columns = [column for column in columns if column in available]
+        self.columns: List[str] = list(columns) if columns is not None else list(available)
+
+    @property
+    def num_rows(self) -> int:
+        """Row count from the file footer; no data is read."""
+        return self._file.metadata.num_rows
+
+    def iter_batches(self) -> Iterator[pa.RecordBatch]:
+        yield from self._file.iter_batches(batch_size=self.batch_size, columns=self.columns)
+
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """Yield rows as dicts, one record batch in memory at a time."""
+        for batch in self.iter_batches():
+            yield from batch.to_pylist()
+
+    def _take_positions(self, positions: np.ndarray) -> pd.DataFrame:
+        """Read only the rows at ``positions`` (in that order), batch by batch."""
+        if len(positions) == 0:
+            return self._file.schema_arrow.empty_table().select(self.columns).to_pandas()
+        wanted = np.sort(positions)
+        last_wanted = int(wanted[-1])
+        pieces = []
+        offset = 0
+        for batch in self.iter_batches():
+            end = offset + batch.num_rows
+            lo, hi = np.searchsorted(wanted, [offset, end])
+            if hi > lo:
+                pieces.append(batch.take(pa.array(wanted[lo:hi] - offset)))
+            offset = end
+            if offset > last_wanted:
+                break
+        selected = pa.Table.from_batches(pieces).to_pandas()
+        # Restore the requested order (DataFrame.sample returns rows in draw order).
+        order = np.argsort(np.argsort(positions, kind="stable"), kind="stable")
+        selected = selected.iloc[order]
+        selected.index = pd.Index(positions)
+        return selected
+
+    def head_dataframe(self, n: int) -> pd.DataFrame:
+        """First ``n`` rows; stops reading once they are collected."""
+        return self._take_positions(np.arange(min(max(n, 0), self.num_rows)))
+
+    def sample_dataframe(self, n: Optional[int], random_state: Optional[int] = None) -> pd.DataFrame:
+        """
+        Random sample of ``n`` rows without replacement; the full file when
+        ``n`` is None or at least ``num_rows``.
+        """
+        total = self.num_rows
+        if n is None or n >= total:
+            return self.read_dataframe()
+        rng = np.random.RandomState(random_state) if random_state is not None else np.random
+        positions = rng.choice(total, size=n, replace=False).astype(np.intp, copy=False)
+        return self._take_positions(positions)
+
+    def read_dataframe(self) -> pd.DataFrame:
+        return self._file.read(columns=self.columns).to_pandas()
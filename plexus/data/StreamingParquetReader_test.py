@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plexus.data.StreamingParquetReader import StreamingParquetReader
+
+
+@pytest.fixture
+def parquet_path(tmp_path):
+    df = pd.DataFrame({
+        'content_id': [f'c{i}' for i in range(2000)],
+        'text': [f'transcript {i}' for i in range(2000)],
+        'Greeting': np.where(np.arange(2000) % 2 == 0, 'Yes', 'No'),
+    })
+    path = tmp_path / 'dataset.parquet'
+    df.to_parquet(path, index=False, row_group_size=300)
+    return str(path), df
+
+
+def test_seeded_sample_matches_dataframe_sample(parquet_path):
+    path, df = parquet_path
+    reader = StreamingParquetReader(path, batch_size=128)
+
+    sampled = reader.sample_dataframe(50, random_state=7)
+
+    pd.testing.assert_frame_equal(sampled, df.sample(n=50, random_state=7))
+
+
+def test_projects_columns_and_reads_head(parquet_path):
+    path, df = parquet_path
+    reader = StreamingParquetReader(path, columns=['content_id', 'Greeting', 'missing'])
+
+    head = reader.head_dataframe(5)
+
+    assert reader.num_rows == 2000
+    assert head.columns.tolist() == ['content_id', 'Greeting']
+    assert head['content_id'].tolist() == ['c0', 'c1', 'c2', 'c3', 'c4']
+
+
+def test_full_read_when_sample_covers_file(parquet_path):
+    path, df = parquet_path
+    reader = StreamingParquetReader(path)
+
+    assert len(reader.sample_dataframe(5000, random_state=1)) == 2000
+    assert len(reader.sample_dataframe(None)) == 2000
+    assert reader.sample_dataframe(0).empty
+
+
+def test_iter_rows_streams_dicts(parquet_path):
+    path, _ = parquet_path
+    reader = StreamingParquetReader(path, columns=['content_id'], batch_size=100)
+
+    rows = reader.iter_rows()
+
+    assert next(rows) == {'content_id': 'c0'}
+    assert sum(1 for _ in rows) == 1999
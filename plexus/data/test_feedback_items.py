@@ -996,3 +996,133 @@ def test_fetch_feedback_items_for_scores_excludes_invalid_items():
 
         assert "score-1" in result
         assert [item.id for item in result["score-1"]] == ["valid-1"]
+
+
+def test_reload_refreshes_every_cached_id_from_the_api_even_with_a_corpus(tmp_path):
+    """Reload never serves corpus rows: invalidation changes values without moving editedAt."""
+    from datetime import datetime, timezone
+    from plexus.dashboard.api.models.feedback_item import FeedbackItem
+
+    with patch('plexus.data.FeedbackItems.create_client') as mock_create_client, \
+         patch('plexus.data.FeedbackItems.resolve_account_id_for_command') as mock_resolve_account:
+
+        mock_create_client.return_value = Mock()
+        mock_resolve_account.return_value = 'test-account-id'
+
+        feedback_items = FeedbackItems(
+            scorecard='test_scorecard',
+            score='test_score',
+            days=14,
+            local_cache_directory=str(tmp_path),
+            feedback_corpus=True,
+        )
+
+    edited_at = datetime.now(timezone.utc)
+
+    def feedback_item(final_value, edit_comment):
+        return FeedbackItem.from_dict({
+            "id": "fb-1",
+            "accountId": "test-account-id",
+            "scorecardId": "scorecard-1",
+            "scoreId": "score-1",
+            "itemId": "item-1",
+            "initialAnswerValue": "Yes",
+            "finalAnswerValue": final_value,
+            "editCommentValue": edit_comment,
+            "isInvalid": False,
+            "editedAt": edited_at.isoformat(),
+            "item": {"id": "item-1", "text": "text", "metadata": "{}", "identifiers": []},
+        })
+
+    # The corpus still holds the value from before the latest change.
+    corpus = feedback_items._get_feedback_corpus("scorecard-1", "score-1")
+    corpus.merge([feedback_item("Yes", None)])
+    corpus.covered_from = edited_at
+    corpus.save()
+
+    cached = pd.DataFrame({
+        'feedback_item_id': ['fb-1', 'fb-gone'],
+        'test_score': ['Yes', 'Yes'],
+        'test_score comment': ['old', 'old'],
+        'test_score edit comment': ['', ''],
+        'metadata': ['{}', '{}'],
+    })
+    feedback_items._save_to_cache(cached, 'reload-test')
+
+    with patch('plexus.data.FeedbackCorpus.FeedbackService.find_feedback_items') as find_feedback_items, \
+         patch.object(feedback_items, '_fetch_specific_feedback_items',
+                      return_value=[feedback_item("No", "Corrected")]) as fetch_specific, \
+         patch.object(feedback_items, '_create_metadata_structure', return_value='{"refreshed": true}'):
+        result = feedback_items._perform_reload('reload-test', 'scorecard-1', 'score-1', 'Scorecard', 'test_score')
+
+    find_feedback_items.assert_not_called()
+    fetch_specific.assert_called_once_with(['fb-1', 'fb-gone'])
+    assert result['test_score'].tolist() == ['No', 'Yes']
+    assert result['test_score edit comment'].tolist() == ['Corrected', '']
+    assert result['metadata'].tolist() == ['{"refreshed": true}', '{}']
+
+
+def test_create_dataset_rows_upserts_extracted_identifiers_in_bulk():
+    """Items with extracted identifiers are upserted in one bulk call on one client."""
+
+    with patch('plexus.data.FeedbackItems.create_client') as mock_create_client, \
+         patch('plexus.data.FeedbackItems.resolve_account_id_for_command') as mock_resolve_account:
+        mock_create_client.return_value = Mock()
+        mock_resolve_account.return_value = 'test-account-id'
+        feedback_items = FeedbackItems(scorecard='test_scorecard', score='test_score', days=14)
+
+    def make_feedback_item(index):
+        item = Mock()
+        item.id = f'item-{index}'
+        item.externalId = f'ext-{index}'
+        item.description = None
+        item.text = f'transcript {index}'
+        item.metadata = {'source': 'test'}
+        item.identifiers = None
+        item.createdAt = item.updatedAt = '2024-01-01T00:00:00Z'
+        feedback_item = Mock()
+        feedback_item.id = f'feedback-{index}'
+        feedback_item.itemId = item.id
+        feedback_item.item = item
+        feedback_item.accountId = 'account-789'
+        feedback_item.scorecardId = 'scorecard-123'
+        feedback_item.scoreId = 'score-456'
+        feedback_item.editorName = 'Test Editor'
+        feedback_item.isAgreement = False
+        feedback_item.cacheKey = f'cache-key-{index}'
+        feedback_item.initialAnswerValue = 'No'
+        feedback_item.finalAnswerValue = 'Yes'
+        feedback_item.editCommentValue = None
+        feedback_item.initialCommentValue = None
+        feedback_item.finalCommentValue = None
+        feedback_item.createdAt = feedback_item.updatedAt = feedback_item.editedAt = '2024-01-01T00:00:00Z'
+        return feedback_item
+
+    feedback_items.identifier_extractor = Mock()
+    feedback_items.identifier_extractor.extract_identifiers.side_effect = lambda feedback_item: [
+        {'name': 'Form ID', 'value': feedback_item.item.id.replace('item', 'form')}
+    ]
+
+    with patch('plexus.data.FeedbackItems.create_client') as mock_create_client, \
+         patch.object(feedback_items, '_resolve_identifiers', return_value=('sc-1', 'Scorecard', 'score-1', 'Score')), \
+         patch.object(feedback_items, 'upsert_items_for_dataset_rows', return_value=[
+             ('item-0', False, None), (None, False, 'throttled'), ('item-2', True, None)
+         ]) as bulk_upsert, \
+         patch.object(feedback_items, 'upsert_item_for_dataset_row', return_value=('item-1', False, None)) as row_upsert:
+        df = feedback_items._create_dataset_rows([make_feedback_item(i) for i in range(3)], "Test Score")
+
+    assert len(df) == 3
+    mock_create_client.assert_called_once()
+    bulk_upsert.assert_called_once()
+    bulk_kwargs = bulk_upsert.call_args.kwargs
+    assert bulk_kwargs['account_id'] == 'account-789'
+    assert bulk_kwargs['score_id'] == 'score-1'
+    assert [row['identifiers'] for row in bulk_kwargs['rows']] == [
+        {'form_id': 'form-0'}, {'form_id': 'form-1'}, {'form_id': 'form-2'}
+    ]
+    assert [row['externalId'] for row in bulk_kwargs['rows']] == ['ext-0', 'ext-1', 'ext-2']
+
+    # Only the row the bulk upsert reported as failed goes through the per-row path.
+    row_upsert.assert_called_once()
+    assert row_upsert.call_args.kwargs['external_id'] == 'ext-1'
+    assert row_upsert.call_args.kwargs['dashboard_client'] is bulk_kwargs['dashboard_client']
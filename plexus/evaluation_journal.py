@@ -0,0 +1,179 @@
+"""
+Append-only local journal of completed evaluation results.
+
+When an evaluation runs with ``--journal`` (or ``--resume``), every item it
+finishes scoring is appended to ``.plexus/cache/evaluations/<evaluation_id>.jsonl``
+(directory overridable with ``PLEXUS_EVALUATION_JOURNAL_DIR``). The first line
+records the sample: the random seed actually used and the sampled content IDs.
+Writes go through a background thread, so the scoring loop never waits on disk,
+and the journal is deleted once the evaluation completes.
+
+If a run crashes or is cancelled, ``plexus evaluate accuracy --resume
+<evaluation_id>`` reads the journal back, draws the same sample, skips the items
+that already have results, rebuilds metrics from the journaled results and keeps
+posting to the same evaluation record.
+"""
+
+import json
+import os
+import queue
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+from plexus.CustomLogging import logging
+
+JOURNAL_DIRECTORY = os.path.join(".plexus", "cache", "evaluations")
+JOURNAL_DIR_ENV_VAR = "PLEXUS_EVALUATION_JOURNAL_DIR"
+
+_STOP = object()
+
+
+def _serialize_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    record = {}
+    for key, value in result.items():
+        if key == "results" and isinstance(value, dict):
+            record[key] = {
+                name: score_result.model_dump(exclude_none=True) if hasattr(score_result, "model_dump") else score_result
+                for name, score_result in value.items()
+            }
+        else:
+            record[key] = value
+    return record
+
+
+def _deserialize_result(record: Dict[str, Any]) -> Dict[str, Any]:
+    from plexus.scores.Score import Score
+
+    result = dict(record)
+    result["results"] = {
+        name: Score.Result.model_validate(score_result)
+        for name, score_result in (record.get("results") or {}).items()
+    }
+    return result
+
+
+class EvaluationJournal:
+    """JSONL journal of ``(score, content_id, result)`` records for one evaluation."""
+
+    def __init__(self, evaluation_id: str, directory: Optional[str] = None):
+        if directory is None:
+            directory = os.getenv(JOURNAL_DIR_ENV_VAR, JOURNAL_DIRECTORY)
+        self.evaluation_id = evaluation_id
+        self.path = os.path.join(directory, f"{evaluation_id}.jsonl")
+        self.written = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def write_sample(self, random_seed: Optional[int], content_ids: Iterable[Any]) -> None:
+        """Start a new journal whose first line records the sample being scored."""
+        self.close()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        header = {"sample": {"random_seed": random_seed, "content_ids": [str(content_id) for content_id in content_ids]}}
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(header) + "\n")
+
+    def read_sample(self) -> Optional[Dict[str, Any]]:
+        """The sample recorded by ``write_sample``, or None if there is none."""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                record = json.loads(f.readline() or "{}")
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read the sample from evaluation journal {self.path}: {e}")
+            return None
+        sample = record.get("sample")
+        return sample if isinstance(sample, dict) else None
+
+    def discard(self) -> None:
+        """Stop writing and delete the journal (the evaluation completed)."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning(f"Could not delete evaluation journal {self.path}: {e}")
+
+    def append(self, score_name: str, result: Dict[str, Any]) -> None:
+        """Queue one completed result for writing."""
+        try:
+            line = json.dumps(
+                {"score": score_name, "result": _serialize_result(result)},
+                default=str,
+            )
+        except Exception as e:
+            logging.warning(f"Could not journal result for {result.get('content_id')}: {e}")
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._write_lines, name="evaluation-journal", daemon=True
+                )
+                self._thread.start()
+        self._queue.put(line)
+
+    def _write_lines(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                while True:
+                    line = self._queue.get()
+                    stop = line is _STOP
+                    lines = [] if stop else [line]
+                    # Drain whatever else is queued so one flush covers the batch.
+                    while not stop:
+                        try:
+                            line = self._queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if line is _STOP:
+                            stop = True
+                        else:
+                            lines.append(line)
+                    if lines:
+                        f.write("\n".join(lines) + "\n")
+                        f.flush()
+                        self.written += len(lines)
+                    if stop:
+                        return
+        except Exception as e:
+            logging.warning(f"Evaluation journal {self.path} stopped writing: {e}")
+
+    def close(self) -> None:
+        """Flush queued records and stop the writer thread."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join()
+
+    def completed_results(self, score_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Journaled results for ``score_name``, keyed by content ID.
+
+        A truncated final line from an interrupted write is ignored; if an item
+        was journaled twice, the later record wins.
+        """
+        completed: Dict[str, Dict[str, Any]] = {}
+        if not os.path.exists(self.path):
+            return completed
+        with open(self.path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                    if "sample" in record or record.get("score") != score_name:
+                        continue
+                    result = _deserialize_result(record["result"])
+                except Exception as e:
+                    logging.warning(f"Skipping unreadable journal line {line_number} in {self.path}: {e}")
+                    continue
+                content_id = str(result.get("content_id") or "")
+                if content_id:
+                    completed[content_id] = result
+        return completed
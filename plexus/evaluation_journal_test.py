@@ -0,0 +1,80 @@
+import json
+
+from plexus.evaluation_journal import EvaluationJournal
+from plexus.scores.Score import Score
+
+
+def make_result(content_id, value="Yes"):
+    return {
+        "content_id": content_id,
+        "session_id": content_id,
+        "form_id": "form-1",
+        "results": {
+            "Greeting": Score.Result(
+                parameters=Score.Parameters(name="Greeting", scorecard_name="Test"),
+                value=value,
+                explanation="because",
+                metadata={"human_label": "Yes", "correct": value == "Yes"},
+            )
+        },
+        "human_labels": {"Greeting": "Yes"},
+    }
+
+
+def test_round_trips_results_by_score(tmp_path):
+    journal = EvaluationJournal("eval-1", directory=str(tmp_path))
+    journal.append("Greeting", make_result("c1"))
+    journal.append("Greeting", make_result("c2", value="No"))
+    journal.append("Other", make_result("c3"))
+    journal.close()
+
+    assert journal.written == 3
+    completed = EvaluationJournal("eval-1", directory=str(tmp_path)).completed_results("Greeting")
+
+    assert set(completed) == {"c1", "c2"}
+    restored = completed["c2"]["results"]["Greeting"]
+    assert isinstance(restored, Score.Result)
+    assert restored.value == "No"
+    assert restored.metadata["correct"] is False
+    assert completed["c2"]["human_labels"] == {"Greeting": "Yes"}
+
+
+def test_appends_across_runs_and_later_records_win(tmp_path):
+    first = EvaluationJournal("eval-1", directory=str(tmp_path))
+    first.append("Greeting", make_result("c1", value="No"))
+    first.close()
+
+    second = EvaluationJournal("eval-1", directory=str(tmp_path))
+    second.append("Greeting", make_result("c1", value="Yes"))
+    second.close()
+
+    completed = second.completed_results("Greeting")
+    assert completed["c1"]["results"]["Greeting"].value == "Yes"
+
+
+def test_ignores_truncated_lines(tmp_path):
+    journal = EvaluationJournal("eval-1", directory=str(tmp_path))
+    journal.append("Greeting", make_result("c1"))
+    journal.close()
+    with open(journal.path, "a") as f:
+        f.write(json.dumps({"score": "Greeting", "result": {"content_id": "c2"}})[:20])
+
+    assert set(journal.completed_results("Greeting")) == {"c1"}
+
+
+def test_missing_journal_has_no_results(tmp_path):
+    assert EvaluationJournal("unknown", directory=str(tmp_path)).completed_results("Greeting") == {}
+
+
+def test_sample_header_round_trips_and_is_not_a_result(tmp_path):
+    journal = EvaluationJournal("eval-1", directory=str(tmp_path))
+    journal.write_sample(1234, ["c1", 2])
+    journal.append("Greeting", make_result("c1"))
+    journal.close()
+
+    reopened = EvaluationJournal("eval-1", directory=str(tmp_path))
+    assert reopened.read_sample() == {"random_seed": 1234, "content_ids": ["c1", "2"]}
+    assert set(reopened.completed_results("Greeting")) == {"c1"}
+
+    reopened.discard()
+    assert reopened.read_sample() is None
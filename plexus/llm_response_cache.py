@@ -0,0 +1,254 @@
+"""
+Content-hash response cache for deterministic LangGraph node LLM calls.
+
+Nodes built on ``BaseNode`` attach ``ACTIVE_RESPONSE_CACHE`` to their chat
+model when the call is deterministic (temperature 0 on a model that honours
+it). That proxy forwards to the ``LLMResponseCache`` active in the current
+context, so caching is switched on per evaluation run rather than globally:
+
+    cache = LLMResponseCache("tmp/llm_cache/responses.sqlite")
+    with caching(cache):
+        await evaluation.run()
+    cache.stats()   # hits / misses / hit_rate / entries / bytes / evictions
+
+Entries are keyed by a SHA-256 of the model id and parameters (LangChain's
+``llm_string``) and the fully rendered messages, and stored in SQLite with
+least-recently-used eviction once the store exceeds ``max_bytes``.
+
+Evaluations create a cache automatically when ``PLEXUS_LLM_CACHE`` is set.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+from langchain_core.outputs import ChatGeneration
+
+from plexus.CustomLogging import logging
+
+LLM_CACHE_ENV_VAR = "PLEXUS_LLM_CACHE"
+LLM_CACHE_PATH_ENV_VAR = "PLEXUS_LLM_CACHE_PATH"
+LLM_CACHE_MAX_MB_ENV_VAR = "PLEXUS_LLM_CACHE_MAX_MB"
+DEFAULT_CACHE_PATH = os.path.join("tmp", "llm_cache", "responses.sqlite")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Eviction trims the store to this fraction of max_bytes so it does not run on every write.
+_EVICTION_TARGET = 0.9
+
+_active_cache: ContextVar[Optional["LLMResponseCache"]] = ContextVar(
+    "plexus_active_llm_response_cache", default=None
+)
+
+
+def llm_cache_enabled_from_env() -> bool:
+    return os.getenv(LLM_CACHE_ENV_VAR, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _strip_usage(generation: Any) -> Any:
+    """Drop token usage from a cached generation so replays are not billed as new calls."""
+    if not isinstance(generation, ChatGeneration):
+        return generation
+    message = generation.message.model_copy(deep=True)
+    if getattr(message, "usage_metadata", None) is not None:
+        message.usage_metadata = None
+    message.response_metadata = {
+        key: value
+        for key, value in (message.response_metadata or {}).items()
+        if key not in ("token_usage", "usage")
+    }
+    return generation.model_copy(update={"message": message})
+
+
+class LLMResponseCache(BaseCache):
+    """SQLite-backed LangChain cache keyed by a hash of model settings and messages."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+        )
+        self._connection.commit()
+
+    @classmethod
+    def from_env(cls) -> Optional["LLMResponseCache"]:
+        """Return a cache if ``PLEXUS_LLM_CACHE`` is enabled, otherwise None."""
+        if not llm_cache_enabled_from_env():
+            return None
+        path = os.getenv(LLM_CACHE_PATH_ENV_VAR) or DEFAULT_CACHE_PATH
+        max_bytes = DEFAULT_MAX_BYTES
+        max_mb = os.getenv(LLM_CACHE_MAX_MB_ENV_VAR, "").strip()
+        if max_mb:
+            try:
+                max_bytes = int(float(max_mb) * 1024 * 1024)
+            except ValueError:
+                logging.warning(f"Invalid {LLM_CACHE_MAX_MB_ENV_VAR}={max_mb!r}; using default")
+        try:
+            return cls(path, max_bytes=max_bytes)
+        except Exception as e:
+            logging.warning(f"Could not open LLM response cache at {path}: {e}")
+            return None
+
+    @staticmethod
+    def key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        key = self.key(prompt, llm_string)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._connection.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            self._connection.commit()
+            self.hits += 1
+        try:
+            return [loads(generation) for generation in json.loads(row[0])]
+        except Exception as e:
+            logging.warning(f"Discarding unreadable LLM cache entry: {e}")
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        value = json.dumps([dumps(_strip_usage(generation)) for generation in return_val])
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                (self.key(prompt, llm_string), value, size, time.time()),
+            )
+            self._evict_locked()
+            self._connection.commit()
+
+    def _evict_locked(self) -> None:
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * _EVICTION_TARGET
+        rows = self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY last_used ASC"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= target:
+                break
+            evicted.append((key,))
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process plus the size of the store."""
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+            "evictions": self.evictions,
+        }
+
+
+class _ActiveResponseCache(BaseCache):
+    """Forwards to the cache active in the current context; a no-op when none is."""
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        cache = _active_cache.get()
+        return cache.lookup(prompt, llm_string) if cache is not None else None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        cache = _active_cache.get()
+        if cache is not None:
+            cache.update(prompt, llm_string, return_val)
+
+    # Resolve the active cache on the calling task before LangChain's default
+    # executor hop, so the lookup sees this evaluation's cache.
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        cache = _active_cache.get()
+        return await cache.alookup(prompt, llm_string) if cache is not None else None
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        cache = _active_cache.get()
+        if cache is not None:
+            await cache.aupdate(prompt, llm_string, return_val)
+
+    def clear(self, **kwargs: Any) -> None:
+        cache = _active_cache.get()
+        if cache is not None:
+            cache.clear(**kwargs)
+
+
+ACTIVE_RESPONSE_CACHE = _ActiveResponseCache()
+
+
+def get_active_cache() -> Optional[LLMResponseCache]:
+    return _active_cache.get()
+
+
+@contextmanager
+def caching(cache: Optional[LLMResponseCache]) -> Iterator[Optional[LLMResponseCache]]:
+    """Make ``cache`` the response cache for deterministic node calls in this context."""
+    token = _active_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_cache.reset(token)
+
+
+def is_deterministic(model_provider: str, model_name: Optional[str], temperature: Optional[float]) -> bool:
+    """
+    True when a call with these settings should return the same response every time.
+
+    Requires temperature 0 and excludes OpenAI reasoning models (gpt-5*, o*),
+    which ignore the temperature setting.
+    """
+    if temperature is None or float(temperature) != 0.0:
+        return False
+    model = (model_name or "").lower()
+    if "gpt-5" in model:
+        return False
+    if model_provider in ("ChatOpenAI", "AzureChatOpenAI") and model.startswith("o"):
+        return False
+    return True
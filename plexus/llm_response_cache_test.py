@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration
+
+from plexus.llm_response_cache import (
+    ACTIVE_RESPONSE_CACHE,
+    LLMResponseCache,
+    caching,
+    get_active_cache,
+    is_deterministic,
+)
+
+
+def make_model(*replies):
+    model = GenericFakeChatModel(messages=iter([AIMessage(content=reply) for reply in replies]))
+    model.cache = ACTIVE_RESPONSE_CACHE
+    return model
+
+
+def test_hits_after_first_call_and_reports_stats(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "responses.sqlite"))
+    model = make_model("Yes", "No")
+
+    with caching(cache):
+        first = model.invoke([HumanMessage(content="Is this a greeting?")])
+        second = model.invoke([HumanMessage(content="Is this a greeting?")])
+        other = model.invoke([HumanMessage(content="Is this a complaint?")])
+
+    assert first.content == second.content == "Yes"
+    assert other.content == "No"
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["entries"] == 2
+    assert stats["hit_rate"] == pytest.approx(1 / 3, abs=1e-4)
+
+
+def test_entries_persist_across_cache_instances(tmp_path):
+    path = str(tmp_path / "responses.sqlite")
+    with caching(LLMResponseCache(path)):
+        make_model("Yes").invoke("hello")
+
+    rerun = LLMResponseCache(path)
+    with caching(rerun):
+        assert make_model("different").invoke("hello").content == "Yes"
+    assert rerun.hits == 1
+
+
+def test_async_calls_use_the_active_cache(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "responses.sqlite"))
+    model = make_model("Yes", "No")
+
+    async def run():
+        with caching(cache):
+            first = await model.ainvoke("hello")
+            second = await model.ainvoke("hello")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first.content == second.content == "Yes"
+    assert cache.hits == 1
+
+
+def test_no_caching_outside_an_active_context(tmp_path):
+    model = make_model("Yes", "No")
+
+    assert get_active_cache() is None
+    assert model.invoke("hello").content == "Yes"
+    assert model.invoke("hello").content == "No"
+
+
+def test_cached_responses_drop_token_usage(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "responses.sqlite"))
+    message = AIMessage(
+        content="Yes",
+        usage_metadata={"input_tokens": 10, "output_tokens": 1, "total_tokens": 11},
+        response_metadata={"token_usage": {"total_tokens": 11}, "model_name": "gpt-4o-mini"},
+    )
+    cache.update("prompt", "llm", [ChatGeneration(message=message)])
+
+    cached = cache.lookup("prompt", "llm")[0].message
+    assert cached.content == "Yes"
+    assert cached.usage_metadata is None
+    assert cached.response_metadata == {"model_name": "gpt-4o-mini"}
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "responses.sqlite"), max_bytes=5000)
+    generation = [ChatGeneration(message=AIMessage(content="x" * 300))]
+
+    for i in range(8):
+        cache.update(f"prompt {i}", "llm", generation)
+        cache.lookup("prompt 0", "llm")
+
+    stats = cache.stats()
+    assert stats["evictions"] > 0
+    assert stats["bytes"] <= 5000
+    assert cache.lookup("prompt 0", "llm") is not None
+    assert cache.lookup("prompt 1", "llm") is None
+
+
+def test_is_deterministic():
+    assert is_deterministic("ChatOpenAI", "gpt-4o-mini", 0)
+    assert is_deterministic("BedrockChat", "anthropic.claude-3-haiku", 0.0)
+    assert not is_deterministic("ChatOpenAI", "gpt-4o-mini", 0.7)
+    assert not is_deterministic("ChatOpenAI", "gpt-4o-mini", None)
+    assert not is_deterministic("AzureChatOpenAI", "gpt-5-mini", 0)
+    assert not is_deterministic("ChatOpenAI", "o3-mini", 0)
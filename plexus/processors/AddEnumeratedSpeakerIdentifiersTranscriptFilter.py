@@ -29,16 +29,10 @@ class AddEnumeratedSpeakerIdentifiersTranscriptFilter(Processor):
         Returns:
             Score.Input with enumerated speaker identifiers
         """
-        from plexus.scores.Score import Score
-
         enumerated_text = self.enumerate_speakers(score_input.text)
 
-        # Return new Score.Input with enumerated text
-        return Score.Input(
-            text=enumerated_text,
-            metadata=score_input.metadata,
-            results=score_input.results
-        )
+        # Return a derived Score.Input with enumerated text
+        return score_input.derive(text=enumerated_text)
 
     def enumerate_speakers(self, text: str) -> str:
         """
@@ -21,8 +21,6 @@ class AddUnknownSpeakerIdentifiersTranscriptFilter(Processor):
         Returns:
             Score.Input with speaker identifiers replaced
         """
-        from plexus.scores.Score import Score
-
         # Replace all speaker identifiers with 'Unknown Speaker:'
         modified_text = re.sub(
             r'(?:^|\b)\w+:\s*',
@@ -31,10 +29,6 @@ class AddUnknownSpeakerIdentifiersTranscriptFilter(Processor):
             flags=re.MULTILINE
         )
 
-        # Return new Score.Input with modified text
-        return Score.Input(
-            text=modified_text,
-            metadata=score_input.metadata,
-            results=score_input.results
-        )
+        # Return a derived Score.Input with modified text
+        return score_input.derive(text=modified_text)
 
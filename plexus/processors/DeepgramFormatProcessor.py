@@ -39,8 +39,6 @@ class DeepgramFormatProcessor(Processor):
     """
 
     def process(self, score_input: 'Score.Input') -> 'Score.Input':
-        from plexus.scores.Score import Score
-
         deepgram = score_input.metadata.get('deepgram')
         if not deepgram:
             return score_input
@@ -70,11 +68,7 @@ class DeepgramFormatProcessor(Processor):
                 "Must be one of: paragraphs, sentences, words"
             )
 
-        return Score.Input(
-            text=text,
-            metadata=score_input.metadata,
-            results=score_input.results,
-        )
+        return score_input.derive(text=text)
 
     def _collect_paragraphs(
         self, deepgram: dict, channel_filter: Optional[int]
@@ -1,4 +1,3 @@
-import copy
 from typing import Optional, TYPE_CHECKING
 from plexus.processors.DataframeProcessor import Processor
 
@@ -38,8 +37,6 @@ class DeepgramTimeSliceProcessor(Processor):
     """
 
     def process(self, score_input: 'Score.Input') -> 'Score.Input':
-        from plexus.scores.Score import Score
-
         deepgram = score_input.metadata.get('deepgram')
         if not deepgram:
             return score_input
@@ -63,55 +60,25 @@ class DeepgramTimeSliceProcessor(Processor):
                 # Can't compute "last" without duration; pass through
                 return score_input
 
-        # Deep copy to avoid mutating original
-        filtered = copy.deepcopy(deepgram)
-
-        # Filter all channels
-        for channel in filtered.get('results', {}).get('channels', []):
-            for alt in channel.get('alternatives', []):
-                # Filter words
-                if 'words' in alt:
-                    alt['words'] = [
-                        w for w in alt['words']
-                        if self._in_range(w['start'], start, end)
-                    ]
-                    # Regenerate transcript from filtered words
-                    alt['transcript'] = ' '.join(
-                        w['word'] for w in alt['words']
-                    )
-
-                # Filter paragraphs and sentences within them
-                if 'paragraphs' in alt and 'paragraphs' in alt['paragraphs']:
-                    filtered_paras = []
-                    for para in alt['paragraphs']['paragraphs']:
-                        # Filter sentences within paragraph
-                        if 'sentences' in para:
-                            para['sentences'] = [
-                                s for s in para['sentences']
-                                if self._in_range(s['start'], start, end)
-                            ]
-                            if not para['sentences']:
-                                continue
-                            # Update paragraph text from remaining sentences
-                            para['text'] = ' '.join(
-                                s['text'] for s in para['sentences']
-                            )
-                        elif not self._in_range(para.get('start', 0), start, end):
-                            continue
-                        filtered_paras.append(para)
-
-                    alt['paragraphs']['paragraphs'] = filtered_paras
-                    # Regenerate paragraphs transcript
-                    alt['paragraphs']['transcript'] = ' '.join(
-                        p.get('text', '') for p in filtered_paras
-                    )
-
-        # Filter utterances (top-level, if present)
-        if 'utterances' in filtered.get('results', {}):
-            filtered['results']['utterances'] = [
-                u for u in filtered['results']['utterances']
-                if self._in_range(u['start'], start, end)
-            ]
+        # Copy only the containers we change; unchanged words, sentences and
+        # other payload are shared with the original instead of deep-copied.
+        filtered = dict(deepgram)
+        results = deepgram.get('results')
+        if isinstance(results, dict):
+            results = dict(results)
+            filtered['results'] = results
+            if 'channels' in results:
+                results['channels'] = [
+                    self._slice_channel(channel, start, end)
+                    for channel in results['channels']
+                ]
+
+            # Filter utterances (top-level, if present)
+            if 'utterances' in results:
+                results['utterances'] = [
+                    u for u in results['utterances']
+                    if self._in_range(u['start'], start, end)
+                ]
 
         # Regenerate text from filtered paragraphs
         text = self._rebuild_text(filtered)
@@ -120,11 +87,58 @@ class DeepgramTimeSliceProcessor(Processor):
         new_metadata = score_input.metadata.copy()
         new_metadata['deepgram'] = filtered
 
-        return Score.Input(
-            text=text,
-            metadata=new_metadata,
-            results=score_input.results,
-        )
+        return score_input.derive(text=text, metadata=new_metadata)
+
+    @classmethod
+    def _slice_channel(cls, channel: dict, start: float, end: Optional[float]) -> dict:
+        channel = dict(channel)
+        if 'alternatives' not in channel:
+            return channel
+        alternatives = []
+        for alt in channel['alternatives']:
+            alt = dict(alt)
+            # Filter words
+            if 'words' in alt:
+                alt['words'] = [
+                    w for w in alt['words']
+                    if cls._in_range(w['start'], start, end)
+                ]
+                # Regenerate transcript from filtered words
+                alt['transcript'] = ' '.join(
+                    w['word'] for w in alt['words']
+                )
+
+            # Filter paragraphs and sentences within them
+            if 'paragraphs' in alt and 'paragraphs' in alt['paragraphs']:
+                filtered_paras = []
+                for para in alt['paragraphs']['paragraphs']:
+                    # Filter sentences within paragraph
+                    if 'sentences' in para:
+                        sentences = [
+                            s for s in para['sentences']
+                            if cls._in_range(s['start'], start, end)
+                        ]
+                        if not sentences:
+                            continue
+                        # Update paragraph text from remaining sentences
+                        para = {
+                            **para,
+                            'sentences': sentences,
+                            'text': ' '.join(s['text'] for s in sentences),
+                        }
+                    elif not cls._in_range(para.get('start', 0), start, end):
+                        continue
+                    filtered_paras.append(para)
+
+                alt['paragraphs'] = {
+                    **alt['paragraphs'],
+                    'paragraphs': filtered_paras,
+                    # Regenerate paragraphs transcript
+                    'transcript': ' '.join(p.get('text', '') for p in filtered_paras),
+                }
+            alternatives.append(alt)
+        channel['alternatives'] = alternatives
+        return channel
 
     @staticmethod
     def _in_range(t: float, start: float, end: Optional[float]) -> bool:
@@ -21,14 +21,8 @@ class ExpandContractionsProcessor(Processor):
         Returns:
             Score.Input with contractions expanded
         """
-        from plexus.scores.Score import Score
-
         # Expand contractions
         expanded_text = contractions.fix(score_input.text)
 
-        # Return new Score.Input with expanded text
-        return Score.Input(
-            text=expanded_text,
-            metadata=score_input.metadata,
-            results=score_input.results
-        )
+        # Return a derived Score.Input with expanded text
+        return score_input.derive(text=expanded_text)
@@ -35,17 +35,11 @@ class FilterCustomerOnlyProcessor(Processor):
         Returns:
             Score.Input with text filtered to customer speech only
         """
-        from plexus.scores.Score import Score
-
         # Extract customer-only text
         filtered_text = self._extract_customer_only(score_input.text)
 
-        # Return new Score.Input with filtered text
-        return Score.Input(
-            text=filtered_text,
-            metadata=score_input.metadata,
-            results=score_input.results
-        )
+        # Return a derived Score.Input with filtered text
+        return score_input.derive(text=filtered_text)
 
     def _extract_customer_only(self, text: str) -> str:
         """
@@ -112,8 +112,6 @@ class RelevantWindowsTranscriptFilter(Processor):
         Returns:
             Score.Input with filtered text
         """
-        from plexus.scores.Score import Score
-
         text = score_input.text
 
         # Split into sentences
@@ -136,12 +134,8 @@ class RelevantWindowsTranscriptFilter(Processor):
 
         logging.debug(f"Filtered text: {result}")
 
-        # Return new Score.Input with filtered text
-        return Score.Input(
-            text=result,
-            metadata=score_input.metadata,
-            results=score_input.results
-        )
+        # Return a derived Score.Input with filtered text
+        return score_input.derive(text=result)
 
     def compute_inclusion_flags(self, relevance_flags):
         include_flags = [False] * len(relevance_flags)
@@ -38,8 +38,6 @@ class RemoveSpeakerIdentifiersTranscriptFilter(Processor):
         Returns:
             Score.Input with speaker labels removed
         """
-        from plexus.scores.Score import Score
-
         # Remove speaker identifiers, including multi-token forms like "Speaker 0:"
         filtered_text = self.SPEAKER_LABEL_PATTERN.sub('', str(score_input.text))
         filtered_text = self.GENERIC_SPEAKER_LABEL_PATTERN.sub('', filtered_text)
@@ -49,9 +47,5 @@ class RemoveSpeakerIdentifiersTranscriptFilter(Processor):
         filtered_text = re.sub(r'[ \t]*\n[ \t]*', '\n', filtered_text)
         filtered_text = filtered_text.strip()
 
-        # Return new Score.Input with filtered text
-        return Score.Input(
-            text=filtered_text,
-            metadata=score_input.metadata,
-            results=score_input.results
-        )
+        # Return a derived Score.Input with filtered text
+        return score_input.derive(text=filtered_text)
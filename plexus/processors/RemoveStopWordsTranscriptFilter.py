@@ -27,17 +27,11 @@ class RemoveStopWordsTranscriptFilter(Processor):
         Returns:
             Score.Input with stop words removed
         """
-        from plexus.scores.Score import Score
-
         # Remove stop words
         filtered_text = ' '.join([
             word for word in score_input.text.split()
             if word.lower() not in self.stop_words
         ])
 
-        # Return new Score.Input with filtered text
-        return Score.Input(
-            text=filtered_text,
-            metadata=score_input.metadata,
-            results=score_input.results
-        )
+        # Return a derived Score.Input with filtered text
+        return score_input.derive(text=filtered_text)
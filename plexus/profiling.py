@@ -0,0 +1,276 @@
+"""
+Lightweight span instrumentation for scoring hot paths.
+
+Spans are recorded into the ``SpanRecorder`` that is active in the current
+context. When no recorder is active, ``span()`` returns a shared no-op context
+manager and ``profiled`` wrappers only pay for a single ContextVar lookup, so
+the instrumentation can stay in place on hot paths.
+
+Usage::
+
+    recorder = SpanRecorder()
+    with recording(recorder):
+        with span("score.predict", score="Compliance"):
+            ...
+    recorder.summary()            # per-span count / total / percentiles
+    recorder.write_chrome_trace("trace.json")  # open in chrome://tracing or Perfetto
+
+Evaluations create a recorder automatically when ``PLEXUS_PROFILE`` is set.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+PROFILE_ENV_VAR = "PLEXUS_PROFILE"
+PROFILE_DIR_ENV_VAR = "PLEXUS_PROFILE_DIR"
+DEFAULT_PROFILE_DIR = os.path.join("tmp", "profiles")
+
+SUMMARY_PERCENTILES = (50, 90, 95, 99)
+
+_active_recorder: ContextVar[Optional["SpanRecorder"]] = ContextVar(
+    "plexus_active_span_recorder", default=None
+)
+
+
+def profiling_enabled_from_env() -> bool:
+    return os.getenv(PROFILE_ENV_VAR, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+@dataclass
+class Span:
+    name: str
+    start: float
+    duration: float
+    thread_id: int
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+
+class SpanRecorder:
+    """Thread-safe collector of finished spans."""
+
+    def __init__(self, name: str = "plexus"):
+        self.name = name
+        self.origin = time.perf_counter()
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, name: str = "plexus") -> Optional["SpanRecorder"]:
+        """Return a new recorder if ``PLEXUS_PROFILE`` is enabled, otherwise None."""
+        return cls(name) if profiling_enabled_from_env() else None
+
+    def add(self, name: str, start: float, duration: float, **attributes: Any) -> None:
+        span_record = Span(
+            name=name,
+            start=start,
+            duration=duration,
+            thread_id=threading.get_ident(),
+            attributes=attributes,
+        )
+        with self._lock:
+            self._spans.append(span_record)
+
+    @property
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._spans)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Aggregate spans by name.
+
+        Returns:
+            Dict mapping span name to count, total, mean, max and p50/p90/p95/p99,
+            all durations in seconds.
+        """
+        durations: Dict[str, List[float]] = {}
+        for span_record in self.spans:
+            durations.setdefault(span_record.name, []).append(span_record.duration)
+
+        summary = {}
+        for name in sorted(durations):
+            values = np.asarray(durations[name], dtype=np.float64)
+            percentiles = np.percentile(values, SUMMARY_PERCENTILES)
+            stats = {
+                "count": int(values.size),
+                "total": round(float(values.sum()), 6),
+                "mean": round(float(values.mean()), 6),
+                "max": round(float(values.max()), 6),
+            }
+            for percentile, value in zip(SUMMARY_PERCENTILES, percentiles):
+                stats[f"p{percentile}"] = round(float(value), 6)
+            summary[name] = stats
+        return summary
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return spans in the Chrome trace event format (complete events, microseconds)."""
+        pid = os.getpid()
+        events = []
+        for span_record in self.spans:
+            events.append({
+                "name": span_record.name,
+                "cat": span_record.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": round((span_record.start - self.origin) * 1e6, 3),
+                "dur": round(span_record.duration * 1e6, 3),
+                "pid": pid,
+                "tid": span_record.thread_id,
+                "args": {key: _json_safe(value) for key, value in span_record.attributes.items()},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"name": self.name}}
+
+    def write_json(self, path: str) -> str:
+        return _write_json(path, {"name": self.name, "spans": self.summary()})
+
+    def write_chrome_trace(self, path: str) -> str:
+        return _write_json(path, self.to_chrome_trace())
+
+    def export(self, directory: Optional[str] = None, prefix: Optional[str] = None) -> Dict[str, str]:
+        """
+        Write the summary and the Chrome trace into ``directory``.
+
+        Returns:
+            Dict with the ``summary`` and ``trace`` file paths.
+        """
+        directory = directory or os.getenv(PROFILE_DIR_ENV_VAR) or DEFAULT_PROFILE_DIR
+        prefix = prefix or self.name
+        return {
+            "summary": self.write_json(os.path.join(directory, f"{prefix}.profile.json")),
+            "trace": self.write_chrome_trace(os.path.join(directory, f"{prefix}.trace.json")),
+        }
+
+
+def _json_safe(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def _write_json(path: str, payload: Dict[str, Any]) -> str:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+    return path
+
+
+def get_recorder() -> Optional[SpanRecorder]:
+    return _active_recorder.get()
+
+
+@contextmanager
+def recording(recorder: Optional[SpanRecorder]) -> Iterator[Optional[SpanRecorder]]:
+    """
+    Make ``recorder`` the active recorder for the current context.
+
+    Tasks created and ``asyncio.to_thread`` calls made inside the block inherit
+    it. Passing None disables recording for the block.
+    """
+    token = _active_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _active_recorder.reset(token)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def set(self, **attributes: Any) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _ActiveSpan:
+    __slots__ = ("recorder", "name", "attributes", "start")
+
+    def __init__(self, recorder: SpanRecorder, name: str, attributes: Dict[str, Any]):
+        self.recorder = recorder
+        self.name = name
+        self.attributes = attributes
+        self.start = 0.0
+
+    def __enter__(self) -> "_ActiveSpan":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        duration = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self.recorder.add(self.name, self.start, duration, **self.attributes)
+
+    def set(self, **attributes: Any) -> None:
+        """Attach attributes discovered while the span is open."""
+        self.attributes.update(attributes)
+
+
+def span(name: str, **attributes: Any):
+    """Time the enclosed block as ``name`` when a recorder is active."""
+    recorder = _active_recorder.get()
+    if recorder is None:
+        return _NOOP_SPAN
+    return _ActiveSpan(recorder, name, attributes)
+
+
+def record(name: str, duration: float, **attributes: Any) -> None:
+    """Record an already-measured duration (e.g. queue wait) ending now."""
+    recorder = _active_recorder.get()
+    if recorder is None:
+        return
+    recorder.add(name, time.perf_counter() - duration, duration, **attributes)
+
+
+def profiled(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorator recording each call of a sync or async function as a span."""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                recorder = _active_recorder.get()
+                if recorder is None:
+                    return await func(*args, **kwargs)
+                with _ActiveSpan(recorder, span_name, {}):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = _active_recorder.get()
+            if recorder is None:
+                return func(*args, **kwargs)
+            with _ActiveSpan(recorder, span_name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,120 @@
+import asyncio
+import json
+
+import pytest
+
+from plexus.profiling import (
+    SpanRecorder,
+    get_recorder,
+    profiled,
+    record,
+    recording,
+    span,
+)
+
+
+def test_span_is_noop_without_active_recorder():
+    assert get_recorder() is None
+    with span("anything", attr=1) as active:
+        active.set(more=2)
+    record("anything", 1.0)
+
+
+def test_spans_are_recorded_and_summarized():
+    recorder = SpanRecorder()
+    with recording(recorder):
+        for _ in range(4):
+            with span("score.predict", score="A"):
+                pass
+        record("evaluation.queue_wait", 0.5)
+        record("evaluation.queue_wait", 1.5)
+
+    assert get_recorder() is None
+    summary = recorder.summary()
+    assert summary["score.predict"]["count"] == 4
+    queue_wait = summary["evaluation.queue_wait"]
+    assert queue_wait["count"] == 2
+    assert queue_wait["total"] == pytest.approx(2.0)
+    assert queue_wait["p50"] == pytest.approx(1.0)
+    assert queue_wait["max"] == pytest.approx(1.5)
+    assert set(queue_wait) >= {"mean", "p90", "p95", "p99"}
+
+
+def test_span_records_error_type():
+    recorder = SpanRecorder()
+    with recording(recorder):
+        with pytest.raises(ValueError):
+            with span("llm.network"):
+                raise ValueError("boom")
+
+    assert recorder.spans[0].attributes["error"] == "ValueError"
+
+
+def test_profiled_decorator_handles_sync_and_async_functions():
+    @profiled("sync.work")
+    def sync_work(value):
+        return value * 2
+
+    @profiled()
+    async def async_work(value):
+        await asyncio.sleep(0)
+        return value + 1
+
+    assert sync_work(2) == 4  # no recorder active
+
+    recorder = SpanRecorder()
+
+    async def run():
+        with recording(recorder):
+            results = await asyncio.gather(*(async_work(i) for i in range(3)))
+            return results, sync_work(3)
+
+    results, doubled = asyncio.run(run())
+    assert results == [1, 2, 3]
+    assert doubled == 6
+    summary = recorder.summary()
+    assert summary["sync.work"]["count"] == 1
+    async_name = next(name for name in summary if name.endswith("async_work"))
+    assert summary[async_name]["count"] == 3
+
+
+def test_recorder_propagates_to_threads_started_with_to_thread():
+    recorder = SpanRecorder()
+
+    def blocking():
+        with span("dashboard.fetch_item"):
+            return 1
+
+    async def run():
+        with recording(recorder):
+            return await asyncio.to_thread(blocking)
+
+    assert asyncio.run(run()) == 1
+    assert recorder.summary()["dashboard.fetch_item"]["count"] == 1
+
+
+def test_export_writes_summary_and_chrome_trace(tmp_path):
+    recorder = SpanRecorder(name="evaluation")
+    with recording(recorder):
+        with span("score.load", score="A", config={"nested": True}):
+            pass
+
+    paths = recorder.export(directory=str(tmp_path), prefix="run")
+
+    summary = json.loads(open(paths["summary"]).read())
+    assert summary["spans"]["score.load"]["count"] == 1
+
+    trace = json.loads(open(paths["trace"]).read())
+    event = trace["traceEvents"][0]
+    assert event["ph"] == "X"
+    assert event["name"] == "score.load"
+    assert event["cat"] == "score"
+    assert event["args"]["score"] == "A"
+    assert isinstance(event["args"]["config"], str)
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.delenv("PLEXUS_PROFILE", raising=False)
+    assert SpanRecorder.from_env() is None
+    monkeypatch.setenv("PLEXUS_PROFILE", "1")
+    assert isinstance(SpanRecorder.from_env(), SpanRecorder)
@@ -1925,6 +1925,7 @@ def analyze_score_result(
     score_guidelines: str = "",
     score_yaml_code: str = "",
     feedback_context: str = "",
+    raise_errors: bool = False,
 ) -> tuple:
     """
     Run a two-turn GPT-5 mini conversation to analyze a misclassification.
@@ -1942,6 +1943,8 @@ def analyze_score_result(
         score_guidelines: Score guidelines text (truncated to 2000 chars)
         score_yaml_code: Score YAML configuration (truncated to 4000 chars)
         feedback_context: Additional context about reviewer feedback
+        raise_errors: Re-raise LLM errors instead of returning ("", ""), so callers
+            can retry rate-limited requests
     """
     system = (
         "You are an expert quality analyst reviewing AI scoring errors across domains and modalities."
@@ -1993,6 +1996,8 @@ def analyze_score_result(
 
         return detailed_cause, suggested_fix
     except Exception as exc:
+        if raise_errors:
+            raise
         logger.warning("analyze_score_result failed: %s", exc)
         return "", ""
 
@@ -0,0 +1,307 @@
+"""
+Staged execution for evaluation root-cause analysis (RCA).
+
+A feedback evaluation's RCA runs in three stages:
+
+1. ``prefetch_item_contexts`` loads the primary input text and metadata of every
+   incorrect item up front, with batched ``getItem`` queries.
+2. Per-item LLM analyses run through an ``RcaTaskPool``. The pool caps how many
+   run at once and backs off when the provider rate-limits.
+3. ``RcaAnalysisCache`` memoizes per-exemplar analyses by item, score version and
+   prompt hash. With ``PLEXUS_RCA_CACHE_DIR`` set, the analyses are also kept on
+   disk, and re-running an evaluation reuses the earlier explanations.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from plexus import rca_analysis
+from plexus.utils.rate_limits import is_rate_limit_error
+
+logger = logging.getLogger(__name__)
+
+RCA_CONCURRENCY = 8
+RCA_CACHE_DIR_ENV_VAR = "PLEXUS_RCA_CACHE_DIR"
+
+
+def rca_concurrency() -> int:
+    """Maximum concurrent RCA LLM calls, from ``PLEXUS_RCA_CONCURRENCY``."""
+    value = os.getenv("PLEXUS_RCA_CONCURRENCY", "").strip()
+    if not value:
+        return RCA_CONCURRENCY
+    try:
+        concurrency = int(value)
+    except ValueError:
+        logger.warning("Invalid PLEXUS_RCA_CONCURRENCY=%r; using default %s", value, RCA_CONCURRENCY)
+        return RCA_CONCURRENCY
+    return max(1, concurrency)
+
+
+def _missing_item_context() -> Dict[str, Any]:
+    return {
+        "primary_input": "",
+        "metadata_snapshot": "",
+        "primary_input_modality": "unknown",
+        "primary_input_fetch_error": True,
+    }
+
+
+def item_context_from_item(item: Any) -> Dict[str, Any]:
+    """Build the RCA item-context record for a dashboard Item (or None)."""
+    if not item:
+        return _missing_item_context()
+    raw_metadata = getattr(item, "metadata", None)
+    metadata_snapshot = ""
+    if raw_metadata:
+        if isinstance(raw_metadata, str):
+            metadata_snapshot = raw_metadata
+        else:
+            try:
+                metadata_snapshot = json.dumps(raw_metadata)
+            except TypeError:
+                metadata_snapshot = str(raw_metadata)
+    primary_input = getattr(item, "text", None) or ""
+    if primary_input:
+        modality = "text"
+    elif metadata_snapshot:
+        modality = "structured"
+    else:
+        modality = "unknown"
+    return {
+        "primary_input": primary_input,
+        "metadata_snapshot": metadata_snapshot,
+        "primary_input_modality": modality,
+        "primary_input_fetch_error": False,
+    }
+
+
+async def prefetch_item_contexts(
+    item_ids: Iterable[str],
+    client: Any,
+    chunk_size: int = 25,
+    max_concurrency: int = 4,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Load item context for every item ID in batched requests.
+
+    Returns a dict mapping each item ID to its context record. Items that could
+    not be fetched get a record with ``primary_input_fetch_error`` set.
+    """
+    from plexus.dashboard.api.models.item import Item as DashboardItem
+
+    item_ids = list(dict.fromkeys(item_id for item_id in item_ids if item_id))
+    if not item_ids or client is None:
+        return {}
+
+    chunk_size = max(1, chunk_size)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _fetch_chunk(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+        async with semaphore:
+            try:
+                items = await asyncio.to_thread(
+                    DashboardItem.batch_get_by_ids, chunk, client, chunk_size
+                )
+            except Exception as exc:
+                logger.debug("Item context prefetch failed for %d item(s): %s", len(chunk), exc)
+                return {item_id: _missing_item_context() for item_id in chunk}
+        return {item_id: item_context_from_item(items.get(item_id)) for item_id in chunk}
+
+    chunks = [item_ids[start:start + chunk_size] for start in range(0, len(item_ids), chunk_size)]
+    contexts: Dict[str, Dict[str, Any]] = {}
+    for chunk_contexts in await asyncio.gather(*[_fetch_chunk(chunk) for chunk in chunks]):
+        contexts.update(chunk_contexts)
+    return contexts
+
+
+async def gather_with_progress(
+    awaitables: Iterable[Awaitable[Any]],
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """``asyncio.gather`` that calls ``on_progress(completed, total)`` as each awaitable finishes."""
+    awaitables = list(awaitables)
+    total = len(awaitables)
+    completed = 0
+
+    async def _track(awaitable):
+        nonlocal completed
+        try:
+            return await awaitable
+        finally:
+            completed += 1
+            if on_progress is not None:
+                on_progress(completed, total)
+
+    return list(await asyncio.gather(
+        *[_track(awaitable) for awaitable in awaitables],
+        return_exceptions=return_exceptions,
+    ))
+
+
+class RcaTaskPool:
+    """
+    Bounded pool for blocking RCA LLM calls.
+
+    ``run`` executes a function in a worker thread while holding one of
+    ``max_concurrency`` slots. Rate-limit errors are retried with exponential
+    backoff and jitter; the slot is released while waiting so other calls can
+    proceed. Any other error is raised to the caller.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_retries: int = 4,
+        initial_backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 30.0,
+    ):
+        self.max_concurrency = max_concurrency or rca_concurrency()
+        self.max_retries = max_retries
+        self.initial_backoff_seconds = initial_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.rate_limited = 0
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def _backoff_seconds(self, attempt: int) -> float:
+        delay = min(self.max_backoff_seconds, self.initial_backoff_seconds * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                try:
+                    return await asyncio.to_thread(func, *args, **kwargs)
+                except Exception as exc:
+                    if attempt >= self.max_retries or not is_rate_limit_error(exc):
+                        raise
+                    self.rate_limited += 1
+                    delay = self._backoff_seconds(attempt)
+                    logger.info(
+                        "RCA call %s rate-limited (attempt %d/%d); retrying in %.2fs",
+                        getattr(func, "__name__", "call"),
+                        attempt + 1,
+                        self.max_retries,
+                        delay,
+                    )
+            attempt += 1
+            await asyncio.sleep(delay)
+
+
+class RcaAnalysisCache:
+    """
+    Memoizes exemplar analyses by (item, score version, prompt hash).
+
+    Entries are kept in memory for the run. Writing them to disk, so later runs
+    of the same evaluation can reuse them, is opt-in: set ``directory`` (or
+    ``PLEXUS_RCA_CACHE_DIR``) and each entry is also stored there as a small
+    JSON file.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        if directory is None:
+            directory = os.getenv(RCA_CACHE_DIR_ENV_VAR, "")
+        self.directory = directory
+        self._entries: Dict[str, Tuple[str, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def prompt_hash(**prompt_inputs: Any) -> str:
+        payload = json.dumps(
+            {"model": rca_analysis.RCA_OPENAI_MODEL, **prompt_inputs},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _key(item_id: str, score_version_id: str, prompt_hash: str) -> str:
+        raw = f"{item_id}\x00{score_version_id}\x00{prompt_hash}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, score_version_id: str, key: str) -> Optional[str]:
+        if not self.directory:
+            return None
+        return os.path.join(self.directory, score_version_id or "unversioned", f"{key}.json")
+
+    def get(self, item_id: str, score_version_id: str, prompt_hash: str) -> Optional[Tuple[str, str]]:
+        key = self._key(item_id, score_version_id, prompt_hash)
+        entry = self._entries.get(key)
+        path = self._path(score_version_id, key)
+        if entry is None and path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                entry = (data.get("detailed_cause", ""), data.get("suggested_fix", ""))
+                self._entries[key] = entry
+            except Exception as exc:
+                logger.debug("Ignoring unreadable RCA cache entry %s: %s", path, exc)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def put(
+        self,
+        item_id: str,
+        score_version_id: str,
+        prompt_hash: str,
+        analysis: Tuple[str, str],
+    ) -> None:
+        key = self._key(item_id, score_version_id, prompt_hash)
+        self._entries[key] = analysis
+        path = self._path(score_version_id, key)
+        if not path:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                json.dump({
+                    "item_id": item_id,
+                    "score_version_id": score_version_id,
+                    "prompt_hash": prompt_hash,
+                    "detailed_cause": analysis[0],
+                    "suggested_fix": analysis[1],
+                }, f)
+        except Exception as exc:
+            logger.debug("Failed to write RCA cache entry %s: %s", path, exc)
+
+
+async def analyze_score_result_cached(
+    pool: RcaTaskPool,
+    cache: Optional[RcaAnalysisCache],
+    *,
+    item_id: str,
+    score_version_id: str = "",
+    **analysis_inputs: Any,
+) -> Tuple[str, str]:
+    """
+    Run ``rca_analysis.analyze_score_result`` through the pool, memoized in ``cache``.
+
+    Returns ``(detailed_cause, suggested_fix)``; ``("", "")`` if the analysis
+    failed. Only non-empty analyses are cached.
+    """
+    prompt_hash = RcaAnalysisCache.prompt_hash(**analysis_inputs)
+    if cache is not None and item_id:
+        cached = cache.get(item_id, score_version_id or "", prompt_hash)
+        if cached is not None:
+            return cached
+
+    try:
+        analysis = await pool.run(
+            rca_analysis.analyze_score_result, raise_errors=True, **analysis_inputs
+        )
+    except Exception as exc:
+        logger.warning("analyze_score_result failed for item %s: %s", item_id, exc)
+        return "", ""
+
+    if cache is not None and item_id and any(analysis):
+        cache.put(item_id, score_version_id or "", prompt_hash, tuple(analysis))
+    return analysis
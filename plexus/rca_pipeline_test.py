@@ -0,0 +1,203 @@
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from plexus import rca_pipeline
+from plexus.dashboard.api.models.item import Item
+from plexus.rca_pipeline import (
+    RcaAnalysisCache,
+    RcaTaskPool,
+    analyze_score_result_cached,
+    gather_with_progress,
+    prefetch_item_contexts,
+)
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class FakeItem:
+    def __init__(self, text="", metadata=None):
+        self.text = text
+        self.metadata = metadata
+
+
+@pytest.mark.asyncio
+async def test_pool_retries_rate_limits_and_bounds_concurrency():
+    pool = RcaTaskPool(max_concurrency=2, initial_backoff_seconds=0.001)
+    calls = {"count": 0, "active": 0, "peak": 0}
+
+    def flaky(value):
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise RateLimitError("429 Too Many Requests")
+        return value * 2
+
+    assert await pool.run(flaky, 21) == 42
+    assert pool.rate_limited == 1
+
+    lock = threading.Lock()
+
+    def slow(value):
+        with lock:
+            calls["active"] += 1
+            calls["peak"] = max(calls["peak"], calls["active"])
+        time.sleep(0.02)
+        with lock:
+            calls["active"] -= 1
+        return value
+
+    assert await asyncio.gather(*[pool.run(slow, i) for i in range(6)]) == list(range(6))
+    assert calls["peak"] <= 2
+
+
+@pytest.mark.asyncio
+async def test_pool_raises_other_errors_without_retry():
+    pool = RcaTaskPool(max_concurrency=1, initial_backoff_seconds=0.001)
+    calls = []
+
+    def broken():
+        calls.append(1)
+        raise ValueError("bad prompt")
+
+    with pytest.raises(ValueError):
+        await pool.run(broken)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_analysis_is_memoized_by_item_version_and_prompt(tmp_path):
+    pool = RcaTaskPool(max_concurrency=2)
+    calls = []
+
+    def fake_analyze(**kwargs):
+        calls.append(kwargs)
+        return f"cause for {kwargs['predicted']}", "fix"
+
+    inputs = dict(primary_input="transcript", predicted="Yes", correct="No", explanation="")
+    with patch.object(rca_pipeline.rca_analysis, "analyze_score_result", side_effect=fake_analyze):
+        first = await analyze_score_result_cached(
+            pool, RcaAnalysisCache(str(tmp_path)), item_id="item-1", score_version_id="v1", **inputs
+        )
+        # A fresh cache on the same directory stands in for a later evaluation run.
+        rerun_cache = RcaAnalysisCache(str(tmp_path))
+        second = await analyze_score_result_cached(
+            pool, rerun_cache, item_id="item-1", score_version_id="v1", **inputs
+        )
+        await analyze_score_result_cached(
+            pool, rerun_cache, item_id="item-1", score_version_id="v2", **inputs
+        )
+
+    assert first == second == ("cause for Yes", "fix")
+    assert rerun_cache.hits == 1
+    assert len(calls) == 2
+    assert calls[0]["raise_errors"] is True
+
+
+@pytest.mark.asyncio
+async def test_failed_analysis_returns_empty_and_is_not_cached():
+    pool = RcaTaskPool(max_concurrency=1)
+    cache = RcaAnalysisCache("")
+
+    with patch.object(
+        rca_pipeline.rca_analysis, "analyze_score_result", side_effect=ValueError("empty response")
+    ):
+        result = await analyze_score_result_cached(
+            pool, cache, item_id="item-1", primary_input="text", predicted="Yes", correct="No"
+        )
+
+    assert result == ("", "")
+    assert cache.get("item-1", "", RcaAnalysisCache.prompt_hash(
+        primary_input="text", predicted="Yes", correct="No"
+    )) is None
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(rca_pipeline.RCA_CACHE_DIR_ENV_VAR, raising=False)
+    pool = RcaTaskPool(max_concurrency=1)
+    cache = RcaAnalysisCache()
+
+    with patch.object(rca_pipeline.rca_analysis, "analyze_score_result", return_value=("cause", "fix")):
+        await analyze_score_result_cached(
+            pool, cache, item_id="item-1", score_version_id="v1", primary_input="text"
+        )
+
+    assert cache.directory == ""
+    assert cache.get("item-1", "v1", RcaAnalysisCache.prompt_hash(primary_input="text")) == ("cause", "fix")
+    assert os.listdir(tmp_path) == []
+
+    monkeypatch.setenv(rca_pipeline.RCA_CACHE_DIR_ENV_VAR, str(tmp_path / "rca"))
+    assert RcaAnalysisCache().directory == str(tmp_path / "rca")
+
+
+@pytest.mark.asyncio
+async def test_prefetch_item_contexts_uses_batched_lookup():
+    items = {
+        "item-1": FakeItem(text="hello"),
+        "item-2": FakeItem(metadata={"form": 1}),
+        "item-3": None,
+    }
+    with patch(
+        "plexus.dashboard.api.models.item.Item.batch_get_by_ids",
+        side_effect=lambda ids, client, chunk_size: {i: items[i] for i in ids},
+    ) as batch_get:
+        contexts = await prefetch_item_contexts(
+            ["item-1", "item-2", "item-3", "item-1"], client=object(), chunk_size=2
+        )
+
+    assert batch_get.call_count == 2
+    assert contexts["item-1"]["primary_input"] == "hello"
+    assert contexts["item-1"]["primary_input_modality"] == "text"
+    assert contexts["item-2"]["metadata_snapshot"] == '{"form": 1}'
+    assert contexts["item-2"]["primary_input_modality"] == "structured"
+    assert contexts["item-3"]["primary_input_fetch_error"] is True
+
+
+def test_item_batch_get_fetches_items_with_aliased_queries():
+    client = Mock()
+    client.execute.side_effect = lambda query, variables: {
+        f"item{i}": ({'id': item_id, 'text': f"text {item_id}"} if item_id != 'missing' else None)
+        for i, item_id in enumerate(variables[f"id{n}"] for n in range(len(variables)))
+    }
+
+    with patch.object(Item, 'from_dict', side_effect=lambda data, client: data['text']):
+        items = Item.batch_get_by_ids(['a', 'b', 'missing', 'a'], client, chunk_size=2)
+
+    assert client.execute.call_count == 2
+    assert 'item1: getItem(id: $id1)' in client.execute.call_args_list[0][0][0]
+    assert items == {'a': 'text a', 'b': 'text b', 'missing': None}
+
+
+def test_item_batch_get_falls_back_to_get_by_id_when_a_chunk_fails():
+    client = Mock()
+    client.execute.side_effect = Exception("query too complex")
+
+    with patch.object(Item, 'get_by_id', side_effect=lambda item_id, client: f"item {item_id}") as get_by_id:
+        items = Item.batch_get_by_ids(['a', 'b'], client)
+
+    assert items == {'a': 'item a', 'b': 'item b'}
+    assert get_by_id.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_gather_with_progress_reports_each_completion():
+    progress = []
+
+    async def work(value):
+        await asyncio.sleep(0)
+        return value
+
+    results = await gather_with_progress(
+        [work(i) for i in range(3)],
+        on_progress=lambda done, total: progress.append((done, total)),
+    )
+
+    assert results == [0, 1, 2]
+    assert progress == [(1, 3), (2, 3), (3, 3)]
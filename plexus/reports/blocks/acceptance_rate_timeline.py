@@ -5,6 +5,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from .feedback_rates_base import FeedbackRatesBase
+from .time_buckets import TimeBucketIndex
 
 
 @dataclass(frozen=True)
@@ -131,15 +132,26 @@ class AcceptanceRateTimeline(FeedbackRatesBase):
             )
             self._log(f"Fetched {len(raw_feedback_items)} raw feedback items in window")
 
+            # Partition both windows by bucket once, then compute each bucket on its own rows.
+            bucket_index = TimeBucketIndex.from_buckets(buckets, "start_utc", "end_utc")
+            score_results_by_bucket = bucket_index.group(
+                raw_score_results,
+                lambda result: self._to_dt(result.get("updatedAt") or result.get("createdAt")),
+            )
+            feedback_items_by_bucket = bucket_index.group(
+                raw_feedback_items,
+                lambda item: self._to_dt(item.get("editedAt") or item.get("updatedAt") or item.get("createdAt")),
+            )
+
             points: List[Dict[str, Any]] = []
-            for bucket_index, bucket in enumerate(buckets):
+            for index, bucket in enumerate(buckets):
                 metrics = self._compute_bucket_metrics(
                     bucket=bucket,
-                    bucket_index=bucket_index,
+                    bucket_index=index,
                     scorecard_id=scorecard.id,
                     resolved_score_id=resolved_score_id,
-                    raw_score_results=raw_score_results,
-                    raw_feedback_items=raw_feedback_items,
+                    raw_score_results=score_results_by_bucket[index],
+                    raw_feedback_items=feedback_items_by_bucket[index],
                 )
                 points.append(metrics)
 
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
-from plexus.analysis.metrics import GwetAC1
-from plexus.analysis.metrics.metric import Metric
 from plexus.dashboard.api.models.feedback_item import FeedbackItem
 
 from . import feedback_utils
@@ -16,6 +15,7 @@ from .feedback_scope_resolver import (
     resolve_score_for_scorecard,
     resolve_scorecard,
 )
+from .time_buckets import AgreementTally, TimeBucketIndex
 
 
 @dataclass(frozen=True)
@@ -50,6 +50,7 @@ class FeedbackAlignmentTimeline(BaseReportBlock):
     }
     CALENDAR_BUCKET_TYPES = {"calendar_day", "calendar_week", "calendar_biweek", "calendar_month"}
     WEEK_START_INDEX = {"monday": 0, "sunday": 6}
+    FEEDBACK_FETCH_CONCURRENCY = 6
 
     async def generate(self) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         self.log_messages = []
@@ -173,52 +174,38 @@ class FeedbackAlignmentTimeline(BaseReportBlock):
                 f"bucket_count={effective_bucket_count}, window_mode={window_mode}"
             )
 
-            overall_bucket_items: List[List[FeedbackItem]] = [[] for _ in buckets]
-            score_series: List[Dict[str, Any]] = []
-            total_feedback_items_retrieved = 0
+            bucket_index = self._bucket_index(buckets)
+            items_by_score = await self._fetch_feedback_items_for_scores(
+                scorecard_id=scorecard.id,
+                score_ids=[score_info["score_id"] for score_info in scores_to_analyze],
+                start_date=range_start_utc,
+                end_date=range_end_query_utc,
+            )
+            total_feedback_items_retrieved = sum(len(items) for items in items_by_score.values())
 
+            overall_tallies = [AgreementTally() for _ in buckets]
+            score_series: List[Dict[str, Any]] = []
             for score_info in scores_to_analyze:
-                score_id = score_info["score_id"]
-                score_name = score_info["score_name"]
-                feedback_items = await self._fetch_feedback_items_for_score(
-                    scorecard_id=scorecard.id,
-                    score_id=score_id,
-                    start_date=range_start_utc,
-                    end_date=range_end_query_utc,
+                score_tallies = self._tally_alignment_by_bucket(
+                    items_by_score.get(score_info["score_id"], []),
+                    bucket_index,
                 )
-                total_feedback_items_retrieved += len(feedback_items)
-
-                per_bucket_items: List[List[FeedbackItem]] = [[] for _ in buckets]
-                for feedback_item in feedback_items:
-                    edited_at = feedback_item.editedAt
-                    if not edited_at:
-                        continue
-                    if edited_at.tzinfo is None:
-                        edited_at = edited_at.replace(tzinfo=timezone.utc)
-                    edited_local = edited_at.astimezone(tzinfo)
-
-                    bucket_index = self._find_bucket_index(edited_local, buckets)
-                    if bucket_index is None:
-                        continue
-
-                    per_bucket_items[bucket_index].append(feedback_item)
-                    overall_bucket_items[bucket_index].append(feedback_item)
-
-                points = [
-                    self._build_point(bucket, index, self._calculate_alignment_metrics(items))
-                    for index, (bucket, items) in enumerate(zip(buckets, per_bucket_items))
-                ]
+                for overall_tally, score_tally in zip(overall_tallies, score_tallies):
+                    overall_tally.merge(score_tally)
                 score_series.append(
                     {
-                        "score_id": score_id,
-                        "score_name": score_name,
-                        "points": points,
+                        "score_id": score_info["score_id"],
+                        "score_name": score_info["score_name"],
+                        "points": [
+                            self._build_point(bucket, index, tally.metrics())
+                            for index, (bucket, tally) in enumerate(zip(buckets, score_tallies))
+                        ],
                     }
                 )
 
             overall_points = [
-                self._build_point(bucket, index, self._calculate_alignment_metrics(items))
-                for index, (bucket, items) in enumerate(zip(buckets, overall_bucket_items))
+                self._build_point(bucket, index, tally.metrics())
+                for index, (bucket, tally) in enumerate(zip(buckets, overall_tallies))
             ]
 
             mode = "single_score" if score_identifier else "all_scores"
@@ -376,6 +363,28 @@ class FeedbackAlignmentTimeline(BaseReportBlock):
             end_date=end_date,
         )
 
+    async def _fetch_feedback_items_for_scores(
+        self,
+        scorecard_id: str,
+        score_ids: List[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Dict[str, List[FeedbackItem]]:
+        """Fetch the window once for every requested score, a few scores at a time."""
+        semaphore = asyncio.Semaphore(self.FEEDBACK_FETCH_CONCURRENCY)
+
+        async def _fetch(score_id: str) -> List[FeedbackItem]:
+            async with semaphore:
+                return await self._fetch_feedback_items_for_score(
+                    scorecard_id=scorecard_id,
+                    score_id=score_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+
+        results = await asyncio.gather(*[_fetch(score_id) for score_id in score_ids])
+        return dict(zip(score_ids, results))
+
     def _resolve_account_id(self) -> str:
         account_id = self.params.get("account_id")
         if not account_id and hasattr(self.api_client, "context") and self.api_client.context:
@@ -580,51 +589,27 @@ class FeedbackAlignmentTimeline(BaseReportBlock):
         month = (month_index % 12) + 1
         return value.replace(year=year, month=month, day=1)
 
-    def _find_bucket_index(self, edited_local: datetime, buckets: List[_TimeBucket]) -> Optional[int]:
-        for index, bucket in enumerate(buckets):
-            if bucket.start_local <= edited_local < bucket.end_local:
-                return index
-        return None
-
-    def _calculate_alignment_metrics(self, items: List[FeedbackItem]) -> Dict[str, Any]:
-        paired_initial: List[str] = []
-        paired_final: List[str] = []
-
-        for item in items:
-            if item.initialAnswerValue is None or item.finalAnswerValue is None:
-                continue
-            paired_initial.append(str(item.initialAnswerValue))
-            paired_final.append(str(item.finalAnswerValue))
-
-        item_count = len(paired_initial)
-        if item_count == 0:
-            return {
-                "ac1": None,
-                "accuracy": None,
-                "item_count": 0,
-                "agreements": 0,
-                "mismatches": 0,
-            }
+    def _bucket_index(self, buckets: List[_TimeBucket]) -> TimeBucketIndex:
+        # Bucket edges are timezone-aware, so assignment compares instants and
+        # needs no conversion of item timestamps into the report timezone.
+        return TimeBucketIndex.from_buckets(buckets, "start_local", "end_local")
 
-        agreements = sum(1 for initial, final in zip(paired_initial, paired_final) if initial == final)
-        mismatches = item_count - agreements
-        accuracy = (agreements / item_count) * 100
+    def _assign_buckets(self, feedback_items: List[FeedbackItem], bucket_index: TimeBucketIndex) -> List[int]:
+        """Bucket index per item by editedAt (``-1`` when missing or outside the window)."""
+        return bucket_index.assign(
+            getattr(feedback_item, "editedAt", None) for feedback_item in feedback_items
+        ).tolist()
 
-        ac1: Optional[float] = None
-        try:
-            calculator = GwetAC1()
-            metric_input = Metric.Input(reference=paired_final, predictions=paired_initial)
-            ac1 = calculator.calculate(metric_input).value
-        except Exception as exc:
-            self._log(f"Warning: AC1 calculation failed for bucket with {item_count} items: {exc}", level="WARNING")
-
-        return {
-            "ac1": ac1,
-            "accuracy": accuracy,
-            "item_count": item_count,
-            "agreements": agreements,
-            "mismatches": mismatches,
-        }
+    def _tally_alignment_by_bucket(
+        self,
+        feedback_items: List[FeedbackItem],
+        bucket_index: TimeBucketIndex,
+    ) -> List[AgreementTally]:
+        tallies = [AgreementTally() for _ in range(len(bucket_index))]
+        for feedback_item, index in zip(feedback_items, self._assign_buckets(feedback_items, bucket_index)):
+            if index >= 0:
+                tallies[index].add(feedback_item.initialAnswerValue, feedback_item.finalAnswerValue)
+        return tallies
 
     def _build_point(self, bucket: _TimeBucket, index: int, metrics: Dict[str, Any]) -> Dict[str, Any]:
         return {
@@ -7,6 +7,7 @@ from zoneinfo import ZoneInfo
 from plexus.dashboard.api.models.feedback_item import FeedbackItem
 
 from .feedback_alignment_timeline import FeedbackAlignmentTimeline
+from .time_buckets import TimeBucketIndex
 
 
 class FeedbackVolumeTimeline(FeedbackAlignmentTimeline):
@@ -155,32 +156,19 @@ class FeedbackVolumeTimeline(FeedbackAlignmentTimeline):
                 f"bucket_count={len(buckets)}, window_mode={window_mode}"
             )
 
+            bucket_index = self._bucket_index(buckets)
+            items_by_score = await self._fetch_feedback_items_for_scores(
+                scorecard_id=scorecard.id,
+                score_ids=[score_info["score_id"] for score_info in scores_to_analyze],
+                start_date=range_start_utc,
+                end_date=range_end_query_utc,
+            )
             total_feedback_items_retrieved = 0
-            for score_info in scores_to_analyze:
-                feedback_items = await self._fetch_feedback_items_for_score(
-                    scorecard_id=scorecard.id,
-                    score_id=score_info["score_id"],
-                    start_date=range_start_utc,
-                    end_date=range_end_query_utc,
-                )
+            for feedback_items in items_by_score.values():
                 total_feedback_items_retrieved += len(feedback_items)
-
-                for feedback_item in feedback_items:
-                    edited_at = (
-                        getattr(feedback_item, "editedAt", None)
-                        or getattr(feedback_item, "updatedAt", None)
-                        or getattr(feedback_item, "createdAt", None)
-                    )
-                    if not edited_at:
-                        continue
-                    if edited_at.tzinfo is None:
-                        edited_at = edited_at.replace(tzinfo=timezone.utc)
-                    edited_local = edited_at.astimezone(tzinfo)
-                    bucket_index = self._find_bucket_index(edited_local, buckets)
-                    if bucket_index is None:
-                        continue
-
-                    self._accumulate_feedback_item(points[bucket_index], feedback_item)
+                for feedback_item, index in zip(feedback_items, self._assign_buckets(feedback_items, bucket_index)):
+                    if index >= 0:
+                        self._accumulate_feedback_item(points[index], feedback_item)
 
             output: Dict[str, Any] = {
                 "report_type": "feedback_volume_timeline",
@@ -211,6 +199,15 @@ class FeedbackVolumeTimeline(FeedbackAlignmentTimeline):
             self._log(f"ERROR generating FeedbackVolumeTimeline: {exc}", level="ERROR")
             return {"error": str(exc), "points": []}, self._get_log_string()
 
+    def _assign_buckets(self, feedback_items: List[FeedbackItem], bucket_index: TimeBucketIndex) -> List[int]:
+        """Bucket volume by editedAt, falling back to updatedAt/createdAt."""
+        return bucket_index.assign(
+            getattr(feedback_item, "editedAt", None)
+            or getattr(feedback_item, "updatedAt", None)
+            or getattr(feedback_item, "createdAt", None)
+            for feedback_item in feedback_items
+        ).tolist()
+
     def _empty_point(self, *, bucket: Any, bucket_index: int) -> Dict[str, Any]:
         return {
             "bucket_index": bucket_index,
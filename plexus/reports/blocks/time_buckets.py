@@ -0,0 +1,156 @@
+"""
+Shared time-bucketing engine for timeline report blocks.
+
+Timeline blocks split a window into ordered, non-overlapping buckets and then
+aggregate feedback items (or score results) per bucket. ``TimeBucketIndex``
+assigns every timestamp to its bucket with one sorted search instead of a
+linear scan over the buckets, and ``AgreementTally`` keeps the counts needed
+for accuracy and Gwet's AC1 so series can be aggregated and merged without
+holding per-bucket item lists.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_micros(value: datetime) -> int:
+    """Exact integer microseconds since the epoch (naive datetimes are treated as UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _ONE_MICROSECOND
+
+
+class TimeBucketIndex:
+    """Sorted bucket edges supporting O(log B) lookups and vectorized assignment."""
+
+    def __init__(self, bounds: Sequence[Tuple[datetime, datetime]]):
+        starts = [to_epoch_micros(start) for start, _ in bounds]
+        ends = [to_epoch_micros(end) for _, end in bounds]
+        if any(later < earlier for earlier, later in zip(starts, starts[1:])):
+            raise ValueError("Time buckets must be ordered by start time.")
+        self._starts = starts
+        self._ends = ends
+        self._starts_array = np.asarray(starts, dtype=np.int64)
+        self._ends_array = np.asarray(ends, dtype=np.int64)
+
+    @classmethod
+    def from_buckets(cls, buckets: Sequence[Any], start_attr: str, end_attr: str) -> "TimeBucketIndex":
+        return cls([(getattr(bucket, start_attr), getattr(bucket, end_attr)) for bucket in buckets])
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def index_of(self, value: Optional[datetime]) -> Optional[int]:
+        """Bucket containing ``value`` (start inclusive, end exclusive), if any."""
+        if value is None:
+            return None
+        micros = to_epoch_micros(value)
+        index = bisect_right(self._starts, micros) - 1
+        if index >= 0 and micros < self._ends[index]:
+            return index
+        return None
+
+    def assign(self, values: Iterable[Optional[datetime]]) -> np.ndarray:
+        """Bucket index for each value, ``-1`` where it is missing or outside every bucket."""
+        values = list(values)
+        present = np.fromiter((value is not None for value in values), dtype=bool, count=len(values))
+        micros = np.fromiter(
+            (to_epoch_micros(value) if value is not None else 0 for value in values),
+            dtype=np.int64,
+            count=len(values),
+        )
+        if not len(self._starts):
+            return np.full(len(values), -1, dtype=np.int64)
+        indices = np.searchsorted(self._starts_array, micros, side="right") - 1
+        clipped = np.clip(indices, 0, None)
+        inside = present & (indices >= 0) & (micros < self._ends_array[clipped])
+        return np.where(inside, indices, -1)
+
+    def group(
+        self,
+        records: Sequence[Any],
+        timestamp: Callable[[Any], Optional[datetime]],
+    ) -> List[List[Any]]:
+        """Partition ``records`` into per-bucket lists in one pass."""
+        groups: List[List[Any]] = [[] for _ in self._starts]
+        assignments = self.assign(timestamp(record) for record in records)
+        for record, index in zip(records, assignments.tolist()):
+            if index >= 0:
+                groups[index].append(record)
+        return groups
+
+
+def gwet_ac1_from_counts(item_count: int, agreements: int, category_counts: Dict[str, int]) -> Optional[float]:
+    """
+    Gwet's AC1 from aggregate counts.
+
+    ``category_counts`` counts each category across both raters, so it sums to
+    ``2 * item_count``. Matches ``plexus.analysis.metrics.GwetAC1`` on the
+    paired ratings, except that an empty input yields ``None``.
+    """
+    if item_count == 0:
+        return None
+    if len(category_counts) <= 1:
+        return 1.0
+    observed_agreement = agreements / item_count
+    counts = np.array([category_counts[category] for category in sorted(category_counts)], dtype=float)
+    pi_values = counts / (2 * item_count)
+    pe = sum(pi_values * (1 - pi_values)) / (len(counts) - 1)
+    denominator = 1 - pe
+    if denominator == 0:
+        return float("nan")
+    return (observed_agreement - pe) / denominator
+
+
+class AgreementTally:
+    """Running agreement counts for one bucket (or series) of initial/final answer pairs."""
+
+    __slots__ = ("item_count", "agreements", "category_counts")
+
+    def __init__(self) -> None:
+        self.item_count = 0
+        self.agreements = 0
+        self.category_counts: Counter = Counter()
+
+    def add(self, initial: Any, final: Any) -> None:
+        """Count one pair; pairs with a missing value are skipped."""
+        if initial is None or final is None:
+            return
+        initial_str = str(initial)
+        final_str = str(final)
+        self.item_count += 1
+        if initial_str == final_str:
+            self.agreements += 1
+        self.category_counts[initial_str] += 1
+        self.category_counts[final_str] += 1
+
+    def merge(self, other: "AgreementTally") -> None:
+        self.item_count += other.item_count
+        self.agreements += other.agreements
+        self.category_counts.update(other.category_counts)
+
+    def metrics(self) -> Dict[str, Any]:
+        if self.item_count == 0:
+            return {
+                "ac1": None,
+                "accuracy": None,
+                "item_count": 0,
+                "agreements": 0,
+                "mismatches": 0,
+            }
+        return {
+            "ac1": gwet_ac1_from_counts(self.item_count, self.agreements, self.category_counts),
+            "accuracy": (self.agreements / self.item_count) * 100,
+            "item_count": self.item_count,
+            "agreements": self.agreements,
+            "mismatches": self.item_count - self.agreements,
+        }
@@ -0,0 +1,109 @@
+import random
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from plexus.analysis.metrics import GwetAC1
+from plexus.analysis.metrics.metric import Metric
+from plexus.reports.blocks.time_buckets import AgreementTally, TimeBucketIndex, gwet_ac1_from_counts
+
+
+def _daily_bounds(start: datetime, days: int):
+    return [(start + timedelta(days=i), start + timedelta(days=i + 1)) for i in range(days)]
+
+
+def test_index_of_uses_half_open_buckets():
+    start = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    index = TimeBucketIndex(_daily_bounds(start, 3))
+
+    assert index.index_of(start) == 0
+    assert index.index_of(start + timedelta(days=1) - timedelta(microseconds=1)) == 0
+    assert index.index_of(start + timedelta(days=1)) == 1
+    assert index.index_of(start + timedelta(days=3)) is None
+    assert index.index_of(start - timedelta(microseconds=1)) is None
+    assert index.index_of(None) is None
+
+
+def test_assign_matches_linear_scan_across_timezones_and_gaps():
+    tz = ZoneInfo("America/New_York")
+    # Local-midnight buckets spanning a DST change, with a gap after the third bucket.
+    local_start = datetime(2026, 3, 6, tzinfo=tz)
+    bounds = [
+        (local_start + timedelta(days=i), local_start + timedelta(days=i + 1))
+        for i in range(6)
+        if i != 3
+    ]
+    index = TimeBucketIndex(bounds)
+
+    rng = random.Random(7)
+    values = [
+        datetime(2026, 3, 5, tzinfo=timezone.utc) + timedelta(minutes=rng.randrange(0, 60 * 24 * 9))
+        for _ in range(500)
+    ] + [None, datetime(2026, 3, 7, 12)]  # naive timestamps are treated as UTC
+
+    def linear(value):
+        if value is None:
+            return -1
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        for i, (start, end) in enumerate(bounds):
+            if start <= value < end:
+                return i
+        return -1
+
+    assert index.assign(values).tolist() == [linear(value) for value in values]
+    assert [index.index_of(value) for value in values] == [
+        None if position == -1 else position for position in map(linear, values)
+    ]
+
+
+def test_group_partitions_records_in_one_pass():
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    index = TimeBucketIndex(_daily_bounds(start, 2))
+    records = [
+        {"id": "a", "at": start + timedelta(hours=1)},
+        {"id": "b", "at": start + timedelta(days=1, hours=1)},
+        {"id": "c", "at": start + timedelta(days=5)},
+        {"id": "d", "at": start + timedelta(hours=2)},
+    ]
+
+    groups = index.group(records, lambda record: record["at"])
+
+    assert [[record["id"] for record in group] for group in groups] == [["a", "d"], ["b"]]
+
+
+def test_unordered_buckets_are_rejected():
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    with pytest.raises(ValueError):
+        TimeBucketIndex(list(reversed(_daily_bounds(start, 2))))
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_tally_matches_gwet_ac1_on_paired_lists(seed):
+    rng = random.Random(seed)
+    labels = ["Yes", "No", "Maybe"]
+    pairs = [(rng.choice(labels), rng.choice(labels + [None])) for _ in range(200)]
+
+    first, second = AgreementTally(), AgreementTally()
+    for position, (initial, final) in enumerate(pairs):
+        (first if position % 2 else second).add(initial, final)
+    first.merge(second)
+    metrics = first.metrics()
+
+    paired = [(str(i), str(f)) for i, f in pairs if i is not None and f is not None]
+    expected = GwetAC1().calculate(
+        Metric.Input(reference=[f for _, f in paired], predictions=[i for i, _ in paired])
+    ).value
+    agreements = sum(1 for i, f in paired if i == f)
+
+    assert metrics["item_count"] == len(paired)
+    assert metrics["agreements"] == agreements
+    assert metrics["mismatches"] == len(paired) - agreements
+    assert metrics["accuracy"] == pytest.approx(agreements / len(paired) * 100)
+    assert metrics["ac1"] == pytest.approx(expected)
+
+
+def test_tally_edge_cases():
+    assert AgreementTally().metrics()["ac1"] is None
+    assert gwet_ac1_from_counts(3, 3, {"Yes": 6}) == 1.0
@@ -524,6 +524,9 @@ class DeepLearningSemanticClassifier(Score):
 
 
     def predict(self, context, model_input: Score.Input):
+        return self.predict_batch(context, [model_input])[0]
+
+    def predict_batch(self, context, model_inputs):
         # Check if model is loaded, if not, load it
         if not hasattr(self, 'model') or self.model is None:
             try:
@@ -532,42 +535,34 @@ class DeepLearningSemanticClassifier(Score):
                 logging.error(f"Failed to load model: {str(e)}")
                 raise
 
-        # Proceed with prediction
-        logging.info(f"Received input: {model_input}")
-
-        text = model_input.text
-        logging.info(f"Processing text (first 100 chars): {text[:100]}...")
+        texts = [model_input.text for model_input in model_inputs]
+        logging.info(f"Processing batch of {len(texts)} texts")
 
         try:
-            encoded_input = self.encode_input([text])
+            # One tokenization pass and one forward pass for the whole batch
+            encoded_input = self.encode_input(texts)
             logging.info(f"Encoded input shapes: input_ids={encoded_input['input_ids'].shape}, attention_mask={encoded_input['attention_mask'].shape}")
 
-            predictions = self.model.predict([encoded_input['input_ids'], encoded_input['attention_mask']])
+            predictions = np.asarray(self.model.predict([encoded_input['input_ids'], encoded_input['attention_mask']]))
             logging.info(f"Raw prediction shape: {predictions.shape}")
-            logging.info(f"Raw predictions: {predictions}")
-            logging.info(f"Prediction type: {type(predictions)}")
-            logging.info(f"Prediction dtype: {predictions.dtype}")
 
             if self.parameters.number_of_classes > 2:
                 logging.info("Handling multi-class prediction")
-                confidence_score = float(np.max(predictions[0]))
-                predicted_class = int(np.argmax(predictions[0]))
+                confidence_scores = np.max(predictions, axis=1)
+                predicted_classes = np.argmax(predictions, axis=1)
             else:
                 logging.info("Handling binary prediction")
-                confidence_score = float(predictions[0][0])
-                predicted_class = int(predictions[0][0] > 0.5)
-
-            logging.info(f"Predicted class (before conversion): {predicted_class}")
-            logging.info(f"Confidence score: {confidence_score}")
-
-            predicted_label = self.inverse_label_map[predicted_class]
-            logging.info(f"Predicted label: {predicted_label}")
-
-            return [self.Result(
-                name =       self.parameters.score_name,
-                value =      predicted_label,
-                confidence = confidence_score
-            )]
+                confidence_scores = predictions[:, 0]
+                predicted_classes = (predictions[:, 0] > 0.5).astype(int)
+
+            return [
+                [self.Result(
+                    name =       self.parameters.score_name,
+                    value =      self.inverse_label_map[int(predicted_class)],
+                    confidence = float(confidence_score)
+                )]
+                for predicted_class, confidence_score in zip(predicted_classes, confidence_scores)
+            ]
         except Exception as e:
             logging.error(f"Error during prediction: {str(e)}")
             logging.error(f"Error type: {type(e)}")
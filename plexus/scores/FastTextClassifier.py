@@ -294,10 +294,10 @@ class FastTextClassifier(Score):
         predictions = []
         confidence_scores = []
 
-        for text in texts:
-            prediction = self.model.predict(text, k=len(self.model.labels))
-            labels, confs = prediction
+        # fastText predicts a list of texts in a single native call
+        batch_labels, batch_confs = self.model.predict(texts, k=len(self.model.labels))
 
+        for labels, confs in zip(batch_labels, batch_confs):
             if self._is_multi_class:
                 conf_scores = np.zeros(len(self.label_map))
                 for label, conf in zip(labels, confs):
@@ -309,4 +309,18 @@ class FastTextClassifier(Score):
 
             predictions.append(self.label_map[labels[0].replace('__label__', '')])
 
-        return np.array(predictions), np.array(confidence_scores)
\ No newline at end of file
+        return np.array(predictions), np.array(confidence_scores)
+
+    def predict_batch(self, context, model_inputs):
+        predictions, confidence_scores = self.predict(
+            pd.DataFrame({'text': [model_input.text for model_input in model_inputs]})
+        )
+        inverse_label_map = {index: label for label, index in self.label_map.items()}
+        return [
+            Score.Result(
+                parameters=self.parameters,
+                value=inverse_label_map[int(prediction)],
+                confidence=float(np.max(confidence))
+            )
+            for prediction, confidence in zip(predictions, confidence_scores)
+        ]
\ No newline at end of file
@@ -3,8 +3,8 @@ import logging
 import traceback
 import graphviz
 from types import FunctionType
-from typing import Type, Tuple, Literal, Optional, Any, TypedDict, List, Dict, Union
-from pydantic import BaseModel, ConfigDict, create_model, Field
+from typing import Type, Tuple, Literal, Optional, Any, TypedDict, List, Dict, Union, ClassVar
+from pydantic import BaseModel, ConfigDict, create_model, Field, TypeAdapter
 import concurrent.futures
 import importlib
 import asyncio
@@ -16,6 +16,7 @@ from functools import partialmethod
 
 from plexus.LangChainUser import LangChainUser
 from plexus.scores.Score import Score
+from plexus.profiling import profiled, span
 from plexus.utils.dict_utils import truncate_dict_strings
 
 from langchain_community.callbacks import OpenAICallbackHandler
@@ -84,6 +85,8 @@ class BatchProcessingPause(Exception):
 warnings.filterwarnings("ignore", 
     message="Field \"model_.*\" .* has conflict with protected namespace \"model_\".*")
 
+_METADATA_ADAPTER = TypeAdapter(dict)
+
 class LangGraphScore(Score, LangChainUser):
     """
     A Score implementation that uses LangGraph for orchestrating LLM-based classification.
@@ -211,6 +214,26 @@ class LangGraphScore(Score, LangChainUser):
             extra='allow'
         )
 
+        # Read-only payloads in metadata that every node dump can share instead
+        # of deep-copying (a long Deepgram transcript is megabytes of dicts).
+        SHARED_METADATA_KEYS: ClassVar[frozenset] = frozenset({'deepgram'})
+
+        def model_dump(self, *args, **kwargs) -> Dict[str, Any]:
+            metadata = self.metadata
+            if args or kwargs or not isinstance(metadata, dict) or \
+                    not self.SHARED_METADATA_KEYS.intersection(metadata):
+                return super().model_dump(*args, **kwargs)
+            dumped = super().model_dump(exclude={'metadata'})
+            copied = _METADATA_ADAPTER.dump_python(
+                {k: v for k, v in metadata.items() if k not in self.SHARED_METADATA_KEYS}
+            )
+            dumped['metadata'] = {
+                key: value if key in self.SHARED_METADATA_KEYS else copied[key]
+                for key, value in metadata.items()
+            }
+            # Keep the key order of a regular dump: declared fields, then extras.
+            return {key: dumped[key] for key in (*type(self).model_fields, *dumped) if key in dumped}
+
     def __init__(self, **parameters):
         """
         Initialize the LangGraphScore.
@@ -599,6 +622,7 @@ class LangGraphScore(Score, LangChainUser):
         logging.info("Workflow edges configured")
         return False  # Indicate we didn't handle final node routing
 
+    @profiled("langgraph.compile_workflow")
     async def build_compiled_workflow(self):
         """Build the LangGraph workflow with optional persistence."""
         logging.info("Building LangGraph workflow")
@@ -1545,13 +1569,14 @@ class LangGraphScore(Score, LangChainUser):
                     raise TypeError(f"Expected Score.Result object but got {type(result)}")
                 initial_results[result.parameters.name] = result
 
-        initial_state = self.combined_state_class(
-            text=self.preprocess_text(model_input.text),
-            metadata=model_input.metadata,
-            results=initial_results,
-            retry_count=0,
-            at_llm_breakpoint=False,
-        ).model_dump()
+        with span("langgraph.build_state"):
+            initial_state = self.combined_state_class(
+                text=self.preprocess_text(model_input.text),
+                metadata=model_input.metadata,
+                results=initial_results,
+                retry_count=0,
+                at_llm_breakpoint=False,
+            ).model_dump()
 
         if batch_data:
             initial_state.update(batch_data)
@@ -1562,13 +1587,14 @@ class LangGraphScore(Score, LangChainUser):
             # Add timeout protection to prevent infinite hangs
             timeout_seconds = int(os.getenv('LANGGRAPH_TIMEOUT', '300'))  # Default 5 minutes
             
-            graph_result = await asyncio.wait_for(
-                self.workflow.ainvoke(
-                    initial_state,
-                    config=thread
-                ),
-                timeout=timeout_seconds
-            )
+            with span("langgraph.workflow", score=self.parameters.name):
+                graph_result = await asyncio.wait_for(
+                    self.workflow.ainvoke(
+                        initial_state,
+                        config=thread
+                    ),
+                    timeout=timeout_seconds
+                )
             
             # DEBUG: Log the graph_result before converting to Score.Result
             logging.debug(f"graph_result keys: {list(graph_result.keys())}")
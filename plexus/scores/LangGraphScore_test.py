@@ -9846,3 +9846,23 @@ async def test_production_conditional_output_override_bug():
 
 
 print("="*80)
+
+
+def test_graph_state_dump_shares_deepgram_payload():
+    deepgram = {'results': {'channels': [{'alternatives': [{'words': [{'word': 'hi'}]}]}]}}
+    trace = {'node_results': []}
+    state = LangGraphScore.GraphState(
+        text="hi",
+        metadata={'deepgram': deepgram, 'trace': trace},
+        extra_field="kept",
+    )
+
+    dumped = state.model_dump()
+
+    assert list(dumped) == list(
+        LangGraphScore.GraphState.model_fields) + ['extra_field']
+    assert dumped['metadata']['deepgram'] is deepgram
+    assert dumped['metadata'] is not state.metadata
+    assert dumped['metadata']['trace'] == trace
+    assert dumped['metadata']['trace'] is not trace
+    assert state.model_dump(exclude={'text'})['metadata']['deepgram'] is not deepgram
@@ -128,23 +128,43 @@ class OpenAIEmbeddingsClassifier(Score):
         logging.info(f"Validation accuracy: {val_accuracy}")
 
     def predict(self, context, model_input):
+        return self.predict_batch(context, [model_input])[0]
+
+    def predict_batch(self, context, model_inputs):
         if self.parameters.multiple_windows:
-            windows = self._apply_sliding_window(model_input.text)
-            embeddings = self._compute_embeddings(windows)
-            embedding = np.mean(embeddings, axis=0)
+            windows_per_input = [self._apply_sliding_window(model_input.text) for model_input in model_inputs]
         else:
-            truncated_text = ' '.join(model_input.text.split()[:self.parameters.maximum_tokens_per_window])
-            embedding = self._compute_embeddings([truncated_text])[0]
-        
-        prediction = self.model.predict([embedding])[0]
-        predicted_label = self.label_encoder.inverse_transform([prediction])[0]
-        confidence_score = np.max(self.model.predict_proba([embedding])[0])
-        
-        return self.Result(
-            name=self.parameters.score_name,
-            value=predicted_label,
-            confidence=confidence_score
-        )
+            windows_per_input = [
+                [' '.join(model_input.text.split()[:self.parameters.maximum_tokens_per_window])]
+                for model_input in model_inputs
+            ]
+
+        # Embed every window of every input in as few API requests as the batch size allows
+        window_embeddings = self._compute_embeddings([window for windows in windows_per_input for window in windows])
+
+        embeddings = []
+        offset = 0
+        for windows in windows_per_input:
+            input_embeddings = window_embeddings[offset:offset + len(windows)]
+            offset += len(windows)
+            if self.parameters.multiple_windows:
+                embeddings.append(np.mean(input_embeddings, axis=0))
+            else:
+                embeddings.append(input_embeddings[0])
+        embeddings = np.array(embeddings)
+
+        predictions = self.model.predict(embeddings)
+        predicted_labels = self.label_encoder.inverse_transform(predictions)
+        confidence_scores = np.max(self.model.predict_proba(embeddings), axis=1)
+
+        return [
+            self.Result(
+                name=self.parameters.score_name,
+                value=predicted_label,
+                confidence=confidence_score
+            )
+            for predicted_label, confidence_score in zip(predicted_labels, confidence_scores)
+        ]
 
     def evaluate_model(self):
         val_predictions_str = self.label_encoder.inverse_transform(self.val_predictions)
@@ -328,16 +328,24 @@ class Score(ABC,
 
     def __getattribute__(self, name):
         attr = super().__getattribute__(name)
-        if name != "predict" or not callable(attr):
+        if name not in ("predict", "predict_batch") or not callable(attr):
             return attr
         if getattr(attr, "_score_validation_wrapped", False):
             return attr
 
-        @wraps(attr)
-        def validated_predict(*args, **kwargs):
-            result = attr(*args, **kwargs)
-            self._validate_prediction_result(result)
-            return result
+        if name == "predict_batch":
+            @wraps(attr)
+            def validated_predict(*args, **kwargs):
+                results = attr(*args, **kwargs)
+                for result in results:
+                    self._validate_prediction_result(result)
+                return results
+        else:
+            @wraps(attr)
+            def validated_predict(*args, **kwargs):
+                result = attr(*args, **kwargs)
+                self._validate_prediction_result(result)
+                return result
 
         setattr(validated_predict, "_score_validation_wrapped", True)
         return validated_predict
@@ -485,6 +493,36 @@ class Score(ABC,
         """
         pass
 
+    def predict_batch(self, context, model_inputs: List[Input]) -> List[Union[Result, List[Result]]]:
+        """
+        Make predictions for several inputs at once.
+
+        The default implementation calls ``predict`` once per input. Scores backed
+        by a local model override this with a single vectorized inference call, and
+        ``Scorecard`` then routes their predictions through a ``PredictionBatcher``
+        that groups concurrent requests into one ``predict_batch`` call.
+
+        Parameters
+        ----------
+        context : Any
+            Context for the prediction
+        model_inputs : List[Score.Input]
+            The inputs to make predictions for.
+
+        Returns
+        -------
+        List[Union[Score.Result, List[Score.Result]]]
+            One ``predict`` result per input, in input order.
+        """
+        return [self.predict(context, model_input) for model_input in model_inputs]
+
+    @classmethod
+    def supports_batch_prediction(cls) -> bool:
+        """
+        Whether this score class provides its own vectorized ``predict_batch``.
+        """
+        return cls.predict_batch is not Score.predict_batch
+
     def is_relevant(self, text):
         """
         Determine if the given text is relevant using the predict method.
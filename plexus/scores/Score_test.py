@@ -77,3 +77,14 @@ def test_ensure_report_directory_exists_no_error_if_exists(tmp_path):
     score.report_directory_path = lambda: str(report_directory)
     score.report_file_name("test_file.txt")
     assert report_directory.exists()
+
+def test_predict_batch_defaults_to_predict_per_input():
+    class EchoScore(ConcreteScore):
+        def predict(self, context, model_input: Score.Input):
+            return Score.Result(parameters=self.parameters, value=model_input.text)
+
+    score = EchoScore(scorecard_name="Test scorecard", score_name="Test score")
+    results = score.predict_batch(None, [Score.Input(text="Yes"), Score.Input(text="No")])
+
+    assert [result.value for result in results] == ["Yes", "No"]
+    assert not EchoScore.supports_batch_prediction()
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+from typing import Any, List, Optional, Tuple
+
+from plexus.profiling import span
+
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_WAIT_SECONDS = 0.01
+
+
+class PredictionBatcher:
+    """
+    Groups concurrent predictions for one score instance into ``predict_batch`` calls.
+
+    Each ``predict()`` call enqueues its input and waits. The pending queue is
+    flushed when it reaches ``max_batch_size`` or when ``max_wait_seconds`` has
+    passed since the first input arrived, whichever comes first. Batches run in a
+    worker thread one at a time, so requests that arrive while a batch is being
+    scored accumulate into the next one.
+    """
+
+    def __init__(
+        self,
+        score,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+        context: Any = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.score = score
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.context = context
+        self.batches: int = 0
+        self.predictions: int = 0
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: set = set()
+        self._inference_lock = threading.Lock()
+
+    async def predict(self, model_input) -> Any:
+        """Return the score's result for ``model_input`` once its batch has run."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A new event loop (e.g. a later asyncio.run); nothing from the old one can complete.
+            self._loop = loop
+            self._pending = []
+            self._timer = None
+
+        future = loop.create_future()
+        self._pending.append((model_input, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_seconds, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        model_inputs = [model_input for model_input, _ in batch]
+        try:
+            results = await asyncio.to_thread(self._predict_batch, model_inputs)
+            if len(results) != len(model_inputs):
+                raise ValueError(
+                    f"predict_batch returned {len(results)} results for {len(model_inputs)} inputs"
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def _predict_batch(self, model_inputs: List[Any]) -> List[Any]:
+        score_name = getattr(self.score.parameters, "name", None)
+        with self._inference_lock:
+            with span("score.predict_batch", score=score_name, size=len(model_inputs)):
+                results = self.score.predict_batch(self.context, model_inputs)
+            self.batches += 1
+            self.predictions += len(model_inputs)
+        return results
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from plexus.scores.Score import Score
+from plexus.scores.core.PredictionBatcher import PredictionBatcher
+
+
+class BatchScore(Score):
+    def __init__(self, **parameters):
+        super().__init__(**parameters)
+        self.batch_sizes = []
+
+    def predict(self, context, model_input):
+        return self.predict_batch(context, [model_input])[0]
+
+    def predict_batch(self, context, model_inputs):
+        self.batch_sizes.append(len(model_inputs))
+        return [
+            Score.Result(parameters=self.parameters, value=model_input.text.upper())
+            for model_input in model_inputs
+        ]
+
+
+class FailingBatchScore(BatchScore):
+    def predict_batch(self, context, model_inputs):
+        raise RuntimeError("model unavailable")
+
+
+def make_score(score_class=BatchScore):
+    return score_class(scorecard_name="Test scorecard", name="Batch score")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_predictions_share_one_batch():
+    score = make_score()
+    batcher = PredictionBatcher(score, max_batch_size=32, max_wait_seconds=0.05)
+
+    results = await asyncio.gather(*(
+        batcher.predict(Score.Input(text=f"item {i}")) for i in range(5)
+    ))
+
+    assert [result.value for result in results] == [f"ITEM {i}" for i in range(5)]
+    assert score.batch_sizes == [5]
+    assert batcher.batches == 1
+    assert batcher.predictions == 5
+
+
+@pytest.mark.asyncio
+async def test_full_batches_flush_without_waiting():
+    score = make_score()
+    batcher = PredictionBatcher(score, max_batch_size=2, max_wait_seconds=60)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.predict(Score.Input(text=str(i))) for i in range(4))),
+        timeout=5,
+    )
+
+    assert [result.value for result in results] == ["0", "1", "2", "3"]
+    assert score.batch_sizes == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_reach_every_caller():
+    batcher = PredictionBatcher(make_score(FailingBatchScore), max_wait_seconds=0.01)
+
+    results = await asyncio.gather(
+        batcher.predict(Score.Input(text="a")),
+        batcher.predict(Score.Input(text="b")),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_batcher_works_across_event_loops():
+    score = make_score()
+    batcher = PredictionBatcher(score, max_wait_seconds=0.01)
+
+    for text in ("first", "second"):
+        result = asyncio.run(batcher.predict(Score.Input(text=text)))
+        assert result.value == text.upper()
+
+    assert score.batch_sizes == [1, 1]
+
+
+def test_supports_batch_prediction():
+    assert BatchScore.supports_batch_prediction()
+    assert not Score.supports_batch_prediction()
@@ -32,6 +32,8 @@ class BaseNode(ABC, LangChainUser):
         single_line_messages: bool = False
         name: Optional[str] = None
 
+    RESPONSE_CACHE_ENABLED = True
+
     def __init__(self, **parameters):
         super().__init__(**parameters)
         self.parameters = self.Parameters(**parameters)
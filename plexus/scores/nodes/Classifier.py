@@ -7,6 +7,7 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import AIMessage, HumanMessage, BaseMessage, SystemMessage
 from plexus.scores.nodes.BaseNode import BaseNode
 from plexus.CustomLogging import logging
+from plexus.profiling import record, span
 from plexus.scores.LangGraphScore import BatchProcessingPause
 from plexus.scores.prompt_trace import (
     build_prompt_diagnostics,
@@ -431,11 +432,17 @@ class Classifier(BaseNode):
                 logging.debug("No confidence calibration data found - using raw confidence")
                 return raw_confidence
 
-            # Apply calibration using the serialized calibration data
-            from plexus.confidence_calibration import apply_calibration_from_serialized
-            calibrated_confidence = apply_calibration_from_serialized(raw_confidence, calibration_config)
+            # Compile the serialized calibration data once per node and reuse it
+            cached = getattr(self, '_compiled_confidence_calibration', None)
+            if cached is None or cached[0] is not calibration_config:
+                from plexus.confidence_calibration import compile_calibration
+                cached = (calibration_config, compile_calibration(calibration_config))
+                self._compiled_confidence_calibration = cached
 
-            return calibrated_confidence
+            compiled_calibration = cached[1]
+            if compiled_calibration is None:
+                return raw_confidence
+            return compiled_calibration.calibrate(raw_confidence)
 
         except Exception as e:
             logging.warning(f"Error applying confidence calibration: {e}")
@@ -996,7 +1003,8 @@ class Classifier(BaseNode):
                     last_exc: Exception | None = None
                     for attempt in range(1, max_attempts + 1):
                         try:
-                            response = await model.ainvoke(messages)
+                            with span("llm.network", node=self.parameters.name, attempt=attempt):
+                                response = await model.ainvoke(messages)
                             break
                         except Exception as e:
                             last_exc = e
@@ -1008,6 +1016,7 @@ class Classifier(BaseNode):
                                     f"Retrying in {delay_s:.1f}s..."
                                 )
                                 await asyncio.sleep(delay_s)
+                                record("llm.retry_backoff", delay_s, node=self.parameters.name, attempt=attempt)
                                 continue
                             raise
                     else:
@@ -1015,18 +1024,19 @@ class Classifier(BaseNode):
                         assert last_exc is not None
                         raise last_exc
                     
-                    # Normalize completion text (handles Responses API content blocks)
-                    completion_text = self.normalize_text_output(response)
-
-                    # Extract reasoning content for gpt-oss models
-                    reasoning_content = ""
-                    if self.is_gpt_oss_model():
-                        reasoning_content = self.extract_reasoning_content(response)
-
-                    # Extract logprobs for confidence calculation if enabled
-                    raw_logprobs = None
-                    if self.parameters.confidence and self._is_openai_model():
-                        raw_logprobs = self._extract_logprobs(response)
+                    with span("llm.parse", node=self.parameters.name):
+                        # Normalize completion text (handles Responses API content blocks)
+                        completion_text = self.normalize_text_output(response)
+
+                        # Extract reasoning content for gpt-oss models
+                        reasoning_content = ""
+                        if self.is_gpt_oss_model():
+                            reasoning_content = self.extract_reasoning_content(response)
+
+                        # Extract logprobs for confidence calculation if enabled
+                        raw_logprobs = None
+                        if self.parameters.confidence and self._is_openai_model():
+                            raw_logprobs = self._extract_logprobs(response)
 
                     # Create the initial result state
                     result_state = self.GraphState(
@@ -5,7 +5,7 @@ from langgraph.graph import StateGraph
 from plexus.scores.nodes.BaseNode import BaseNode
 from plexus.CustomLogging import logging
 from plexus.LangChainUser import LangChainUser
-from plexus.scores.shared.fuzzy_matching import FuzzyTarget, FuzzyTargetGroup, FuzzyMatchingEngine
+from plexus.scores.shared.fuzzy_matching import FuzzyTarget, FuzzyTargetGroup, FuzzyMatchingEngine, CompiledFuzzyMatcher
 
 
 # --- Main FuzzyMatchClassifier Node ---
@@ -58,6 +58,42 @@ class FuzzyMatchClassifier(BaseNode):
         # Validate the targets structure
         FuzzyMatchingEngine.validate_targets_structure(self.parameters.targets)
 
+        # Compile the targets and data paths once so each state is scored in a
+        # single vectorized pass
+        self._matcher = CompiledFuzzyMatcher(self.parameters.targets)
+        self._compiled_paths = {
+            path: self._parse_data_path(path) for path in self.parameters.data_paths
+        }
+
+    @staticmethod
+    def _parse_data_path(path: str) -> List[Tuple]:
+        """
+        Parse a JSONPath-like expression into access steps once, so that extraction
+        doesn't re-split the path for every state.
+
+        Steps are ('field', key), ('index', key, index, index_str) or
+        ('array', key, remaining_parts). An 'array' step is always the last one.
+        """
+        steps = []
+        parts = path.split('.')
+        for i, part in enumerate(parts):
+            if not part:
+                continue
+            if part.endswith('[]'):
+                steps.append(('array', part[:-2], tuple(parts[i + 1:])))
+                break
+            elif '[' in part and part.endswith(']'):
+                array_key = part.split('[')[0]
+                index_str = part.split('[')[1][:-1]
+                try:
+                    index = int(index_str)
+                except ValueError:
+                    index = None
+                steps.append(('index', array_key, index, index_str))
+            else:
+                steps.append(('field', part))
+        return steps
+
     def _extract_values_from_path(self, state_dict: Dict[str, Any], path: str) -> List[str]:
         """
         Extract values from state using JSONPath-like syntax.
@@ -68,24 +104,23 @@ class FuzzyMatchClassifier(BaseNode):
         - 'metadata.schools[].school_id' -> [school.school_id for school in state.metadata.schools]
         """
         try:
+            steps = self._compiled_paths.get(path)
+            if steps is None:
+                steps = self._compiled_paths[path] = self._parse_data_path(path)
+
             # Start with the full state dictionary
             current = state_dict
 
-            # Split path by dots
-            parts = path.split('.')
-
-            for i, part in enumerate(parts):
-                if not part:
-                    continue
+            for step in steps:
+                kind = step[0]
 
                 # Handle array notation like 'schools[]'
-                if part.endswith('[]'):
-                    array_key = part[:-2]
+                if kind == 'array':
+                    _, array_key, remaining_parts = step
                     if array_key in current and isinstance(current[array_key], list):
                         array_items = current[array_key]
 
                         # Check if there are more parts after the array notation
-                        remaining_parts = parts[i + 1:]
                         if remaining_parts:
                             # Extract field from each array item
                             result = []
@@ -111,26 +146,24 @@ class FuzzyMatchClassifier(BaseNode):
                         return []
 
                 # Handle array index notation like 'schools[0]'
-                elif '[' in part and part.endswith(']'):
-                    array_key = part.split('[')[0]
-                    index_str = part.split('[')[1][:-1]
-                    try:
-                        index = int(index_str)
-                        if array_key in current and isinstance(current[array_key], list):
-                            if 0 <= index < len(current[array_key]):
-                                current = current[array_key][index]
-                            else:
-                                logging.warning(f"Array index {index} out of range for '{array_key}' in path '{path}'")
-                                return []
+                elif kind == 'index':
+                    _, array_key, index, index_str = step
+                    if index is None:
+                        logging.warning(f"Invalid array index '{index_str}' in path '{path}'")
+                        return []
+                    if array_key in current and isinstance(current[array_key], list):
+                        if 0 <= index < len(current[array_key]):
+                            current = current[array_key][index]
                         else:
-                            logging.warning(f"Array key '{array_key}' not found or not a list in path '{path}'")
+                            logging.warning(f"Array index {index} out of range for '{array_key}' in path '{path}'")
                             return []
-                    except ValueError:
-                        logging.warning(f"Invalid array index '{index_str}' in path '{path}'")
+                    else:
+                        logging.warning(f"Array key '{array_key}' not found or not a list in path '{path}'")
                         return []
 
                 # Handle regular field access
                 else:
+                    part = step[1]
                     if isinstance(current, dict) and part in current:
                         current = current[part]
                     else:
@@ -163,10 +196,12 @@ class FuzzyMatchClassifier(BaseNode):
 
     def _evaluate_fuzzy_targets(self, item: Union[FuzzyTargetGroup, FuzzyTarget], values: List[str]) -> Tuple[bool, List[Dict]]:
         """
-        Recursively evaluates a target or group against the extracted values.
+        Evaluates a target or group against the extracted values.
         Similar to FuzzyMatchExtractor's _evaluate method but works with a list of values.
+        The configured targets use the matcher compiled at construction time.
         """
-        return FuzzyMatchingEngine.evaluate_multiple_values(item, values)
+        matcher = self._matcher if item is self.parameters.targets else CompiledFuzzyMatcher(item)
+        return matcher.evaluate_multiple_values(values)
 
     def _generate_classification(self, matches: List[Dict[str, Any]]) -> Tuple[Optional[str], Optional[str]]:
         """
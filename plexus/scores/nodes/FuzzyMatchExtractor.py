@@ -5,7 +5,7 @@ from langgraph.graph import StateGraph, END
 from plexus.scores.nodes.BaseNode import BaseNode
 from plexus.CustomLogging import logging
 from plexus.LangChainUser import LangChainUser # Although not used for LLM, might inherit base params
-from plexus.scores.shared.fuzzy_matching import FuzzyTarget, FuzzyTargetGroup, FuzzyMatchingEngine
+from plexus.scores.shared.fuzzy_matching import FuzzyTarget, FuzzyTargetGroup, FuzzyMatchingEngine, CompiledFuzzyMatcher
 
 # --- Node Implementation ---
 
@@ -57,9 +57,13 @@ class FuzzyMatchExtractor(BaseNode):
         # Pre-validate the structure recursively if needed (Pydantic does most of this)
         FuzzyMatchingEngine.validate_targets_structure(self.parameters.targets)
 
+        # Compile the targets once; each text is then scored in a single vectorized pass
+        self._matcher = CompiledFuzzyMatcher(self.parameters.targets)
+
     def _evaluate(self, item: Union[FuzzyTargetGroup, FuzzyTarget], text: str) -> Tuple[bool, List[Dict]]:
-        """Recursively evaluates a target or group against the text."""
-        return FuzzyMatchingEngine.evaluate_single_text(item, text)
+        """Evaluates a target or group against the text."""
+        matcher = self._matcher if item is self.parameters.targets else CompiledFuzzyMatcher(item)
+        return matcher.evaluate_single_text(text)
 
     def get_matcher_node(self) -> Callable:
         """Returns the callable node function for the graph."""
@@ -5,6 +5,6 @@ This module provides common data structures and evaluation logic
 used by both FuzzyMatchExtractor and FuzzyMatchClassifier nodes.
 """
 
-from .core import FuzzyTarget, FuzzyTargetGroup, FuzzyMatchingEngine
+from .core import FuzzyTarget, FuzzyTargetGroup, FuzzyMatchingEngine, CompiledFuzzyMatcher
 
-__all__ = ["FuzzyTarget", "FuzzyTargetGroup", "FuzzyMatchingEngine"]
\ No newline at end of file
+__all__ = ["FuzzyTarget", "FuzzyTargetGroup", "FuzzyMatchingEngine", "CompiledFuzzyMatcher"]
\ No newline at end of file
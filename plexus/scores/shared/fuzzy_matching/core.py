@@ -6,6 +6,7 @@ This module contains the common data structures and evaluation logic that both n
 
 from typing import Optional, Dict, Callable, List, Union, Literal, Tuple
 from pydantic import BaseModel, Field, field_validator
+import numpy as np
 from rapidfuzz import fuzz, process, utils
 from plexus.CustomLogging import logging
 
@@ -92,42 +93,7 @@ class FuzzyMatchingEngine:
             )
 
             if result:
-                score = result[1]
-                choice = result[0]
-                matched_substring = choice
-                matched_indices = None
-
-                # Attempt to find the actual substring and indices using alignment functions
-                try:
-                    alignment = None
-                    if item.scorer == 'partial_ratio':
-                        alignment = fuzz.partial_ratio_alignment(target_str, text_to_search, processor=processor)
-                    elif item.scorer == 'token_sort_ratio':
-                        alignment = fuzz.token_sort_ratio_alignment(target_str, text_to_search, processor=processor)
-                    elif item.scorer == 'token_set_ratio':
-                        alignment = fuzz.token_set_ratio_alignment(target_str, text_to_search, processor=processor)
-
-                    if alignment:
-                        matched_substring = text_to_search[alignment.dest_start:alignment.dest_end]
-                        matched_indices = (alignment.dest_start, alignment.dest_end)
-                        logging.debug(f"Alignment successful for '{item.target}'. Matched: '{matched_substring}' Indices: {matched_indices}")
-                    elif item.scorer not in ['ratio', 'WRatio', 'QRatio']:
-                        logging.warning(f"Alignment failed or not supported for scorer '{item.scorer}' on target '{item.target}'. Using full text as matched_text.")
-                    else:
-                        logging.debug(f"Alignment not available for scorer '{item.scorer}' on target '{item.target}'. Using full text as matched_text.")
-
-                except Exception as e:
-                    logging.warning(f"Error during alignment calculation for target '{item.target}' with scorer '{item.scorer}': {e}. Using full text.", exc_info=True)
-
-                match_details = {
-                    "target": item.target,
-                    "threshold": item.threshold,
-                    "score": score,
-                    "matched_text": matched_substring,
-                    "matched_indices": matched_indices
-                }
-                logging.debug(f"Match found for '{item.target}': Score={score} >= Threshold={item.threshold}")
-                return True, [match_details]
+                return True, [FuzzyMatchingEngine._single_text_match_details(item, result[0], result[1])]
             else:
                 logging.debug(f"No match found for '{item.target}' (Threshold: {item.threshold})")
                 return False, []
@@ -165,6 +131,48 @@ class FuzzyMatchingEngine:
             logging.debug(f"{item.operator.upper()} group result: {overall_result}")
             return overall_result, collected_matches
 
+    @staticmethod
+    def _single_text_match_details(item: FuzzyTarget, text_to_search: str, score: float) -> Dict:
+        """
+        Builds the match dict for a FuzzyTarget that met its threshold against a text,
+        locating the matched substring with the scorer's alignment function when available.
+        """
+        target_str = item.target
+        processor = utils.default_process if item.preprocess else None
+        matched_substring = text_to_search
+        matched_indices = None
+
+        # Attempt to find the actual substring and indices using alignment functions
+        try:
+            alignment = None
+            if item.scorer == 'partial_ratio':
+                alignment = fuzz.partial_ratio_alignment(target_str, text_to_search, processor=processor)
+            elif item.scorer == 'token_sort_ratio':
+                alignment = fuzz.token_sort_ratio_alignment(target_str, text_to_search, processor=processor)
+            elif item.scorer == 'token_set_ratio':
+                alignment = fuzz.token_set_ratio_alignment(target_str, text_to_search, processor=processor)
+
+            if alignment:
+                matched_substring = text_to_search[alignment.dest_start:alignment.dest_end]
+                matched_indices = (alignment.dest_start, alignment.dest_end)
+                logging.debug(f"Alignment successful for '{item.target}'. Matched: '{matched_substring}' Indices: {matched_indices}")
+            elif item.scorer not in ['ratio', 'WRatio', 'QRatio']:
+                logging.warning(f"Alignment failed or not supported for scorer '{item.scorer}' on target '{item.target}'. Using full text as matched_text.")
+            else:
+                logging.debug(f"Alignment not available for scorer '{item.scorer}' on target '{item.target}'. Using full text as matched_text.")
+
+        except Exception as e:
+            logging.warning(f"Error during alignment calculation for target '{item.target}' with scorer '{item.scorer}': {e}. Using full text.", exc_info=True)
+
+        logging.debug(f"Match found for '{item.target}': Score={score} >= Threshold={item.threshold}")
+        return {
+            "target": item.target,
+            "threshold": item.threshold,
+            "score": score,
+            "matched_text": matched_substring,
+            "matched_indices": matched_indices
+        }
+
     @staticmethod
     def evaluate_multiple_values(item: Union[FuzzyTargetGroup, FuzzyTarget], values: List[str]) -> Tuple[bool, List[Dict]]:
         """
@@ -258,4 +266,156 @@ class FuzzyMatchingEngine:
         if isinstance(target_config, FuzzyTargetGroup):
             for item in target_config.items:
                 FuzzyMatchingEngine.validate_targets_structure(item)
-        # Pydantic handles most structural validation
\ No newline at end of file
+        # Pydantic handles most structural validation
+
+_SCORER_FUNCS = {
+    'ratio': fuzz.ratio,
+    'partial_ratio': fuzz.partial_ratio,
+    'token_sort_ratio': fuzz.token_sort_ratio,
+    'token_set_ratio': fuzz.token_set_ratio,
+    'WRatio': fuzz.WRatio,
+    'QRatio': fuzz.QRatio
+}
+
+
+class CompiledFuzzyMatcher:
+    """
+    A target configuration compiled once for repeated evaluation.
+
+    All FuzzyTarget leaves are flattened into preprocessed choice arrays, one per
+    (scorer, preprocess, threshold) combination. At evaluation time each array is scored against
+    the input values with a single `rapidfuzz.process.cdist` call, and the AND/OR
+    groups are then evaluated over the resulting score matrix.
+
+    Results are identical to `FuzzyMatchingEngine.evaluate_single_text` and
+    `FuzzyMatchingEngine.evaluate_multiple_values`.
+    """
+
+    def __init__(self, targets: Union[FuzzyTargetGroup, FuzzyTarget], workers: int = 1):
+        """
+        Args:
+            targets: The root FuzzyTarget or FuzzyTargetGroup.
+            workers: Number of threads `cdist` may use (-1 for all cores). Scoring is
+                usually too small to benefit, so the default is a single thread.
+        """
+        self.targets = targets
+        self.workers = workers
+        self.leaves: List[FuzzyTarget] = []
+        self._tree = self._compile(targets)
+
+        # Group leaf indices by how they are scored so each group is one cdist call.
+        # The threshold is part of the key because it is passed as score_cutoff, which
+        # lets rapidfuzz skip work exactly as process.extractOne does per target.
+        self._scoring_groups: Dict[Tuple[str, bool, int], Tuple[List[int], List[str]]] = {}
+        for index, leaf in enumerate(self.leaves):
+            leaf_indices, choices = self._scoring_groups.setdefault(
+                (leaf.scorer, leaf.preprocess, leaf.threshold), ([], [])
+            )
+            leaf_indices.append(index)
+            choices.append(utils.default_process(leaf.target) if leaf.preprocess else leaf.target)
+        self._thresholds = np.array([leaf.threshold for leaf in self.leaves], dtype=np.float64)
+
+    def _compile(self, item: Union[FuzzyTargetGroup, FuzzyTarget]):
+        """Flattens targets into `self.leaves` and returns the tree over leaf indices."""
+        if isinstance(item, FuzzyTarget):
+            self.leaves.append(item)
+            return len(self.leaves) - 1
+        return (item.operator, [self._compile(sub_item) for sub_item in item.items])
+
+    def _score_matrix(self, values: List[str]) -> np.ndarray:
+        """Returns a (leaves x values) matrix of scorer(target, value) scores."""
+        scores = np.zeros((len(self.leaves), len(values)), dtype=np.float64)
+        if not values:
+            return scores
+        processed_values = None
+        for (scorer, preprocess, threshold), (leaf_indices, choices) in self._scoring_groups.items():
+            if preprocess:
+                if processed_values is None:
+                    processed_values = [utils.default_process(value) for value in values]
+                group_values = processed_values
+            else:
+                group_values = values
+            scores[leaf_indices, :] = process.cdist(
+                choices,
+                group_values,
+                scorer=_SCORER_FUNCS[scorer],
+                score_cutoff=threshold,
+                dtype=np.float64,
+                workers=self.workers
+            )
+        return scores
+
+    def _evaluate_tree(self, node, passed: List[bool], leaf_match: Callable[[int], Dict]) -> Tuple[bool, List[Dict]]:
+        """
+        Evaluates the AND/OR tree with the same short-circuit rules as FuzzyMatchingEngine.
+        `passed` holds the precomputed threshold result per leaf; match dicts are only
+        built for leaves that are actually reached and passed.
+        """
+        if isinstance(node, int):
+            return (True, [leaf_match(node)]) if passed[node] else (False, [])
+
+        operator, children = node
+        collected_matches = []
+        if operator == 'or':
+            for child in children:
+                child_result, child_matches = self._evaluate_tree(child, passed, leaf_match)
+                collected_matches.extend(child_matches)
+                if child_result:
+                    return True, collected_matches
+            return False, collected_matches
+
+        for child in children:
+            child_result, child_matches = self._evaluate_tree(child, passed, leaf_match)
+            if not child_result:
+                return False, []
+            collected_matches.extend(child_matches)
+        return True, collected_matches
+
+    def evaluate_single_text(self, text: str) -> Tuple[bool, List[Dict]]:
+        """
+        Evaluates the compiled targets against a single text string.
+        Used by FuzzyMatchExtractor.
+
+        Returns:
+            Tuple of (success: bool, matches: List[Dict])
+        """
+        scores = self._score_matrix([text])[:, 0]
+        passed = (scores >= self._thresholds).tolist()
+
+        def leaf_match(index: int) -> Dict:
+            return FuzzyMatchingEngine._single_text_match_details(self.leaves[index], text, float(scores[index]))
+
+        return self._evaluate_tree(self._tree, passed, leaf_match)
+
+    def evaluate_multiple_values(self, values: List[str]) -> Tuple[bool, List[Dict]]:
+        """
+        Evaluates the compiled targets against a list of values, keeping the best
+        scoring value per target.
+        Used by FuzzyMatchClassifier.
+
+        Returns:
+            Tuple of (success: bool, matches: List[Dict])
+        """
+        values = [value for value in values if value and isinstance(value, str)]
+        if not values:
+            return self._evaluate_tree(self._tree, [False] * len(self.leaves), None)
+
+        scores = self._score_matrix(values)
+        # argmax returns the first best value, matching the engine's strict '>' scan
+        best_indices = scores.argmax(axis=1)
+        best_scores = scores[range(len(self.leaves)), best_indices]
+        passed = ((best_scores >= self._thresholds) & (best_scores > 0)).tolist()
+
+        def leaf_match(index: int) -> Dict:
+            leaf = self.leaves[index]
+            score = float(best_scores[index])
+            logging.debug(f"Match found for '{leaf.target}': Score={score} >= Threshold={leaf.threshold}")
+            return {
+                "target": leaf.target,
+                "threshold": leaf.threshold,
+                "score": score,
+                "matched_text": values[int(best_indices[index])],
+                "matched_indices": None
+            }
+
+        return self._evaluate_tree(self._tree, passed, leaf_match)
@@ -1,5 +1,5 @@
 import pytest
-from plexus.scores.shared.fuzzy_matching.core import FuzzyTarget, FuzzyTargetGroup, FuzzyMatchingEngine
+from plexus.scores.shared.fuzzy_matching.core import FuzzyTarget, FuzzyTargetGroup, FuzzyMatchingEngine, CompiledFuzzyMatcher
 
 
 class TestFuzzyTarget:
@@ -362,4 +362,69 @@ class TestFuzzyMatchingEngine:
         assert success is True
         # Should only have one match due to short-circuiting
         assert len(matches) == 1
-        assert matches[0]["target"] == "exact_match"
\ No newline at end of file
+        assert matches[0]["target"] == "exact_match"
+
+class TestCompiledFuzzyMatcher:
+    """CompiledFuzzyMatcher must produce the same match dicts as FuzzyMatchingEngine."""
+
+    SCORERS = ['ratio', 'partial_ratio', 'token_sort_ratio', 'token_set_ratio', 'WRatio', 'QRatio']
+
+    def _targets(self):
+        return FuzzyTargetGroup(
+            operator="or",
+            items=[
+                FuzzyTargetGroup(
+                    operator="and",
+                    items=[
+                        FuzzyTarget(target="American", threshold=70, scorer="partial_ratio"),
+                        FuzzyTarget(target="university", threshold=80, scorer="token_set_ratio", preprocess=True),
+                    ]
+                ),
+                *[
+                    FuzzyTarget(target=target, threshold=threshold, scorer=scorer, preprocess=preprocess)
+                    for target, threshold in [("Colorado Tech", 60), ("AIU", 50), ("Online College", 85)]
+                    for scorer in self.SCORERS
+                    for preprocess in (False, True)
+                ],
+            ]
+        )
+
+    @pytest.mark.parametrize("text", [
+        "American InterContinental University",
+        "colorado technical university online",
+        "Welcome to AIU Online College",
+        "Nothing relevant here",
+    ])
+    def test_single_text_matches_engine(self, text):
+        targets = self._targets()
+        matcher = CompiledFuzzyMatcher(targets)
+
+        assert matcher.evaluate_single_text(text) == FuzzyMatchingEngine.evaluate_single_text(targets, text)
+
+    @pytest.mark.parametrize("values", [
+        ["American InterContinental University", "AIU"],
+        ["colorado tech", "", None, "Colorado Technical University"],
+        ["Unrelated", "Also unrelated"],
+        [],
+    ])
+    def test_multiple_values_matches_engine(self, values):
+        targets = self._targets()
+        matcher = CompiledFuzzyMatcher(targets)
+
+        assert matcher.evaluate_multiple_values(values) == FuzzyMatchingEngine.evaluate_multiple_values(targets, values)
+
+    def test_each_leaf_in_or_group_matches_engine(self):
+        """Evaluate every leaf on its own so short-circuiting can't hide a difference."""
+        for leaf in self._targets().items[1:]:
+            for values in (["American InterContinental University", "aiu online"], ["Colorado Tech!"]):
+                assert CompiledFuzzyMatcher(leaf).evaluate_multiple_values(values) == \
+                    FuzzyMatchingEngine.evaluate_multiple_values(leaf, values)
+                assert CompiledFuzzyMatcher(leaf).evaluate_single_text(values[0]) == \
+                    FuzzyMatchingEngine.evaluate_single_text(leaf, values[0])
+
+    def test_targets_are_flattened_once(self):
+        matcher = CompiledFuzzyMatcher(self._targets())
+
+        assert len(matcher.leaves) == 2 + 3 * len(self.SCORERS) * 2
+        # One choice array per (scorer, preprocess, threshold) combination
+        assert len(matcher._scoring_groups) == len(self.SCORERS) * 2 * 3 + 2
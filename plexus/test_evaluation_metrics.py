@@ -186,6 +186,7 @@ class TestScoreTextProcessing:
         mock_evaluation.processed_items_by_score = {}
         mock_evaluation.total_skipped = 0
         mock_evaluation.scorecard.scores = [{"name": "test_score"}]
+        mock_evaluation.override_data = {}
 
         mock_result = create_mock_score_result("yes", "yes")
         mock_evaluation.scorecard.score_entire_text = AsyncMock(
@@ -212,6 +213,7 @@ class TestScoreTextProcessing:
         mock_evaluation.processed_items_by_score = {}
         mock_evaluation.total_skipped = 0
         mock_evaluation.scorecard.scores = [{"name": "test_score"}]
+        mock_evaluation.override_data = {}
 
         async def never_returns(**kwargs):
             await asyncio.Future()
@@ -240,6 +242,7 @@ class TestScoreTextProcessing:
         mock_evaluation.processed_items_by_score = {}
         mock_evaluation.total_skipped = 0
         mock_evaluation.scorecard.scores = [{"name": "test_score"}]
+        mock_evaluation.override_data = {}
         mock_evaluation.dashboard_client = MagicMock()
         mock_evaluation.experiment_id = "eval-123"
         mock_evaluation._create_score_result = AsyncMock()
@@ -274,6 +277,7 @@ class TestScoreTextProcessing:
         mock_evaluation.processed_items_by_score = {}
         mock_evaluation.total_skipped = 0
         mock_evaluation.scorecard.scores = [{"name": "test_score"}]
+        mock_evaluation.override_data = {}
         mock_evaluation.dashboard_client = MagicMock()
         mock_evaluation.experiment_id = "eval-123"
         mock_evaluation.account_id = "acct-123"
@@ -310,6 +314,7 @@ class TestScoreTextProcessing:
         mock_evaluation.processed_items_by_score = {}
         mock_evaluation.total_skipped = 0
         mock_evaluation.scorecard.scores = [{"name": "test_score"}]
+        mock_evaluation.override_data = {}
 
         error_result = Score.Result(
             parameters=Score.Parameters(name="test_score", scorecard_name="test_scorecard"),
@@ -653,3 +658,100 @@ class TestMultiScoreHandling:
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
+
+
+class TestResumeFromJournal:
+    """Test that resumed evaluations restore journaled items instead of re-scoring them"""
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_journaled_items(self, mock_evaluation, tmp_path, monkeypatch):
+        monkeypatch.setenv("PLEXUS_EVALUATION_JOURNAL_DIR", str(tmp_path))
+        mock_evaluation.experiment_id = "eval-1"
+        mock_evaluation.maybe_start_metrics_task = AsyncMock()
+        mock_evaluation.resume = True
+
+        first_result = create_mock_evaluation_results([('yes', 'yes')])[0]
+        first_result['content_id'] = 'c1'
+        journal = mock_evaluation._get_result_journal()
+        journal.append("test_score", first_result)
+        journal.close()
+
+        second_result = create_mock_evaluation_results([('no', 'yes')])[0]
+        second_result['content_id'] = 'c2'
+        mock_evaluation.score_text = AsyncMock(return_value=second_result)
+
+        rows = pd.DataFrame([
+            {'content_id': 'c1', 'text': 'first'},
+            {'content_id': 'c2', 'text': 'second'},
+        ])
+        results = await mock_evaluation.score_all_texts_for_score(rows, "test_score", None)
+        mock_evaluation._close_result_journal()
+
+        assert mock_evaluation.score_text.await_count == 1
+        assert mock_evaluation.score_text.await_args.args[0]['content_id'] == 'c2'
+        assert sorted(result['content_id'] for result in results) == ['c1', 'c2']
+        assert mock_evaluation.processed_items_by_score["test_score"] == 2
+        assert mock_evaluation.calculate_metrics(results)['accuracy'] == 0.5
+        assert set(journal.completed_results("test_score")) == {'c1', 'c2'}
+
+    def test_journal_is_opt_in_and_discarded_on_completion(self, mock_evaluation, tmp_path, monkeypatch):
+        monkeypatch.setenv("PLEXUS_EVALUATION_JOURNAL_DIR", str(tmp_path))
+        mock_evaluation.experiment_id = "eval-1"
+        assert mock_evaluation._get_result_journal() is None
+
+        mock_evaluation.journal_results = True
+        journal = mock_evaluation._get_result_journal()
+        journal.write_sample(None, ['c1'])
+        journal.append("test_score", create_mock_evaluation_results([('yes', 'yes')])[0])
+        mock_evaluation._close_result_journal(completed=True)
+
+        assert not os.path.exists(journal.path)
+
+
+class _TooManyRequests(Exception):
+    status_code = 429
+
+
+class TestThrottleReporting:
+    """Test that throttled LLM attempts reach the adaptive concurrency limiter"""
+
+    @pytest.mark.asyncio
+    async def test_retried_429_in_score_text_reduces_concurrency(self, mock_evaluation):
+        from langchain_core.language_models.fake_chat_models import FakeListChatModel
+        from plexus.LangChainUser import LangChainUser
+
+        class ThrottledOnceChatModel(FakeListChatModel):
+            throttled: bool = False
+
+            async def _agenerate(self, *args, **kwargs):
+                if not self.throttled:
+                    self.throttled = True
+                    raise _TooManyRequests("429 Too Many Requests")
+                return await super()._agenerate(*args, **kwargs)
+
+        # Configured like LangChainUser's models: retries absorb the 429. The
+        # process-wide LLM cache (set when the topic analyzers are imported)
+        # would otherwise answer without calling the model.
+        model = ThrottledOnceChatModel(responses=["Yes"], cache=False).with_retry(
+            retry_if_exception_type=(Exception,),
+            wait_exponential_jitter=False,
+            stop_after_attempt=3,
+        ).with_config(callbacks=[LangChainUser._create_token_counter(None)])
+
+        async def score_entire_text(**kwargs):
+            response = await model.ainvoke("Is this a greeting?")
+            return {"test_score": create_mock_score_result(response.content, "Yes")}
+
+        mock_evaluation.scorecard.scores = [{"name": "test_score"}]
+        mock_evaluation.override_data = {}
+        mock_evaluation.scorecard.score_entire_text = score_entire_text
+        mock_evaluation.maybe_start_metrics_task = AsyncMock()
+        limiter = mock_evaluation._concurrency_limiter_for_score("test_score")
+        initial_limit = limiter.limit
+
+        rows = pd.DataFrame([{"content_id": "c1", "text": "hello", "test_score": "Yes"}])
+        results = await mock_evaluation.score_all_texts_for_score(rows, "test_score", None)
+
+        assert [result["results"]["test_score"].value for result in results] == ["Yes"]
+        assert limiter.throttled == 1
+        assert limiter.limit < initial_limit
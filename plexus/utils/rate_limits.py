@@ -0,0 +1,29 @@
+"""
+Recognize provider throttling errors (HTTP 429, Bedrock ``ThrottlingException``,
+OpenAI ``RateLimitError``) regardless of which client library raised them.
+"""
+
+_RATE_LIMIT_ERROR_CODES = {
+    "ThrottlingException",
+    "Throttling",
+    "TooManyRequestsException",
+    "RateLimitError",
+    "rate_limit_exceeded",
+}
+_RATE_LIMIT_MESSAGES = ("rate limit", "rate_limit", "throttl", "too many requests")
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """True for provider throttling errors (HTTP 429, Bedrock/OpenAI rate limits)."""
+    status = getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    if type(exc).__name__ in _RATE_LIMIT_ERROR_CODES:
+        return True
+    response = getattr(exc, "response", None)
+    if isinstance(response, dict):
+        code = (response.get("Error") or {}).get("Code")
+        if code in _RATE_LIMIT_ERROR_CODES:
+            return True
+    message = str(exc).lower()
+    return any(fragment in message for fragment in _RATE_LIMIT_MESSAGES)
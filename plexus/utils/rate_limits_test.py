@@ -0,0 +1,22 @@
+from plexus.utils.rate_limits import is_rate_limit_error
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def test_is_rate_limit_error():
+    assert is_rate_limit_error(RateLimitError("slow down"))
+    assert is_rate_limit_error(Exception("ThrottlingException: Rate exceeded"))
+    assert is_rate_limit_error(StatusError(429))
+    client_error = Exception("boom")
+    client_error.response = {"Error": {"Code": "ThrottlingException"}}
+    assert is_rate_limit_error(client_error)
+    assert not is_rate_limit_error(StatusError(500))
+    assert not is_rate_limit_error(ValueError("bad input"))
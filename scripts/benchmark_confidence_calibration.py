@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark confidence calibration against the previous per-element implementation.
+
+Compares, on synthetic data:
+- temperature scaling (Python loop vs vectorized),
+- temperature search (ECE objective over the loop vs vectorized log-loss),
+- applying an isotonic lookup table (per-call array rebuild vs compiled calibrator).
+
+Usage:
+    python scripts/benchmark_confidence_calibration.py --size 20000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import time
+from typing import Callable, List
+
+import numpy as np
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scipy.optimize import minimize_scalar  # noqa: E402
+
+from plexus.confidence_calibration import (  # noqa: E402
+    apply_temperature_scaling,
+    compile_calibration,
+    expected_calibration_error,
+    find_optimal_temperature,
+)
+
+
+def legacy_temperature_scaling(confidence_scores: List[float], temperature: float) -> List[float]:
+    scaled_scores = []
+    for prob in confidence_scores:
+        prob = max(1e-7, min(1 - 1e-7, prob))
+        logit = np.log(prob / (1 - prob))
+        scaled_scores.append(1 / (1 + np.exp(-logit / temperature)))
+    return scaled_scores
+
+
+def legacy_find_optimal_temperature(confidence_scores: List[float], accuracy_labels: List[int]) -> float:
+    accuracies = np.array(accuracy_labels)
+
+    def objective(temperature):
+        scaled = np.array(legacy_temperature_scaling(confidence_scores, temperature))
+        return expected_calibration_error(scaled, accuracies, n_bins=10)
+
+    return minimize_scalar(objective, bounds=(0.1, 10.0), method="bounded").x
+
+
+def legacy_apply_calibration(raw_confidence: float, calibration_data) -> float:
+    raw_points = np.array(calibration_data["raw_confidence"])
+    calibrated_points = np.array(calibration_data["calibrated_confidence"])
+    calibrated = np.interp(raw_confidence, raw_points, calibrated_points)
+    return max(0.0, min(1.0, float(calibrated)))
+
+
+def _best_of(fn: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=20000, help="Number of synthetic predictions")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case (best time is reported)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    logits = rng.normal(0.0, 3.0, args.size)
+    raw = (1 / (1 + np.exp(-logits))).tolist()
+    labels = (rng.random(args.size) < 1 / (1 + np.exp(-logits / 2.0))).astype(int).tolist()
+    calibration_data = {
+        "method": "isotonic_regression",
+        "raw_confidence": np.linspace(0, 1, 101).tolist(),
+        "calibrated_confidence": np.sqrt(np.linspace(0, 1, 101)).tolist(),
+    }
+    compiled = compile_calibration(calibration_data)
+
+    cases = [
+        (
+            "temperature scaling",
+            lambda: legacy_temperature_scaling(raw, 1.7),
+            lambda: apply_temperature_scaling(raw, 1.7),
+        ),
+        (
+            "temperature search",
+            lambda: legacy_find_optimal_temperature(raw, labels),
+            lambda: find_optimal_temperature(raw, labels),
+        ),
+        (
+            "apply calibration",
+            lambda: [legacy_apply_calibration(value, calibration_data) for value in raw],
+            lambda: compiled.apply(raw),
+        ),
+    ]
+
+    print(f"{'case':<22} {'legacy (s)':>12} {'current (s)':>12} {'speedup':>9}")
+    for name, legacy, current in cases:
+        legacy_seconds = _best_of(legacy, args.repeat)
+        current_seconds = _best_of(current, args.repeat)
+        speedup = legacy_seconds / current_seconds if current_seconds else float("inf")
+        print(f"{name:<22} {legacy_seconds:>12.4f} {current_seconds:>12.4f} {speedup:>8.1f}x")
+
+    print(
+        f"temperatures: legacy(ECE)={legacy_find_optimal_temperature(raw, labels):.3f} "
+        f"current(log-loss)={find_optimal_temperature(raw, labels):.3f} (true 2.000)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,114 @@
+"""
+Cold-start budget for lightweight `plexus` commands.
+
+The dispatcher and Celery workers start a fresh `plexus` process for every
+command, so startup cost is paid over and over. Each check below starts a new
+interpreter, imports the CLI and resolves one command, then fails if that took
+longer than the budget or pulled in the scoring stack.
+
+The budget defaults to 5 seconds and can be changed with
+PLEXUS_CLI_STARTUP_BUDGET_SECONDS. Run this file directly to print a timing
+table:
+
+    python tests/cli/test_cli_startup_budget.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+import pytest
+
+BUDGET_ENV_VAR = "PLEXUS_CLI_STARTUP_BUDGET_SECONDS"
+DEFAULT_BUDGET_SECONDS = 5.0
+
+# Commands that only talk to the API and must not need the scoring stack.
+LIGHTWEIGHT_COMMANDS = [
+    None,  # plexus --help
+    "task",
+    "tasks",
+    "item",
+    "score-results",
+    "scorecard",
+    "procedure",
+    "execute",
+    "command",
+    "metrics",
+]
+
+HEAVY_MODULES = [
+    "langgraph",
+    "litellm",
+    "graphviz",
+    "tiktoken",
+    "plexus.Scorecard",
+    "plexus.scores.LangGraphScore",
+]
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from plexus.cli.shared.CommandLineInterface import cli
+name = sys.argv[1] or None
+if name is not None:
+    cli.get_command(None, name)
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "modules": [m for m in json.loads(sys.argv[2]) if m in sys.modules]}))
+"""
+
+
+def startup_budget() -> float:
+    value = os.getenv(BUDGET_ENV_VAR, "").strip()
+    return float(value) if value else DEFAULT_BUDGET_SECONDS
+
+
+def measure_startup(command):
+    """Import the CLI and resolve ``command`` in a fresh interpreter."""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = f"{REPO_ROOT}{os.pathsep}{env.get('PYTHONPATH', '')}"
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE, command or "", json.dumps(HEAVY_MODULES)],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("command", LIGHTWEIGHT_COMMANDS, ids=lambda c: c or "--help")
+def test_lightweight_command_startup_within_budget(command):
+    measurement = measure_startup(command)
+
+    assert measurement["modules"] == [], (
+        f"`plexus {command or '--help'}` imported {measurement['modules']} at startup"
+    )
+    budget = startup_budget()
+    assert measurement["seconds"] <= budget, (
+        f"`plexus {command or '--help'}` took {measurement['seconds']:.2f}s to start "
+        f"(budget {budget:.2f}s, set {BUDGET_ENV_VAR} to change)"
+    )
+
+
+def test_registered_short_help_matches_commands():
+    from plexus.cli.shared.CommandLineInterface import COMMANDS, cli
+
+    for name, _, short_help in COMMANDS:
+        command = cli.get_command(click.Context(cli), name)
+        assert isinstance(command, click.Command), name
+        assert command.get_short_help_str(limit=1000) == short_help, name
+
+
+if __name__ == "__main__":
+    budget = startup_budget()
+    print(f"{'command':<16} {'seconds':>8}  heavy modules (budget {budget:.2f}s)")
+    for command in LIGHTWEIGHT_COMMANDS:
+        measurement = measure_startup(command)
+        print(f"{command or '--help':<16} {measurement['seconds']:>8.2f}  {', '.join(measurement['modules']) or '-'}")
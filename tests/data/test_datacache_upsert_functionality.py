@@ -358,5 +358,51 @@ class TestDataCacheUpsertFunctionality:
             assert call_args['identifiers'] is complex_identifiers
 
 
+class TestDataCacheBulkUpsert:
+    """Test DataCache upsert_items_for_dataset_rows method."""
+
+    def setup_method(self):
+        self.account_id = str(uuid.uuid4())
+        self.mock_client = Mock()
+        self.data_cache = MockDataCache()
+
+    def test_rows_are_prepared_and_batched(self):
+        import pandas as pd
+        rows = pd.DataFrame([
+            {'id': 'ext-1', 'text': 'one', 'metadata': '{"a": 1}', 'identifiers': {'form_id': '1'}},
+            {'id': 'ext-2', 'text': 'two', 'metadata': None, 'identifiers': '{"form_id": "2"}'},
+        ])
+
+        with patch('plexus.dashboard.api.models.item.Item.batch_upsert_by_identifiers') as mock_batch:
+            mock_batch.return_value = [('item-1', True, None), ('item-2', False, None)]
+
+            result = self.data_cache.upsert_items_for_dataset_rows(
+                dashboard_client=self.mock_client,
+                account_id=self.account_id,
+                rows=rows,
+                score_id='score-1'
+            )
+
+        assert result == [('item-1', True, None), ('item-2', False, None)]
+        prepared = mock_batch.call_args[1]['rows']
+        assert prepared[0]['external_id'] == 'ext-1'
+        assert prepared[0]['metadata'] == {'a': 1}
+        assert prepared[0]['description'] == 'Dataset Item - ext-1'
+        assert prepared[0]['score_id'] == 'score-1'
+        assert prepared[1]['identifiers'] == {'form_id': '2'}
+        assert mock_batch.call_args[1]['is_evaluation'] is False
+
+    def test_bulk_upsert_exception_reports_error_per_row(self):
+        with patch('plexus.dashboard.api.models.item.Item.batch_upsert_by_identifiers',
+                   side_effect=Exception("API down")):
+            result = self.data_cache.upsert_items_for_dataset_rows(
+                dashboard_client=self.mock_client,
+                account_id=self.account_id,
+                rows=[{'id': 'ext-1', 'identifiers': {}}]
+            )
+
+        assert result == [(None, False, "Failed to upsert items: API down")]
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
\ No newline at end of file
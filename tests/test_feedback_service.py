@@ -396,9 +396,8 @@ class TestFeedbackService:
         assert formatted["analysis"]["accuracy"] == 85.0
         assert formatted["recommendation"] == "Test recommendation"
     
-    def test_prioritize_feedback_with_edit_comments(self):
-        """Test prioritization of feedback items with edit comments."""
-        # Create items with and without edit comments
+    def test_select_page_puts_edit_comments_first(self):
+        """Test that a limited page takes items with edit comments first, in order."""
         items_with_comments = []
         items_without_comments = []
         
@@ -412,41 +411,28 @@ class TestFeedbackService:
             item.editCommentValue = None
             items_without_comments.append(item)
         
-        all_items = items_with_comments + items_without_comments
+        all_items = items_without_comments[:2] + items_with_comments + items_without_comments[2:]
         
-        # Test prioritization with limit
-        result = FeedbackService.prioritize_feedback_with_edit_comments(
-            all_items, limit=4, prioritize_edit_comments=True
-        )
-        
-        # Should get all 3 items with comments plus 1 without
-        assert len(result) == 4
+        result = FeedbackService._select_page(all_items, limit=4, offset=None, prioritize_edit_comments=True)
         
-        # Count items with comments in result
-        with_comments_count = sum(1 for item in result if item.editCommentValue)
-        assert with_comments_count == 3  # All items with comments should be included
+        assert result == items_with_comments + items_without_comments[:1]
     
-    def test_prioritize_feedback_no_limit(self):
-        """Test prioritization without limit returns all items."""
-        items = [Mock(spec=FeedbackItem) for _ in range(5)]
+    def test_select_page_no_limit(self):
+        """Test that without a limit every item is returned in its original order."""
+        items = [Mock(spec=FeedbackItem, editCommentValue=None) for _ in range(5)]
         
-        result = FeedbackService.prioritize_feedback_with_edit_comments(
-            items, limit=None, prioritize_edit_comments=True
-        )
+        result = FeedbackService._select_page(items, limit=None, offset=None, prioritize_edit_comments=True)
         
-        assert len(result) == 5
         assert result == items
     
-    def test_prioritize_feedback_no_prioritization(self):
-        """Test prioritization when prioritize_edit_comments is False."""
-        items = [Mock(spec=FeedbackItem) for _ in range(10)]
+    def test_select_page_no_prioritization(self):
+        """Test that offset and limit apply to the original order without prioritization."""
+        items = [Mock(spec=FeedbackItem, editCommentValue=None) for _ in range(10)]
+        items[7].editCommentValue = "Edit comment"
         
-        result = FeedbackService.prioritize_feedback_with_edit_comments(
-            items, limit=5, prioritize_edit_comments=False
-        )
+        result = FeedbackService._select_page(items, limit=5, offset=2, prioritize_edit_comments=False)
         
-        assert len(result) == 5
-        # Should be a subset of original items (order may be different due to shuffle) 
+        assert result == items[2:7]
 
 class TestFeedbackServiceTimeWindow:
     """Test suite for FeedbackService time window calculations."""
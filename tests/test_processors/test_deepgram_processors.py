@@ -130,6 +130,20 @@ class TestDeepgramTimeSliceProcessor(unittest.TestCase):
         )
         self.assertEqual(self.mono, original)
 
+    def test_derived_input_shares_untouched_metadata(self):
+        proc = self._make_processor(end=5.0)
+        inp = Score.Input(
+            text="x",
+            metadata={'deepgram': self.mono, 'other_key': {'nested': True}},
+        )
+        result = proc.process(inp)
+
+        self.assertIs(result.metadata['other_key'], inp.metadata['other_key'])
+        self.assertIsNot(result.metadata['deepgram'], self.mono)
+        self.assertIs(result.metadata['deepgram']['metadata'], self.mono['metadata'])
+        with self.assertRaises(Exception):
+            result.text = "changed"
+
     # --- text regeneration ---
 
     def test_text_is_regenerated(self):